@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the array-driven backtest path against the tick-by-tick trade loop.
+
+Runs BacktestDataStreamer.run(fast=False) and run(fast=True) with a trailing
+stop configuration over random 15 second ticks from 8:00 to 18:00 ET.
+
+Usage: python scripts/benchmark_fast_backtest.py [--days 3] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from models.tick_data import TickData
+from mlf_utils.timezone_utils import ET
+from models.monitor_configuration import MonitorConfiguration
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+
+
+def make_aggregators(days: int) -> dict:
+    rng = np.random.default_rng(7)
+    aggregators = {'1m-normal': CANormal("TEST", "1m", True), '1m-heiken': CAHeiken("TEST", "1m", True),
+                   '5m-normal': CANormal("TEST", "5m", True)}
+    price = 100.0
+    for day in range(days):
+        start = datetime(2024, 3, 4 + day, 8, 0, tzinfo=ET)
+        for i in range(10 * 240):
+            price += rng.normal(0, 0.04)
+            tick = TickData(symbol="TEST", timestamp=start + timedelta(seconds=15 * i), open=price,
+                            high=price + 0.02, low=price - 0.02, close=price, volume=10)
+            for aggregator in aggregators.values():
+                aggregator.process_tick(tick)
+    for aggregator in aggregators.values():
+        aggregator.finalize()
+    return aggregators
+
+
+def create_config() -> MonitorConfiguration:
+    return MonitorConfiguration(
+        name="Fast Backtest Benchmark",
+        trade_executor={"default_position_size": 100, "stop_loss_pct": 0.005, "take_profit_pct": 0.01,
+                        "trailing_stop_loss": True, "trailing_stop_distance_pct": 0.003},
+        indicators=[
+            {"name": "sma_cross", "type": "Indicator", "indicator_class": "SMACrossoverIndicator",
+             "agg_config": "1m-normal",
+             "parameters": {"period": 10, "crossover_value": 0.0005, "trend": "bullish", "lookback": 5}},
+            {"name": "rsi", "type": "Indicator", "indicator_class": "RSIIndicator",
+             "agg_config": "1m-heiken",
+             "parameters": {"period": 10, "oversold_threshold": 45.0, "overbought_threshold": 55.0,
+                            "trend": "bullish", "lookback": 4}},
+            {"name": "macd_bear", "type": "Indicator", "indicator_class": "MACDHistogramCrossoverIndicator",
+             "agg_config": "5m-normal",
+             "parameters": {"fast": 6, "slow": 13, "signal": 5, "histogram_threshold": 0.0,
+                            "trend": "bearish", "lookback": 4}},
+        ],
+        bars={
+            "bull": {"type": "bull", "indicators": {"sma_cross": 1.0, "rsi": 1.0}},
+            "bear": {"type": "bear", "indicators": {"macd_bear": 1.0}},
+        },
+        enter_long=[{"name": "bull", "threshold": 0.4}],
+        exit_long=[{"name": "bear", "threshold": 0.6}],
+    )
+
+
+def best_time(streamer: BacktestDataStreamer, fast: bool, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        streamer.replace_monitor_config(streamer.monitor_config)
+        start = time.perf_counter()
+        streamer.run(fast=fast)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    aggregators = make_aggregators(args.days)
+    timings = {}
+    for fast in (False, True):
+        streamer = BacktestDataStreamer()
+        streamer.initialize(aggregators, {"ticker": "TEST", "start_date": "a", "end_date": "b"}, create_config())
+        streamer.run(fast=fast)  # warm up the indicator calculation
+        timings[fast] = best_time(streamer, fast, args.repeat)
+
+    candles = len(aggregators['1m-normal'].get_history())
+    print(f"backtest on {candles} 1m candles, best of {args.repeat}")
+    print(f"  tick loop : {timings[False] * 1000:8.1f} ms")
+    print(f"  fast path : {timings[True] * 1000:8.1f} ms  ({timings[False] / timings[True]:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark encoding a 1,000-candle chart-data package.
+
+Compares the previous path (recursive Python sanitize, then the standard json
+encoder as used by jsonify / Flask-SocketIO) with mlf_utils.fast_json.
+
+Usage: python scripts/benchmark_json_encoding.py [--candles 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from mlf_utils import fast_json
+
+
+def recursive_sanitize(data):
+    """The sanitize walk payloads went through before fast_json"""
+    if isinstance(data, dict):
+        return {k: recursive_sanitize(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [recursive_sanitize(item) for item in data]
+    elif isinstance(data, float):
+        if math.isnan(data) or math.isinf(data):
+            return None
+        return data
+    elif isinstance(data, np.floating):
+        if np.isnan(data) or np.isinf(data):
+            return None
+        return float(data)
+    elif isinstance(data, np.integer):
+        return int(data)
+    elif isinstance(data, np.ndarray):
+        return recursive_sanitize(data.tolist())
+    return data
+
+
+def make_chart_package(candles: int) -> dict:
+    """Chart package shaped like ChartDataService.get_unified_chart_data output"""
+    rng = np.random.default_rng(0)
+    timestamps = (1709562600000 + 60000 * np.arange(candles)).tolist()
+    closes = 100 + np.cumsum(rng.normal(0, 0.1, candles))
+
+    def series(values):
+        return [[ts, float(v)] for ts, v in zip(timestamps, values)]
+
+    components = {}
+    for name in ('macd_macd', 'macd_signal', 'macd_histogram', 'sma_sma', 'adx_adx', 'adx_plus_di'):
+        values = rng.normal(size=candles)
+        values[:30] = np.nan  # warm-up period
+        components[name] = series(values)
+
+    indicators = {f"ind{i}": series(rng.random(candles)) for i in range(6)}
+    return {
+        'success': True,
+        'candlestick_data': [[ts, c, c + 0.05, c - 0.05, c] for ts, c in zip(timestamps, closes.tolist())],
+        'per_aggregator_candles': {'1m-normal': [[ts, c, c, c, c] for ts, c in zip(timestamps, closes.tolist())]},
+        'indicator_history': indicators,
+        'raw_indicator_history': {name: [[ts, round(v)] for ts, v in points] for name, points in indicators.items()},
+        'component_history': components,
+        'bar_scores_formatted': [{'timestamp': ts, 'scores': {'bull': float(rng.random()), 'bear': np.float64(0.1)}}
+                                 for ts in timestamps],
+        'bar_score_history': {'bull': rng.random(candles), 'bear': rng.random(candles)},
+        'trades': [{'timestamp': timestamps[i], 'type': 'buy', 'price': float(closes[i]), 'pnl': float('nan')}
+                   for i in range(0, candles, 50)],
+        'trade_details': {timestamps[i]: {'pnl_pct': np.float64(0.5)} for i in range(0, candles, 50)},
+    }
+
+
+def best_time(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--candles', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    package = make_chart_package(args.candles)
+
+    legacy = best_time(lambda: json.dumps(recursive_sanitize(package)), args.repeat)
+    fast = best_time(lambda: fast_json.dumps_bytes(package), args.repeat)
+    jsonable = best_time(lambda: fast_json.to_jsonable(package), args.repeat)
+    size_kb = len(fast_json.dumps_bytes(package)) / 1024
+
+    backend = "orjson" if fast_json.HAS_ORJSON else "json (fallback)"
+    print(f"{args.candles}-candle chart package ({size_kb:.0f} KB), best of {args.repeat}, backend: {backend}")
+    print(f"  sanitize + json.dumps : {legacy * 1000:8.2f} ms")
+    print(f"  fast_json.dumps_bytes : {fast * 1000:8.2f} ms  ({legacy / fast:.1f}x)")
+    print(f"  fast_json.to_jsonable : {jsonable * 1000:8.2f} ms  ({legacy / jsonable:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Array-based candle building for historical data.
+
+Replaying every tick through CandleAggregator.process_tick costs a datetime
+replace, a market-hours check and a few row writes per tick and aggregator.
+For backtests the whole tick range is known up front, so the candles can be
+computed from the tick columns instead: ticks are bucketed by ET wall-clock
+candle start, and each bucket is reduced with NumPy (first/last/max/min/sum).
+
+The results are the same candles (values, timestamps and in-progress candle)
+that process_tick/finalize produce for CANormal and CAHeiken:
+
+- Normal: open of the first tick, high/low over the first tick's high/low and
+  every later tick's open/high/low/close, close of the last tick, summed volume.
+- Heiken-Ashi: open is (open + close) / 2 of the previous candle (the first
+  tick's close for the very first candle); close is the last tick's
+  (o + h + l + c) / 4 and high/low combine the last tick with open and close.
+"""
+
+import functools
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+from candle_aggregator.candle_aggregator import CandleAggregator
+from candle_aggregator.candle_store import CandleStore, FIELDS
+from mlf_utils.timezone_utils import ET, MARKET_OPEN_SECONDS, MARKET_CLOSE_SECONDS
+
+MS_PER_MINUTE = 60_000
+MS_PER_HOUR = 3_600_000
+MS_PER_DAY = 86_400_000
+
+# Candle length per timeframe as used by CandleAggregator._get_candle_start_time (others use 1 minute)
+CANDLE_MINUTES = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "1h": 60}
+
+
+def et_offsets_ms(timestamp_ms: np.ndarray) -> np.ndarray:
+    """ET UTC offset (ms) of each epoch-ms timestamp; offsets only change on UTC hour boundaries"""
+    hours, inverse = np.unique(timestamp_ms // MS_PER_HOUR, return_inverse=True)
+    offsets = np.array([int(datetime.fromtimestamp(int(hour) * 3600, ET).utcoffset().total_seconds()) * 1000
+                        for hour in hours.tolist()], dtype=np.int64)
+    return offsets[inverse]
+
+
+def regular_hours_mask(local_ms: np.ndarray) -> np.ndarray:
+    """Ticks during regular trading hours (weekdays 9:30 - 16:00 ET), as is_market_hours()"""
+    # Epoch day 0 (1970-01-01) was a Thursday (weekday 3)
+    weekday = (local_ms // MS_PER_DAY + 3) % 7
+    second_of_day = (local_ms % MS_PER_DAY) // 1000
+    return (weekday < 5) & (second_of_day >= MARKET_OPEN_SECONDS) & (second_of_day < MARKET_CLOSE_SECONDS)
+
+
+def _sequential_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-bucket sums added in tick order (the order process_tick accumulates volume)"""
+    if np.all(np.mod(values, 1) == 0):
+        # Whole numbers: every summation order gives the same result
+        return np.add.reduceat(values, starts)
+    bounds = starts.tolist() + [len(values)]
+    values = values.tolist()
+    return np.array([functools.reduce(operator.add, values[start:stop])
+                     for start, stop in zip(bounds[:-1], bounds[1:])], dtype=np.float64)
+
+
+def _normal_candles(o, h, l, c, v, starts, stops) -> np.ndarray:
+    first = np.zeros(len(o), dtype=bool)
+    first[starts] = True
+    tick_high = np.where(first, h, np.maximum(np.maximum(o, h), np.maximum(l, c)))
+    tick_low = np.where(first, l, np.minimum(np.minimum(o, h), np.minimum(l, c)))
+    return np.vstack([o[starts], np.maximum.reduceat(tick_high, starts), np.minimum.reduceat(tick_low, starts),
+                      c[stops - 1], _sequential_sums(v, starts)])
+
+
+def _heiken_candles(o, h, l, c, v, starts, stops) -> np.ndarray:
+    last = stops - 1
+    ha_close = (o[last] + h[last] + l[last] + c[last]) / 4
+
+    # Each open depends on the previous candle, so this recursion stays a loop over candles
+    ha_open = [float(c[starts[0]])]
+    for previous_close in ha_close[:-1].tolist():
+        ha_open.append((ha_open[-1] + previous_close) / 2)
+    ha_open = np.array(ha_open, dtype=np.float64)
+
+    return np.vstack([ha_open, np.maximum(np.maximum(h[last], ha_open), ha_close),
+                      np.minimum(np.minimum(l[last], ha_open), ha_close), ha_close, _sequential_sums(v, starts)])
+
+
+CANDLE_BUILDERS = {"normal": _normal_candles, "heiken": _heiken_candles}
+
+
+def resample_ticks(aggregator: CandleAggregator, ticks, finalize: bool = True) -> None:
+    """
+    Fill an empty aggregator with the candles of `ticks` (columns timestamp in
+    epoch ms, open, high, low, close, volume; sorted by time), as if every tick
+    had been passed to process_tick and then, optionally, finalize().
+    """
+    if len(aggregator.history) or aggregator.current_candle is not None:
+        raise ValueError(f"Aggregator {aggregator.symbol} {aggregator.timeframe} already has candles")
+    builder = CANDLE_BUILDERS.get(aggregator._get_aggregator_type())
+    if builder is None:
+        # Unknown candle type: fall back to the tick-by-tick path
+        for tick in ticks.to_ticks(aggregator.symbol):
+            aggregator.process_tick(tick)
+        if finalize:
+            aggregator.finalize()
+        return
+
+    timestamp = np.asarray(ticks.timestamp, dtype=np.int64)
+    columns = [np.asarray(getattr(ticks, name), dtype=np.float64) for name in FIELDS]
+    local_ms = timestamp + et_offsets_ms(timestamp)
+    if not aggregator.include_extended_hours:
+        keep = regular_hours_mask(local_ms)
+        if not keep.all():
+            timestamp, local_ms = timestamp[keep], local_ms[keep]
+            columns = [column[keep] for column in columns]
+    if len(timestamp) == 0:
+        return
+
+    # A new candle starts whenever the ET wall-clock candle start changes
+    candle_ms = CANDLE_MINUTES.get(aggregator.timeframe, 1) * MS_PER_MINUTE
+    bucket = local_ms - local_ms % candle_ms
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    stops = np.append(starts[1:], len(bucket))
+
+    values = builder(*columns, starts, stops)
+    candle_timestamps = bucket[starts] - (local_ms[starts] - timestamp[starts])
+    timestamp_objects = [datetime.fromtimestamp(ms / 1000, ET) for ms in candle_timestamps.tolist()]
+
+    aggregator._store = CandleStore.from_columns(candle_timestamps, values, timestamp_objects, has_live=not finalize,
+                                                 symbol=aggregator.symbol, time_increment=aggregator.timeframe)
+    # The last tick completed the previous candle if it started the newest one
+    aggregator.completed_candle = (aggregator._store.row(len(starts) - 2)
+                                   if len(starts) > 1 and stops[-1] - starts[-1] == 1 else None)
+
+
+def resample_aggregators(aggregators: Dict[str, CandleAggregator], ticks, finalize: bool = True,
+                         max_workers: Optional[int] = None) -> None:
+    """
+    resample_ticks() for several empty aggregators over the same ticks. The
+    timeframes are independent, so they are built on a thread pool (the heavy
+    lifting happens in NumPy).
+    """
+    if len(aggregators) <= 1:
+        for aggregator in aggregators.values():
+            resample_ticks(aggregator, ticks, finalize)
+        return
+    max_workers = max_workers or min(len(aggregators), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(resample_ticks, aggregator, ticks, finalize) for aggregator in aggregators.values()]
+        for future in futures:
+            future.result()
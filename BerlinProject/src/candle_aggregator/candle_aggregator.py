@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 from models.tick_data import TickData
 from mlf_utils.timezone_utils import is_market_hours, is_aware
+from candle_aggregator.candle_store import CandleStore, CandleHistory, CandleSeries
 import numpy as np
 
 
@@ -17,13 +18,61 @@ class CandleAggregator(ABC):
         self.timeframe = timeframe
         self.timeframe_minutes = self._calculate_timeframe_minutes()
         self.include_extended_hours = include_extended_hours
-        self.current_candle: Optional[TickData] = None
-        self.history: List[TickData] = []
+        # Completed candles plus the in-progress candle, stored column-wise
+        self._store = CandleStore(symbol=symbol, time_increment=timeframe)
         self.completed_candle: Optional[TickData] = None
         self.maximum_drawdown: Optional[float] = None
         self.volatility: Optional[float] = None
         self.volatility_adjusted: Optional[float] = None
 
+    @property
+    def history(self) -> CandleHistory:
+        """Completed candles, as a list-like view over the column store"""
+        return CandleHistory(self._store)
+
+    @history.setter
+    def history(self, candles: List[TickData]) -> None:
+        current = self._store.live
+        current = current.to_tick_data() if current is not None else None
+        self._store.clear()
+        self._store.extend(candles)
+        self._store.set_live(current)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever a candle is started, updated or completed (cache key for derived results)"""
+        return self._store.version
+
+    def export_columns(self) -> Tuple[np.ndarray, np.ndarray, List, bool]:
+        """
+        Candle columns for rebuilding this aggregator elsewhere (see from_columns).
+
+        Returns:
+            (int64 epoch-ms timestamps, (5, n) OHLCV values, timestamp objects,
+             whether the last row is the in-progress candle)
+        """
+        return (self._store.timestamps(include_live=True), self._store.ohlc_view(include_live=True),
+                self._store.series(include_live=True).timestamp_objects(), self._store.has_live)
+
+    @classmethod
+    def from_columns(cls, symbol: str, timeframe: str, include_extended_hours: bool,
+                     timestamps: np.ndarray, values: np.ndarray, timestamp_objects: List,
+                     has_live: bool = False) -> 'CandleAggregator':
+        """Aggregator over existing candle columns (no copy), e.g. backtest data in shared memory"""
+        aggregator = cls(symbol, timeframe, include_extended_hours)
+        aggregator._store = CandleStore.from_columns(timestamps, values, timestamp_objects, has_live,
+                                                     symbol=symbol, time_increment=timeframe)
+        return aggregator
+
+    @property
+    def current_candle(self) -> Optional[TickData]:
+        """In-progress candle (a row proxy into the store's tail slot)"""
+        return self._store.live
+
+    @current_candle.setter
+    def current_candle(self, candle: Optional[TickData]) -> None:
+        self._store.set_live(candle)
+
     @abstractmethod
     def _get_aggregator_type(self) -> str:
         """Return aggregator type identifier"""
@@ -129,11 +178,12 @@ class CandleAggregator(ABC):
 
     def _complete_current_candle(self) -> Optional[TickData]:
         """Move current candle to history"""
-        if self.current_candle is None:
+        completed = self.current_candle
+        if completed is None:
             return None
 
-        self.history.append(self.current_candle)
-        return self.current_candle
+        self.history.append(completed)
+        return completed
 
     def _get_candle_start_time(self, timestamp: datetime) -> datetime:
         """Get normalized candle start time for timeframe"""
@@ -170,15 +220,30 @@ class CandleAggregator(ABC):
             The completed candle if one existed, None otherwise
         """
         if self.current_candle is not None:
-            self.history.append(self.current_candle)
             completed = self.current_candle
-            self.current_candle = None
+            self.history.append(completed)
             return completed
         return None
 
-    def get_history(self) -> List[TickData]:
-        """Get completed candles"""
-        return self.history.copy()
+    def get_history(self) -> CandleSeries:
+        """Get completed candles (zero-copy view; use .copy() for a mutable list)"""
+        return self.history.snapshot()
+
+    def get_candles(self, include_current: bool = True) -> CandleSeries:
+        """Get completed candles plus, optionally, the current candle as one zero-copy view"""
+        return self._store.series(include_live=include_current)
+
+    def closes(self, include_current: bool = False) -> np.ndarray:
+        """Read-only view of close prices"""
+        return self._store.column("close", include_live=include_current)
+
+    def timestamps_ms(self, include_current: bool = False) -> np.ndarray:
+        """Read-only view of candle timestamps as int64 epoch milliseconds"""
+        return self._store.timestamps(include_live=include_current)
+
+    def ohlc_view(self, n: Optional[int] = None, include_current: bool = False) -> np.ndarray:
+        """Read-only (5, n) view of the last n candles: open, high, low, close, volume rows"""
+        return self._store.ohlc_view(n, include_live=include_current)
 
     def get_latest_candle(self) -> Optional[TickData]:
         """Get most recent completed candle"""
@@ -262,21 +327,15 @@ class CandleAggregator(ABC):
         if len(self.history) < 2:
             return 0.0
 
-        # Extract close prices from history
-        close_prices = [candle.close for candle in self.history]
-
-        # Track running maximum and maximum drawdown
-        running_max = close_prices[0]
-        max_drawdown = 0.0
+        close_prices = self.closes()
 
-        for price in close_prices[1:]:
-            # Update running maximum
-            running_max = max(running_max, price)
+        # Running maximum, and drawdown of each later price from it
+        running_max = np.maximum.accumulate(close_prices)[1:]
+        prices = close_prices[1:]
+        positive = running_max > 0
+        drawdowns = ((prices[positive] - running_max[positive]) / running_max[positive]) * 100
 
-            # Calculate drawdown from running maximum
-            if running_max > 0:
-                drawdown = ((price - running_max) / running_max) * 100
-                max_drawdown = min(max_drawdown, drawdown)
+        max_drawdown = min(0.0, float(drawdowns.min())) if drawdowns.size else 0.0
 
         self.maximum_drawdown = max_drawdown
         return max_drawdown
@@ -293,8 +352,7 @@ class CandleAggregator(ABC):
 
     def get_volatility(self, net_profit: Optional[float] = None) -> Tuple[float, Optional[float]]:
         if not self.volatility:
-            close_prices = [candle.close for candle in self.history]
-            clses = np.array(close_prices)
+            clses = self.closes()
             price_volatility = clses.std()
             minimum, maximum = clses.min(), clses.max()
             if minimum == maximum:
@@ -0,0 +1,419 @@
+"""
+Columnar candle storage for CandleAggregator.
+
+Candles are kept in preallocated, growable NumPy columns (int64 epoch-millisecond
+timestamps plus float64 open/high/low/close/volume) instead of a list of TickData
+objects. The in-progress candle lives in the tail slot right after the completed
+ones, so "history + current" is a single contiguous slice and indicators can read
+close/high/low columns as zero-copy views.
+
+TickData-compatible access is kept through CandleRow, a lightweight row proxy that
+reads and writes the underlying columns.
+"""
+
+from datetime import datetime, tzinfo
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from models.tick_data import TickData
+
+FIELDS = ("open", "high", "low", "close", "volume")
+_FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+
+def timestamp_to_epoch_ms(timestamp: Any) -> int:
+    """Convert a candle timestamp (datetime or integer epoch) to int64 milliseconds."""
+    if isinstance(timestamp, datetime):
+        return int(timestamp.timestamp() * 1000)
+    if timestamp is None:
+        return MISSING_TIMESTAMP
+    return int(timestamp)
+
+
+def epoch_ms_to_datetimes(timestamps: np.ndarray, tz: Optional[tzinfo] = None) -> List[Optional[datetime]]:
+    """Inverse of timestamp_to_epoch_ms for a column of timestamps (in timezone `tz`)."""
+    return [None if ms == MISSING_TIMESTAMP else datetime.fromtimestamp(ms / 1000, tz)
+            for ms in timestamps.tolist()]
+
+
+def _to_float(value: Any) -> float:
+    return np.nan if value is None else value
+
+
+class CandleRow(TickData):
+    """
+    Row proxy over a CandleStore. Behaves like TickData, but OHLCV values and the
+    timestamp are read from (and written to) the store's columns.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: 'CandleStore', index: int, symbol: Optional[str] = None,
+                 time_increment: Optional[str] = None):
+        self._store = store
+        self._index = index
+        self.symbol = symbol
+        self.time_increment = time_increment
+
+    def _get(self, field: int) -> float:
+        return float(self._store._values[field, self._index])
+
+    def _set(self, field: int, value: Any) -> None:
+        self._store._values[field, self._index] = _to_float(value)
+        self._store.version += 1
+
+    open = property(lambda self: self._get(0), lambda self, v: self._set(0, v))
+    high = property(lambda self: self._get(1), lambda self, v: self._set(1, v))
+    low = property(lambda self: self._get(2), lambda self, v: self._set(2, v))
+    close = property(lambda self: self._get(3), lambda self, v: self._set(3, v))
+    volume = property(lambda self: self._get(4), lambda self, v: self._set(4, v))
+
+    @property
+    def timestamp(self) -> Any:
+        return self._store._timestamp_objects[self._index]
+
+    @timestamp.setter
+    def timestamp(self, value: Any) -> None:
+        self._store._timestamp_objects[self._index] = value
+        self._store._timestamps[self._index] = timestamp_to_epoch_ms(value)
+        self._store.version += 1
+
+    def to_tick_data(self) -> TickData:
+        """Detach this row into a standalone TickData."""
+        return TickData(open=self.open, high=self.high, low=self.low, close=self.close,
+                        volume=self.volume, timestamp=self.timestamp, symbol=self.symbol,
+                        time_increment=self.time_increment)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle as a plain TickData so a single row never drags the whole store along
+        return TickData, (self.open, self.high, self.low, self.close, self.volume,
+                          self.timestamp, self.symbol, self.time_increment)
+
+
+class CandleStore:
+    """
+    Growable columnar candle buffer: `len(store)` completed candles followed by an
+    optional live (in-progress) candle in the tail slot.
+
+    `version` increases on every write (new, completed or mutated candle), so an
+    unchanged version means every view over the store still reads the same data.
+    """
+
+    def __init__(self, symbol: Optional[str] = None, time_increment: Optional[str] = None,
+                 capacity: int = 1024):
+        self.symbol = symbol
+        self.time_increment = time_increment
+        capacity = max(int(capacity), 1)
+        self._timestamps = np.full(capacity, MISSING_TIMESTAMP, dtype=np.int64)
+        self._values = np.full((len(FIELDS), capacity), np.nan, dtype=np.float64)
+        self._timestamp_objects: List[Any] = []
+        self._size = 0
+        self._live: Optional[CandleRow] = None
+        self.version = 0
+
+    @classmethod
+    def from_columns(cls, timestamps: np.ndarray, values: np.ndarray, timestamp_objects: List[Any],
+                     has_live: bool = False, symbol: Optional[str] = None,
+                     time_increment: Optional[str] = None) -> 'CandleStore':
+        """
+        Wrap existing columns (e.g. shared memory) without copying.
+
+        `values` is the (5, n) open/high/low/close/volume block; with `has_live` the
+        last row is the in-progress candle. Read-only arrays give a read-only store.
+        """
+        store = cls(symbol=symbol, time_increment=time_increment, capacity=1)
+        store._timestamps = timestamps
+        store._values = values
+        store._timestamp_objects = list(timestamp_objects)
+        store._size = len(timestamps) - (1 if has_live else 0)
+        if has_live:
+            store._live = CandleRow(store, store._size, symbol=symbol, time_increment=time_increment)
+        return store
+
+    # ----- size / capacity -----
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def has_live(self) -> bool:
+        return self._live is not None
+
+    @property
+    def capacity(self) -> int:
+        return self._timestamps.shape[0]
+
+    def _ensure_capacity(self, required: int) -> None:
+        if required <= self.capacity:
+            return
+        new_capacity = max(required, self.capacity * 2)
+        timestamps = np.full(new_capacity, MISSING_TIMESTAMP, dtype=np.int64)
+        values = np.full((len(FIELDS), new_capacity), np.nan, dtype=np.float64)
+        used = self._used()
+        timestamps[:used] = self._timestamps[:used]
+        values[:, :used] = self._values[:, :used]
+        self._timestamps, self._values = timestamps, values
+
+    def _used(self) -> int:
+        return self._size + (1 if self._live is not None else 0)
+
+    # ----- writes -----
+
+    def _write_row(self, index: int, candle: TickData) -> None:
+        self.version += 1
+        self._timestamps[index] = timestamp_to_epoch_ms(candle.timestamp)
+        for field, name in enumerate(FIELDS):
+            self._values[field, index] = _to_float(getattr(candle, name))
+        if index < len(self._timestamp_objects):
+            self._timestamp_objects[index] = candle.timestamp
+        else:
+            self._timestamp_objects.append(candle.timestamp)
+
+    def append(self, candle: TickData) -> None:
+        """Append a completed candle. Appending the live row commits it in place."""
+        if candle is self._live:
+            self.commit_live()
+            return
+
+        live = self._live
+        self._ensure_capacity(self._used() + 1)
+        if live is not None:
+            # Keep the live candle in the tail slot, after the new completed one
+            self._timestamps[self._size + 1] = self._timestamps[self._size]
+            self._values[:, self._size + 1] = self._values[:, self._size]
+            self._timestamp_objects.append(self._timestamp_objects[self._size])
+            live._index = self._size + 1
+        self._write_row(self._size, candle)
+        self._size += 1
+
+    def extend(self, candles: Iterable[TickData]) -> None:
+        for candle in candles:
+            self.append(candle)
+
+    def set_live(self, candle: Optional[TickData]) -> Optional[CandleRow]:
+        """Write `candle` into the tail slot and return the row proxy for it."""
+        if candle is None:
+            self.clear_live()
+            return None
+        if candle is self._live:
+            return self._live
+
+        self._ensure_capacity(self._size + 1)
+        self._write_row(self._size, candle)
+        self._live = CandleRow(self, self._size,
+                               symbol=getattr(candle, "symbol", self.symbol),
+                               time_increment=getattr(candle, "time_increment", self.time_increment))
+        return self._live
+
+    def commit_live(self) -> Optional[CandleRow]:
+        """Turn the live candle into the newest completed candle."""
+        live = self._live
+        if live is not None:
+            self._size += 1
+            self._live = None
+            self.version += 1
+        return live
+
+    def clear_live(self) -> None:
+        if self._live is not None:
+            del self._timestamp_objects[self._size:]
+            self._live = None
+            self.version += 1
+
+    def clear(self) -> None:
+        self._size = 0
+        self._live = None
+        self._timestamp_objects = []
+        self.version += 1
+
+    @property
+    def live(self) -> Optional[CandleRow]:
+        return self._live
+
+    # ----- reads -----
+
+    def row(self, index: int) -> CandleRow:
+        return CandleRow(self, index, symbol=self.symbol, time_increment=self.time_increment)
+
+    def column(self, field: str, include_live: bool = False) -> np.ndarray:
+        """Read-only zero-copy view of one float64 column."""
+        end = self._used() if include_live else self._size
+        view = self._values[_FIELD_INDEX[field], :end]
+        view.flags.writeable = False
+        return view
+
+    def timestamps(self, include_live: bool = False) -> np.ndarray:
+        """Read-only zero-copy view of the int64 epoch-millisecond timestamps."""
+        end = self._used() if include_live else self._size
+        view = self._timestamps[:end]
+        view.flags.writeable = False
+        return view
+
+    def ohlc_view(self, n: Optional[int] = None, include_live: bool = False) -> np.ndarray:
+        """Read-only (5, n) view of the last `n` rows as open/high/low/close/volume."""
+        end = self._used() if include_live else self._size
+        start = 0 if n is None else max(end - n, 0)
+        view = self._values[:, start:end]
+        view.flags.writeable = False
+        return view
+
+    def series(self, include_live: bool = False) -> 'CandleSeries':
+        end = self._used() if include_live else self._size
+        return CandleSeries(self, 0, end)
+
+    # ----- pickling -----
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        used = self._used()
+        state["_timestamps"] = self._timestamps[:used].copy()
+        state["_values"] = self._values[:, :used].copy()
+        state["_live"] = self._live is not None
+        return state
+
+    def __setstate__(self, state):
+        has_live = state.pop("_live")
+        self.__dict__.update(state)
+        self._live = None
+        if has_live:
+            self._live = CandleRow(self, self._size, symbol=self.symbol, time_increment=self.time_increment)
+
+
+class CandleSeries:
+    """
+    Fixed-range, list-like view over a CandleStore.
+
+    Indexing returns CandleRow proxies; slicing returns another view. Columns are
+    available as zero-copy NumPy views through closes()/highs()/lows()/... and
+    column(). copy() materializes a plain list, matching the old List[TickData] API.
+    """
+
+    __slots__ = ("_store", "_start", "_stop")
+
+    def __init__(self, store: CandleStore, start: int, stop: int):
+        self._store = store
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __bool__(self) -> bool:
+        return self._stop > self._start
+
+    def _row(self, index: int) -> CandleRow:
+        store = self._store
+        if store._live is not None and index == store._size:
+            return store._live
+        return store.row(index)
+
+    def __getitem__(self, item: Union[int, slice]):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return CandleSeries(self._store, self._start + start, self._start + max(stop, start))
+            return [self._row(self._start + i) for i in range(start, stop, step)]
+
+        length = len(self)
+        if item < 0:
+            item += length
+        if item < 0 or item >= length:
+            raise IndexError("candle index out of range")
+        return self._row(self._start + item)
+
+    def __iter__(self) -> Iterator[CandleRow]:
+        for index in range(self._start, self._stop):
+            yield self._row(index)
+
+    def __reversed__(self) -> Iterator[CandleRow]:
+        for index in range(self._stop - 1, self._start - 1, -1):
+            yield self._row(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CandleSeries, list)):
+            return len(self) == len(other) and all(a is b or _same_candle(a, b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CandleSeries({len(self)} candles)"
+
+    def copy(self) -> List[TickData]:
+        return list(self)
+
+    def column(self, field: str) -> np.ndarray:
+        view = self._store._values[_FIELD_INDEX[field], self._start:self._stop]
+        view.flags.writeable = False
+        return view
+
+    def opens(self) -> np.ndarray:
+        return self.column("open")
+
+    def highs(self) -> np.ndarray:
+        return self.column("high")
+
+    def lows(self) -> np.ndarray:
+        return self.column("low")
+
+    def closes(self) -> np.ndarray:
+        return self.column("close")
+
+    def volumes(self) -> np.ndarray:
+        return self.column("volume")
+
+    def timestamps(self) -> np.ndarray:
+        view = self._store._timestamps[self._start:self._stop]
+        view.flags.writeable = False
+        return view
+
+    def timestamp_objects(self) -> List[Any]:
+        return self._store._timestamp_objects[self._start:self._stop]
+
+    def ohlc_view(self, n: Optional[int] = None) -> np.ndarray:
+        start = self._start if n is None else max(self._stop - n, self._start)
+        view = self._store._values[:, start:self._stop]
+        view.flags.writeable = False
+        return view
+
+
+class CandleHistory(CandleSeries):
+    """
+    Live view of a store's completed candles, used as CandleAggregator.history.
+    Its length follows the store, and it supports the list mutations the
+    aggregators rely on (append/extend/clear).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, store: CandleStore):
+        super().__init__(store, 0, 0)
+
+    @property
+    def _stop(self) -> int:
+        return self._store._size
+
+    @_stop.setter
+    def _stop(self, value: int) -> None:
+        pass
+
+    def append(self, candle: TickData) -> None:
+        self._store.append(candle)
+
+    def extend(self, candles: Iterable[TickData]) -> None:
+        self._store.extend(candles)
+
+    def clear(self) -> None:
+        live = self._store.live
+        self._store.clear()
+        if live is not None:
+            self._store.set_live(live.to_tick_data())
+
+    def snapshot(self) -> CandleSeries:
+        """Fixed-length view of the candles completed so far."""
+        return CandleSeries(self._store, 0, self._store._size)
+
+
+def _same_candle(a: TickData, b: TickData) -> bool:
+    return all(getattr(a, name) == getattr(b, name) for name in FIELDS + ("timestamp",))
+
@@ -3,6 +3,7 @@ from mongo_tools.mongo_db_connect import MongoDBConnect
 from candle_aggregator.candle_aggregator_normal import CANormal
 from candle_aggregator.candle_aggregator_heiken import CAHeiken
 from candle_aggregator.candle_aggregator import CandleAggregator
+from candle_aggregator.bulk_resampler import resample_aggregators
 
 
 class CSAContainer:
@@ -23,10 +24,10 @@ class CSAContainer:
 
     def _create_aggregators(self):
         mongo_connect = MongoDBConnect()
-        raw_ticks = mongo_connect._load_raw_ticks(self.ticker, self.start_date, self.end_date)
+        tick_arrays = mongo_connect._load_raw_tick_arrays(self.ticker, self.start_date, self.end_date)
         mongo_connect.close()
 
-        if not raw_ticks:
+        if not len(tick_arrays):
             print(f"Warning: No ticks loaded for {self.ticker} {self.start_date} to {self.end_date}")
             return
 
@@ -40,16 +41,13 @@ class CSAContainer:
             else:
                 aggregator = CANormal(self.ticker, timeframe, self.include_extended_hours)
 
-            for tick in raw_ticks:
-                aggregator.process_tick(tick)
-
-            # Finalize the aggregator to complete the last candle
-            # This is critical for EOD exit logic - ensures the last candle (e.g., 15:59) is included in history
-            aggregator.finalize()
-
             self.aggregators[agg_key] = aggregator
 
-        print(f"Created {len(self.aggregators)} aggregators for {self.ticker} {self.start_date} to {self.end_date} ({len(raw_ticks)} ticks)")
+        # Build every timeframe from the tick columns, finalized so the last candle
+        # (e.g., 15:59) is included in history - critical for EOD exit logic
+        resample_aggregators(self.aggregators, tick_arrays, finalize=True)
+
+        print(f"Created {len(self.aggregators)} aggregators for {self.ticker} {self.start_date} to {self.end_date} ({len(tick_arrays)} ticks)")
 
     def get_aggregators(self) -> Dict[str, CandleAggregator]:
         return self.aggregators
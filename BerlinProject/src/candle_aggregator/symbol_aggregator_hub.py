@@ -0,0 +1,133 @@
+"""
+Shared candle aggregators for live streaming.
+
+Every monitor card (DataStreamer) on a symbol needs the same candle series for a
+given timeframe/type. The hub owns one aggregator per
+(symbol, timeframe, aggregator type, include_extended_hours) and hands it out by
+reference, so N cards on one ticker aggregate each tick once instead of N times.
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+from models.tick_data import TickData
+from candle_aggregator.candle_aggregator import CandleAggregator
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("SymbolAggregatorHub")
+
+AggregatorKey = Tuple[str, str, str, bool]  # (symbol, timeframe, agg_type, include_extended_hours)
+
+
+class SymbolAggregatorHub:
+    """
+    Owns the live candle aggregators shared by all DataStreamers.
+
+    Aggregators are reference counted: subscribe() creates or reuses one,
+    unsubscribe() drops it once no streamer uses it. process_tick() is idempotent
+    per tick object, so every DataStreamer receiving the same tick can call it and
+    only the first call advances the aggregators.
+    """
+
+    def __init__(self) -> None:
+        self._aggregators: Dict[AggregatorKey, CandleAggregator] = {}
+        self._subscribers: Dict[AggregatorKey, int] = {}
+        self._prepopulated: set = set()
+        self._last_tick: Dict[str, TickData] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(symbol: str, timeframe: str, agg_type: str, include_extended_hours: bool) -> AggregatorKey:
+        return symbol, timeframe, agg_type, bool(include_extended_hours)
+
+    def _key_for(self, aggregator: CandleAggregator) -> AggregatorKey:
+        return self.make_key(aggregator.symbol, aggregator.timeframe,
+                             aggregator._get_aggregator_type(), aggregator.include_extended_hours)
+
+    @staticmethod
+    def _create_aggregator(symbol: str, timeframe: str, agg_type: str,
+                           include_extended_hours: bool) -> CandleAggregator:
+        if agg_type == "heiken":
+            return CAHeiken(symbol, timeframe, include_extended_hours)
+        return CANormal(symbol, timeframe, include_extended_hours)
+
+    def subscribe(self, symbol: str, timeframe: str, agg_type: str,
+                  include_extended_hours: bool = True) -> CandleAggregator:
+        """Get the shared aggregator for this key, creating it on first use"""
+        key = self.make_key(symbol, timeframe, agg_type, include_extended_hours)
+        with self._lock:
+            aggregator = self._aggregators.get(key)
+            if aggregator is None:
+                aggregator = self._create_aggregator(symbol, timeframe, agg_type, include_extended_hours)
+                self._aggregators[key] = aggregator
+                self._subscribers[key] = 0
+                logger.info(f"Created shared {agg_type} aggregator for {symbol} {timeframe}")
+            self._subscribers[key] += 1
+            return aggregator
+
+    def unsubscribe(self, aggregator: CandleAggregator) -> None:
+        """Release one reference to a shared aggregator; it is dropped when unused"""
+        key = self._key_for(aggregator)
+        with self._lock:
+            if self._aggregators.get(key) is not aggregator:
+                return
+            self._subscribers[key] -= 1
+            if self._subscribers[key] <= 0:
+                del self._aggregators[key]
+                del self._subscribers[key]
+                self._prepopulated.discard(key)
+                logger.info(f"Released shared aggregator for {key[0]} {key[1]}-{key[2]}")
+                if not self.get_aggregators(key[0]):
+                    self._last_tick.pop(key[0], None)
+
+    def prepopulate(self, aggregator: CandleAggregator, data_link) -> int:
+        """
+        Load historical data into a shared aggregator once.
+
+        Later subscribers reuse the already populated (and since updated) candles.
+
+        Returns:
+            Number of candles loaded by this call (0 if already populated)
+        """
+        key = self._key_for(aggregator)
+        with self._lock:
+            if key in self._prepopulated:
+                return 0
+            self._prepopulated.add(key)
+            return aggregator.prepopulate_data(data_link)
+
+    def process_tick(self, tick_data: TickData) -> bool:
+        """
+        Advance every aggregator of the tick's symbol with this tick.
+
+        Calling again with the same tick object is a no-op, which lets each
+        DataStreamer forward the tick without aggregating it twice.
+
+        Returns:
+            True if the aggregators were advanced by this call
+        """
+        symbol = tick_data.symbol
+        with self._lock:
+            if self._last_tick.get(symbol) is tick_data:
+                return False
+            self._last_tick[symbol] = tick_data
+
+            for key, aggregator in self._aggregators.items():
+                if key[0] == symbol:
+                    aggregator.process_tick(tick_data)
+            return True
+
+    def get_aggregators(self, symbol: str) -> List[CandleAggregator]:
+        """All shared aggregators currently held for a symbol"""
+        with self._lock:
+            return [aggregator for key, aggregator in self._aggregators.items() if key[0] == symbol]
+
+    def subscriber_count(self, aggregator: CandleAggregator) -> int:
+        key = self._key_for(aggregator)
+        with self._lock:
+            return self._subscribers.get(key, 0) if self._aggregators.get(key) is aggregator else 0
+
+    def __len__(self) -> int:
+        return len(self._aggregators)
@@ -279,7 +279,7 @@ class StandaloneSchwabFetcher:
                     if existing_data:
                         self.collection.update_one(
                             {'_id': existing_doc['_id']},
-                            {'$set': {'data': existing_data}}
+                            {'$set': {'data': existing_data}, '$inc': {'version': 1}}
                         )
                         logger.debug(f"Cleared day {day} from {ticker} {year}-{month}")
                     else:
@@ -480,7 +480,7 @@ class StandaloneSchwabFetcher:
 
                     self.collection.update_one(
                         {'_id': existing_doc['_id']},
-                        {'$set': {'data': existing_data}}
+                        {'$set': {'data': existing_data}, '$inc': {'version': 1}}
                     )
                     documents_updated += 1
                     logger.info(f"📝 Updated existing document for {ticker} {year}-{month}")
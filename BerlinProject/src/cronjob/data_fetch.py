@@ -95,7 +95,7 @@ class DataFetch:
 
                     self.collection.update_one(
                         {'_id': existing_doc['_id']},
-                        {'$set': {'data': data}}
+                        {'$set': {'data': data}, '$inc': {'version': 1}}
                     )
                 else:
                     # Create new document
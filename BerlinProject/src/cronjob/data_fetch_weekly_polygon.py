@@ -355,7 +355,7 @@ def update_mongodb_data(collection, ticker: str, aggs: List[Any]) -> int:
                 # Update the document
                 collection.update_one(
                     {'_id': existing_doc['_id']},
-                    {'$set': {'data': existing_data}}
+                    {'$set': {'data': existing_data}, '$inc': {'version': 1}}
                 )
                 logger.info(f"   ✅ Updated {ticker} {year}-{month:02d}")
 
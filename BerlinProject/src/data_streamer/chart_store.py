@@ -0,0 +1,364 @@
+"""
+Materialized chart series for one card, kept up to date by the DataStreamer.
+
+The full chart-data endpoint re-runs IndicatorProcessorHistoricalNew over the whole
+session on every request. The ChartStore runs that calculation once, when the first
+incremental request seeds it. After that the DataStreamer hands it every tick, and
+each primary candle that completes gets its points appended from the indicators'
+streaming state (BaseIndicator.update), so a completed candle costs O(1) per
+indicator and requests never recalculate. `get_since` then only has to slice off
+the points newer than a client's cursor.
+"""
+
+import bisect
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from candle_aggregator.candle_aggregator import CandleAggregator
+from indicator_triggers.indicator_base import IndicatorType
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("ChartStore")
+
+Series = List[List[float]]  # [[timestamp_ms, value], ...] sorted by timestamp
+
+# Same minimum as IndicatorCalculator.calculate_indicator_batch (fewer candles score 0)
+MIN_INDICATOR_CANDLES = 10
+
+
+def _format_series(timestamps: np.ndarray, values: List) -> Series:
+    """[[ts, value]] pairs for the finite values (same filtering as ChartDataService)"""
+    values = np.asarray(values, dtype=float)[:len(timestamps)]
+    mask = np.isfinite(values)
+    return [[ts, value] for ts, value in zip(timestamps[:len(values)][mask].tolist(), values[mask].tolist())]
+
+
+def _format_candles(timestamps: np.ndarray, ohlc: np.ndarray) -> Series:
+    """[[ts, open, high, low, close]] rows from an aggregator's columns"""
+    return [[ts, o, h, l, c] for ts, o, h, l, c in zip(timestamps.tolist(), *ohlc[:4].tolist())]
+
+
+def _tail(series: List, since: int) -> List:
+    """Entries of a timestamp-sorted series newer than `since`"""
+    return series[bisect.bisect_right(series, since, key=lambda point: point[0]):]
+
+
+def _append_point(series: Series, timestamp: int, value: float) -> None:
+    if math.isfinite(value):
+        series.append([timestamp, value])
+
+
+@dataclass
+class IndicatorStream:
+    """
+    Incremental state of one indicator on the chart's primary timeline.
+
+    `aligned_raw` holds the raw value of every stored primary candle as a full
+    recalculation would give it now; the values of the candles inside coarse
+    candles that were still open are refreshed as those complete, because the
+    lookback decay of new points reads them.
+    """
+    calculator: Any  # IndicatorCalculator
+    aggregator_key: str
+    timeframe_minutes: int
+    aligned_raw: List[float]
+    settled: int  # coarse candles whose values were final when aligned_raw was last written
+    committed: List[Tuple[float, Dict[str, float]]] = field(default_factory=list)
+    committed_timestamp: Optional[int] = None  # last candle passed to update()
+
+    @property
+    def name(self) -> str:
+        return self.calculator.name
+
+    @property
+    def streaming(self) -> bool:
+        return self.calculator.indicator.supports_streaming()
+
+    @property
+    def is_trend(self) -> bool:
+        indicator = self.calculator.indicator
+        return (hasattr(indicator, 'get_indicator_type') and
+                indicator.get_indicator_type() == IndicatorType.TREND)
+
+    def commit(self, aggregator: CandleAggregator) -> bool:
+        """
+        Pass newly completed candles to the indicator's streaming state.
+
+        Returns:
+            False when the aggregator history no longer extends the committed candles
+        """
+        history = aggregator.history
+        count = len(self.committed)
+        if count > len(history) or (count and int(aggregator.timestamps_ms()[count - 1]) != self.committed_timestamp):
+            return False
+        for candle in history[count:]:
+            self.committed.append(self.calculator.indicator.update(candle))
+        if len(history) > count:
+            self.committed_timestamp = int(aggregator.timestamps_ms()[len(history) - 1])
+        return True
+
+    def value_lookup(self, aggregator: CandleAggregator) -> Callable[[int], Tuple[float, Dict[str, float]]]:
+        """(value, components) of the aggregator's candle at an index, in-progress candle included"""
+        if not self.streaming:
+            # No streaming support: recalculate this indicator (only) over its candles
+            raw_values, components, _ = self.calculator.calculate_indicator_batch(aggregator.get_candles())
+            raw_values = np.asarray(raw_values, dtype=float)
+            components = {name: np.asarray(values, dtype=float) for name, values in components.items()}
+            return lambda index: (float(raw_values[index]),
+                                  {name: float(values[index]) for name, values in components.items()
+                                   if index < len(values)})
+
+        current_candle = aggregator.get_current_candle()
+        current: List[Tuple[float, Dict[str, float]]] = []
+
+        def lookup(index: int) -> Tuple[float, Dict[str, float]]:
+            if index < len(self.committed):
+                return self.committed[index]
+            if not current:
+                current.append(self.calculator.indicator.update_current(current_candle))
+            return current[0]
+        return lookup
+
+
+class ChartStore:
+    """
+    Chart series of a card (candles per aggregator, indicator/raw/component
+    histories, bar scores) on the primary timeline, covering completed candles only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.seeded: bool = False
+        self.primary_agg_key: Optional[str] = None
+        self.candles: Dict[str, Series] = {}
+        self.indicator_history: Dict[str, Series] = {}
+        self.raw_indicator_history: Dict[str, Series] = {}
+        self.component_history: Dict[str, Series] = {}
+        self.bar_scores: List[Dict] = []
+        self.indicator_agg_mapping: Dict[str, str] = {}
+        self._candle_spans: Dict[str, int] = {}  # candle length (ms) per aggregator
+        self._series_cursor: Optional[int] = None  # primary candle the series were calculated up to
+        self._monitor_config = None
+        self._processor = None  # IndicatorProcessorHistoricalNew of the seed (bar score plans)
+        self._streams: List[IndicatorStream] = []
+
+    @property
+    def cursor(self) -> Optional[int]:
+        """Timestamp (ms) of the newest completed primary candle in the store"""
+        primary = self.candles.get(self.primary_agg_key)
+        return primary[-1][0] if primary else None
+
+    def ensure_current(self, aggregators: Dict[str, CandleAggregator], monitor_config) -> None:
+        """
+        Seed the store on first use; afterwards append the points of candles
+        completed since the last update (normally the DataStreamer already has).
+        """
+        with self._lock:
+            if not self.seeded:
+                # Primary timeline is the first aggregator (same as ChartDataService)
+                self.primary_agg_key = next(iter(aggregators), None)
+                self._monitor_config = monitor_config
+                self._append_candles(aggregators)
+                self._calculate_series(aggregators)
+                self.seeded = True
+                logger.info(f"Seeded chart store: {len(self.bar_scores)} primary candles, "
+                            f"{len(self.indicator_history)} indicators, "
+                            f"{len(self.component_history)} components")
+                return
+
+            self._append_candles(aggregators)
+            self._extend_series(aggregators)
+
+    def update(self, aggregators: Dict[str, CandleAggregator]) -> int:
+        """
+        Append candles completed since the last call, and the indicator points of
+        the new primary candles. No-op until the store is seeded.
+
+        Returns:
+            Number of primary candles appended
+        """
+        if not self.seeded:
+            return 0
+
+        with self._lock:
+            appended = self._append_candles(aggregators)
+            if appended:
+                try:
+                    self._extend_series(aggregators)
+                except Exception as e:
+                    # Runs on the tick path: the next candle or request catches up
+                    logger.error(f"Chart store update failed: {e}")
+            return appended
+
+    def _calculate_series(self, aggregators: Dict[str, CandleAggregator]) -> None:
+        """
+        Indicator, raw, component and bar-score series of the stored primary candles,
+        recalculated from scratch, and the streaming state the next candles extend.
+
+        The live IndicatorProcessor values already include the in-progress candle, so
+        they cannot stand in for a completed candle's values. The historical processor
+        is run instead, which makes the series identical to the full chart-data endpoint.
+        """
+        from optimization.calculators.indicator_processor_historical_new import IndicatorProcessorHistoricalNew
+
+        processor = IndicatorProcessorHistoricalNew(self._monitor_config)
+        (indicator_history, raw_indicator_history, bar_score_history,
+         component_history, indicator_agg_mapping) = processor.calculate_indicators(aggregators)
+        self.indicator_agg_mapping = dict(indicator_agg_mapping)
+
+        # The historical values also cover the in-progress candle (and candles that
+        # completed after the candles were stored); keep the stored candles' points only
+        timestamps = np.array([row[0] for row in self.candles.get(self.primary_agg_key, [])], dtype=np.int64)
+        self.indicator_history = {name: _format_series(timestamps, values)
+                                  for name, values in indicator_history.items()}
+        self.raw_indicator_history = {name: _format_series(timestamps, values)
+                                      for name, values in raw_indicator_history.items()}
+        self.component_history = {name: _format_series(timestamps, values)
+                                  for name, values in component_history.items()}
+
+        bar_names = list(bar_score_history.keys())
+        bar_values = {name: np.nan_to_num(np.asarray(values, dtype=float)[:len(timestamps)],
+                                          nan=0.0, posinf=0.0, neginf=0.0).tolist()
+                      for name, values in bar_score_history.items()}
+        self.bar_scores = [{'timestamp': ts, 'scores': {name: bar_values[name][i] for name in bar_names
+                                                         if i < len(bar_values[name])}}
+                           for i, ts in enumerate(timestamps.tolist())]
+        self._series_cursor = self.cursor
+
+        self._processor = processor
+        self._streams = []
+        for calculator in processor.indicator_calculators:
+            aggregator_key = calculator.get_aggregator_key()
+            aggregator = aggregators[aggregator_key]
+            stream = IndicatorStream(
+                calculator=calculator, aggregator_key=aggregator_key,
+                timeframe_minutes=aggregator.get_timeframe_minutes(),
+                aligned_raw=np.asarray(raw_indicator_history.get(calculator.name, []),
+                                       dtype=float)[:len(timestamps)].tolist(),
+                settled=len(aggregator.history))
+            if stream.streaming:
+                stream.commit(aggregator)
+            self._streams.append(stream)
+
+    def _extend_series(self, aggregators: Dict[str, CandleAggregator]) -> None:
+        """
+        Append the points of the primary candles stored since the last calculation.
+        Falls back to a full recalculation while an indicator has too few candles to
+        score, or when an aggregator's history was replaced.
+        """
+        primary = aggregators.get(self.primary_agg_key)
+        if primary is None or self._series_cursor == self.cursor:
+            return
+
+        incremental = (
+            self._processor is not None
+            # Series are stamped on the first aggregator but calculated on the shortest one
+            and primary.get_timeframe_minutes() == min(agg.get_timeframe_minutes() for agg in aggregators.values())
+            and all(len(aggregators[stream.aggregator_key].get_candles()) >= MIN_INDICATOR_CANDLES
+                    for stream in self._streams)
+            and all(stream.commit(aggregators[stream.aggregator_key]) for stream in self._streams if stream.streaming))
+        if incremental:
+            try:
+                self._append_points(aggregators, primary.timestamps_ms())
+                return
+            except Exception as e:
+                logger.error(f"Appending chart points failed, recalculating the series: {e}")
+        self._calculate_series(aggregators)
+
+    def _append_points(self, aggregators: Dict[str, CandleAggregator], primary_timestamps: np.ndarray) -> None:
+        """Indicator, raw, component and bar-score points of the new primary candles"""
+        from optimization.calculators.indicator_processor_historical_new import lookback_decay
+
+        first_new = len(self.bar_scores)  # one bar-score entry per stored primary candle
+        new_timestamps = primary_timestamps[first_new:].tolist()
+        primary_minutes = self._processor.primary_timeframe_minutes
+        new_decayed: Dict[str, List[float]] = {}
+
+        for stream in self._streams:
+            aggregator = aggregators[stream.aggregator_key]
+            value_at = stream.value_lookup(aggregator)
+            coarse_timestamps = aggregator.timestamps_ms(include_current=True)
+
+            # Primary candles inside coarse candles that were still open last time get
+            # their current values (the decay below reads them), then the new ones follow
+            refresh_from = first_new
+            if stream.settled < len(coarse_timestamps):
+                refresh_from = min(first_new, int(np.searchsorted(
+                    primary_timestamps, coarse_timestamps[stream.settled], side='left')))
+            coarse_indexes = np.searchsorted(coarse_timestamps, primary_timestamps[refresh_from:], side='right') - 1
+            del stream.aligned_raw[refresh_from:]
+
+            lookback = stream.calculator.config.parameters.get('lookback', None)
+            window = int(lookback * stream.timeframe_minutes / primary_minutes) if lookback else 0
+            decayed_values = new_decayed.setdefault(stream.name, [])
+            for position, coarse_index in enumerate(coarse_indexes.tolist(), start=refresh_from):
+                value, components = value_at(coarse_index) if coarse_index >= 0 else (0.0, {})
+                stream.aligned_raw.append(value)
+                if position < first_new:
+                    continue
+
+                if stream.is_trend or not lookback:
+                    decayed = value
+                elif window > 0:
+                    decayed = float(lookback_decay(stream.aligned_raw[max(0, position - window + 1):], window)[-1])
+                else:
+                    decayed = 0.0
+                decayed_values.append(decayed)
+
+                timestamp = new_timestamps[position - first_new]
+                _append_point(self.raw_indicator_history.setdefault(stream.name, []), timestamp, value)
+                _append_point(self.indicator_history.setdefault(stream.name, []), timestamp, decayed)
+                for component_name, component_value in components.items():
+                    _append_point(self.component_history.setdefault(f"{stream.name}_{component_name}", []),
+                                  timestamp, float(component_value))
+            stream.settled = len(aggregator.history)
+
+        bar_score_history = self._processor._calculate_bar_scores_batch(new_decayed, len(new_timestamps))
+        bar_values = {name: np.nan_to_num(np.asarray(values, dtype=float),
+                                          nan=0.0, posinf=0.0, neginf=0.0).tolist()
+                      for name, values in bar_score_history.items()}
+        self.bar_scores.extend({'timestamp': ts, 'scores': {name: values[i] for name, values in bar_values.items()}}
+                               for i, ts in enumerate(new_timestamps))
+        self._series_cursor = self.cursor
+
+    def _append_candles(self, aggregators: Dict[str, CandleAggregator]) -> int:
+        new_primary = 0
+        for agg_key, aggregator in aggregators.items():
+            timestamps = aggregator.timestamps_ms()
+            rows = self.candles.setdefault(agg_key, [])
+            self._candle_spans.setdefault(agg_key, aggregator.get_timeframe_minutes() * 60000)
+            start = int(np.searchsorted(timestamps, rows[-1][0], side='right')) if rows else 0
+            if start >= len(timestamps):
+                continue
+            rows.extend(_format_candles(timestamps[start:], aggregator.ohlc_view(len(timestamps) - start)))
+            if agg_key == self.primary_agg_key:
+                new_primary = len(timestamps) - start
+        return new_primary
+
+    def get_since(self, since: int) -> Dict[str, Any]:
+        """Chart points with a timestamp after `since` (ms), plus the new cursor"""
+        with self._lock:
+            # A longer candle that started before the cursor may have completed after
+            # the cursor's primary candle: select candles by when they completed
+            primary_span = self._candle_spans.get(self.primary_agg_key, 0)
+            per_aggregator_candles = {
+                agg_key: _tail(rows, since + primary_span - self._candle_spans.get(agg_key, primary_span))
+                for agg_key, rows in self.candles.items()}
+            return {
+                'since': since,
+                'cursor': self.cursor,
+                'primary_agg_key': self.primary_agg_key,
+                'candlestick_data': per_aggregator_candles.get(self.primary_agg_key, []),
+                'per_aggregator_candles': per_aggregator_candles,
+                'indicator_agg_mapping': self.indicator_agg_mapping,
+                'indicator_history': {name: _tail(series, since) for name, series in self.indicator_history.items()},
+                'raw_indicator_history': {name: _tail(series, since)
+                                          for name, series in self.raw_indicator_history.items()},
+                'component_history': {name: _tail(series, since) for name, series in self.component_history.items()},
+                'bar_scores_formatted': self.bar_scores[bisect.bisect_right(
+                    self.bar_scores, since, key=lambda entry: entry['timestamp']):],
+            }
@@ -11,8 +11,10 @@ from data_streamer.indicator_processor import IndicatorProcessor
 from candle_aggregator.candle_aggregator import CandleAggregator
 from candle_aggregator.candle_aggregator_normal import CANormal
 from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from candle_aggregator.symbol_aggregator_hub import SymbolAggregatorHub
 from models.monitor_configuration import MonitorConfiguration
 from data_streamer.external_tool import ExternalTool
+from data_streamer.chart_store import ChartStore
 # ONLY CHANGE: Import unified trade executor instead of simple
 from portfolios.trade_executor_unified import TradeExecutorUnified
 from mlf_utils.log_manager import LogManager
@@ -25,20 +27,26 @@ class DataStreamer:
     DataStreamer with simple aggregator type selection
     """
 
-    def __init__(self, card_id: str, symbol: str, monitor_config: MonitorConfiguration, include_extended_hours: bool = True):
+    def __init__(self, card_id: str, symbol: str, monitor_config: MonitorConfiguration, include_extended_hours: bool = True,
+                 aggregator_hub: Optional[SymbolAggregatorHub] = None):
         self.card_id = card_id
         self.symbol = symbol
         self.monitor_config = monitor_config
         self.include_extended_hours = include_extended_hours
+        # When set, aggregators are shared with every other card on this symbol
+        self.aggregator_hub: Optional[SymbolAggregatorHub] = aggregator_hub
 
         aggregator_configs = monitor_config.get_aggregator_configs()
         self.aggregators: Dict[str, CandleAggregator] = {}
 
         for agg_key, agg_type in aggregator_configs.items():
             timeframe = agg_key.split('-')[0]  # Extract timeframe from key
-            aggregator = self._create_aggregator(agg_type, symbol, timeframe)
+            if aggregator_hub is not None:
+                aggregator = aggregator_hub.subscribe(symbol, timeframe, agg_type, include_extended_hours)
+            else:
+                aggregator = self._create_aggregator(agg_type, symbol, timeframe)
+                logger.info(f"Created {agg_type} aggregator for {timeframe}")
             self.aggregators[agg_key] = aggregator  # ← Store with unique key!
-            logger.info(f"Created {agg_type} aggregator for {timeframe}")
 
         # Processing components
         self.indicator_processor: IndicatorProcessor = IndicatorProcessor(monitor_config)
@@ -52,6 +60,9 @@ class DataStreamer:
         self.raw_indicators: Dict[str, float] = {}
         self.bar_scores: Dict[str, float] = {}
 
+        # Materialized chart series for incremental chart-data requests (seeded on first use)
+        self.chart_store: ChartStore = ChartStore()
+
         logger.info(f"DataStreamer initialized for {symbol}")
         logger.info(f"Trade Executor Config: {monitor_config.trade_executor}")
 
@@ -62,16 +73,22 @@ class DataStreamer:
         if tick_data.symbol != self.symbol:
             return
 
-        # Process tick through all aggregators
-        for timeframe, aggregator in self.aggregators.items():
-            completed_candle = aggregator.process_tick(tick_data)
-            if completed_candle is not None:
-                logger.debug(f"Completed {timeframe} {aggregator._get_aggregator_type()} candle")
+        # Process tick through all aggregators (shared ones are advanced once per tick by the hub)
+        if self.aggregator_hub is not None:
+            self.aggregator_hub.process_tick(tick_data)
+        else:
+            for timeframe, aggregator in self.aggregators.items():
+                completed_candle = aggregator.process_tick(tick_data)
+                if completed_candle is not None:
+                    logger.debug(f"Completed {timeframe} {aggregator._get_aggregator_type()} candle")
 
         # Calculate indicators based on current aggregator state
         self.indicators, self.raw_indicators, self.bar_scores = (
             self.indicator_processor.calculate_indicators_new(self.aggregators))
 
+        # Append completed candles to the chart store
+        self.chart_store.update(self.aggregators)
+
         # Execute trading logic
         self.trade_executor.make_decision(
             tick=tick_data,
@@ -79,6 +96,11 @@ class DataStreamer:
             bar_scores=self.bar_scores
         )
 
+        # Skip the UI-only work below while no tool needs this card's updates
+        tools = [tool for tool in self.external_tools if tool.wants_updates(self.card_id)]
+        if not tools:
+            return
+
         # Get portfolio performance metrics
         portfolio_metrics = self.trade_executor.portfolio.get_performance_metrics(tick_data.close)
 
@@ -92,7 +114,7 @@ class DataStreamer:
         }
 
         # Send data to external tools (including component data and data status)
-        for tool in self.external_tools:
+        for tool in tools:
             tool.process_tick(
                 card_id=self.card_id,
                 symbol=self.symbol,
@@ -106,6 +128,14 @@ class DataStreamer:
                 thresholds=thresholds
             )
 
+    def release_aggregators(self) -> None:
+        """Return shared aggregators to the hub (call when the card is removed)"""
+        if self.aggregator_hub is None:
+            return
+        for aggregator in self.aggregators.values():
+            self.aggregator_hub.unsubscribe(aggregator)
+        self.aggregators = {}
+
     def _create_aggregator(self, agg_type: str, symbol: str, timeframe: str) -> CandleAggregator:
         """
         Create appropriate aggregator based on type
@@ -259,7 +289,11 @@ class DataStreamer:
         try:
             for agg_key, aggregator in self.aggregators.items():
                 # Use prepopulate_data method from base CandleAggregator class
-                candles_loaded = aggregator.prepopulate_data(data_link)
+                # (shared aggregators are only populated by the first card that loads them)
+                if self.aggregator_hub is not None:
+                    candles_loaded = self.aggregator_hub.prepopulate(aggregator, data_link)
+                else:
+                    candles_loaded = aggregator.prepopulate_data(data_link)
                 logger.info(f"Loaded {candles_loaded} historical candles for {agg_key}")
 
             # After loading historical data, calculate initial indicators
@@ -397,12 +431,7 @@ class DataStreamer:
         all_data: Dict[str, List[TickData]] = {}
 
         for agg_key, aggregator in self.aggregators.items():
-            history: List[TickData] = aggregator.get_history().copy()
-            current: Optional[TickData] = aggregator.get_current_candle()
-
-            if current:
-                history.append(current)
-
-            all_data[agg_key] = history
+            # History + current candle as one zero-copy view over the aggregator's columns
+            all_data[agg_key] = aggregator.get_candles()
 
         return all_data
\ No newline at end of file
@@ -27,6 +27,11 @@ class ExternalTool(ABC):
     def handle_completed_candle(self, symbol: str, candle: TickData) -> None:
         pass
 
+    # Not required to be implemented: False lets the DataStreamer skip building
+    # UI-only data (portfolio metrics, data status) for this card's ticks
+    def wants_updates(self, card_id: str) -> bool:
+        return True
+
     def process_tick(self, card_id: str, symbol: str, tick_data: TickData,
                      indicators: Dict[str, float], raw_indicators: Dict[str, float],
                      bar_scores: Dict[str, float], portfolio_metrics: Optional[Dict[str, Any]] = None,
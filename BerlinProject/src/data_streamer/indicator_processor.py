@@ -2,9 +2,10 @@
 Enhanced IndicatorProcessor with proper history tracking - Refactored to use IndicatorRegistry
 """
 
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Hashable
 from datetime import datetime
 import math
+import weakref
 import numpy as np
 
 from candle_aggregator.candle_aggregator import CandleAggregator
@@ -21,11 +22,25 @@ from mlf_utils.log_manager import LogManager
 logger = LogManager().get_logger("IndicatorProcessor")
 
 
+def freeze_parameters(value) -> Hashable:
+    """Convert an indicator parameter structure into a hashable, order-independent key"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze_parameters(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze_parameters(item) for item in value)
+    return value
+
+
 class IndicatorProcessor:
     """
     Processes indicators for completed candles with time-based decay and history tracking
     """
 
+    # Latest results shared by every processor reading the same aggregator:
+    # aggregator -> {(agg_key, indicator_class, frozen params): (aggregator version, result)}
+    # Identical indicator definitions (across bars or cards) are computed once per tick.
+    _result_cache: "weakref.WeakKeyDictionary[CandleAggregator, Dict]" = weakref.WeakKeyDictionary()
+
     def __init__(self, configuration: MonitorConfiguration) -> None:
         self.config: MonitorConfiguration = configuration
         self.stored_values: Dict[str, Dict[str, any]] = {}
@@ -56,6 +71,14 @@ class IndicatorProcessor:
         self.indicator_objects: Dict[str, any] = {}
         self._initialize_indicators()
 
+        # Incremental state for streaming indicators: name -> (committed candle count, last committed timestamp)
+        self._stream_positions: Dict[str, Tuple[int, any]] = {}
+        self._stream_last_results: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+        # Result cache statistics for this processor
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
         # Calculate required ticks based on indicator parameters
         self._calculate_required_ticks()
 
@@ -222,13 +245,6 @@ class IndicatorProcessor:
             if indicator_key not in self.indicator_trigger_history:
                 self.indicator_trigger_history[indicator_key] = []
 
-            # Get all candles from this aggregator (history + current)
-            all_candles = aggregator.get_history().copy()
-            if aggregator.get_current_candle():
-                all_candles.append(aggregator.get_current_candle())
-
-            # Skip debug output for performance
-
             # Determine if we should calculate (on PIP or when candle completes)
             calc_on_pip = indicator_def.calc_on_pip or self.first_pass
             should_calculate = calc_on_pip or aggregator.completed_candle
@@ -236,7 +252,7 @@ class IndicatorProcessor:
             if should_calculate:
                 try:
                     # Calculate the indicator (now returns tuple of result and components)
-                    result, components = self._calculate_single_indicator(all_candles, indicator_def)
+                    result, components = self._cached_latest_indicator(aggregator, agg_key, indicator_def)
 
                     if result is not None and len(result) > 0:
                         raw_value = float(result[-1])
@@ -257,7 +273,8 @@ class IndicatorProcessor:
                             # SIGNAL indicators: apply time-based decay
                             self.indicator_trigger_history[indicator_key].append(raw_value)
                             lookback = indicator_def.parameters.get('lookback', 10)
-                            trigger_history = np.array(self.indicator_trigger_history[indicator_key])
+                            # Only the last `lookback` triggers can affect the decay
+                            trigger_history = np.array(self.indicator_trigger_history[indicator_key][-lookback:])
                             decay_value = self.calculate_time_based_metric(trigger_history, lookback)
                             self.indicators[indicator_def.name] = decay_value
 
@@ -343,6 +360,89 @@ class IndicatorProcessor:
         return metric
 
 
+    def _cached_latest_indicator(self,
+                                 aggregator: CandleAggregator,
+                                 agg_key: str,
+                                 indicator_def) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Return the latest indicator result, reusing one already computed for the same
+        aggregator version, indicator class and parameters.
+
+        The cached arrays are shared between processors and must not be modified.
+        """
+        indicator = self.indicator_objects.get(indicator_def.name)
+        parameters = indicator.config.parameters if indicator is not None else indicator_def.parameters
+        key = (agg_key, indicator_def.indicator_class, freeze_parameters(parameters or {}))
+
+        try:
+            results = self._result_cache.setdefault(aggregator, {})
+            cached = results.get(key)
+        except TypeError:  # Unhashable parameter values: calculate without caching
+            return self._calculate_latest_indicator(aggregator, indicator_def)
+
+        version = aggregator.version
+        if cached is not None and cached[0] == version:
+            self.cache_hits += 1
+            return cached[1]
+
+        self.cache_misses += 1
+        result = self._calculate_latest_indicator(aggregator, indicator_def)
+        results[key] = (version, result)
+        return result
+
+    def _calculate_latest_indicator(self,
+                                    aggregator: CandleAggregator,
+                                    indicator_def) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Calculate an indicator for the aggregator's latest candle.
+
+        Indicators that support streaming are advanced incrementally over the newly
+        completed candles and evaluated on the in-progress candle without committing it.
+        Other indicators fall back to a full recalculation over history + current candle.
+        Only the last element of the returned arrays is meaningful to the caller.
+        """
+        indicator = self.indicator_objects.get(indicator_def.name)
+        if indicator is None or not indicator.supports_streaming():
+            return self._calculate_single_indicator(aggregator.get_candles(), indicator_def)
+
+        current_candle = aggregator.get_current_candle()
+        history = aggregator.history
+        if len(history) + (1 if current_candle else 0) < 10:  # Need minimum data
+            return np.array([0.0]), {}
+
+        try:
+            value, components = self._stream_indicator(indicator, indicator_def.name, history, current_candle)
+        except Exception as e:
+            logger.error(f"Error calculating indicator '{indicator_def.name}': {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            self._stream_positions.pop(indicator_def.name, None)
+            return np.array([0.0]), {}
+
+        return np.array([value]), {name: np.array([component]) for name, component in components.items()}
+
+    def _stream_indicator(self, indicator, name: str, history: List[TickData],
+                          current_candle) -> Tuple[float, Dict[str, float]]:
+        """Commit any new completed candles to a streaming indicator and evaluate the current one."""
+        position, last_timestamp = self._stream_positions.get(name, (0, None))
+
+        # Restart the series if the aggregator history no longer extends what was fed
+        # (e.g. prepopulated or replaced history)
+        if position > len(history) or (position > 0 and history[position - 1].timestamp != last_timestamp):
+            position = 0
+        if position == 0:
+            indicator.reset_stream()
+            self._stream_last_results.pop(name, None)
+
+        for candle in history[position:]:
+            self._stream_last_results[name] = indicator.update(candle)
+        if len(history) > position:
+            self._stream_positions[name] = (len(history), history[-1].timestamp)
+
+        if current_candle:
+            return indicator.update_current(current_candle)
+        return self._stream_last_results.get(name, (0.0, {}))
+
     def _calculate_single_indicator(self,
                                     tick_history: List[TickData],
                                     indicator_def) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
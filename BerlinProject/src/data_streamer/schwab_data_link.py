@@ -395,6 +395,7 @@ class SchwabDataLink(DataLink):
                 logger.debug(f"Processing TickData for {symbol}: ${tick_data.close}")
 
                 # Pass TickData to all registered DataStreamers for this symbol
+                # (streamers sharing a SymbolAggregatorHub aggregate the tick only once)
                 if symbol in self.data_streamers:
                     for data_streamer in self.data_streamers[symbol]:
                         try:
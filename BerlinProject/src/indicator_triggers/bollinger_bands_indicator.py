@@ -1,12 +1,14 @@
 """Bollinger Bands Lower Band Bounce signal indicator."""
 
 import math
+from collections import deque
 from typing import List, Tuple, Dict, Any
 import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
+from indicator_triggers.streaming_state import RollingSMA, RollingStdDev
 
 
 class BollingerBandsLowerBandBounceIndicator(BaseIndicator):
@@ -92,7 +94,7 @@ class BollingerBandsLowerBandBounceIndicator(BaseIndicator):
         if len(tick_data) < period:
             return np.array([math.nan] * len(tick_data)), {}
 
-        closes = np.array([tick.close for tick in tick_data])
+        closes = candle_column(tick_data, "close")
         upper, middle, lower = ta.BBANDS(closes, period, sd, sd)
 
         signals = np.zeros(len(closes))
@@ -130,5 +132,59 @@ class BollingerBandsLowerBandBounceIndicator(BaseIndicator):
         }
         return signals, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        period = self.get_parameter("period")
+        self._middle_sma = RollingSMA(period)
+        self._stddev = RollingStdDev(period)
+        self._touches: deque = deque(maxlen=int(self.get_parameter("candle_bounce_number")))
+        self._prev_bounce_percentage = np.float64(math.nan)
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        sd = self.get_parameter("sd")
+        candle_bounce_number = int(self.get_parameter("candle_bounce_number"))
+        bounce_trigger = self.get_parameter("bounce_trigger")
+        close = np.float64(candle.close)
+        index = self._stream_length
+
+        if commit:
+            middle = self._middle_sma.push(candle.close)
+            deviation = self._stddev.push(candle.close, middle)
+        else:
+            middle = self._middle_sma.peek(candle.close)
+            deviation = self._stddev.peek(candle.close, middle)
+        upper = np.float64(middle + sd * deviation)
+        lower = np.float64(middle - sd * deviation)
+
+        # numpy scalar division keeps calculate()'s inf/NaN behaviour on flat bands
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.get_parameter("trend") == 'bullish':
+                touched = close <= lower
+                bounce_percentage = (close - lower) / (middle - lower)
+            else:  # bearish
+                touched = close >= upper
+                bounce_percentage = (upper - close) / (upper - middle)
+
+        signal = 0.0
+        if index >= candle_bounce_number and any(self._touches):
+            if (bounce_percentage >= bounce_trigger and
+                    (index == candle_bounce_number or self._prev_bounce_percentage < bounce_trigger)):
+                signal = 1.0
+
+        if commit:
+            self._touches.append(bool(touched))
+            self._prev_bounce_percentage = bounce_percentage
+
+        if index + 1 < self.get_parameter("period"):
+            return math.nan, {}
+        return signal, {
+            f"{self.name()}_upper": float(upper),
+            f"{self.name()}_middle": float(middle),
+            f"{self.name()}_lower": float(lower)
+        }
+
 
 IndicatorRegistry().register(BollingerBandsLowerBandBounceIndicator)
@@ -5,7 +5,7 @@ import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
 
 
 class CDLPatternIndicator(BaseIndicator):
@@ -78,10 +78,10 @@ class CDLPatternIndicator(BaseIndicator):
             return np.array([0.0] * len(tick_data)), {}
 
         # Extract OHLC data
-        opens = np.array([tick.open for tick in tick_data])
-        highs = np.array([tick.high for tick in tick_data])
-        lows = np.array([tick.low for tick in tick_data])
-        closes = np.array([tick.close for tick in tick_data])
+        opens = candle_column(tick_data, "open")
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
+        closes = candle_column(tick_data, "close")
 
         # Initialize result array
         result = np.zeros(len(tick_data))
@@ -13,6 +13,18 @@ from models.tick_data import TickData
 from mlf_utils.singleton import Singleton
 
 
+def candle_column(tick_data, field: str) -> np.ndarray:
+    """Float64 array of one OHLCV field for a candle sequence.
+
+    Aggregator candle views (CandleSeries) hand back a zero-copy column; plain
+    lists of TickData are converted element by element.
+    """
+    column = getattr(tick_data, "column", None)
+    if column is not None:
+        return column(field)
+    return np.array([getattr(tick, field) for tick in tick_data], dtype=np.float64)
+
+
 class ParameterType(Enum):
     INTEGER = "integer"
     FLOAT = "float"
@@ -180,6 +192,58 @@ class BaseIndicator(ABC):
         """Calculate indicator values for given tick data."""
         pass
 
+    def supports_streaming(self) -> bool:
+        """Return True if this indicator implements the incremental update() path.
+
+        Streaming indicators keep O(1) rolling state per candle instead of
+        recalculating over the full history. Override in subclasses that implement
+        reset_stream() and _stream_step().
+        """
+        return False
+
+    def reset_stream(self) -> None:
+        """Reset the incremental state so the next update() starts a new series.
+
+        Streaming subclasses extend this (calling super()) to rebuild their rolling state.
+        """
+        self._stream_length = 0
+
+    def update(self, candle: TickData) -> Tuple[float, Dict[str, float]]:
+        """Commit a completed candle to the rolling state.
+
+        Returns:
+            Tuple of (value, components) for that candle, matching the last element
+            of calculate() over the full history up to and including it.
+        """
+        self._ensure_stream()
+        result = self._stream_step(candle, commit=True)
+        self._stream_length += 1
+        return result
+
+    def update_current(self, candle: TickData) -> Tuple[float, Dict[str, float]]:
+        """Evaluate the in-progress candle against the rolling state without committing it.
+
+        Can be called any number of times per candle as ticks arrive; the state only
+        advances when the completed candle is passed to update().
+        """
+        self._ensure_stream()
+        return self._stream_step(candle, commit=False)
+
+    def _ensure_stream(self) -> None:
+        if not self.supports_streaming():
+            raise NotImplementedError(f"{self.__class__.__name__} does not support streaming updates")
+        if not getattr(self, '_stream_initialized', False):
+            self.reset_stream()
+            self._stream_initialized = True
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        """Advance (or peek) the rolling state by one candle. Streaming subclasses override.
+
+        self._stream_length holds the number of committed candles, so the series
+        length including this candle is self._stream_length + 1.
+        """
+        raise NotImplementedError
+
     def calculate_levels(self, tick_data: List[TickData], signals: np.ndarray,
                          component_data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate target price and stop loss levels for signals.
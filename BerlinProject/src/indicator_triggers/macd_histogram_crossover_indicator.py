@@ -6,7 +6,8 @@ import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
+from indicator_triggers.streaming_state import RollingEMA
 
 
 class MACDHistogramCrossoverIndicator(BaseIndicator):
@@ -125,7 +126,7 @@ class MACDHistogramCrossoverIndicator(BaseIndicator):
         if len(tick_data) < slow + signal:
             return np.array([math.nan] * len(tick_data)), {}
 
-        closes = np.array([tick.close for tick in tick_data], dtype=np.float64)
+        closes = candle_column(tick_data, "close")
         macd, signal_line, histogram = ta.MACD(closes, fastperiod=fast, slowperiod=slow, signalperiod=signal)
 
         component_data = {
@@ -154,5 +155,52 @@ class MACDHistogramCrossoverIndicator(BaseIndicator):
 
         return result, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        # TA-Lib swaps the periods when slow < fast, and seeds the fast EMA so it
+        # lines up with the slow one
+        fast, slow = sorted((self.get_parameter("fast"), self.get_parameter("slow")))
+        self._fast_ema = RollingEMA(fast, skip=slow - fast)
+        self._slow_ema = RollingEMA(slow)
+        self._signal_ema = RollingEMA(self.get_parameter("signal"))
+        self._prev_crossed = False
+        self._prev_valid = False
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        histogram_threshold = self.get_parameter("histogram_threshold")
+
+        if commit:
+            macd = self._fast_ema.push(candle.close) - self._slow_ema.push(candle.close)
+            signal_line = self._signal_ema.push(macd) if not math.isnan(macd) else math.nan
+        else:
+            macd = self._fast_ema.peek(candle.close) - self._slow_ema.peek(candle.close)
+            signal_line = self._signal_ema.peek(macd) if not math.isnan(macd) else math.nan
+
+        histogram = macd - signal_line
+        valid = not math.isnan(histogram)
+        if not valid:
+            # TA-Lib leaves the MACD line unset until the signal line is available
+            macd = math.nan
+
+        if self.get_parameter("trend") == 'bullish':
+            crossed = histogram > histogram_threshold
+        else:  # bearish
+            crossed = histogram < -histogram_threshold
+
+        result = 1.0 if (crossed and not self._prev_crossed and valid and self._prev_valid) else 0.0
+        if commit:
+            self._prev_crossed, self._prev_valid = crossed, valid
+
+        if self._stream_length + 1 < self.get_parameter("slow") + self.get_parameter("signal"):
+            return math.nan, {}
+        return result, {
+            f"{self.name()}_macd": macd,
+            f"{self.name()}_signal": signal_line,
+            f"{self.name()}_histogram": histogram
+        }
+
 
 IndicatorRegistry().register(MACDHistogramCrossoverIndicator)
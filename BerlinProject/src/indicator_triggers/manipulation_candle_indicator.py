@@ -18,7 +18,7 @@ import talib as ta
 
 from models.tick_data import TickData
 from indicator_triggers.indicator_base import (
-    BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+    BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
 )
 
 
@@ -150,10 +150,10 @@ class ManipulationCandleIndicator(BaseIndicator):
             return signals, empty
 
         # Pre-compute OHLC arrays
-        opens = np.array([t.open for t in tick_data])
-        highs = np.array([t.high for t in tick_data])
-        lows = np.array([t.low for t in tick_data])
-        closes = np.array([t.close for t in tick_data])
+        opens = candle_column(tick_data, "open")
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
+        closes = candle_column(tick_data, "close")
 
         # Pre-compute TA-Lib reversal patterns across all data
         hammer = ta.CDLHAMMER(opens, highs, lows, closes)
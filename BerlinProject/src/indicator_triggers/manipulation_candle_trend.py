@@ -21,7 +21,7 @@ import talib as ta
 
 from models.tick_data import TickData
 from indicator_triggers.indicator_base import (
-    BaseIndicator, ParameterSpec, ParameterType, IndicatorType, IndicatorRegistry
+    BaseIndicator, ParameterSpec, ParameterType, IndicatorType, IndicatorRegistry, candle_column
 )
 
 
@@ -156,9 +156,9 @@ class ManipulationCandleTrend(BaseIndicator):
         candle_min = self._get_candle_minutes()
 
         # Pre-compute OHLC arrays
-        highs = np.array([t.high for t in tick_data])
-        lows = np.array([t.low for t in tick_data])
-        closes = np.array([t.close for t in tick_data])
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
+        closes = candle_column(tick_data, "close")
 
         # ATR calculations
         intraday_atr = ta.ATR(highs, lows, closes, timeperiod=atr_period)
@@ -6,7 +6,8 @@ import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
+from indicator_triggers.streaming_state import WilderRSI
 
 
 class RSIIndicator(BaseIndicator):
@@ -120,7 +121,7 @@ class RSIIndicator(BaseIndicator):
             return np.array([math.nan] * len(tick_data)), {}
 
         # Calculate RSI
-        closes = np.array([tick.close for tick in tick_data])
+        closes = candle_column(tick_data, "close")
         rsi = ta.RSI(closes, timeperiod=period)
 
         # Create mask for valid (non-NaN) RSI values
@@ -155,5 +156,38 @@ class RSIIndicator(BaseIndicator):
 
         return signals, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._rsi = WilderRSI(self.get_parameter("period"))
+        self._prev_beyond = False
+        self._prev_valid = False
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        oversold_threshold = self.get_parameter("oversold_threshold")
+        overbought_threshold = self.get_parameter("overbought_threshold")
+        rsi = self._rsi.push(candle.close) if commit else self._rsi.peek(candle.close)
+
+        valid = not math.isnan(rsi)
+        if self.get_parameter("trend") == "bullish":
+            beyond = rsi < oversold_threshold
+        else:  # bearish
+            beyond = rsi > overbought_threshold
+
+        # Signal when RSI moves back inside the threshold it was beyond on the previous candle
+        signal = 1.0 if (not beyond and self._prev_beyond and valid and self._prev_valid) else 0.0
+        if commit:
+            self._prev_beyond, self._prev_valid = beyond, valid
+
+        if self._stream_length + 1 < self.get_parameter("period"):
+            return math.nan, {}
+        return signal, {
+            f"{self.name()}_rsi": rsi,
+            f"{self.name()}_oversold": oversold_threshold,
+            f"{self.name()}_overbought": overbought_threshold
+        }
+
 
 IndicatorRegistry().register(RSIIndicator)
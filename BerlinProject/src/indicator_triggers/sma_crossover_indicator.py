@@ -6,7 +6,8 @@ import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
+from indicator_triggers.streaming_state import RollingSMA
 
 
 class SMACrossoverIndicator(BaseIndicator):
@@ -85,7 +86,7 @@ class SMACrossoverIndicator(BaseIndicator):
             return np.array([math.nan] * len(tick_data)), {f"{self.name()}_sma": np.array([0]*len(tick_data))}
 
         # Calculate SMA
-        closes = np.array([tick.close for tick in tick_data])
+        closes = candle_column(tick_data, "close")
         sma = ta.SMA(closes, timeperiod=period)
 
         # Create mask for valid (non-NaN) SMA values
@@ -106,5 +107,33 @@ class SMACrossoverIndicator(BaseIndicator):
 
         return result, {f"{self.name()}_sma": sma}
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._sma = RollingSMA(self.get_parameter("period"))
+        self._prev_crossed = False
+        self._prev_valid = False
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        crossover_value = self.get_parameter("crossover_value")
+        sma = self._sma.push(candle.close) if commit else self._sma.peek(candle.close)
+
+        valid = not math.isnan(sma)
+        if self.get_parameter("trend") == 'bullish':
+            crossed = candle.close > sma * (1 + crossover_value)
+        else:  # bearish
+            crossed = candle.close < sma * (1 - crossover_value)
+
+        # Same rule as calculate(): only trigger when BOTH current and previous are valid
+        result = 1.0 if (crossed and not self._prev_crossed and valid and self._prev_valid) else 0.0
+        if commit:
+            self._prev_crossed, self._prev_valid = crossed, valid
+
+        if self._stream_length + 1 < self.get_parameter("period"):
+            return math.nan, {f"{self.name()}_sma": 0.0}
+        return result, {f"{self.name()}_sma": sma}
+
 
 IndicatorRegistry().register(SMACrossoverIndicator)
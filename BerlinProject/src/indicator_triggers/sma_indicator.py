@@ -6,7 +6,8 @@ import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
+from indicator_triggers.streaming_state import RollingSMA
 
 
 class SMAIndicator(BaseIndicator):
@@ -51,9 +52,22 @@ class SMAIndicator(BaseIndicator):
         if len(tick_data) < period:
             return np.array([math.nan] * len(tick_data)), {}
 
-        closes = np.array([tick.close for tick in tick_data])
+        closes = candle_column(tick_data, "close")
         sma = ta.SMA(closes, timeperiod=period)
         return sma, {f"{self.name()}_sma": sma}
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._sma = RollingSMA(self.get_parameter("period"))
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        sma = self._sma.push(candle.close) if commit else self._sma.peek(candle.close)
+        if self._stream_length + 1 < self.get_parameter("period"):
+            return math.nan, {}
+        return sma, {f"{self.name()}_sma": sma}
+
 
 IndicatorRegistry().register(SMAIndicator)
@@ -0,0 +1,389 @@
+"""
+Rolling state primitives for the incremental (streaming) indicator path.
+
+Each primitive mirrors the arithmetic of the matching TA-Lib function, so feeding
+candles one at a time produces the same value as the last element of the batch
+calculation over the full history (to floating-point tolerance).
+
+Every primitive exposes:
+- push(...): commit a completed candle and return the value at that candle
+- peek(...): return the value the next candle would produce, without committing it
+"""
+
+import math
+from collections import deque
+from typing import Optional, Tuple
+
+NAN = math.nan
+
+
+def _ta_is_zero(value: float) -> bool:
+    """TA-Lib's TA_IS_ZERO tolerance check."""
+    return -0.00000001 < value < 0.00000001
+
+
+def true_range(high: float, low: float, prev_close: float) -> float:
+    """TA-Lib TRUE_RANGE macro."""
+    result = high - low
+    candidate = abs(high - prev_close)
+    if candidate > result:
+        result = candidate
+    candidate = abs(low - prev_close)
+    if candidate > result:
+        result = candidate
+    return result
+
+
+class RollingSMA:
+    """Simple moving average with TA-Lib's running-total arithmetic (TA_SMA)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self._total = 0.0
+        self._window: deque = deque()
+
+    def _advance(self, value: float, commit: bool) -> float:
+        count = self.count + 1
+        if count < self.period:
+            if commit:
+                self.count = count
+                self._total += value
+                self._window.append(value)
+            return NAN
+
+        total = self._total + value
+        result = total / self.period
+        if commit:
+            self.count = count
+            self._window.append(value)
+            self._total = total - self._window.popleft()
+        return result
+
+    def push(self, value: float) -> float:
+        return self._advance(value, True)
+
+    def peek(self, value: float) -> float:
+        return self._advance(value, False)
+
+
+class RollingEMA:
+    """Exponential moving average seeded with an SMA (TA_EMA, default compatibility).
+
+    Args:
+        period: EMA period
+        skip: Number of leading values to ignore before seeding. TA-Lib's MACD seeds
+              the fast EMA so that it lines up with the slow one, which is equivalent
+              to skipping (slow - fast) values.
+    """
+
+    def __init__(self, period: int, skip: int = 0):
+        self.period = period
+        self.skip = skip
+        self.k = 2.0 / (period + 1)
+        self.count = 0
+        self._seed_total = 0.0
+        self._value = NAN
+
+    def _advance(self, value: float, commit: bool) -> float:
+        count = self.count + 1
+        seeded_count = count - self.skip
+        seed_total = self._seed_total
+
+        if seeded_count <= 0:
+            result = NAN
+        elif seeded_count < self.period:
+            seed_total += value
+            result = NAN
+        elif seeded_count == self.period:
+            seed_total += value
+            result = seed_total / self.period
+        else:
+            result = ((value - self._value) * self.k) + self._value
+
+        if commit:
+            self.count = count
+            self._seed_total = seed_total
+            self._value = result
+        return result
+
+    def push(self, value: float) -> float:
+        return self._advance(value, True)
+
+    def peek(self, value: float) -> float:
+        return self._advance(value, False)
+
+
+class RollingStdDev:
+    """Population standard deviation over a window around a precalculated mean.
+
+    Used for SMA Bollinger Bands. TA-Lib accumulates the deviation incrementally, so
+    the two agree to floating-point tolerance rather than bit for bit; the window is
+    bounded by the period, so each step stays O(1) in the history length.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self._window: deque = deque(maxlen=period)
+
+    def _advance(self, value: float, mean: float, commit: bool) -> float:
+        if commit:
+            self._window.append(value)
+            window = self._window
+        else:
+            window = list(self._window)[1 - self.period:] + [value] if self.period > 1 else [value]
+
+        if len(window) < self.period:
+            return NAN
+
+        total = 0.0
+        for sample in window:
+            deviation = sample - mean
+            total += deviation * deviation
+        return math.sqrt(total / self.period)
+
+    def push(self, value: float, mean: float) -> float:
+        return self._advance(value, mean, True)
+
+    def peek(self, value: float, mean: float) -> float:
+        return self._advance(value, mean, False)
+
+
+class WilderRSI:
+    """Relative Strength Index with Wilder smoothing (TA_RSI, default compatibility)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self._prev_value = NAN
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _advance(self, value: float, commit: bool) -> float:
+        count = self.count + 1
+        gain, loss = self._gain, self._loss
+        result = NAN
+
+        if count > 1:
+            change = value - self._prev_value
+            if count <= self.period + 1:
+                # Initial accumulation of the first `period` changes
+                if change < 0:
+                    loss -= change
+                else:
+                    gain += change
+                if count == self.period + 1:
+                    loss /= self.period
+                    gain /= self.period
+                    result = self._rsi(gain, loss)
+            else:
+                loss *= (self.period - 1)
+                gain *= (self.period - 1)
+                if change < 0:
+                    loss -= change
+                else:
+                    gain += change
+                loss /= self.period
+                gain /= self.period
+                result = self._rsi(gain, loss)
+
+        if commit:
+            self.count = count
+            self._prev_value = value
+            self._gain, self._loss = gain, loss
+        return result
+
+    @staticmethod
+    def _rsi(gain: float, loss: float) -> float:
+        total = gain + loss
+        return 100.0 * (gain / total) if not _ta_is_zero(total) else 0.0
+
+    def push(self, value: float) -> float:
+        return self._advance(value, True)
+
+    def peek(self, value: float) -> float:
+        return self._advance(value, False)
+
+
+class DirectionalMovement:
+    """Wilder-smoothed directional movement: +DI, -DI and ADX (TA_PLUS_DI, TA_MINUS_DI, TA_ADX).
+
+    push/peek return (adx, plus_di, minus_di); values are NaN until each series
+    reaches its TA-Lib lookback (period for the DIs, 2 * period - 1 for ADX).
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self._prev_high = NAN
+        self._prev_low = NAN
+        self._prev_close = NAN
+        self._plus_dm = 0.0
+        self._minus_dm = 0.0
+        self._tr = 0.0
+        self._sum_dx = 0.0
+        self._adx = NAN
+
+    def _advance(self, high: float, low: float, close: float,
+                 commit: bool) -> Tuple[float, float, float]:
+        period = self.period
+        count = self.count + 1
+        index = count - 1
+        plus_dm, minus_dm, tr = self._plus_dm, self._minus_dm, self._tr
+        sum_dx, adx = self._sum_dx, self._adx
+        plus_di = minus_di = NAN
+
+        if index > 0:
+            diff_p = high - self._prev_high
+            diff_m = self._prev_low - low
+            range_value = true_range(high, low, self._prev_close)
+
+            if index < period:
+                # Initial accumulation over the first (period - 1) bars
+                if diff_m > 0 and diff_p < diff_m:
+                    minus_dm += diff_m
+                elif diff_p > 0 and diff_p > diff_m:
+                    plus_dm += diff_p
+                tr += range_value
+            else:
+                minus_dm -= minus_dm / period
+                plus_dm -= plus_dm / period
+                if diff_m > 0 and diff_p < diff_m:
+                    minus_dm += diff_m
+                elif diff_p > 0 and diff_p > diff_m:
+                    plus_dm += diff_p
+                tr = tr - (tr / period) + range_value
+
+                if not _ta_is_zero(tr):
+                    minus_di = 100.0 * (minus_dm / tr)
+                    plus_di = 100.0 * (plus_dm / tr)
+                else:
+                    minus_di = plus_di = 0.0
+
+                dx = NAN
+                if not _ta_is_zero(tr):
+                    di_sum = minus_di + plus_di
+                    if not _ta_is_zero(di_sum):
+                        dx = 100.0 * (abs(minus_di - plus_di) / di_sum)
+
+                if index < 2 * period - 1:
+                    if not math.isnan(dx):
+                        sum_dx += dx
+                elif index == 2 * period - 1:
+                    if not math.isnan(dx):
+                        sum_dx += dx
+                    adx = sum_dx / period
+                elif not math.isnan(dx):
+                    adx = ((adx * (period - 1)) + dx) / period
+
+        if commit:
+            self.count = count
+            self._prev_high, self._prev_low, self._prev_close = high, low, close
+            self._plus_dm, self._minus_dm, self._tr = plus_dm, minus_dm, tr
+            self._sum_dx, self._adx = sum_dx, adx
+
+        adx_out = adx if index >= 2 * period - 1 else NAN
+        return adx_out, plus_di, minus_di
+
+    def push(self, high: float, low: float, close: float) -> Tuple[float, float, float]:
+        return self._advance(high, low, close, True)
+
+    def peek(self, high: float, low: float, close: float) -> Tuple[float, float, float]:
+        return self._advance(high, low, close, False)
+
+
+class AverageTrueRange:
+    """Average True Range with Wilder smoothing, seeded with an SMA of true ranges (TA_ATR)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self._prev_close = NAN
+        self._seed_total = 0.0
+        self._atr = NAN
+
+    def _advance(self, high: float, low: float, close: float, commit: bool) -> float:
+        period = self.period
+        count = self.count + 1
+        index = count - 1
+        seed_total, atr = self._seed_total, self._atr
+        result = NAN
+
+        if index > 0:
+            range_value = true_range(high, low, self._prev_close)
+            if period <= 1:
+                result = range_value
+            elif index < period:
+                seed_total += range_value
+            elif index == period:
+                seed_total += range_value
+                atr = seed_total / period
+                result = atr
+            else:
+                atr *= period - 1
+                atr += range_value
+                atr /= period
+                result = atr
+
+        if commit:
+            self.count = count
+            self._prev_close = close
+            self._seed_total, self._atr = seed_total, atr
+        return result
+
+    def push(self, high: float, low: float, close: float) -> float:
+        return self._advance(high, low, close, True)
+
+    def peek(self, high: float, low: float, close: float) -> float:
+        return self._advance(high, low, close, False)
+
+
+class RollingAroon:
+    """AROON Up/Down over a window of period + 1 bars (TA_AROON).
+
+    Ties resolve to the most recent extreme, matching TA-Lib. push/peek return
+    (aroon_down, aroon_up), NaN until the window is full.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.factor = 100.0 / period
+        self._highs: deque = deque(maxlen=period + 1)
+        self._lows: deque = deque(maxlen=period + 1)
+
+    def _advance(self, high: float, low: float, commit: bool) -> Tuple[float, float]:
+        highs = list(self._highs)
+        lows = list(self._lows)
+        highs.append(high)
+        lows.append(low)
+        if len(highs) > self.period + 1:
+            highs.pop(0)
+            lows.pop(0)
+
+        if commit:
+            self._highs.append(high)
+            self._lows.append(low)
+
+        if len(highs) < self.period + 1:
+            return NAN, NAN
+
+        highest_idx = self._latest_extreme(highs, lambda candidate, best: candidate >= best)
+        lowest_idx = self._latest_extreme(lows, lambda candidate, best: candidate <= best)
+        today = len(highs) - 1
+        aroon_up = self.factor * (self.period - (today - highest_idx))
+        aroon_down = self.factor * (self.period - (today - lowest_idx))
+        return aroon_down, aroon_up
+
+    @staticmethod
+    def _latest_extreme(values, better) -> int:
+        best_idx: Optional[int] = None
+        for i, value in enumerate(values):
+            if best_idx is None or better(value, values[best_idx]):
+                best_idx = i
+        return best_idx
+
+    def push(self, high: float, low: float) -> Tuple[float, float]:
+        return self._advance(high, low, True)
+
+    def peek(self, high: float, low: float) -> Tuple[float, float]:
+        return self._advance(high, low, False)
@@ -5,7 +5,7 @@ import numpy as np
 from scipy.signal import argrelextrema
 
 from models.tick_data import TickData
-from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry
+from indicator_triggers.indicator_base import BaseIndicator, ParameterSpec, ParameterType, IndicatorRegistry, candle_column
 
 
 class SupportResistanceIndicator(BaseIndicator):
@@ -52,7 +52,7 @@ class SupportResistanceIndicator(BaseIndicator):
         sensitivity = self.get_parameter("sensitivity")
         level_type = self.get_parameter("level_type")
 
-        closes = np.array([tick.close for tick in tick_data])
+        closes = candle_column(tick_data, "close")
         result = np.zeros(len(closes))
 
         support_levels = []
@@ -11,13 +11,17 @@ Output range: -1.0 to +1.0 (direction-encoded strength)
 """
 
 import math
+from collections import deque
 from typing import List, Tuple, Dict, Any
 import numpy as np
 import talib as ta
 
 from models.tick_data import TickData
 from indicator_triggers.indicator_base import (
-    BaseIndicator, ParameterSpec, ParameterType, IndicatorType, IndicatorRegistry
+    BaseIndicator, ParameterSpec, ParameterType, IndicatorType, IndicatorRegistry, candle_column
+)
+from indicator_triggers.streaming_state import (
+    AverageTrueRange, DirectionalMovement, RollingAroon, RollingEMA, RollingSMA
 )
 from typing import Any
 
@@ -153,9 +157,9 @@ class ADXTrendIndicator(BaseIndicator):
             return np.zeros(n), {}
 
         # Extract OHLC data
-        highs = np.array([tick.high for tick in tick_data], dtype=np.float64)
-        lows = np.array([tick.low for tick in tick_data], dtype=np.float64)
-        closes = np.array([tick.close for tick in tick_data], dtype=np.float64)
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
+        closes = candle_column(tick_data, "close")
 
         # Calculate ADX and directional indicators
         adx = ta.ADX(highs, lows, closes, timeperiod=period)
@@ -218,6 +222,50 @@ class ADXTrendIndicator(BaseIndicator):
 
         return result, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._dm = DirectionalMovement(self.get_parameter("period"))
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        trend_threshold = self.get_parameter("trend_threshold")
+        strong_trend_threshold = self.get_parameter("strong_trend_threshold")
+        direction_filter = self.get_parameter("direction_filter")
+
+        if commit:
+            adx, plus_di, minus_di = self._dm.push(candle.high, candle.low, candle.close)
+        else:
+            adx, plus_di, minus_di = self._dm.peek(candle.high, candle.low, candle.close)
+
+        if self._stream_length + 1 < self.get_parameter("period") + 1:
+            return 0.0, {}
+
+        valid = not (math.isnan(adx) or math.isnan(plus_di) or math.isnan(minus_di))
+        trend_strength = 0.0
+        if valid and adx >= trend_threshold:
+            if adx >= strong_trend_threshold:
+                trend_strength = 1.0
+            else:
+                trend_strength = (adx - trend_threshold) / (strong_trend_threshold - trend_threshold)
+
+        direction = 1.0 if plus_di > minus_di else -1.0
+        result = trend_strength * direction if valid else 0.0
+
+        if direction_filter == "Bull":
+            result = result if result > 0 else 0.0
+        elif direction_filter == "Bear":
+            result = result if result < 0 else 0.0
+
+        return result, {
+            f"{self.name()}_adx": adx,
+            f"{self.name()}_plus_di": plus_di,
+            f"{self.name()}_minus_di": minus_di,
+            f"{self.name()}_strength": trend_strength,
+            f"{self.name()}_direction": direction
+        }
+
 
 class EMASlopeTrendIndicator(BaseIndicator):
     """EMA slope-based trend indicator.
@@ -361,7 +409,7 @@ class EMASlopeTrendIndicator(BaseIndicator):
             return np.zeros(n), {}
 
         # Extract close prices
-        closes = np.array([tick.close for tick in tick_data], dtype=np.float64)
+        closes = candle_column(tick_data, "close")
 
         # Calculate EMA
         ema = ta.EMA(closes, timeperiod=period)
@@ -420,6 +468,65 @@ class EMASlopeTrendIndicator(BaseIndicator):
 
         return result, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        slope_period = self.get_parameter("slope_period")
+        smoothing = self.get_parameter("smoothing")
+        self._ema = RollingEMA(self.get_parameter("period"))
+        # EMA values for the current bar and the slope_period bars before it
+        self._ema_window: deque = deque(maxlen=slope_period)
+        self._slope_sma = RollingSMA(smoothing) if smoothing > 1 else None
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        period = self.get_parameter("period")
+        slope_period = self.get_parameter("slope_period")
+        normalize_factor = self.get_parameter("normalize_factor")
+        smoothing = self.get_parameter("smoothing")
+        direction_filter = self.get_parameter("direction_filter")
+        close = candle.close
+        index = self._stream_length
+
+        ema = self._ema.push(close) if commit else self._ema.peek(close)
+
+        slope = 0.0
+        if index >= slope_period:
+            ema_then = self._ema_window[0]
+            if not math.isnan(ema) and not math.isnan(ema_then):
+                slope = (ema - ema_then) / slope_period
+
+        if self._slope_sma is None:
+            smoothed_slope = slope
+        else:
+            smoothed_slope = self._slope_sma.push(slope) if commit else self._slope_sma.peek(slope)
+
+        if commit:
+            self._ema_window.append(ema)
+
+        if index + 1 < period + slope_period + smoothing:
+            return 0.0, {}
+
+        normalized = 0.0
+        if not math.isnan(smoothed_slope) and not math.isnan(close) and close > 0:
+            max_expected_slope = close * normalize_factor
+            if max_expected_slope > 0:
+                normalized = smoothed_slope / max_expected_slope
+
+        result = min(max(normalized, -1.0), 1.0)
+        if direction_filter == "Bull":
+            result = result if result > 0 else 0.0
+        elif direction_filter == "Bear":
+            result = result if result < 0 else 0.0
+
+        return result, {
+            f"{self.name()}_ema": ema,
+            f"{self.name()}_slope": slope,
+            f"{self.name()}_smoothed_slope": smoothed_slope,
+            f"{self.name()}_normalized": normalized
+        }
+
 
 class SuperTrendIndicator(BaseIndicator):
     """SuperTrend-based trend indicator.
@@ -538,9 +645,9 @@ class SuperTrendIndicator(BaseIndicator):
             return np.zeros(n), {}
 
         # Extract OHLC data
-        highs = np.array([tick.high for tick in tick_data], dtype=np.float64)
-        lows = np.array([tick.low for tick in tick_data], dtype=np.float64)
-        closes = np.array([tick.close for tick in tick_data], dtype=np.float64)
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
+        closes = candle_column(tick_data, "close")
 
         # Calculate ATR
         atr = ta.ATR(highs, lows, closes, timeperiod=atr_period)
@@ -642,6 +749,91 @@ class SuperTrendIndicator(BaseIndicator):
 
         return result, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._atr = AverageTrueRange(self.get_parameter("atr_period"))
+        self._prev_close = math.nan
+        self._prev_direction = 0.0
+        self._prev_supertrend = 0.0
+        self._prev_final_upper = 0.0
+        self._prev_final_lower = 0.0
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        atr_period = self.get_parameter("atr_period")
+        multiplier = self.get_parameter("multiplier")
+        direction_filter = self.get_parameter("direction_filter")
+        close = candle.close
+        index = self._stream_length
+
+        if commit:
+            atr = self._atr.push(candle.high, candle.low, close)
+        else:
+            atr = self._atr.peek(candle.high, candle.low, close)
+
+        hl2 = (candle.high + candle.low) / 2
+        upper_band = hl2 + (multiplier * atr)
+        lower_band = hl2 - (multiplier * atr)
+
+        if index < atr_period:
+            # Still in ATR warmup
+            direction = supertrend = final_upper = final_lower = 0.0
+        elif index == atr_period:
+            final_upper, final_lower = upper_band, lower_band
+            if close > final_upper:
+                direction, supertrend = 1.0, final_lower
+            else:
+                direction, supertrend = -1.0, final_upper
+        elif math.isnan(atr):
+            direction, supertrend = self._prev_direction, self._prev_supertrend
+            final_upper, final_lower = self._prev_final_upper, self._prev_final_lower
+        else:
+            # Trailing bands: lower only moves up, upper only moves down
+            if lower_band > self._prev_final_lower or self._prev_close < self._prev_final_lower:
+                final_lower = lower_band
+            else:
+                final_lower = self._prev_final_lower
+
+            if upper_band < self._prev_final_upper or self._prev_close > self._prev_final_upper:
+                final_upper = upper_band
+            else:
+                final_upper = self._prev_final_upper
+
+            if self._prev_direction == 1:
+                if close < final_lower:
+                    direction, supertrend = -1.0, final_upper
+                else:
+                    direction, supertrend = 1.0, final_lower
+            else:
+                if close > final_upper:
+                    direction, supertrend = 1.0, final_lower
+                else:
+                    direction, supertrend = -1.0, final_upper
+
+        if commit:
+            self._prev_close = close
+            self._prev_direction, self._prev_supertrend = direction, supertrend
+            self._prev_final_upper, self._prev_final_lower = final_upper, final_lower
+
+        if index + 1 < atr_period + 1:
+            return 0.0, {}
+
+        result = direction
+        if direction_filter == "Bull":
+            result = result if result > 0 else 0.0
+        elif direction_filter == "Bear":
+            result = result if result < 0 else 0.0
+
+        return result, {
+            f"{self.name()}_line": supertrend,
+            f"{self.name()}_upper": final_upper,
+            f"{self.name()}_lower": final_lower,
+            f"{self.name()}_direction": direction,
+            f"{self.name()}_atr": atr
+        }
+
 
 class AROONTrendIndicator(BaseIndicator):
     """AROON Oscillator-based trend indicator.
@@ -737,8 +929,8 @@ class AROONTrendIndicator(BaseIndicator):
             return np.zeros(n), {}
 
         # Extract high/low data
-        highs = np.array([tick.high for tick in tick_data], dtype=np.float64)
-        lows = np.array([tick.low for tick in tick_data], dtype=np.float64)
+        highs = candle_column(tick_data, "high")
+        lows = candle_column(tick_data, "low")
 
         # Calculate AROON indicators
         aroon_down, aroon_up = ta.AROON(highs, lows, timeperiod=period)
@@ -770,6 +962,38 @@ class AROONTrendIndicator(BaseIndicator):
 
         return result, component_data
 
+    def supports_streaming(self) -> bool:
+        return True
+
+    def reset_stream(self) -> None:
+        super().reset_stream()
+        self._aroon = RollingAroon(self.get_parameter("period"))
+
+    def _stream_step(self, candle: TickData, commit: bool) -> Tuple[float, Dict[str, float]]:
+        threshold = self.get_parameter("threshold")
+
+        if commit:
+            aroon_down, aroon_up = self._aroon.push(candle.high, candle.low)
+        else:
+            aroon_down, aroon_up = self._aroon.peek(candle.high, candle.low)
+
+        if self._stream_length + 1 < self.get_parameter("period") + 1:
+            return 0.0, {}
+
+        oscillator = aroon_up - aroon_down
+        result = 0.0
+        if not math.isnan(oscillator):
+            if abs(oscillator) >= threshold:
+                result = oscillator / 100.0
+            else:
+                result = (oscillator / 100.0) * (abs(oscillator) / threshold)
+
+        return min(max(result, -1.0), 1.0), {
+            f"{self.name()}_up": aroon_up,
+            f"{self.name()}_down": aroon_down,
+            f"{self.name()}_oscillator": oscillator
+        }
+
 
 # Register all trend indicators
 IndicatorRegistry().register(ADXTrendIndicator)
@@ -26,6 +26,9 @@ class EnvVars(metaclass=Singleton):
         self.mongo_port = int(self.get_env('MONGO_PORT', '27017'))
         self.mongo_database = self.get_env('MONGO_DATABASE', 'MTA_devel')
         self.mongo_collection = self.get_env("MONGO_COLLECTION", "tick_history_polygon")
+        # Local columnar tick cache in front of MongoDB
+        self.tick_cache_enabled = self.get_bool('TICK_CACHE_ENABLED', "True")
+        self.tick_cache_path = self.get_env('TICK_CACHE_PATH', "~/tmp/tick_cache")
 
         # schwab settings
         self.schwab_app_key = self.get_env('SCHWAB_APP_KEY')
@@ -48,6 +51,9 @@ class EnvVars(metaclass=Singleton):
         # Pip data settings
         self.pip_data_path = self.get_env('PIP_DATA_PATH')
 
+        # Live dashboard: coalesced card update frames per second
+        self.ui_frame_rate = float(self.get_env('UI_FRAME_RATE', '20'))
+
 
 
     def get_env(self, variable: str, default: Optional[str] = None) -> Optional[str]:
@@ -0,0 +1,79 @@
+"""
+Fast JSON encoding for UI payloads (WebSocket events and chart-data responses).
+
+Uses orjson when it is installed: NaN/Infinity are written as null and NumPy
+arrays and scalars are encoded natively, so payloads can be encoded in one pass
+without the recursive sanitize walk. Without orjson it falls back to the standard
+json module after sanitizing.
+
+The module also works as the `json` option of Flask-SocketIO (dumps/loads with
+standard library signatures), which makes socket events use the fast encoder.
+"""
+
+import json
+import math
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if HAS_ORJSON else 0
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not encode natively (non-contiguous or object arrays, other NumPy scalars)"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _sanitize(obj: Any) -> Any:
+    """Fallback: recursively replace NaN/Infinity with None and NumPy types with Python ones"""
+    if isinstance(obj, dict):
+        return {(k if isinstance(k, str) else str(k)): _sanitize(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_sanitize(item) for item in obj]
+    elif isinstance(obj, np.ndarray):
+        return _sanitize(obj.tolist())
+    elif isinstance(obj, np.generic):
+        return _sanitize(obj.item())
+    elif isinstance(obj, float):
+        return None if math.isnan(obj) or math.isinf(obj) else obj
+    return obj
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """Encode data as UTF-8 JSON (NaN/Infinity -> null, NumPy types supported)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(_sanitize(data), default=str, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(data: Any, **kwargs) -> str:
+    """json.dumps-compatible encoder (formatting arguments are ignored)"""
+    return dumps_bytes(data).decode('utf-8')
+
+
+def loads(data, **kwargs) -> Any:
+    """json.loads-compatible decoder"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data, **kwargs)
+
+
+def to_jsonable(data: Any) -> Any:
+    """
+    JSON-safe copy of data built from Python types only (NaN/Infinity -> None,
+    NumPy arrays -> lists, dict keys -> strings).
+    """
+    if HAS_ORJSON:
+        return orjson.loads(dumps_bytes(data))
+    return _sanitize(data)
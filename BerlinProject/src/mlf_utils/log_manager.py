@@ -12,7 +12,7 @@ class LogManager(metaclass=Singleton):
         self._loggers: Dict[str, logging.Logger] = {}
         self._file_handler: logging.Handler | None = None
         self._console_handler: logging.Handler | None = None
-        self._log_dir = Path(EnvVars().log_path or "/var/log/raptor")
+        self._log_dir = Path(EnvVars().log_path or "/var/log/raptor").expanduser()
         self._setup_base_config(log_filename)
         print(f"LOGGER using: {self._log_dir} {log_filename}")
 
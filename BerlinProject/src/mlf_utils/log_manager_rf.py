@@ -25,7 +25,7 @@ class LogManager(metaclass=_LogManagerSingleton):
     def __init__(self, log_filename: str = "application.log"):
         self._loggers: Dict[str, logging.Logger] = {}
         self._file_handler: logging.Handler | None = None
-        self._log_dir = Path(EnvVars().log_path or "/var/log/mlf")
+        self._log_dir = Path(EnvVars().log_path or "/var/log/mlf").expanduser()
         print(f"LOGMANAGER init: {self._log_dir}")
         self._setup_base_config(log_filename)
 
@@ -7,6 +7,7 @@ from models.indicator_definition import IndicatorDefinition
 import os
 
 # models/monitor_configuration.py
+import hashlib
 import json
 from typing import List, Dict, Optional, Set, Any
 from config.types import PyObjectId
@@ -84,6 +85,17 @@ class MonitorConfiguration(BaseModel):
         return (self.indicators == other.indicators and
                 self.trade_executor == other.trade_executor)
 
+    def configuration_hash(self, decimals: int = 6) -> str:
+        """
+        Canonical hash of what drives a backtest: trade executor, conditions, bars and
+        indicators with every float rounded to `decimals` places (ids, names and
+        descriptions are left out). Equal hashes give equal backtests.
+        """
+        data = self.model_dump(mode='json', exclude={'id': True, 'name': True, 'description': True, 'user_id': True,
+                                                     'indicators': {'__all__': {'id', 'description'}}})
+        canonical = json.dumps(_round_floats(data, decimals), sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(canonical.encode()).hexdigest()
+
     def get_time_increments(self) -> Set[str]:
         """Get all unique timeframes from indicators"""
         timeframes = set()
@@ -111,6 +123,16 @@ class MonitorConfiguration(BaseModel):
         return configs
 
 
+def _round_floats(value: Any, decimals: int) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(float(value), decimals) + 0.0  # 1 == 1.0 and no separate -0.0
+    if isinstance(value, dict):
+        return {key: _round_floats(item, decimals) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_round_floats(item, decimals) for item in value]
+    return value
+
+
 def load_monitor_config(config_file: str) -> Optional[MonitorConfiguration]:
     """Load monitor configuration from JSON file with improved path resolution"""
     try:
@@ -1,14 +1,20 @@
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Any, Sequence
 from pymongo import MongoClient
+from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure, OperationFailure, PyMongoError
 
 from models.tick_data import TickData
-from mlf_utils.timezone_utils import assume_et
 from models.monitor_configuration import MonitorConfiguration
 from candle_aggregator.candle_aggregator import CandleAggregator
 from candle_aggregator.candle_aggregator_normal import CANormal
 from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from candle_aggregator.bulk_resampler import resample_aggregators
 from mlf_utils.env_vars import EnvVars
+from mlf_utils.log_manager import LogManager
+from mongo_tools.tick_cache import TickCache, TickArrays, decode_month_documents, parse_float_value
+
+logger = LogManager().get_logger("MongoDBConnect")
 
 
 # we use mongodb and the collection tick_history_polygon now.
@@ -21,7 +27,8 @@ class MongoDBConnect:
     4. Store completed candles in aggregator histories
     """
 
-    #
+    # Seconds before an unreachable MongoDB is tried again
+    OFFLINE_RETRY_SECONDS = 30.0
 
     def __init__(self):
         # Get configuration from environment variables
@@ -29,6 +36,12 @@ class MongoDBConnect:
         self.client = MongoClient(env.mongo_host, env.mongo_port, serverSelectionTimeoutMS=5000)
         self.db = self.client[env.mongo_database]
         self.collection = self.db[env.mongo_collection]
+        # Local columnar copy of the tick documents
+        self.tick_cache: Optional[TickCache] = TickCache(env.tick_cache_path) if env.tick_cache_enabled else None
+        # Connection failures skip Mongo until this time (time.monotonic()), then it is probed again
+        self._offline_until: float = 0.0
+        # False once the server rejected the fingerprint pipeline ($bsonSize needs MongoDB 4.4+)
+        self._fingerprints_supported: bool = True
 
         self.aggregators: Dict[str, CandleAggregator] = {}
         self.ticker: str = ""
@@ -44,22 +57,7 @@ class MongoDBConnect:
         Returns:
             float: Parsed float value
         """
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        if isinstance(value, str):
-            # Handle "float: 186.952392578125" format
-            if value.startswith("float: "):
-                parsed_value = float(value[7:])  # Remove "float: " prefix
-                # Debug: Parsed string value
-                return parsed_value
-            # Handle direct string numbers
-            parsed_value = float(value)
-            # Debug: Parsed string value
-            return parsed_value
-
-        # Debug: Default fallback for value
-        return 0.0  # Default fallback
+        return parse_float_value(value)
 
     def process_historical_data(self, ticker: str, start_date: str, end_date: str,
                                 monitor_config: MonitorConfiguration,
@@ -72,110 +70,141 @@ class MongoDBConnect:
         self.ticker = ticker
         self.total_ticks_processed = 0
 
-        raw_ticks = self._load_raw_ticks(ticker, start_date, end_date)
-        if not raw_ticks:
+        tick_arrays = self._load_raw_tick_arrays(ticker, start_date, end_date)
+        if not len(tick_arrays):
             return False
 
         self._create_aggregators(ticker, monitor_config, include_extended_hours)
-        self._process_all_ticks(raw_ticks)
+        # Candles are built from the tick columns (same result as _process_all_ticks)
+        resample_aggregators(self.aggregators, tick_arrays)
+        self.total_ticks_processed = len(tick_arrays)
         self._report_results()
 
         return True
 
-    def _load_raw_ticks(self, ticker: str, start_date: str, end_date: str) -> List[TickData]:
+    def _load_raw_ticks(self, ticker: str, start_date: str, end_date: str) -> Sequence[TickData]:
         """
-        Query MongoDB and convert to TickData objects
+        Load ticks for the date range (through the local tick cache) as a sequence
+        of TickData; the objects are built from the columns as they are accessed.
         """
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            # Build query that correctly handles year boundaries
-            # When start_year == end_year, simple range works
-            # When crossing years, need $or to handle each year's valid months
-            if start.year == end.year:
-                query = {
-                    'ticker': ticker,
-                    'year': start.year,
-                    'month': {'$gte': start.month, '$lte': end.month}
-                }
-            else:
-                # Crossing year boundary - use $or for each year's valid month range
-                year_conditions = []
-                for year in range(start.year, end.year + 1):
-                    if year == start.year:
-                        # First year: from start month to December
-                        year_conditions.append({'year': year, 'month': {'$gte': start.month}})
-                    elif year == end.year:
-                        # Last year: from January to end month
-                        year_conditions.append({'year': year, 'month': {'$lte': end.month}})
-                    else:
-                        # Middle years: all months
-                        year_conditions.append({'year': year})
-                query = {'ticker': ticker, '$or': year_conditions}
-
-            documents = list(self.collection.find(query).sort([('year', 1), ('month', 1)]))
-
-            if not documents:
-                # No data found for ticker
-                return []
-
-            # Found MongoDB documents
-            raw_ticks = []
-
-            for doc in documents:
-                year = doc['year']
-                month = doc['month']
-                data_dict = doc.get('data', {})
-
-                for day_str, day_data in data_dict.items():
-                    day = int(day_str)
-
-                    for timestamp_str, ohlc in day_data.items():
-                        timestamp_seconds = int(timestamp_str)
-
-                        # Convert timestamp (stored as seconds-since-midnight in ET)
-                        hours = timestamp_seconds // 3600
-                        minutes = (timestamp_seconds % 3600) // 60
-                        seconds = timestamp_seconds % 60
-
-                        # Create ET-aware datetime since MongoDB stores market time (Eastern)
-                        naive_dt = datetime(year, month, day, hours, minutes, seconds)
-                        dt = assume_et(naive_dt)
-
-                        if start.date() <= dt.date() <= end.date():
-                            # Debug: Skip raw OHLC logging for performance
-
-                            # Parse OHLC values using the helper method
-                            parsed_open = self._parse_float_value(ohlc['open'])
-                            parsed_high = self._parse_float_value(ohlc['high'])
-                            parsed_low = self._parse_float_value(ohlc['low'])
-                            parsed_close = self._parse_float_value(ohlc['close'])
-
-                            # Debug: Skip parsed OHLC logging for performance
-
-                            tick = TickData(
-                                symbol=ticker,
-                                timestamp=dt,
-                                open=parsed_open,
-                                high=parsed_high,
-                                low=parsed_low,
-                                close=parsed_close,
-                                volume=ohlc.get('volume', 0),
-                                time_increment="RAW"
-                            )
-                            raw_ticks.append(tick)
-
-            # Sort chronologically
-            raw_ticks.sort(key=lambda x: x.timestamp)
-
-            return raw_ticks
+        return self._load_raw_tick_arrays(ticker, start_date, end_date).to_ticks(ticker)
 
+    def _load_raw_tick_arrays(self, ticker: str, start_date: str, end_date: str) -> TickArrays:
+        """
+        load_tick_arrays(), but empty when loading fails
+        """
+        try:
+            return self.load_tick_arrays(ticker, start_date, end_date)
         except Exception as e:
             # Error loading data
             import traceback
             traceback.print_exc()
-            return []
+            return TickArrays.empty()
+
+    def load_tick_arrays(self, ticker: str, start_date: str, end_date: str) -> TickArrays:
+        """
+        Load ticks for [start_date, end_date] (YYYY-MM-DD, ET dates) as sorted columns.
+
+        Months whose cached fingerprint matches the Mongo documents are read from
+        the tick cache; the others are decoded from Mongo and cached. If MongoDB
+        is unreachable, cached months are used as they are; if it cannot compute
+        the fingerprints, every month is read from Mongo.
+        """
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        months = [(year, month) for year in range(start.year, end.year + 1) for month in range(1, 13)
+                  if (start.year, start.month) <= (year, month) <= (end.year, end.month)]
+        if not months:
+            return TickArrays.empty()
+
+        if self.tick_cache is None:
+            return self._decode_months(ticker, months).between_dates(start_date, end_date)
+
+        fingerprints = self._month_fingerprints(ticker, months)
+        if fingerprints is None and not self._mongo_offline():
+            # Cached months cannot be validated: read everything from Mongo (without caching it)
+            try:
+                return self._decode_months(ticker, months).between_dates(start_date, end_date)
+            except PyMongoError as e:
+                logger.warning(f"Loading {ticker} ticks from MongoDB failed, using cached ticks: {e}")
+                if isinstance(e, ConnectionFailure):
+                    self._offline_until = time.monotonic() + self.OFFLINE_RETRY_SECONDS
+
+        parts: Dict[Tuple[int, int], TickArrays] = {}
+        stale = []
+        for year, month in months:
+            if fingerprints is None:
+                # MongoDB unavailable - serve whatever is cached
+                cached = self.tick_cache.get(ticker, year, month)
+            elif (year, month) in fingerprints:
+                cached = self.tick_cache.get(ticker, year, month, fingerprints[(year, month)])
+            else:
+                continue  # no documents for this month
+            if cached is not None:
+                parts[(year, month)] = cached
+            elif fingerprints is not None:
+                stale.append((year, month))
+
+        if stale:
+            documents = self._find_month_documents(ticker, stale)
+            for key in stale:
+                if key in documents:
+                    parts[key] = decode_month_documents(documents[key])
+                    self.tick_cache.put(ticker, key[0], key[1], parts[key], fingerprints[key])
+
+        arrays = TickArrays.concatenate([parts[key] for key in months if key in parts])
+        return arrays.between_dates(start_date, end_date)
+
+    def _decode_months(self, ticker: str, months: List[Tuple[int, int]]) -> TickArrays:
+        """Ticks of the months decoded straight from Mongo"""
+        documents = self._find_month_documents(ticker, months)
+        return TickArrays.concatenate([decode_month_documents(documents[key]) for key in months if key in documents])
+
+    def _mongo_offline(self) -> bool:
+        return time.monotonic() < self._offline_until
+
+    @staticmethod
+    def _months_query(ticker: str, months: List[Tuple[int, int]]) -> Dict[str, Any]:
+        return {'ticker': ticker, '$or': [{'year': year, 'month': month} for year, month in months]}
+
+    def _find_month_documents(self, ticker: str, months: List[Tuple[int, int]]) -> Dict[Tuple[int, int], List[Dict]]:
+        """Tick documents grouped by (year, month)"""
+        documents: Dict[Tuple[int, int], List[Dict]] = {}
+        if not months:
+            return documents
+        # Only the fields the decoder reads
+        projection = {'year': 1, 'month': 1, 'data': 1}
+        for doc in self.collection.find(self._months_query(ticker, months), projection).sort([('year', 1), ('month', 1)]):
+            documents.setdefault((doc['year'], doc['month']), []).append(doc)
+        return documents
+
+    def _month_fingerprints(self, ticker: str, months: List[Tuple[int, int]]) -> Optional[Dict[Tuple[int, int], str]]:
+        """
+        Fingerprint of each month's documents (id, BSON size and version counter)
+        without transferring the tick data ($bsonSize needs MongoDB 4.4+).
+        None when MongoDB is unreachable or cannot compute the fingerprints.
+        """
+        if self._mongo_offline() or not self._fingerprints_supported:
+            return None
+        pipeline = [
+            {'$match': self._months_query(ticker, months)},
+            {'$project': {'year': 1, 'month': 1, 'version': 1, 'size': {'$bsonSize': '$$ROOT'}}},
+            {'$sort': {'_id': 1}},
+        ]
+        try:
+            fingerprints: Dict[Tuple[int, int], List[str]] = {}
+            for doc in self.collection.aggregate(pipeline):
+                fingerprints.setdefault((doc['year'], doc['month']), []).append(
+                    f"{doc['_id']}:{doc.get('size', 0)}:{doc.get('version', 0)}")
+            return {key: "|".join(parts) for key, parts in fingerprints.items()}
+        except (ServerSelectionTimeoutError, ConnectionFailure) as e:
+            logger.warning(f"MongoDB unavailable, using cached ticks for {ticker}: {e}")
+            self._offline_until = time.monotonic() + self.OFFLINE_RETRY_SECONDS
+            return None
+        except OperationFailure as e:
+            logger.warning(f"MongoDB cannot fingerprint tick documents, tick cache bypassed: {e}")
+            self._fingerprints_supported = False
+            return None
 
     def _create_aggregators(self, ticker: str, monitor_config: MonitorConfiguration,
                             include_extended_hours: bool = True):
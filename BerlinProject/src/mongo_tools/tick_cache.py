@@ -0,0 +1,231 @@
+"""
+Local columnar cache for MongoDB tick history.
+
+Each (ticker, year, month) is stored as one NPZ file of sorted NumPy columns
+(timestamp in epoch milliseconds, open, high, low, close, volume) together with
+a fingerprint of the Mongo documents it was decoded from. MongoDBConnect reuses
+a month while the fingerprint still matches and reloads it from Mongo when the
+documents change.
+"""
+
+import calendar
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator
+
+import numpy as np
+
+from models.tick_data import TickData
+from mlf_utils.timezone_utils import ET, assume_et
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("TickCache")
+
+COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
+def parse_float_value(value) -> float:
+    """Parse a float that may be stored as a string with 'float: ' prefix"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        # Handle "float: 186.952392578125" format
+        if value.startswith("float: "):
+            return float(value[7:])
+        return float(value)
+    return 0.0  # Default fallback
+
+
+def date_bounds_ms(start_date: str, end_date: str) -> (int, int):
+    """Epoch-ms range [ET midnight of start_date, ET midnight after end_date)"""
+    start = assume_et(datetime.strptime(start_date, "%Y-%m-%d"))
+    end = assume_et(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1))
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+@dataclass
+class TickArrays:
+    """Columnar ticks sorted by timestamp (epoch milliseconds)"""
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def empty(cls) -> "TickArrays":
+        return cls(np.empty(0, dtype=np.int64), *(np.empty(0, dtype=np.float64) for _ in range(5)))
+
+    @classmethod
+    def concatenate(cls, parts: List["TickArrays"]) -> "TickArrays":
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(*(np.concatenate([getattr(part, column) for part in parts]) for column in COLUMNS))
+
+    def take(self, index) -> "TickArrays":
+        return TickArrays(*(getattr(self, column)[index] for column in COLUMNS))
+
+    def between_dates(self, start_date: str, end_date: str) -> "TickArrays":
+        """Ticks whose ET date is within [start_date, end_date] (binary search on the timestamps)"""
+        start_ms, end_ms = date_bounds_ms(start_date, end_date)
+        lo, hi = np.searchsorted(self.timestamp, [start_ms, end_ms], side='left')
+        return self.take(slice(lo, hi))
+
+    def to_ticks(self, symbol: str) -> "TickList":
+        """TickData view of the columns (ticks are only built when accessed)"""
+        return TickList(self, symbol)
+
+
+class TickList(Sequence):
+    """
+    Read-only sequence of TickData (ET-aware timestamps, time_increment "RAW")
+    over TickArrays for callers that still consume tick objects. Each access
+    builds new TickData objects; nothing is kept.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, arrays: TickArrays, symbol: str):
+        self.arrays = arrays
+        self.symbol = symbol
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TickList(self.arrays.take(index), self.symbol)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("tick index out of range")
+        return next(self._iter_range(index, index + 1))
+
+    def __iter__(self) -> Iterator[TickData]:
+        for start in range(0, len(self), self.CHUNK_SIZE):
+            yield from self._iter_range(start, min(start + self.CHUNK_SIZE, len(self)))
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[TickData]:
+        arrays, symbol = self.arrays, self.symbol
+        columns = [getattr(arrays, column)[start:stop].tolist() for column in COLUMNS]
+        for timestamp_ms, open_, high, low, close, volume in zip(*columns):
+            yield TickData(symbol=symbol, timestamp=datetime.fromtimestamp(timestamp_ms / 1000, tz=ET),
+                           open=open_, high=high, low=low, close=close, volume=volume, time_increment="RAW")
+
+
+def _parse_float_column(values: List[Any]) -> np.ndarray:
+    """Float column from raw Mongo values (numbers, "float: x" or numeric strings)"""
+    column = np.array(values)
+    if column.dtype.kind in 'iuf':
+        return column.astype(np.float64)
+    try:
+        if column.dtype.kind == 'U':
+            return np.char.replace(column, 'float: ', '').astype(np.float64)
+    except ValueError:
+        pass
+    return np.array([parse_float_value(value) for value in values], dtype=np.float64)
+
+
+def _fixed_utc_offset_seconds(year: int, month: int, day: int) -> Optional[int]:
+    """ET UTC offset of a day in seconds, or None on DST transition days"""
+    first = assume_et(datetime(year, month, day)).utcoffset()
+    last = assume_et(datetime(year, month, day, 23, 59, 59)).utcoffset()
+    if first != last:
+        return None
+    return int(first.total_seconds())
+
+
+def decode_month_documents(documents: List[Dict[str, Any]]) -> TickArrays:
+    """
+    Decode the tick documents of one month into sorted columns.
+
+    Documents hold {'year', 'month', 'data': {day: {seconds since ET midnight: ohlc}}}.
+    Epoch timestamps are computed per day from the day's UTC offset; only the
+    two DST transition days per year convert each tick through the time zone.
+    """
+    timestamp_parts = []
+    ohlc_values = []
+    for doc in documents:
+        year = doc['year']
+        month = doc['month']
+        for day_str, day_data in doc.get('data', {}).items():
+            if not day_data:
+                continue
+            day = int(day_str)
+            seconds = np.fromiter(map(int, day_data.keys()), dtype=np.int64, count=len(day_data))
+            ohlc_values.extend(day_data.values())
+
+            offset = _fixed_utc_offset_seconds(year, month, day)
+            if offset is not None:
+                # MongoDB stores market time (Eastern): epoch = local wall time - UTC offset
+                midnight = calendar.timegm((year, month, day, 0, 0, 0)) - offset
+                timestamp_parts.append((midnight + seconds) * 1000)
+            else:
+                timestamp_parts.append(np.array([
+                    int(assume_et(datetime(year, month, day, s // 3600, (s % 3600) // 60, s % 60)).timestamp()) * 1000
+                    for s in seconds.tolist()], dtype=np.int64))
+
+    if not ohlc_values:
+        return TickArrays.empty()
+
+    volumes = [ohlc.get('volume', 0) for ohlc in ohlc_values]
+    volume = np.array(volumes)
+    if volume.dtype.kind not in 'iuf':
+        # Strings or missing values: store as floats (missing -> 0)
+        volume = np.array([parse_float_value(v) if v is not None else 0.0 for v in volumes], dtype=np.float64)
+
+    arrays = TickArrays(np.concatenate(timestamp_parts),
+                        _parse_float_column([ohlc['open'] for ohlc in ohlc_values]),
+                        _parse_float_column([ohlc['high'] for ohlc in ohlc_values]),
+                        _parse_float_column([ohlc['low'] for ohlc in ohlc_values]),
+                        _parse_float_column([ohlc['close'] for ohlc in ohlc_values]),
+                        volume)
+    return arrays.take(np.argsort(arrays.timestamp, kind='stable'))
+
+
+class TickCache:
+    """NPZ files under cache_dir/<TICKER>/<year>-<month>.npz"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    def path(self, ticker: str, year: int, month: int) -> Path:
+        return self.cache_dir / ticker.upper() / f"{year:04d}-{month:02d}.npz"
+
+    def get(self, ticker: str, year: int, month: int, fingerprint: Optional[str] = None) -> Optional[TickArrays]:
+        """
+        Cached month, or None when missing, unreadable or (if a fingerprint is
+        given) built from different Mongo documents.
+        """
+        path = self.path(ticker, year, month)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if fingerprint is not None and str(data['fingerprint']) != fingerprint:
+                    return None
+                return TickArrays(*(data[column] for column in COLUMNS))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tick cache file {path}: {e}")
+            return None
+
+    def put(self, ticker: str, year: int, month: int, arrays: TickArrays, fingerprint: str) -> None:
+        """Write a month atomically (readers never see a partial file)"""
+        path = self.path(ticker, year, month)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+            np.savez(tmp_path, fingerprint=np.array(fingerprint),
+                     **{column: getattr(arrays, column) for column in COLUMNS})
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write tick cache file {path}: {e}")
@@ -1,14 +1,19 @@
 # optimization/calculators/bt_data_streamer.py - Parallel processing compatible version
 
 import json
+import uuid
 from typing import Dict, List, Optional, Any
 
+import numpy as np
+
 from models.monitor_configuration import MonitorConfiguration
 from candle_aggregator.candle_aggregator import CandleAggregator
 from mongo_tools.mongo_db_connect import MongoDBConnect
 from optimization.calculators.indicator_processor_historical_new import IndicatorProcessorHistoricalNew
+from optimization.calculators.indicator_memo import IndicatorMemo
 from portfolios.portfolio_tool import Portfolio
 from portfolios.trade_executor_unified import TradeExecutorUnified
+from indicator_triggers.indicator_base import candle_column
 from models.tick_data import TickData
 from mlf_utils.log_manager import LogManager
 
@@ -39,14 +44,24 @@ class BacktestDataStreamer:
         self.indicator_history = None
         self.bar_score_history = None
 
+        # Per-tick arrays for the fast backtest path (depend only on the loaded data)
+        self._closes: Optional[np.ndarray] = None
+        self._end_of_day_mask: Optional[np.ndarray] = None
+        # Identity of the loaded data split (IndicatorMemo key), survives pickling and copy_data_from
+        self.data_key: Optional[str] = None
+        # Streamers over leading parts of this split (staged fitness evaluation), by fraction
+        self._prefixes: Dict[float, 'BacktestDataStreamer'] = {}
+
         # Create unified trade executor from monitor config
         self.trade_executor: Optional[TradeExecutorUnified] = None
 
 
 
-    def initialize(self, aggregators: Dict[str, CandleAggregator], data_config: Dict[str, Any], monitor_config: MonitorConfiguration):
+    def initialize(self, aggregators: Dict[str, CandleAggregator], data_config: Dict[str, Any],
+                   monitor_config: Optional[MonitorConfiguration] = None):
         """
         Initialize BacktestDataStreamer with pre-built aggregators and data config.
+        Without monitor_config, call replace_monitor_config() before running.
         """
         self.monitor_config = monitor_config
         self.ticker = data_config['ticker']
@@ -60,7 +75,7 @@ class BacktestDataStreamer:
         self.primary_aggregator = None
 
         # Create unified trade executor from monitor config
-        self.trade_executor = TradeExecutorUnified(self.monitor_config)
+        self.trade_executor = TradeExecutorUnified(self.monitor_config) if self.monitor_config else None
 
         # Build tick history from provided aggregators
         self._build_tick_history()
@@ -88,7 +103,7 @@ class BacktestDataStreamer:
 
         # Clear any existing aggregators to force fresh data load
         self.aggregators.clear()
-        self.tick_history.clear()
+        self.tick_history = []
 
         # Load all historical data once
         # self.load_historical_data()
@@ -97,6 +112,10 @@ class BacktestDataStreamer:
 
     def _build_tick_history(self):
         """Build tick history from primary timeframe aggregator"""
+        self._closes = None
+        self._end_of_day_mask = None
+        self._prefixes = {}
+        self.data_key = uuid.uuid4().hex
         if not self.aggregators:
             logger.error("No aggregators available to build tick history")
             self.tick_history = []
@@ -112,20 +131,8 @@ class BacktestDataStreamer:
             self.tick_history = []
             return
 
-        # Convert candles to tick history once
-        self.tick_history = []
-        for candle in all_candles:
-            tick_data = TickData(
-                symbol=self.ticker,
-                timestamp=candle.timestamp,
-                open=candle.open,
-                high=candle.high,
-                low=candle.low,
-                close=candle.close,
-                volume=candle.volume,
-                time_increment="BACKTEST"
-            )
-            self.tick_history.append(tick_data)
+        # Tick history is a zero-copy view over the primary aggregator's candle columns
+        self.tick_history = all_candles
 
         logger.info(f"BacktestDataStreamer created with {len(self.tick_history)} ticks")
 
@@ -144,11 +151,10 @@ class BacktestDataStreamer:
             return all_candles
 
         for agg_key, aggregator in self.aggregators.items():
-            candles = []
             history = aggregator.get_history()
-            for candle in history:
-                timestamp_ms = int(candle.timestamp.timestamp() * 1000)
-                candles.append([timestamp_ms, candle.open, candle.high, candle.low, candle.close])
+            ohlc = history.ohlc_view()
+            candles = [list(row) for row in zip(history.timestamps().tolist(), ohlc[0].tolist(),
+                                                ohlc[1].tolist(), ohlc[2].tolist(), ohlc[3].tolist())]
             all_candles[agg_key] = candles
             logger.debug(f"Prepared {len(candles)} candles for {agg_key}")
 
@@ -167,8 +173,41 @@ class BacktestDataStreamer:
         if not self.aggregators or agg_key not in self.aggregators:
             return []
 
-        history = self.aggregators[agg_key].get_history()
-        return [int(candle.timestamp.timestamp() * 1000) for candle in history]
+        return self.aggregators[agg_key].timestamps_ms().tolist()
+
+    def data_split(self) -> Dict[str, str]:
+        """Data config of this split (ticker and date range)"""
+        return {'ticker': self.ticker, 'start_date': self.start_date, 'end_date': self.end_date}
+
+    def prefix_streamer(self, fraction: float) -> 'BacktestDataStreamer':
+        """
+        Streamer over the first `fraction` of this split's primary candles. Every
+        aggregator is cut at the same time and wraps views of this split's columns
+        (no candle copies); cached per fraction.
+        """
+        prefix = self._prefixes.get(fraction)
+        if prefix is not None:
+            return prefix
+
+        primary_timestamps = self.primary_aggregator.timestamps_ms()
+        count = min(len(primary_timestamps), max(1, int(round(len(primary_timestamps) * fraction))))
+        cutoff = primary_timestamps[count - 1]
+        aggregators = {}
+        for agg_key, aggregator in self.aggregators.items():
+            timestamps, values, timestamp_objects, _ = aggregator.export_columns()
+            length = int(np.searchsorted(timestamps, cutoff, side='right'))
+            aggregators[agg_key] = type(aggregator).from_columns(
+                aggregator.symbol, aggregator.timeframe, aggregator.include_extended_hours,
+                timestamps[:length], values[:, :length], timestamp_objects[:length])
+
+        prefix = BacktestDataStreamer()
+        prefix.initialize(aggregators, {'ticker': self.ticker, 'start_date': self.start_date,
+                                        'end_date': str(self.tick_history[count - 1].timestamp)},
+                          self.monitor_config)
+        # Own indicator memo key: indicator results of the prefix differ in length from the full split
+        prefix.data_key = f"{self.data_key}:{fraction}"
+        self._prefixes[fraction] = prefix
+        return prefix
 
     def copy_data_from(self, source_streamer: 'BacktestDataStreamer'):
         """
@@ -182,15 +221,34 @@ class BacktestDataStreamer:
         self.tick_history = source_streamer.tick_history  # Shared read-only data
         self.primary_timeframe = source_streamer.primary_timeframe
         self.primary_aggregator = source_streamer.primary_aggregator
+        self._closes = source_streamer._closes
+        self._end_of_day_mask = source_streamer._end_of_day_mask
+        self.data_key = source_streamer.data_key
 
         logger.debug(f"Copied data: {len(self.tick_history)} ticks, {len(self.aggregators)} aggregators")
 
 
 
-    def run_backtest(self):
+    def _get_closes(self) -> np.ndarray:
+        if self._closes is None:
+            self._closes = candle_column(self.tick_history, "close")
+        return self._closes
+
+    def _get_end_of_day_mask(self) -> np.ndarray:
+        if self._end_of_day_mask is None:
+            self._end_of_day_mask = TradeExecutorUnified.end_of_day_window_mask(
+                [tick.timestamp for tick in self.tick_history])
+        return self._end_of_day_mask
+
+    def run_backtest(self, fast: bool = False, indicator_memo: Optional[IndicatorMemo] = None):
         """
         OPTIMIZED: Calculate ALL indicators at once, then execute trades
         This is the key change for GA performance
+
+        Args:
+            fast: Execute trades with TradeExecutorUnified.run_on_arrays, which only visits
+                  trade ticks; produces the same portfolio as the per-tick loop
+            indicator_memo: Reuse indicator results of earlier configurations run on this data
         """
         if not self.tick_history:
             logger.error("No tick history available for backtest")
@@ -204,9 +262,16 @@ class BacktestDataStreamer:
 
         # STEP 1: Calculate ALL indicators for entire timeline at once (batch processing)
         indicator_processor = IndicatorProcessorHistoricalNew(self.monitor_config)
-        indicator_history, raw_indicator_history, bar_score_history, component_history, indicator_agg_mapping = indicator_processor.calculate_indicators(self.aggregators)
+        indicator_history, raw_indicator_history, bar_score_history, component_history, indicator_agg_mapping = indicator_processor.calculate_indicators(
+            self.aggregators, indicator_memo, self.data_key)
 
         # STEP 2: Execute trades using pre-calculated indicators
+        if fast:
+            end_of_day_mask = self._get_end_of_day_mask() if self.trade_executor.exit_by_end_of_day else None
+            if self.trade_executor.run_on_arrays(self.tick_history, self._get_closes(), bar_score_history,
+                                                 indicator_history, end_of_day_mask):
+                return indicator_history, raw_indicator_history, bar_score_history, component_history
+
         for i, tick_data in enumerate(self.tick_history):
             # Get pre-calculated indicators for this time point
             indicators = {}
@@ -258,9 +323,10 @@ class BacktestDataStreamer:
 
 
 
-    def run(self) -> Portfolio:
-        """Complete backtest process"""
-        indicator_history, raw_indicator_history, bar_score_history, component_history = self.run_backtest()
+    def run(self, fast: bool = False, indicator_memo: Optional[IndicatorMemo] = None) -> Portfolio:
+        """Complete backtest process (fast, indicator_memo: see run_backtest)"""
+        indicator_history, raw_indicator_history, bar_score_history, component_history = self.run_backtest(
+            fast, indicator_memo)
         self.component_history = component_history
         self.indicator_history = indicator_history
         self.bar_score_history = bar_score_history
@@ -0,0 +1,129 @@
+"""
+Indicator result memo shared across GA individuals.
+
+Most individuals in a generation only differ in bar weights or thresholds, so
+their indicators (class + parameters on the same aggregator) are identical to
+ones already computed for another individual on the same data split. The memo
+keeps the aligned raw, decayed and component arrays of recent indicators so
+IndicatorProcessorHistoricalNew can skip TA-Lib for them.
+
+Each process keeps its own memo (see get_indicator_memo); worker processes of
+MlfFitnessCalculator report their hit/miss counts back with their results.
+Entries hold arrays as long as the primary timeline, so the memo is bounded by
+the bytes it holds (max_megabytes per process) as well as by its entry count.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from data_streamer.indicator_processor import freeze_parameters
+
+MemoKey = Tuple[Hashable, str, str, Hashable]  # (data_key, aggregator_key, indicator_class, frozen parameters)
+
+# Default memory budget of one process's memo
+DEFAULT_MEMO_MEGABYTES = 128.0
+
+
+@dataclass
+class IndicatorMemoEntry:
+    """Indicator results aligned to the primary timeframe of one data split"""
+    raw_values: np.ndarray
+    decayed_values: np.ndarray
+    components: Dict[str, np.ndarray]
+
+    @property
+    def nbytes(self) -> int:
+        return (self.raw_values.nbytes + self.decayed_values.nbytes
+                + sum(values.nbytes for values in self.components.values()))
+
+
+class IndicatorMemo:
+    """
+    Bounded LRU of indicator results keyed by data split, aggregator key,
+    indicator class and canonicalized parameters. Least recently used entries
+    are evicted once there are more than max_entries or their arrays take more
+    than max_megabytes.
+    """
+
+    def __init__(self, max_entries: int = 512, max_megabytes: float = DEFAULT_MEMO_MEGABYTES) -> None:
+        self.max_entries = max_entries
+        self.max_megabytes = max_megabytes
+        self.nbytes = 0
+        self._entries: "OrderedDict[MemoKey, IndicatorMemoEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(data_key: Hashable, aggregator_key: str, indicator_class: str,
+                 parameters: Dict) -> Optional[MemoKey]:
+        """Memo key, or None when the parameters cannot be hashed"""
+        key = (data_key, aggregator_key, indicator_class, freeze_parameters(parameters))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: MemoKey) -> Optional[IndicatorMemoEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: MemoKey, entry: IndicatorMemoEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            max_bytes = self.max_megabytes * 1024 * 1024
+            while self._entries and (len(self._entries) > self.max_entries or self.nbytes > max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def counts(self) -> Tuple[int, int]:
+        """(hits, misses) so far"""
+        return self.hits, self.misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def hit_rate(hits: int, misses: int) -> float:
+    lookups = hits + misses
+    return hits / lookups if lookups else 0.0
+
+
+_process_memo: Optional[IndicatorMemo] = None
+_process_memo_lock = threading.Lock()
+
+
+def get_indicator_memo(max_megabytes: Optional[float] = None) -> IndicatorMemo:
+    """
+    The indicator memo of the current process (created on first use). A given
+    max_megabytes sets its memory budget (the default budget otherwise).
+    """
+    global _process_memo
+    with _process_memo_lock:
+        if _process_memo is None:
+            _process_memo = IndicatorMemo()
+        if max_megabytes is not None:
+            _process_memo.max_megabytes = max_megabytes
+        return _process_memo
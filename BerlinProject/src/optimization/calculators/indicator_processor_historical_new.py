@@ -2,9 +2,9 @@
 Complete Historical Indicator Processor - Batch processing for genetic algorithms
 """
 
-import bisect
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Tuple
+from typing import Tuple, Optional
 
 from candle_aggregator.candle_aggregator import CandleAggregator
 from models.monitor_configuration import MonitorConfiguration
@@ -14,11 +14,79 @@ from indicator_triggers.indicator_base import IndicatorRegistry, IndicatorType
 import indicator_triggers.refactored_indicators
 import indicator_triggers.trend_indicators
 from models.indicator_definition import IndicatorDefinition
+from optimization.calculators.indicator_memo import IndicatorMemo, IndicatorMemoEntry
 from mlf_utils.log_manager import LogManager
 
 logger = LogManager().get_logger("IndicatorProcessorHistoricalNew")
 
 
+@dataclass
+class BarScorePlan:
+    """Bar configuration parsed once for batch scoring"""
+    signal_weights: List[Tuple[str, float]]
+    trend_indicators: List[Tuple[str, float, bool]]  # (name, weight, hard gate)
+    bearish: bool
+    trend_logic: str
+    trend_threshold: float
+
+    @classmethod
+    def from_config(cls, bar_config) -> 'BarScorePlan':
+        if not isinstance(bar_config, dict):
+            return cls([], [], False, 'AND', 0.0)
+
+        # Extract signal indicator weights from bar config
+        signal_weights = bar_config['indicators'] if 'indicators' in bar_config else bar_config
+
+        trend_indicators = []
+        for trend_name, config in bar_config.get('trend_indicators', {}).items():
+            if isinstance(config, dict):
+                weight = config.get('weight', 1.0)
+                mode = config.get('mode', 'soft')
+            else:
+                weight = float(config)
+                mode = 'soft'
+            trend_indicators.append((trend_name, weight, mode == 'hard'))
+
+        return cls(
+            signal_weights=list(signal_weights.items()),
+            trend_indicators=trend_indicators,
+            bearish=bar_config.get('type', 'bull').lower() == 'bear',
+            trend_logic=bar_config.get('trend_logic', 'AND').upper(),
+            trend_threshold=bar_config.get('trend_threshold', 0.0)
+        )
+
+
+def lookback_decay(raw_values, lookback: int) -> np.ndarray:
+    """
+    Time-based lookback decay of trigger values in one O(n) pass.
+
+    At each index the most recent non-zero trigger within the last `lookback` values
+    (current one included) scores (1 - distance / lookback) * sign(trigger), where
+    distance is the number of steps since that trigger; without one the score is 0.
+    The index of the last trigger is carried forward with np.maximum.accumulate.
+
+    Args:
+        raw_values: Raw trigger values (list or array)
+        lookback: Window length in steps
+
+    Returns:
+        float64 array of decayed values, same length as raw_values
+    """
+    raw_array = np.asarray(raw_values, dtype=np.float64)
+    n = len(raw_array)
+    decayed = np.zeros(n)
+    if n == 0 or lookback <= 0:
+        return decayed
+
+    positions = np.arange(n)
+    last_trigger = np.maximum.accumulate(np.where(raw_array != 0, positions, -1))
+    distance = positions - last_trigger
+    active = (last_trigger >= 0) & (distance < lookback)
+
+    decayed[active] = (1.0 - distance[active] / float(lookback)) * np.sign(raw_array[last_trigger[active]])
+    return decayed
+
+
 class IndicatorCalculator:
     def __init__(self, config: IndicatorDefinition):
         self.config: IndicatorDefinition = config
@@ -71,42 +139,7 @@ class IndicatorCalculator:
         Apply time-based lookback scoring using vectorized operations
         This replicates the same logic as IndicatorProcessor.calculate_time_based_metric
         """
-        # if not raw_values:
-        #     return []
-
-        # Convert to numpy for faster operations
-        raw_array = np.array(raw_values)
-        trigger_values_with_lookback = np.zeros(len(raw_array))
-
-        # Apply lookback scoring for each time point
-        for i in range(len(raw_array)):
-            # Get lookback window up to current point
-            start_idx = max(0, i + 1 - lookback)
-            window = raw_array[start_idx:i+1]
-
-            # Find non-zero indices (triggers)
-            non_zero_mask = window != 0
-            if not np.any(non_zero_mask):
-                trigger_values_with_lookback[i] = 0.0
-                continue
-
-            # Get most recent trigger
-            non_zero_indices = np.where(non_zero_mask)[0]
-            last_trigger_idx = non_zero_indices[-1]
-            trigger_value = window[last_trigger_idx]
-
-            # Calculate decay based on position from end
-            lookback_location = len(window) - last_trigger_idx - 1
-            lookback_ratio = lookback_location / float(lookback)
-
-            # Clamp lookback_ratio to [0, 1] range to prevent values going below 0
-            lookback_ratio = min(1.0, max(0.0, lookback_ratio))
-
-            # Apply same formula as live system
-            trigger_values_with_lookback[i] = (1.0 - lookback_ratio) * np.sign(trigger_value)
-
-        return trigger_values_with_lookback.tolist()
-
+        return lookback_decay(raw_values, lookback).tolist()
 
     def get_aggregator_key(self) -> str:
         """Get the correct aggregator key for an indicator"""
@@ -129,6 +162,7 @@ class IndicatorProcessorHistoricalNew:
         # Store primary timeframe info (calculated once when aggregators are provided)
         self.primary_timeframe_minutes: int = None
         self.primary_timeframe_length: int = None
+        self._bar_score_plans: Optional[Dict[str, BarScorePlan]] = None
         # logger.debug(f"IndicatorProcessorHistoricalNew initialized with {len(self.config.indicators)} indicators")
 
     def _create_indicator_objects(self):
@@ -212,22 +246,27 @@ class IndicatorProcessorHistoricalNew:
 
         aligned_values = np.zeros(self.primary_timeframe_length)
 
-        # Build sorted list of coarse candle timestamps (as Unix seconds for binary search)
-        coarse_timestamps = [c.timestamp.timestamp() for c in coarse_candles]
+        # Sorted coarse candle timestamps (epoch ms) for binary search
+        coarse_timestamps = self._candle_timestamps_ms(coarse_candles)
+        primary_timestamps = self._candle_timestamps_ms(primary_candles)
 
-        # For each primary candle, find the coarse candle it falls within
-        for primary_idx, primary_candle in enumerate(primary_candles):
-            primary_ts = primary_candle.timestamp.timestamp()
+        # For each primary candle, find the rightmost coarse candle that starts <= it
+        # (searchsorted 'right' returns the insertion point, -1 gives the containing candle)
+        coarse_idx = np.searchsorted(coarse_timestamps, primary_timestamps, side='right') - 1
 
-            # Binary search: find the rightmost coarse candle that starts <= primary_ts
-            # bisect_right returns insertion point, -1 gives us the containing candle
-            coarse_idx = bisect.bisect_right(coarse_timestamps, primary_ts) - 1
-
-            if 0 <= coarse_idx < len(values):
-                aligned_values[primary_idx] = values[coarse_idx]
+        values = np.asarray(values, dtype=np.float64)
+        valid = (coarse_idx >= 0) & (coarse_idx < len(values))
+        aligned_values[:len(primary_timestamps)][valid] = values[coarse_idx[valid]]
 
         return aligned_values
 
+    @staticmethod
+    def _candle_timestamps_ms(candles) -> np.ndarray:
+        """Candle timestamps as int64 epoch ms (zero-copy for aggregator candle views)"""
+        if hasattr(candles, 'timestamps'):
+            return candles.timestamps()
+        return np.array([int(c.timestamp.timestamp() * 1000) for c in candles], dtype=np.int64)
+
     def _align_to_primary_timeframe_index_based(
         self,
         values: List[float],
@@ -281,37 +320,9 @@ class IndicatorProcessorHistoricalNew:
             lookback_periods * indicator_timeframe_minutes / self.primary_timeframe_minutes
         )
 
-        trigger_values_with_lookback = np.zeros(len(aligned_raw_values))
-
-        # Apply lookback scoring for each time point at primary resolution
-        for i in range(len(aligned_raw_values)):
-            # Get lookback window up to current point (in primary timeframe)
-            start_idx = max(0, i + 1 - lookback_in_primary_periods)
-            window = aligned_raw_values[start_idx:i+1]
-
-            # Find non-zero indices (triggers)
-            non_zero_mask = window != 0
-            if not np.any(non_zero_mask):
-                trigger_values_with_lookback[i] = 0.0
-                continue
-
-            # Get most recent trigger
-            non_zero_indices = np.where(non_zero_mask)[0]
-            last_trigger_idx = non_zero_indices[-1]
-            trigger_value = window[last_trigger_idx]
-
-            # Calculate decay based on PRIMARY timeframe distance from trigger
-            # This is the key change: decay happens at 1-minute resolution, not 5-minute
-            lookback_location = len(window) - last_trigger_idx - 1
-            lookback_ratio = lookback_location / float(lookback_in_primary_periods)
-
-            # Clamp lookback_ratio to [0, 1] range
-            lookback_ratio = min(1.0, max(0.0, lookback_ratio))
-
-            # Apply decay formula
-            trigger_values_with_lookback[i] = (1.0 - lookback_ratio) * np.sign(trigger_value)
-
-        return trigger_values_with_lookback
+        # Decay is measured in PRIMARY timeframe steps since the last trigger,
+        # so a 5-minute trigger fades at 1-minute resolution
+        return lookback_decay(aligned_raw_values, lookback_in_primary_periods)
 
     def _align_to_primary_timeframe_debug(
         self,
@@ -344,7 +355,8 @@ class IndicatorProcessorHistoricalNew:
 
         return interpolated
 
-    def calculate_indicators(self, aggregators: Dict[str, CandleAggregator]) -> Tuple[
+    def calculate_indicators(self, aggregators: Dict[str, CandleAggregator],
+                             memo: Optional[IndicatorMemo] = None, data_key=None) -> Tuple[
         Dict[str, List[float]],  # indicator_history (time-decayed)
         Dict[str, List[float]],  # raw_indicator_history (trigger values)
         Dict[str, List[float]],  # bar_score_history
@@ -354,6 +366,11 @@ class IndicatorProcessorHistoricalNew:
         """
         Calculate indicators for entire historical timeline using batch operations
 
+        Args:
+            aggregators: Candle aggregators of the data split
+            memo: Optional IndicatorMemo shared between configurations (GA individuals)
+            data_key: Identity of the data split in aggregators; the memo is only used when given
+
         Returns:
             - indicator_history: {indicator_name: [time_decayed_value_at_tick_0, ...]}
             - raw_indicator_history: {indicator_name: [trigger_value_at_tick_0, ...]}
@@ -390,94 +407,122 @@ class IndicatorProcessorHistoricalNew:
         for indicator in self.indicator_calculators:
             # Get the correct aggregator key for this indicator
             aggregator_key = indicator.get_aggregator_key()
-            candles = all_candle_data[aggregator_key]
-
-            # Calculate raw indicator values (triggers) for entire history
-            # NOTE: We now ignore the pre-calculated lookback values from calculate_indicator_batch
-            # because we'll recalculate decay at the primary timeframe resolution
-            raw_values, components, _ = indicator.calculate_indicator_batch(candles)
-
-            # Get the aggregator's timeframe in minutes
-            aggregator = aggregators[aggregator_key]
-            indicator_timeframe_minutes = aggregator.get_timeframe_minutes()
-
-            # DEBUG: Log alignment info
-            # print(f"[ALIGN] {indicator.name}: {indicator_timeframe_minutes}m -> {self.primary_timeframe_minutes}m | "
-            #            f"Before: {len(raw_values)} values | After: {self.primary_timeframe_length} values")
-
-            # Step 1: Align raw trigger values to primary timeframe using TIMESTAMP matching
-            # Pass candle lists for proper timestamp-based alignment (fixes market gap bug)
-            coarse_candles = candles  # Candles from the indicator's aggregator
-            aligned_raw_values = self._align_to_primary_timeframe(
-                raw_values, indicator_timeframe_minutes, coarse_candles, primary_candles
-            )
-
-            # Step 2: Check if this is a TREND indicator (no decay) or SIGNAL indicator (with decay)
-            is_trend_indicator = (hasattr(indicator.indicator, 'get_indicator_type') and
-                                  indicator.indicator.get_indicator_type() == IndicatorType.TREND)
-
-            if is_trend_indicator:
-                # TREND indicators: use aligned raw values directly (no decay)
-                # Trend indicators show current market state, decay would corrupt the signal
-                aligned_trigger_values_with_lookback = aligned_raw_values
-            else:
-                # SIGNAL indicators: apply lookback decay at primary timeframe resolution
-                lookback_periods = indicator.config.parameters.get('lookback', None)
-                aligned_trigger_values_with_lookback = self._apply_lookback_at_primary_timeframe(
-                    aligned_raw_values,
-                    lookback_periods,
-                    indicator_timeframe_minutes
-                )
-
-            # DEBUG: Verify alignment worked
-            # print(f"[VERIFY] {indicator.name}: aligned_raw_values length = {len(aligned_raw_values)}, "
-            #            f"aligned_trigger_values_with_lookback length = {len(aligned_trigger_values_with_lookback)}, "
-            #            f"expected = {self.primary_timeframe_length}")
 
-            raw_indicator_history[indicator.name] = aligned_raw_values.tolist()
-            indicator_history[indicator.name] = aligned_trigger_values_with_lookback.tolist()
+            # Identical indicators (class + parameters) on the same data reuse memoized arrays
+            memo_key = None
+            entry = None
+            if memo is not None and data_key is not None:
+                memo_key = memo.make_key(data_key, aggregator_key,
+                                         indicator.config.indicator_class or indicator.config.name,
+                                         indicator.config.parameters)
+                if memo_key is not None:
+                    entry = memo.get(memo_key)
+            if entry is None:
+                entry = self._calculate_aligned_indicator(indicator, aggregators, all_candle_data, primary_candles)
+                if memo_key is not None:
+                    memo.put(memo_key, entry)
+
+            raw_indicator_history[indicator.name] = entry.raw_values.tolist()
+            indicator_history[indicator.name] = entry.decayed_values.tolist()
 
             # Store indicator -> aggregator mapping for timestamp lookup
             indicator_agg_mapping[indicator.name] = aggregator_key
 
-            # Align component values to primary timeframe for consistent charting
-            # (Components like ADX raw value, +DI, -DI need same timestamps as other charts)
-            if components:
-                for component_name, component_values in components.items():
-                    key = f"{indicator.name}_{component_name}"
-                    comp_values_list = component_values.tolist() if isinstance(component_values, np.ndarray) else component_values
-                    # Align component values to primary timeframe
-                    aligned_components = self._align_to_primary_timeframe(
-                        comp_values_list, indicator_timeframe_minutes, coarse_candles, primary_candles
-                    )
-                    component_history[key] = aligned_components.tolist()
+            for component_name, aligned_components in entry.components.items():
+                component_history[f"{indicator.name}_{component_name}"] = aligned_components.tolist()
 
         # Calculate bar scores for entire timeline
         bar_score_history = self._calculate_bar_scores_batch(indicator_history, self.primary_timeframe_length)
         return indicator_history, raw_indicator_history, bar_score_history, component_history, indicator_agg_mapping
 
 
+    def _calculate_aligned_indicator(self, indicator: IndicatorCalculator,
+                                     aggregators: Dict[str, CandleAggregator],
+                                     all_candle_data: Dict[str, List[TickData]],
+                                     primary_candles: List) -> IndicatorMemoEntry:
+        """Calculate one indicator and align its raw, decayed and component values to the primary timeframe"""
+        aggregator_key = indicator.get_aggregator_key()
+        candles = all_candle_data[aggregator_key]
+
+        # Calculate raw indicator values (triggers) for entire history
+        # NOTE: We now ignore the pre-calculated lookback values from calculate_indicator_batch
+        # because we'll recalculate decay at the primary timeframe resolution
+        raw_values, components, _ = indicator.calculate_indicator_batch(candles)
+
+        # Get the aggregator's timeframe in minutes
+        aggregator = aggregators[aggregator_key]
+        indicator_timeframe_minutes = aggregator.get_timeframe_minutes()
+
+        # Step 1: Align raw trigger values to primary timeframe using TIMESTAMP matching
+        # Pass candle lists for proper timestamp-based alignment (fixes market gap bug)
+        coarse_candles = candles  # Candles from the indicator's aggregator
+        aligned_raw_values = self._align_to_primary_timeframe(
+            raw_values, indicator_timeframe_minutes, coarse_candles, primary_candles
+        )
+
+        # Step 2: Check if this is a TREND indicator (no decay) or SIGNAL indicator (with decay)
+        is_trend_indicator = (hasattr(indicator.indicator, 'get_indicator_type') and
+                              indicator.indicator.get_indicator_type() == IndicatorType.TREND)
+
+        if is_trend_indicator:
+            # TREND indicators: use aligned raw values directly (no decay)
+            # Trend indicators show current market state, decay would corrupt the signal
+            aligned_trigger_values_with_lookback = aligned_raw_values
+        else:
+            # SIGNAL indicators: apply lookback decay at primary timeframe resolution
+            lookback_periods = indicator.config.parameters.get('lookback', None)
+            aligned_trigger_values_with_lookback = self._apply_lookback_at_primary_timeframe(
+                aligned_raw_values,
+                lookback_periods,
+                indicator_timeframe_minutes
+            )
+
+        # Align component values to primary timeframe for consistent charting
+        # (Components like ADX raw value, +DI, -DI need same timestamps as other charts)
+        aligned_components = {}
+        if components:
+            for component_name, component_values in components.items():
+                comp_values_list = component_values.tolist() if isinstance(component_values, np.ndarray) else component_values
+                aligned_components[component_name] = self._align_to_primary_timeframe(
+                    comp_values_list, indicator_timeframe_minutes, coarse_candles, primary_candles
+                )
+
+        return IndicatorMemoEntry(np.asarray(aligned_raw_values, dtype=np.float64),
+                                  np.asarray(aligned_trigger_values_with_lookback, dtype=np.float64),
+                                  aligned_components)
+
     @staticmethod
     def _extract_all_candle_data(aggregators: Dict[str, CandleAggregator]) -> Dict[str, List[TickData]]:
         """Extract candle data from all aggregators"""
         all_candle_data = {}
 
         for aggregator_key, aggregator in aggregators.items():
-            history = aggregator.get_history().copy()
-            current = aggregator.get_current_candle()
-            if current:
-                history.append(current)
-            all_candle_data[aggregator_key] = history
-            logger.debug(f"{aggregator_key}: {len(history)} candles")
+            candles = aggregator.get_candles()
+            all_candle_data[aggregator_key] = candles
+            logger.debug(f"{aggregator_key}: {len(candles)} candles")
 
         return all_candle_data
 
 
+    def _get_bar_score_plans(self) -> Dict[str, BarScorePlan]:
+        """Weights and gating options per bar, parsed from the configuration once"""
+        if self._bar_score_plans is None:
+            plans = {}
+            for bar_name, bar_config in self.config.bars.items():
+                plans[bar_name] = BarScorePlan.from_config(bar_config)
+                logger.debug(f"[TREND DEBUG] Bar '{bar_name}' config: {bar_config}")
+            self._bar_score_plans = plans
+        return self._bar_score_plans
+
     def _calculate_bar_scores_batch(self, indicator_history: Dict[str, List[float]], timeline_length: int) -> Dict[str, List[float]]:
         """
         Calculate bar scores for entire timeline using batch processing with trend gating.
         All indicators are now aligned to primary timeframe, so calculation is simplified.
 
+        Indicator histories are stacked into one (indicators x timeline) matrix and each
+        bar is scored with a few whole-timeline array operations. Weighted sums accumulate
+        in configuration order, so results match the per-index calculation exactly.
+
         Trend gating allows trend indicators to filter/gate signal indicators:
         - If trend_indicators are configured, they act as multipliers on signal scores
         - If no trend_indicators are configured, bar score is calculated normally
@@ -489,118 +534,86 @@ class IndicatorProcessorHistoricalNew:
             logger.debug("No bar configurations found")
             return bar_score_history
 
-        # Calculate bar scores for each bar configuration
-        for bar_name, bar_config in self.config.bars.items():
-            bar_scores = []
-
-            # DEBUG: Log bar config structure
-            logger.debug(f"[TREND DEBUG] Bar '{bar_name}' config type: {type(bar_config)}")
-            logger.debug(f"[TREND DEBUG] Bar '{bar_name}' config: {bar_config}")
-
-            # Get bar type for trend direction alignment
-            bar_type = bar_config.get('type', 'bull') if isinstance(bar_config, dict) else 'bull'
-
-            # Extract signal indicator weights from bar config
-            if isinstance(bar_config, dict) and 'indicators' in bar_config:
-                signal_weights = bar_config['indicators']
+        names = list(indicator_history.keys())
+        rows = {name: row for row, name in enumerate(names)}
+        matrix = np.empty((len(names), timeline_length))
+        for row, name in enumerate(names):
+            matrix[row] = np.asarray(indicator_history[name], dtype=np.float64)[:timeline_length]
+
+        for bar_name, plan in self._get_bar_score_plans().items():
+            # Signal score: weighted average of the signal indicators present
+            weighted_sum = np.zeros(timeline_length)
+            total_weight = 0.0
+            for indicator_name, weight in plan.signal_weights:
+                if indicator_name in rows:
+                    weighted_sum = weighted_sum + matrix[rows[indicator_name]] * weight
+                    total_weight += weight
+
+            if total_weight > 0:
+                signal_scores = weighted_sum / total_weight
             else:
-                signal_weights = bar_config if isinstance(bar_config, dict) else {}
-
-            # Extract trend indicator configuration (NEW)
-            trend_config = bar_config.get('trend_indicators', {}) if isinstance(bar_config, dict) else {}
-            trend_logic = bar_config.get('trend_logic', 'AND') if isinstance(bar_config, dict) else 'AND'
-            trend_threshold = bar_config.get('trend_threshold', 0.0) if isinstance(bar_config, dict) else 0.0
+                signal_scores = np.zeros(timeline_length)
 
-            # DEBUG: Log extracted trend config
-            logger.debug(f"[TREND DEBUG] Bar '{bar_name}' trend_config: {trend_config}")
-            logger.debug(f"[TREND DEBUG] Bar '{bar_name}' trend_logic: {trend_logic}, threshold: {trend_threshold}")
+            # Apply trend gate to signal score
+            trend_gate = self._calculate_trend_gate_batch(matrix, rows, plan, timeline_length)
+            if trend_gate is not None:
+                signal_scores = signal_scores * trend_gate
 
-            # Calculate bar score at each time point
-            for i in range(timeline_length):
-                # Calculate signal score (weighted sum of signal indicators)
-                weighted_sum = 0.0
-                total_weight = 0.0
-
-                for indicator_name, weight in signal_weights.items():
-                    if indicator_name in indicator_history:
-                        weighted_sum += indicator_history[indicator_name][i] * weight
-                        total_weight += weight
-
-                signal_score = weighted_sum / total_weight if total_weight > 0 else 0.0
-
-                # Calculate trend gate at this time point (NEW)
-                trend_gate = self._calculate_trend_gate_at_index(
-                    indicator_history, i, trend_config, bar_type, trend_logic, trend_threshold
-                )
-
-                # Apply trend gate to signal score
-                final_score = signal_score * trend_gate
-                bar_scores.append(final_score)
-
-            bar_score_history[bar_name] = bar_scores
-            logger.debug(f"Calculated bar scores for {bar_name}: {len(bar_scores)} values")
+            bar_score_history[bar_name] = signal_scores.tolist()
+            logger.debug(f"Calculated bar scores for {bar_name}: {timeline_length} values")
 
         return bar_score_history
 
-    def _calculate_trend_gate_at_index(self, indicator_history: Dict[str, List[float]],
-                                       index: int, trend_config: Dict,
-                                       bar_type: str, trend_logic: str,
-                                       trend_threshold: float) -> float:
-        """Calculate trend gate multiplier at a specific time index.
+    @staticmethod
+    def _calculate_trend_gate_batch(matrix: np.ndarray, rows: Dict[str, int],
+                                    plan: BarScorePlan, timeline_length: int) -> Optional[np.ndarray]:
+        """Calculate the trend gate multiplier (0.0 to 1.0) over the whole timeline.
 
         Args:
-            indicator_history: Dict of indicator_name -> list of values over time
-            index: Current time index
-            trend_config: Dict of trend_indicator_name -> {weight, mode}
-            bar_type: "bull" or "bear"
-            trend_logic: "AND", "OR", or "AVG"
-            trend_threshold: Minimum gate value required
+            matrix: (indicators x timeline) indicator values
+            rows: indicator_name -> matrix row
+            plan: Parsed bar configuration
+            timeline_length: Number of time points
 
         Returns:
-            Trend gate multiplier (0.0 to 1.0)
+            Gate values per time point, or None when no trend indicator applies (pass through)
         """
-        if not trend_config:
-            return 1.0  # No trend indicators - pass through
-
-        trend_values = []
-
-        for trend_name, config in trend_config.items():
-            if trend_name not in indicator_history:
+        gated_rows = []
+        weights = []
+        for trend_name, weight, hard in plan.trend_indicators:
+            if trend_name not in rows:
                 continue
 
-            # Get trend indicator value at this index
-            trend_value = indicator_history[trend_name][index]
-
-            # Get config options
-            if isinstance(config, dict):
-                weight = config.get('weight', 1.0)
-                mode = config.get('mode', 'soft')
-            else:
-                weight = float(config)
-                mode = 'soft'
-
             # Align direction with bar type
-            if bar_type.lower() == 'bear':
-                trend_value = -trend_value
-
-            # Apply gating mode
-            if mode == 'hard':
-                gated_value = 1.0 if trend_value > 0 else 0.0
-            else:  # 'soft'
-                gated_value = max(0.0, min(1.0, trend_value))
+            trend_values = matrix[rows[trend_name]]
+            if plan.bearish:
+                trend_values = -trend_values
 
-            trend_values.append((gated_value, weight))
+            # Apply gating mode (soft clamp keeps min()/max() semantics, so NaN gates to 1.0)
+            if hard:
+                gated = np.where(trend_values > 0, 1.0, 0.0)
+            else:
+                gated = np.where(trend_values < 1.0, trend_values, 1.0)
+                gated = np.where(gated > 0.0, gated, 0.0)
+            gated_rows.append(gated)
+            weights.append(weight)
 
-        if not trend_values:
-            return 1.0
+        if not gated_rows:
+            return None
 
         # Combine based on logic
-        if trend_logic.upper() == 'AND':
-            gate = min(v for v, w in trend_values)
-        elif trend_logic.upper() == 'OR':
-            gate = max(v for v, w in trend_values)
+        if plan.trend_logic == 'AND':
+            gate = np.min(gated_rows, axis=0)
+        elif plan.trend_logic == 'OR':
+            gate = np.max(gated_rows, axis=0)
         else:  # 'AVG'
-            total_weight = sum(w for v, w in trend_values)
-            gate = sum(v * w for v, w in trend_values) / total_weight if total_weight > 0 else 1.0
+            total_weight = sum(weights)
+            if total_weight > 0:
+                weighted = np.zeros(timeline_length)
+                for gated, weight in zip(gated_rows, weights):
+                    weighted = weighted + gated * weight
+                gate = weighted / total_weight
+            else:
+                gate = np.ones(timeline_length)
 
-        return gate if gate >= trend_threshold else 0.0
\ No newline at end of file
+        return np.where(gate >= plan.trend_threshold, gate, 0.0)
@@ -0,0 +1,160 @@
+"""
+Backtest candle data in shared memory for fitness worker processes.
+
+Instead of pickling each split's BacktestDataStreamer (aggregators plus tick
+history) into every executor.map task, the parent exports the candle columns of
+every split once into multiprocessing.shared_memory blocks. Pool workers get the
+small block descriptors through the executor initializer and rebuild read-only
+aggregators over the shared columns on first use of a split, so tasks only carry
+the individual and a split index.
+"""
+
+from dataclasses import dataclass, field
+from datetime import tzinfo
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from candle_aggregator.candle_aggregator import CandleAggregator
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from candle_aggregator.candle_store import FIELDS, epoch_ms_to_datetimes
+from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("SharedBacktestData")
+
+
+@dataclass
+class SharedAggregatorSpec:
+    """Location and metadata of one aggregator's candle columns in shared memory"""
+    shm_name: str
+    length: int
+    symbol: str
+    timeframe: str
+    agg_type: str
+    include_extended_hours: bool
+    has_live: bool
+    tz: Optional[tzinfo]
+
+
+@dataclass
+class SharedSplitSpec:
+    """One data split (BacktestDataStreamer) exported to shared memory"""
+    ticker: str
+    start_date: str
+    end_date: str
+    data_key: str
+    aggregators: Dict[str, SharedAggregatorSpec] = field(default_factory=dict)
+
+
+def _block_size(length: int) -> int:
+    # int64 timestamps followed by the (5, n) float64 OHLCV block
+    return max(1, length * 8 * (1 + len(FIELDS)))
+
+
+def _column_views(buffer, length: int):
+    timestamps = np.ndarray((length,), dtype=np.int64, buffer=buffer)
+    values = np.ndarray((len(FIELDS), length), dtype=np.float64, buffer=buffer, offset=length * 8)
+    return timestamps, values
+
+
+class SharedBacktestData:
+    """
+    Owner (parent process) of the shared memory blocks for a list of data splits.
+
+    `splits` is what the pool initializer passes to workers. Call close() once the
+    pool is shut down to release the blocks.
+    """
+
+    def __init__(self, streamers: List[BacktestDataStreamer]) -> None:
+        self._blocks: List[shared_memory.SharedMemory] = []
+        try:
+            self.splits: List[SharedSplitSpec] = [self._export_split(streamer) for streamer in streamers]
+        except Exception:
+            self.close()
+            raise
+        total_bytes = sum(block.size for block in self._blocks)
+        logger.info(f"Exported {len(self.splits)} data splits to shared memory "
+                    f"({len(self._blocks)} blocks, {total_bytes / 1e6:.1f} MB)")
+
+    def _export_split(self, streamer: BacktestDataStreamer) -> SharedSplitSpec:
+        split = SharedSplitSpec(streamer.ticker, streamer.start_date, streamer.end_date, streamer.data_key)
+        for agg_key, aggregator in streamer.aggregators.items():
+            timestamps, values, timestamp_objects, has_live = aggregator.export_columns()
+            length = len(timestamps)
+
+            block = shared_memory.SharedMemory(create=True, size=_block_size(length))
+            self._blocks.append(block)
+            shared_timestamps, shared_values = _column_views(block.buf, length)
+            shared_timestamps[:] = timestamps
+            shared_values[:] = values
+
+            tz = next((stamp.tzinfo for stamp in timestamp_objects if stamp is not None), None)
+            split.aggregators[agg_key] = SharedAggregatorSpec(
+                block.name, length, aggregator.symbol, aggregator.timeframe, aggregator._get_aggregator_type(),
+                aggregator.include_extended_hours, has_live, tz)
+        return split
+
+    def close(self) -> None:
+        """Release (unlink) all blocks; workers must be done with them"""
+        for block in self._blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+
+def attach_split(spec: SharedSplitSpec, blocks: Dict[str, shared_memory.SharedMemory]) -> BacktestDataStreamer:
+    """
+    Build a BacktestDataStreamer over a split's shared columns (no candle copies).
+
+    Opened blocks are added to `blocks`; they must stay referenced while the
+    streamer is in use.
+    """
+    aggregators: Dict[str, CandleAggregator] = {}
+    for agg_key, agg_spec in spec.aggregators.items():
+        block = shared_memory.SharedMemory(name=agg_spec.shm_name)
+        blocks[agg_spec.shm_name] = block
+        timestamps, values = _column_views(block.buf, agg_spec.length)
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+
+        aggregator_class = CAHeiken if agg_spec.agg_type == "heiken" else CANormal
+        aggregators[agg_key] = aggregator_class.from_columns(
+            agg_spec.symbol, agg_spec.timeframe, agg_spec.include_extended_hours,
+            timestamps, values, epoch_ms_to_datetimes(timestamps, agg_spec.tz), agg_spec.has_live)
+
+    streamer = BacktestDataStreamer()
+    streamer.initialize(aggregators, {'ticker': spec.ticker, 'start_date': spec.start_date,
+                                      'end_date': spec.end_date})
+    # Same split identity as the parent's streamer (indicator memo key)
+    streamer.data_key = spec.data_key
+    return streamer
+
+
+# ----- worker process state (set by the pool initializer) -----
+
+_worker_splits: List[SharedSplitSpec] = []
+_worker_blocks: Dict[str, shared_memory.SharedMemory] = {}
+_worker_streamers: Dict[int, BacktestDataStreamer] = {}
+
+
+def init_worker(splits: List[SharedSplitSpec]) -> None:
+    """ProcessPoolExecutor initializer: remember the shared splits of this run"""
+    global _worker_splits
+    _worker_splits = splits
+    _worker_streamers.clear()
+    _worker_blocks.clear()
+
+
+def get_worker_streamer(split_index: int) -> BacktestDataStreamer:
+    """The worker's streamer for a split, attached to shared memory on first use"""
+    streamer = _worker_streamers.get(split_index)
+    if streamer is None:
+        streamer = attach_split(_worker_splits[split_index], _worker_blocks)
+        _worker_streamers[split_index] = streamer
+    return streamer
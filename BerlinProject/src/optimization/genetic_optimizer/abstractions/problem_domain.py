@@ -38,6 +38,14 @@ class ProblemDomain(ABC):
     def get_sorted_individual_stats(self, stats: List[IndividualStats]) -> List[IndividualStats]:
         return self.fitness_calculator.get_sorted_individual_stats(stats)
 
+    def encode_population(self, population: List[IndividualBase]) -> np.ndarray:
+        """Population as a genome matrix (one row per individual), used for checkpoints"""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
+    def decode_population(self, genomes: np.ndarray, sources: List[str]) -> List[IndividualBase]:
+        """Individuals from encode_population() rows"""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
     @abstractmethod
     def elitist_offspring(self, elitist: IndividualBase) -> IndividualBase:
         raise NotImplementedError
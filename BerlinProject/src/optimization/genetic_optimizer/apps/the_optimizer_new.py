@@ -6,6 +6,7 @@ import random
 import argparse
 
 from optimization.genetic_optimizer.apps.utils.mlf_optimizer_config import MlfOptimizerConfig
+from optimization.genetic_optimizer.genetic_algorithm.checkpoint import GACheckpoint
 
 
 def display_final_results(fitness_calculator, best_individual):
@@ -94,6 +95,10 @@ if __name__ == "__main__":
     parser.add_argument("-s", '--seed', type=int, help="Set the numpy random number seed.", default=6999)
     parser.add_argument("-v", '--visualize', action='store_true', default=False,
                         help='Pop up the graphs for run-time visualization.')
+    parser.add_argument('-c', '--checkpoint', type=str, default="",
+                        help="Checkpoint file (default: <output>/checkpoints/<test name>.npz).")
+    parser.add_argument('-r', '--resume', action='store_true', default=False,
+                        help='Resume from the checkpoint file instead of starting a new run.')
 
     args = parser.parse_args()
 
@@ -126,12 +131,12 @@ if __name__ == "__main__":
     tn = test_name.replace(' ', '-')
     tn = tn.replace('/', '-')
 
-    # Create log files
+    # Create log files (a resumed run appends to the logs of the interrupted one)
     log_p = Path(log_path) / f'{tn}.csv'
-    if log_p.exists():
+    if log_p.exists() and not args.resume:
         log_p.unlink()
     log_p = Path(log_path) / f'{tn}.iterations'
-    if log_p.exists():
+    if log_p.exists() and not args.resume:
         log_p.unlink()
 
     # Load configuration and create optimizer
@@ -141,6 +146,14 @@ if __name__ == "__main__":
     io = MlfOptimizerConfig.from_json(config_data, data_config_file)
     genetic_algorithm = io.create_project()
 
+    # Checkpoints: written every checkpoint_interval generations, --resume continues from the last one
+    checkpoint_file = Path(args.checkpoint) if args.checkpoint else output_path / 'checkpoints' / f'{tn}.npz'
+    genetic_algorithm.checkpoint_path = str(checkpoint_file)
+    if args.resume:
+        checkpoint = GACheckpoint.load(str(checkpoint_file))
+        genetic_algorithm.resume(checkpoint)
+        print(f"▶️  Resuming from {checkpoint_file} at generation {checkpoint.generation}")
+
     print(f"🚀 Starting optimization: {test_name}")
     print(f"   Generations: {genetic_algorithm.number_of_generations}")
     print(f"   Population Size: {genetic_algorithm.population_size}")
@@ -168,8 +181,9 @@ if __name__ == "__main__":
         eta = dt * (genetic_algorithm.number_of_generations - stats[0].iteration)
         # eta = (dt / (stats[0].iteration + 1)) * (genetic_algorithm.number_of_generations - stats[0].iteration)
 
+        duplicate_rate = io.fitness_calculator.get_fitness_cache_stats()['generation_duplicate_rate']
         out_str = f"{test_name}, {stats[0].iteration}/{genetic_algorithm.number_of_generations}, " \
-                  f"{dt:.2f}s, eta: {eta / 60:.2f}m, {metric_out}"
+                  f"{dt:.2f}s, eta: {eta / 60:.2f}m, duplicates: {duplicate_rate:.0%}, {metric_out}"
 
         print(out_str)
 
@@ -1,5 +1,7 @@
 # optimization/genetic_optimizer/apps/utils/mlf_optimizer_config.py - Updated for unified trade executor
 
+import copy
+import multiprocessing as mp
 from typing import Optional, List, Dict
 from dataclasses import dataclass, field
 
@@ -9,6 +11,7 @@ from optimization.genetic_optimizer.apps.utils.objectives import Objective
 
 from optimization.mlf_optimizer import MlfProblem, MlfFitnessCalculator, MlfIndividual
 from optimization.genetic_optimizer.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from optimization.genetic_optimizer.genetic_algorithm.island_model import IslandModel
 from optimization.genetic_optimizer.abstractions.objective_function_base import ObjectiveFunctionBase
 
 from models.monitor_configuration import MonitorConfiguration
@@ -37,20 +40,57 @@ class MlfOptimizerConfig:
     objectives_dict: Optional[Dict[str, ObjectiveFunctionBase]] = None
     model_config: dict = None
 
+    # Streamers the optimizer UI charts on, by data split (see chart_streamer)
+    _chart_streamers: Dict[tuple, BacktestDataStreamer] = field(default_factory=dict, init=False, repr=False)
+
     def __post_init__(self):
         self.model_config = {"preprocess_config": "test_ds"}
 
+    def split_configs(self) -> List[Dict]:
+        """Data configs of the training splits (before empty splits are dropped)"""
+        dc = DataContainer.from_file(self.data_config_file)
+        dc.create_splits(self.hyper_parameters.num_splits, self.hyper_parameters.daily_splits)
+        return dc.split_configs
+
+    def chart_streamer(self, data_split: Optional[Dict[str, str]] = None) -> BacktestDataStreamer:
+        """
+        Streamer over a training split for charting an individual evaluated on it
+        (MlfIndividualStats.data_split; None: the first split). It is never one of
+        the fitness calculator's streamers, so charts can be built and fallback
+        backtests run while the GA evaluates the next generation. Training splits
+        that are not loaded in this process (island runs) are loaded on first use.
+        """
+        streamers = self.fitness_calculator.backtest_streamers if self.fitness_calculator else []
+        if data_split is None:
+            data_split = streamers[0].data_split() if streamers else self.split_configs()[0]
+        key = tuple(sorted(data_split.items()))
+        streamer = self._chart_streamers.get(key)
+        if streamer is not None:
+            return streamer
+
+        streamer = BacktestDataStreamer()
+        source = next((split for split in streamers if split.data_split() == data_split), None)
+        if source is not None:
+            # Shares the split's read-only data
+            streamer.copy_data_from(source)
+            streamer.replace_monitor_config(self.monitor_config)
+        else:
+            aggregator_list = list(self.monitor_config.get_aggregator_configs().keys())
+            streamer.initialize(CSAContainer(data_split, aggregator_list).get_aggregators(), data_split,
+                                self.monitor_config)
+        self._chart_streamers[key] = streamer
+        return streamer
+
     def create_project(self) -> GeneticAlgorithm:
         """Create genetic algorithm project with data splits"""
         # Load data and create splits
-        dc = DataContainer.from_file(self.data_config_file)
-        dc.create_splits(self.hyper_parameters.num_splits, self.hyper_parameters.daily_splits)
+        split_configs = self.split_configs()
 
         # Create streamers for each split
         backtest_streamers: List[BacktestDataStreamer] = []
         aggregator_list = list(self.monitor_config.get_aggregator_configs().keys())
 
-        for split_config in dc.split_configs:
+        for split_config in split_configs:
             csa = CSAContainer(split_config, aggregator_list)
             streamer = BacktestDataStreamer()
             streamer.initialize(csa.get_aggregators(), split_config, self.monitor_config)
@@ -70,29 +110,14 @@ class MlfOptimizerConfig:
         # Validate we have at least one valid streamer
         if not backtest_streamers:
             raise ValueError(
-                f"ERROR: No valid data streamers created. All {len(dc.split_configs)} splits had empty TICK data. "
+                f"ERROR: No valid data streamers created. All {len(split_configs)} splits had empty TICK data. "
                 f"Cannot proceed with optimization without training data."
             )
 
-        logger.info(f"Created {len(backtest_streamers)} valid data streamers out of {len(dc.split_configs)} splits")
-
-        # Create fitness calculator with worker configuration
-        # If num_workers is 0, use sequential execution (force_sequential=True)
-        # If num_workers > 0, use parallel execution with max_workers
-        force_sequential = (self.hyper_parameters.num_workers == 0)
-        max_workers = self.hyper_parameters.num_workers if self.hyper_parameters.num_workers > 0 else None
+        logger.info(f"Created {len(backtest_streamers)} valid data streamers out of {len(split_configs)} splits")
 
-        self.fitness_calculator = MlfFitnessCalculator(
-            backtest_streamers=backtest_streamers,
-            force_sequential=force_sequential,
-            max_workers=max_workers,
-            split_repeat_count=self.hyper_parameters.split_repeats
-        )
-
-        # Add objectives to fitness calculator
-        for obj_name, objective in self.objectives.items():
-            obj_instance = objective.create_objective()
-            self.fitness_calculator.add_objective(obj_instance)
+        self.fitness_calculator = self._create_fitness_calculator(backtest_streamers,
+                                                                  self.hyper_parameters.num_workers)
 
         # Create problem instance with seed_with_original setting
         problem = MlfProblem(
@@ -110,11 +135,66 @@ class MlfOptimizerConfig:
             elitist_size=self.hyper_parameters.elite_size,
             chance_of_mutation=self.hyper_parameters.chance_of_mutation,
             chance_of_crossover=self.hyper_parameters.chance_of_crossover,
-            random_seed=self.hyper_parameters.random_seed
+            random_seed=self.hyper_parameters.random_seed,
+            checkpoint_interval=self.hyper_parameters.checkpoint_interval
         )
 
         return genetic_algorithm
 
+    def _create_fitness_calculator(self, backtest_streamers: List[BacktestDataStreamer],
+                                   num_workers: Optional[int]) -> MlfFitnessCalculator:
+        # Create fitness calculator with worker configuration
+        # If num_workers is 0, use sequential execution (force_sequential=True)
+        # If num_workers > 0, use parallel execution with max_workers (unset: one worker per CPU)
+        fitness_calculator = MlfFitnessCalculator(
+            backtest_streamers=backtest_streamers,
+            force_sequential=(num_workers == 0),
+            max_workers=num_workers or None,
+            split_repeat_count=self.hyper_parameters.split_repeats,
+            racing_stages=self.hyper_parameters.racing_stages,
+            racing_confidence=self.hyper_parameters.racing_confidence,
+            racing_dominance=self.hyper_parameters.racing_dominance,
+            indicator_memo_megabytes=self.hyper_parameters.indicator_memo_megabytes
+        )
+
+        # Add objectives to fitness calculator
+        for obj_name, objective in self.objectives.items():
+            obj_instance = objective.create_objective()
+            fitness_calculator.add_objective(obj_instance)
+        return fitness_calculator
+
+    def create_island_model(self) -> IslandModel:
+        """
+        Island-model run of this configuration: each island process builds its own
+        project (data splits, fitness calculator, problem) with its own seed, and
+        the CPUs are shared out between the islands' worker pools.
+
+        No training split is loaded in this process: its fitness calculator only
+        evaluates elites on test data (add_evaluation_streamer), with a pool sized
+        for the elites that are evaluated, and charts load their split on demand
+        (chart_streamer).
+        """
+        hp = self.hyper_parameters
+        elites_to_evaluate = (self.configuration or {}).get('ga_hyperparameters', {}).get('elites_to_save', 5)
+        self.fitness_calculator = self._create_fitness_calculator(
+            [], 0 if hp.num_workers == 0 else min(elites_to_evaluate, hp.num_workers or mp.cpu_count()))
+        workers_per_island = 0
+        if hp.num_workers != 0:
+            workers_per_island = (hp.num_workers or mp.cpu_count()) // hp.islands
+            if workers_per_island <= 1:
+                workers_per_island = 0  # one process per island: evaluate sequentially inside it
+
+        return IslandModel(
+            factory=MlfIslandFactory(self.configuration, self.data_config_file, workers_per_island),
+            number_of_islands=hp.islands,
+            number_of_generations=hp.number_of_iterations,
+            population_size=hp.population_size,
+            elitist_size=hp.elite_size,
+            migration_interval=hp.migration_interval,
+            migration_size=hp.migration_size,
+            random_seed=hp.random_seed
+        )
+
     def get_trade_executor_summary(self) -> Dict:
         """Get summary of trade executor configuration for logging"""
         trade_exec_config = self.monitor_config.trade_executor
@@ -191,4 +271,18 @@ class MlfOptimizerConfig:
             data_config_file=data_config_file,
             monitor_config=monitor_config,
             configuration=resources
-        )
\ No newline at end of file
+        )
+
+@dataclass
+class MlfIslandFactory:
+    """Builds one island's GeneticAlgorithm from the optimizer JSON (picklable for the island processes)"""
+    configuration: Json
+    data_config_file: str
+    workers_per_island: int = 0
+
+    def __call__(self, island: int, seed: int) -> GeneticAlgorithm:
+        configuration = copy.deepcopy(self.configuration)
+        hyper_parameters = configuration.setdefault('ga_hyperparameters', {})
+        hyper_parameters['random_seed'] = seed
+        hyper_parameters['num_workers'] = self.workers_per_island
+        return MlfOptimizerConfig.from_json(configuration, self.data_config_file).create_project()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 from optimization.genetic_optimizer.support.types import Json
 
 
@@ -12,10 +13,22 @@ class GAHyperparameters:
     chance_of_crossover: float
     num_splits: int
     random_seed: int = 0
-    num_workers: int = 0
+    num_workers: Optional[int] = None  # None: one worker per CPU, 0: sequential
     split_repeats: int = 3
     daily_splits: bool = False
     seed_with_original: bool = True  # Include original monitor config as first individual
+    # Island model: populations evolved in parallel processes with elite migration (1: single population)
+    islands: int = 1
+    migration_interval: int = 5
+    migration_size: int = 2
+    # Generations between checkpoints when the caller sets a checkpoint path (0: no checkpoints)
+    checkpoint_interval: int = 1
+    # Racing: leading fractions of the split that screen individuals before the full backtest (empty: off)
+    racing_stages: Tuple[float, ...] = ()
+    racing_confidence: float = 1.0
+    racing_dominance: float = 0.5
+    # Memory budget of the indicator memo in each evaluating process (every worker keeps its own)
+    indicator_memo_megabytes: float = 128.0
 
     @staticmethod
     def from_json(json: Json) -> 'GAHyperparameters':
@@ -27,10 +40,18 @@ class GAHyperparameters:
         chance_of_crossover = json.get('chance_of_crossover', 0.075)
         num_splits = json.get('num_splits', 4)
         random_seed = json.get('random_seed', 0)
-        num_workers = json.get('num_workers', 0)
+        num_workers = json.get('num_workers')
         split_repeats = json.get('split_repeats', 3)
         daily_splits = json.get('daily_splits', False)
         seed_with_original = json.get('seed_with_original', True)
+        islands = json.get('islands', 1)
+        migration_interval = json.get('migration_interval', 5)
+        migration_size = json.get('migration_size', 2)
+        checkpoint_interval = json.get('checkpoint_interval', 1)
+        racing_stages = tuple(json.get('racing_stages', ()))
+        racing_confidence = json.get('racing_confidence', 1.0)
+        racing_dominance = json.get('racing_dominance', 0.5)
+        indicator_memo_megabytes = json.get('indicator_memo_megabytes', 128.0)
         return GAHyperparameters(number_of_iterations=number_of_iterations,
                                  population_size=population_size,
                                  propagation_fraction=propagation_fraction,
@@ -42,5 +63,13 @@ class GAHyperparameters:
                                  num_workers=num_workers,
                                  split_repeats=split_repeats,
                                  daily_splits=daily_splits,
-                                 seed_with_original=seed_with_original)
+                                 seed_with_original=seed_with_original,
+                                 islands=islands,
+                                 migration_interval=migration_interval,
+                                 migration_size=migration_size,
+                                 checkpoint_interval=checkpoint_interval,
+                                 racing_stages=racing_stages,
+                                 racing_confidence=racing_confidence,
+                                 racing_dominance=racing_dominance,
+                                 indicator_memo_megabytes=indicator_memo_megabytes)
 
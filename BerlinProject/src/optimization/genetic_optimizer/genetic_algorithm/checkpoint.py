@@ -0,0 +1,119 @@
+"""
+Checkpoints of GeneticAlgorithm runs.
+
+A checkpoint is written after the next population has been bred, so a resumed
+run continues with exactly the population (and random number state) the
+interrupted run would have evaluated next. It is one NPZ file:
+
+- genomes of the next population (one row per individual) and their sources
+- fitness values of the generation that was just evaluated
+- best/worst metric history of the StatisticsObserver
+- Python and NumPy random number generator states
+- the fitness calculator's own state (e.g. which data split it is on)
+- `extras`: JSON data of the caller (e.g. ParameterCollector state and the
+  best-individual log of the optimizer UI)
+"""
+
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+
+def _json_default(value):
+    """JSON for the NumPy values that end up in metrics and parameter data"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} in a checkpoint")
+
+
+def _metric_rows(metrics: List) -> np.ndarray:
+    if not metrics:
+        return np.empty((0, 0), dtype=np.float64)
+    return np.array([np.asarray(row, dtype=np.float64) for row in metrics], dtype=np.float64)
+
+
+@dataclass
+class GACheckpoint:
+    generation: int  # next generation to evaluate (0-based)
+    genomes: np.ndarray
+    sources: List[str]
+    fitness_values: np.ndarray
+    best_metrics: np.ndarray
+    worst_metrics: np.ndarray
+    python_random_state: tuple
+    numpy_random_state: tuple
+    fitness_state: Dict[str, Any] = field(default_factory=dict)
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, generation: int, genomes: np.ndarray, sources: List[str], fitness_values: List,
+                statistics_observer=None, fitness_state: Optional[Dict[str, Any]] = None,
+                extras: Optional[Dict[str, Any]] = None) -> "GACheckpoint":
+        """Checkpoint with the current random number generator states"""
+        return cls(generation=generation,
+                   genomes=np.asarray(genomes, dtype=np.float64),
+                   sources=list(sources),
+                   fitness_values=_metric_rows(fitness_values),
+                   best_metrics=_metric_rows(getattr(statistics_observer, 'best_metrics', None)),
+                   worst_metrics=_metric_rows(getattr(statistics_observer, 'worst_metrics', None)),
+                   python_random_state=random.getstate(),
+                   numpy_random_state=np.random.get_state(),
+                   fitness_state=fitness_state or {},
+                   extras=extras or {})
+
+    def restore_random_state(self) -> None:
+        random.setstate(self.python_random_state)
+        np.random.set_state(self.numpy_random_state)
+
+    def save(self, path: str) -> None:
+        """Write the checkpoint atomically (an interrupted write keeps the previous checkpoint)"""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        python_version, python_keys, python_gauss = self.python_random_state
+        numpy_name, numpy_keys, numpy_pos, numpy_has_gauss, numpy_gauss = self.numpy_random_state
+        meta = {
+            'version': CHECKPOINT_VERSION,
+            'generation': self.generation,
+            'sources': self.sources,
+            'python_random': [python_version, python_gauss],
+            'numpy_random': [numpy_name, int(numpy_pos), int(numpy_has_gauss), float(numpy_gauss)],
+            'fitness_state': self.fitness_state,
+            'extras': self.extras
+        }
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp_path, meta=np.array(json.dumps(meta, default=_json_default)),
+                            genomes=self.genomes, fitness_values=self.fitness_values,
+                            best_metrics=self.best_metrics, worst_metrics=self.worst_metrics,
+                            python_random_keys=np.array(python_keys, dtype=np.int64),
+                            numpy_random_keys=np.asarray(numpy_keys, dtype=np.uint32))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GACheckpoint":
+        with np.load(Path(path).expanduser(), allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('version') != CHECKPOINT_VERSION:
+                raise ValueError(f"Unsupported checkpoint version {meta.get('version')} in {path}")
+            python_version, python_gauss = meta['python_random']
+            numpy_name, numpy_pos, numpy_has_gauss, numpy_gauss = meta['numpy_random']
+            return cls(generation=meta['generation'],
+                       genomes=data['genomes'],
+                       sources=meta['sources'],
+                       fitness_values=data['fitness_values'],
+                       best_metrics=data['best_metrics'],
+                       worst_metrics=data['worst_metrics'],
+                       python_random_state=(python_version, tuple(data['python_random_keys'].tolist()),
+                                            python_gauss),
+                       numpy_random_state=(numpy_name, data['numpy_random_keys'], numpy_pos, numpy_has_gauss,
+                                           numpy_gauss),
+                       fitness_state=meta['fitness_state'],
+                       extras=meta['extras'])
@@ -1,10 +1,13 @@
 from typing import Iterable, NamedTuple
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Dict, Tuple, Optional
 import random
 
+import numpy as np
+
 from .observer import StatisticsObserver, Observer
+from .checkpoint import GACheckpoint
 from optimization.genetic_optimizer.abstractions.individual_stats import IndividualStats
 
 from optimization.genetic_optimizer.abstractions import ProblemDomain, IndividualBase
@@ -46,7 +49,13 @@ class GeneticAlgorithm:
     diversity_threshold: float = 0.80  # Trigger reinjection when similarity > 80%
     diversity_mutation_multiplier: float = 3.0  # Heavy mutation rate for diversity individuals
     diversity_random_fraction: float = 0.30  # Fraction of reinjected individuals that are random
-
+    # Individuals from other islands (island model) to place into the next generation
+    pending_immigrants: List[IndividualBase] = field(default_factory=list, repr=False)
+    # Checkpoints: every `checkpoint_interval` generations the next population is written to checkpoint_path
+    checkpoint_path: Optional[str] = None
+    checkpoint_interval: int = 1
+    checkpoint_extras: Optional[Callable[[], Dict[str, Any]]] = field(default=None, repr=False)
+    resume_checkpoint: Optional[GACheckpoint] = field(default=None, repr=False)
 
     def __post_init__(self):
         # Set random seeds for reproducibility if seed > 0
@@ -91,8 +100,8 @@ class GeneticAlgorithm:
                 break
 
     def run_ga_iterations(self, show_step: int) -> Iterable[Tuple[Observer, StatisticsObserver]]:
-        population = self.__initial_generation()
-        for iteration in range(0, self.number_of_generations):
+        first_iteration, population = self.__start_population()
+        for iteration in range(first_iteration, self.number_of_generations):
             self.iteration_index = iteration
             observer = Observer(iteration=iteration)
             fitness_results = self.__calculate_fitness(iteration=iteration, population=population)
@@ -113,7 +122,47 @@ class GeneticAlgorithm:
             # TODO:  Should be putting objectives as a stopping criteria??
             if iteration != self.number_of_generations - 1:
                 population = self.prepare_next_generation(fronts)
-
+                population = self._place_immigrants(population)
+                self._write_checkpoint(iteration + 1, population, fitness_results)
+
+    def _write_checkpoint(self, next_iteration: int, population: List[IndividualBase],
+                          fitness_results: List[IndividualStats]):
+        """Checkpoint the bred population for generation `next_iteration` (when one is due)"""
+        if not self.checkpoint_path or self.checkpoint_interval <= 0 or next_iteration % self.checkpoint_interval:
+            return
+        fitness_calculator = self.problem_domain.fitness_calculator
+        try:
+            checkpoint = GACheckpoint.capture(
+                generation=next_iteration,
+                genomes=self.problem_domain.encode_population(population),
+                sources=[individual.source for individual in population],
+                fitness_values=[stats.fitness_values for stats in fitness_results],
+                statistics_observer=self.statistics_observer,
+                fitness_state=(fitness_calculator.checkpoint_state()
+                               if hasattr(fitness_calculator, 'checkpoint_state') else None),
+                extras=self.checkpoint_extras() if self.checkpoint_extras else None)
+            checkpoint.save(self.checkpoint_path)
+            logger.info(f"💾 Checkpoint for generation {next_iteration} written to {self.checkpoint_path}")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write checkpoint {self.checkpoint_path}: {e}")
+
+    def resume(self, checkpoint: GACheckpoint):
+        """Continue from a checkpoint on the next run_ga_iterations() call"""
+        self.resume_checkpoint = checkpoint
+
+
+    def receive_immigrants(self, immigrants: List[IndividualBase]):
+        """Queue individuals from another population for the next generation"""
+        self.pending_immigrants.extend(immigrants)
+
+    def _place_immigrants(self, population: List[IndividualBase]) -> List[IndividualBase]:
+        """Replace the tail of the population (never the elites) with the pending immigrants"""
+        count = min(len(self.pending_immigrants), max(0, len(population) - self.elitist_size))
+        if count:
+            population = population[:len(population) - count] + self.pending_immigrants[:count]
+            logger.info(f"Placed {count} immigrants into generation {self.iteration_index + 1}")
+        self.pending_immigrants = []
+        return population
 
     @staticmethod
     def debug_population(population, caller):
@@ -343,6 +392,23 @@ class GeneticAlgorithm:
     def __initial_generation(self) -> List[IndividualBase]:
         return self.problem_domain.create_initial_population(self.population_size)
 
+    def __start_population(self) -> Tuple[int, List[IndividualBase]]:
+        """First generation index and its population (from the resume checkpoint, if any)"""
+        checkpoint, self.resume_checkpoint = self.resume_checkpoint, None
+        if checkpoint is None:
+            return 0, self.__initial_generation()
+
+        population = self.problem_domain.decode_population(checkpoint.genomes, checkpoint.sources)
+        checkpoint.restore_random_state()
+        fitness_calculator = self.problem_domain.fitness_calculator
+        if checkpoint.fitness_state and hasattr(fitness_calculator, 'restore_checkpoint_state'):
+            fitness_calculator.restore_checkpoint_state(checkpoint.fitness_state)
+        self.statistics_observer.best_metrics = [np.array(row) for row in checkpoint.best_metrics]
+        self.statistics_observer.worst_metrics = [np.array(row) for row in checkpoint.worst_metrics]
+        self.iteration_index = checkpoint.generation
+        logger.info(f"▶️ Resuming at generation {checkpoint.generation} with {len(population)} individuals")
+        return checkpoint.generation, population
+
     def __calculate_fitness(self, iteration: int, population: List[IndividualBase]) -> List[IndividualStats]:
         fitness = self.problem_domain.calculate_fitness_functions(iteration_key=iteration,
                                                                   population=population)
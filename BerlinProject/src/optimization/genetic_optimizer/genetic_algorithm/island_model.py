@@ -0,0 +1,255 @@
+"""
+Island-model runner: several GeneticAlgorithm populations in separate processes.
+
+Each island builds its own GeneticAlgorithm through a picklable factory
+(island index, random seed) and evolves it independently. Every
+`migration_interval` generations each island sends copies of its best
+`migration_size` individuals to the next island in a ring and waits for the
+ones from its predecessor, which replace the tail of its next population.
+Because the exchange is synchronous, seeded islands give repeatable runs.
+
+The parent merges the islands' first Pareto fronts per generation into one
+set of fronts, so IslandModel.run_ga_iterations() can be consumed like
+GeneticAlgorithm.run_ga_iterations() (e.g. by the optimizer UI). pause(),
+resume() and stop() are passed on to the islands, which check them between
+generations (a paused island also releases its worker pool).
+"""
+
+import copy
+import multiprocessing as mp
+import queue
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from optimization.genetic_optimizer.abstractions.individual_stats import IndividualStats
+from optimization.genetic_optimizer.genetic_algorithm.observer import Observer, StatisticsObserver
+from optimization.genetic_optimizer.genetic_algorithm.pareto_front import (
+    collect_domination_statistics, collect_fronts, crowd_sort
+)
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("IslandModel")
+
+# Seconds an island waits for its neighbour's migrants before continuing without them
+MIGRATION_TIMEOUT = 600
+
+
+def _report_copy(stats: IndividualStats) -> IndividualStats:
+    """Front member for the parent, without the links to the rest of the island's population"""
+    report = copy.copy(stats)
+    report.dominates_over = []
+    report.dominated_by_count = 0
+    report.crowding_distance = 0
+    return report
+
+
+def _shutdown_fitness_pool(genetic_algorithm) -> None:
+    fitness_calculator = getattr(getattr(genetic_algorithm, 'problem_domain', None), 'fitness_calculator', None)
+    if hasattr(fitness_calculator, 'shutdown_executor'):
+        fitness_calculator.shutdown_executor()
+
+
+def _wait_while_paused(genetic_algorithm, paused, stopped) -> bool:
+    """Block while the run is paused (without a worker pool); False once it is stopped"""
+    if paused is not None and paused.is_set() and not (stopped is not None and stopped.is_set()):
+        # The pool restarts on the next generation
+        _shutdown_fitness_pool(genetic_algorithm)
+        while paused.is_set() and not stopped.is_set():
+            time.sleep(0.1)
+    return stopped is None or not stopped.is_set()
+
+
+def _seed_unseeded_island(seed: int) -> None:
+    """
+    GeneticAlgorithm only seeds for seed > 0 and forked islands inherit the
+    parent's RNG state, so unseeded islands would all make the same draws.
+    Give them their own state from OS entropy instead.
+    """
+    if seed <= 0:
+        entropy = np.random.SeedSequence().generate_state(1)[0]
+        np.random.seed(entropy)
+        random.seed(int(entropy))
+
+
+def _receive_migrants(inbox, paused, stopped):
+    """Migrants from the previous island; time spent paused does not count towards MIGRATION_TIMEOUT"""
+    waited = 0.0
+    while waited < MIGRATION_TIMEOUT:
+        if stopped is not None and stopped.is_set():
+            break
+        try:
+            return inbox.get(timeout=1.0)
+        except queue.Empty:
+            if paused is None or not paused.is_set():
+                waited += 1.0
+    raise queue.Empty
+
+
+def run_island(factory: Callable[[int, int], Any], island: int, seed: int, migration_interval: int,
+               migration_size: int, inbox, outbox, reports, paused=None, stopped=None) -> None:
+    """
+    Island process: evolve one GeneticAlgorithm, report its first front every
+    generation and exchange migrants with the neighbouring islands. Between
+    generations it waits while `paused` is set and ends once `stopped` is set.
+    Reports are (island, generation, front) tuples and (island, None, error) at the end.
+    """
+    error = None
+    genetic_algorithm = None
+    try:
+        _seed_unseeded_island(seed)
+        genetic_algorithm = factory(island, seed)
+        last_generation = genetic_algorithm.number_of_generations - 1
+        for observer, _ in genetic_algorithm.run_ga_iterations(1):
+            front = observer.fronts[0] if observer.success and observer.fronts else []
+            reports.put((island, observer.iteration, [_report_copy(stats) for stats in front]))
+
+            if not (observer.iteration + 1) % migration_interval and observer.iteration != last_generation:
+                migrants = [stats.individual.copy_individual(f"migrant from island {island}")
+                            for stats in crowd_sort(front)[:migration_size]] if front else []
+                outbox.put(migrants)
+                try:
+                    genetic_algorithm.receive_immigrants(_receive_migrants(inbox, paused, stopped))
+                except queue.Empty:
+                    logger.warning(f"Island {island}: no migrants at generation {observer.iteration}")
+
+            if not _wait_while_paused(genetic_algorithm, paused, stopped):
+                logger.info(f"Island {island} stopped after generation {observer.iteration}")
+                break
+    except Exception as e:
+        logger.error(f"Island {island} failed: {e}")
+        error = str(e)
+    finally:
+        _shutdown_fitness_pool(genetic_algorithm)
+        reports.put((island, None, error))
+
+
+@dataclass
+class IslandModel:
+    """
+    Runs `number_of_islands` GeneticAlgorithm populations (built by `factory`) in
+    separate processes with ring migration of elites.
+
+    Island i uses seeds[i] when given, otherwise random_seed + i (0 leaves
+    every island unseeded: each one then draws from its own OS-entropy state).
+    """
+    factory: Callable[[int, int], Any]
+    number_of_islands: int
+    number_of_generations: int
+    population_size: int
+    elitist_size: int
+    migration_interval: int = 5
+    migration_size: int = 2
+    random_seed: int = 0
+    seeds: Optional[List[int]] = None
+    mp_context: Optional[Any] = None
+
+    _processes: List[Any] = field(default_factory=list, init=False, repr=False)
+    _paused: Any = field(default=None, init=False, repr=False)
+    _stopped: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.number_of_islands < 1:
+            raise ValueError("An island model needs at least one island")
+        if self.seeds is None:
+            self.seeds = [self.random_seed + island if self.random_seed > 0 else 0
+                          for island in range(self.number_of_islands)]
+        if len(self.seeds) != self.number_of_islands:
+            raise ValueError(f"Expected {self.number_of_islands} island seeds, got {len(self.seeds)}")
+        self.statistics_observer = StatisticsObserver(objectives=None)
+
+    def _start(self):
+        context = self.mp_context or mp.get_context()
+        inboxes = [context.Queue() for _ in range(self.number_of_islands)]
+        reports = context.Queue()
+        self._paused, self._stopped = context.Event(), context.Event()
+        self._processes = []
+        for island in range(self.number_of_islands):
+            # Ring topology: send to the next island, receive from the previous one
+            process = context.Process(
+                target=run_island, name=f"ga-island-{island}",
+                args=(self.factory, island, self.seeds[island], self.migration_interval, self.migration_size,
+                      inboxes[island], inboxes[(island + 1) % self.number_of_islands], reports,
+                      self._paused, self._stopped))
+            process.start()
+            self._processes.append(process)
+        logger.info(f"Started {self.number_of_islands} islands (seeds {self.seeds})")
+        return reports
+
+    def pause(self) -> None:
+        """Islands wait (and release their worker pools) after their current generation"""
+        if self._paused is not None:
+            self._paused.set()
+
+    def resume(self) -> None:
+        if self._paused is not None:
+            self._paused.clear()
+
+    def stop(self) -> None:
+        """Islands end after their current generation; run_ga_iterations() then finishes"""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    def shutdown(self, timeout: float = 5) -> None:
+        """Stop the islands, terminating the ones that do not end within `timeout` seconds"""
+        self.stop()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=5)
+        self._processes = []
+
+    def merge_fronts(self, island_fronts: Dict[int, List[IndividualStats]]) -> Dict[int, List[IndividualStats]]:
+        """Pareto fronts over the union of the islands' first fronts"""
+        merged = [stats for island in sorted(island_fronts) for stats in island_fronts[island]]
+        for index, stats in enumerate(merged):
+            stats.index = index
+        collect_domination_statistics(merged)
+        return collect_fronts(merged)
+
+    def run_ga_iterations(self, show_step: int) -> Iterable[Tuple[Observer, Optional[StatisticsObserver]]]:
+        """Merged (Observer, StatisticsObserver) per generation, like GeneticAlgorithm.run_ga_iterations"""
+        reports = self._start()
+        pending: Dict[int, Dict[int, List[IndividualStats]]] = {}
+        running = set(range(self.number_of_islands))
+        next_generation = 0
+        try:
+            while next_generation < self.number_of_generations and running:
+                try:
+                    island, generation, payload = reports.get(timeout=1.0)
+                except queue.Empty:
+                    for island in list(running):
+                        if not self._processes[island].is_alive():
+                            logger.error(f"Island {island} exited with code {self._processes[island].exitcode}")
+                            running.discard(island)
+                else:
+                    if generation is None:
+                        if payload:
+                            logger.error(f"Island {island} stopped: {payload}")
+                        running.discard(island)
+                    else:
+                        pending.setdefault(generation, {})[island] = payload
+
+                # Report each generation once every island still running has delivered it
+                while next_generation in pending and running <= set(pending[next_generation]):
+                    island_fronts = pending.pop(next_generation)
+                    generation, next_generation = next_generation, next_generation + 1
+                    observer = Observer(iteration=generation)
+                    fronts = self.merge_fronts(island_fronts)
+                    if not fronts:
+                        observer.success = False
+                        yield observer, None
+                        continue
+                    observer.individual_stats = [stats for front in fronts.values() for stats in front]
+                    self.statistics_observer.collect_metrics(fronts)
+                    if generation % show_step == 0 or generation == self.number_of_generations - 1:
+                        observer.complete(fronts=fronts)
+                        yield observer, self.statistics_observer
+        finally:
+            self.shutdown()
@@ -21,14 +21,40 @@ def is_dominating(solution_a: np.array, solution_b: np.array) -> bool:
     return False
 
 
+# Rows of the domination matrix evaluated per broadcast block (bounds the (rows, n, m) temporaries)
+DOMINATION_BLOCK_ROWS = 256
+
+
+def fitness_matrix(individuals: List[IndividualStats]) -> np.ndarray:
+    """Stack the fitness vectors of the individuals into an (n, objectives) float array"""
+    return np.array([ind.fitness_values for ind in individuals], dtype=float).reshape(len(individuals), -1)
+
+
+def domination_matrix(fitness: np.ndarray) -> np.ndarray:
+    """
+    Boolean (n, n) matrix where [i, j] is True when solution i dominates solution j
+    (same rule as is_dominating, evaluated for all pairs with NumPy broadcasting).
+    """
+    n = len(fitness)
+    dominates = np.zeros((n, n), dtype=bool)
+    for start in range(0, n, DOMINATION_BLOCK_ROWS):
+        block = fitness[start:start + DOMINATION_BLOCK_ROWS, None, :]
+        dominates[start:start + DOMINATION_BLOCK_ROWS] = (
+            (block <= fitness[None, :, :]).all(axis=2) & (block < fitness[None, :, :]).any(axis=2))
+    return dominates
+
+
 def collect_domination_statistics(individuals: List[IndividualStats]):
-    for i, solution_a in enumerate(individuals):
-        for j, solution_b in enumerate(individuals):
-            if i == j:
-                continue
-            if is_dominating(solution_a.fitness_values, solution_b.fitness_values):
-                solution_a.dominates(solution_b)
-                solution_b.dominated_by_solution()
+    if not individuals:
+        return
+    dominates = domination_matrix(fitness_matrix(individuals))
+    # No solution dominates itself, so the diagonal is already False
+    dominated_counts = dominates.sum(axis=0)
+    for solution_a, row in zip(individuals, dominates):
+        for j in np.flatnonzero(row):
+            solution_a.dominates(individuals[j])
+    for solution_b, count in zip(individuals, dominated_counts):
+        solution_b.dominated_by_count += int(count)
 
 
 def get_pareto_front(individuals: List[IndividualStats], index: int, max_index: int) -> Tuple[List[IndividualStats], int]:
@@ -42,17 +68,13 @@ def get_pareto_front(individuals: List[IndividualStats], index: int, max_index:
 
 
 def collect_fronts(individuals: List[IndividualStats]) -> Dict[int, List]:
-    index = 0
-    max_domination = max([i.dominated_by_count for i in individuals])
+    # One front per distinct dominated_by_count, in increasing order (same grouping
+    # as stepping get_pareto_front through the counts from 0, so negative counts are skipped)
+    counts = np.array([ind.dominated_by_count for ind in individuals])
     pareto_fronts = dict()
-    cnt = 0
-    while True:
-        front, index = get_pareto_front(individuals, index, max_domination)
-        if len(front) == 0:
-            break
+    for cnt, count in enumerate(np.unique(counts[counts >= 0])):
+        front = [individuals[i] for i in np.flatnonzero(counts == count)]
         pareto_fronts[cnt] = balance_fronts(front)
-        cnt += 1
-        # index += 1
     return pareto_fronts
 
 
@@ -86,31 +108,36 @@ def crowd_sort(front: List[IndividualStats]) -> List[IndividualStats]:
         return front
 
     eps = np.finfo(float).eps
-    objective_count = len(front[0].fitness_values)
-
-    # Reset crowding distances before calculation
-    for ind in front:
-        ind.crowding_distance = 0.0
+    fitness = fitness_matrix(front)
+    distances = np.zeros(len(front))
 
     # Calculate crowding distance contribution from each objective
-    for oc in range(objective_count):
-        sorted_front = sort_front(front, oc)
-        obj_min = sorted_front[0].fitness_values[oc]
-        obj_max = sorted_front[-1].fitness_values[oc]
-        denom = obj_max - obj_min + eps
+    for oc in range(fitness.shape[1]):
+        values = fitness[:, oc]
+        order = _stable_order(values)
+        denom = values[order[-1]] - values[order[0]] + eps
 
         # Boundary points get infinite distance (always preserve extremes)
-        sorted_front[0].crowding_distance = np.inf
-        sorted_front[-1].crowding_distance = np.inf
+        distances[order[0]] = np.inf
+        distances[order[-1]] = np.inf
 
         # Interior points: distance = normalized gap between neighbors
-        for i in range(1, len(sorted_front) - 1):
-            fv_prev = sorted_front[i - 1].fitness_values[oc]
-            fv_next = sorted_front[i + 1].fitness_values[oc]
-            sorted_front[i].crowding_distance += (fv_next - fv_prev) / denom
+        distances[order[1:-1]] += (values[order[2:]] - values[order[:-2]]) / denom
+
+    for ind, distance in zip(front, distances):
+        ind.crowding_distance = float(distance)
 
     # Sort DESCENDING: higher crowding distance = more isolated = preferred for diversity
-    return sorted(front, key=lambda x: x.crowding_distance, reverse=True)
+    if np.isnan(distances).any():
+        return sorted(front, key=lambda x: x.crowding_distance, reverse=True)
+    return [front[i] for i in np.argsort(-distances, kind='stable')]
+
+
+def _stable_order(values: np.ndarray) -> np.ndarray:
+    """Ascending stable order of values; NaNs fall back to sorted() so ties and NaN placement match sort_front"""
+    if np.isnan(values).any():
+        return np.array(sorted(range(len(values)), key=lambda i: values[i]))
+    return np.argsort(values, kind='stable')
 
 
 # ================================================================================
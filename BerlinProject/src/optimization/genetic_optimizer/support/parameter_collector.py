@@ -489,6 +489,36 @@ class ParameterCollector:
             'jumps': jumps
         }
 
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Collected data as plain dicts and lists (for optimization checkpoints)
+
+        Returns:
+            Dict accepted by load_state()
+        """
+        return {
+            'parameter_history': dict(self.parameter_history),
+            'elite_parameter_history': dict(self.elite_parameter_history),
+            'parameter_metadata': self.parameter_metadata,
+            'parameter_evolution_history': dict(self.parameter_evolution_history)
+        }
+
+    def load_state(self, state: Dict[str, Any]):
+        """
+        Replace the collected data with a get_state() snapshot
+
+        Args:
+            state: Dict from get_state()
+        """
+        self.clear()
+        self.parameter_evolution_history.clear()
+        self.parameter_history.update(state.get('parameter_history', {}))
+        self.elite_parameter_history.update(state.get('elite_parameter_history', {}))
+        self.parameter_metadata.update(state.get('parameter_metadata', {}))
+        for param_name, evolution in state.get('parameter_evolution_history', {}).items():
+            self.parameter_evolution_history[param_name].update(evolution)
+        self.logger.info(f"📥 Restored {len(self.parameter_metadata)} parameters from checkpoint")
+
     def clear_generation_data(self):
         """
         Clear parameter history to show only current generation
@@ -0,0 +1,77 @@
+"""
+Fitness results of already evaluated configurations.
+
+Elites, crossover between near-identical parents and mutations that round back
+to existing values give many individuals whose effective MonitorConfiguration
+was already backtested on the same split. MlfFitnessCalculator looks every
+individual up by (split index, configuration hash) before sending work to the
+process pool, so a configuration is backtested once per split for the whole
+run, no matter which generation or worker process it came from. Identical
+individuals within one generation are evaluated once as well.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from optimization.genetic_optimizer.abstractions.individual_stats import IndividualStats
+
+CacheKey = Tuple[int, str]  # (split index, configuration hash)
+
+
+@dataclass
+class FitnessCacheEntry:
+    """Fitness of one configuration on one split"""
+    stats: IndividualStats
+    # Objective values on the racing stages (see MlfFitnessCalculator._race)
+    stage_values: List[Optional[np.ndarray]] = field(default_factory=list)
+
+
+def configuration_key(individual, decimals: int = 6) -> str:
+    """Hash of an individual's effective configuration (genome individuals are not decoded)"""
+    genome = getattr(individual, 'genome', None)
+    schema = getattr(individual, 'schema', None)
+    if genome is not None and schema is not None:
+        return schema.configuration_hash(genome, decimals)
+    return individual.monitor_configuration.configuration_hash(decimals)
+
+
+def reuse_stats(stats: IndividualStats, index: int, individual) -> IndividualStats:
+    """Copy of cached stats for another individual, without the previous front sorting state"""
+    return replace(stats, index=index, individual=individual, dominated_by_count=0, dominates_over=[],
+                   crowding_distance=0, weighted_sum=0, additional_data=dict(stats.additional_data))
+
+
+class FitnessCache:
+    """Bounded LRU of fitness results keyed by split index and configuration hash"""
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, FitnessCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[FitnessCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, stats: IndividualStats, stage_values: List[Optional[np.ndarray]]) -> None:
+        # Stored detached from the population (the GA's front sorting mutates the stats it gets)
+        entry = FitnessCacheEntry(reuse_stats(stats, stats.index, None), list(stage_values))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,82 +1,175 @@
 from dataclasses import dataclass
 import numpy as np
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 import logging
 from concurrent.futures import ProcessPoolExecutor
 import multiprocessing as mp
+import os
 import random
+import time
 
 from optimization.genetic_optimizer.abstractions.fitness_calculator import FitnessCalculator, ObjectiveFunctionBase
 from optimization.genetic_optimizer.abstractions.individual_stats import IndividualStats
 from optimization.genetic_optimizer.genetic_algorithm.observer import Observer
 from portfolios.portfolio_tool import Portfolio
 from .mlf_individual import MlfIndividual
+from .mlf_genome import GenomeSchema
 from .mlf_individual_stats import MlfIndividualStats
+from .fitness_cache import FitnessCache, FitnessCacheEntry, configuration_key, reuse_stats
+from .mlf_objectives import evaluate_objectives
 from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+from optimization.calculators.indicator_memo import DEFAULT_MEMO_MEGABYTES, get_indicator_memo, hit_rate
+from optimization.calculators.shared_backtest_data import SharedBacktestData, init_worker, get_worker_streamer
 from mlf_utils.log_manager import LogManager
 
+logger = LogManager().get_logger("MlfFitnessCalculator")
+
+
+# ----- worker process state (set by the pool initializer) -----
+
+_worker_schema: Optional[GenomeSchema] = None
+
+
+def init_fitness_worker(splits, genome_schema: Optional[GenomeSchema],
+                        memo_megabytes: float = DEFAULT_MEMO_MEGABYTES) -> None:
+    """
+    Pool initializer: attach every split's shared candles up front and keep the
+    run's genome schema, so tasks only carry genomes and a split index. Also sets
+    the memory budget of the worker's indicator memo.
+    """
+    global _worker_schema
+    init_worker(splits)
+    _worker_schema = genome_schema
+    get_indicator_memo(memo_megabytes)
+    for split_index in range(len(splits)):
+        get_worker_streamer(split_index)
+
+
+def _task_payload(individual, genome_schema: Optional[GenomeSchema]):
+    """Genome vector when the workers know the individual's schema, else the individual itself"""
+    genome = getattr(individual, 'genome', None)
+    if genome is not None and genome_schema is not None and getattr(individual, 'schema', None) is genome_schema:
+        return genome
+    return individual
+
+
+def _worker_individual(payload):
+    if isinstance(payload, np.ndarray):
+        return MlfIndividual(source="worker", genome=payload, schema=_worker_schema)
+    return payload
+
 
 def evaluate_individual_worker(args):
     """
     Worker function that runs in separate process.
     This function must be pickleable (defined at module level).
+
+    The split's candle data comes from shared memory (see shared_backtest_data,
+    attached by the pool initializer), so a task only carries the individual and
+    returns fitness values plus a compact portfolio. Genome individuals are sent
+    as their vector; the worker builds the configuration from the run's schema.
+    With a fraction below 1 the backtest runs on the leading part of the split
+    (racing stage) and only the fitness values are returned.
     """
-    individual, source_streamer_data, objectives_data, worker_id = args
-    maximum_drawdown = source_streamer_data.get_maximum_drawdown()
+    payload, split_index, objectives_data, worker_id, use_indicator_memo, fraction = args
+    # Each worker process keeps its own indicator memo across the individuals it evaluates
+    indicator_memo = get_indicator_memo() if use_indicator_memo else None
+    memo_hits, memo_misses = indicator_memo.counts() if indicator_memo else (0, 0)
     try:
-        # Create a new BacktestDataStreamer for this worker
-        backtest_streamer = BacktestDataStreamer()
-        # Copy precomputed data from the source streamer
-        backtest_streamer.copy_data_from(source_streamer_data)
+        individual = _worker_individual(payload)
+        backtest_streamer = get_worker_streamer(split_index)
+        if fraction < 1.0:
+            backtest_streamer = backtest_streamer.prefix_streamer(fraction)
 
         # Set the monitor configuration and run backtest
         backtest_streamer.replace_monitor_config(individual.monitor_configuration)
-        portfolio = backtest_streamer.run()
+        portfolio = backtest_streamer.run(fast=True, indicator_memo=indicator_memo)
+        if indicator_memo:
+            hits, misses = indicator_memo.counts()
+            memo_hits, memo_misses = hits - memo_hits, misses - memo_misses
 
         # Calculate fitness values using the objectives
-        fitness_values = np.array([
-            obj.calculate_objective(individual, portfolio, backtest_streamer)
-            for obj in objectives_data
-        ])
+        fitness_values = evaluate_objectives(objectives_data, individual, portfolio, backtest_streamer)
 
         # Apply penalty if first objective indicates failure
         # if fitness_values[0] == 100.0:
         #     fitness_values = np.ones_like(fitness_values) * 100.0
         success = not all(fv == 100 for fv in fitness_values)
 
-        # Return success result with Portfolio and tick_history for full MlfIndividualStats creation
+        # The parent rebuilds MlfIndividualStats from its own individual and tick history
         return {
             'success': success,
             'fitness_values': fitness_values,
-            'individual': individual,
-            'portfolio': portfolio,  # Return full Portfolio object (pickleable)
-            'tick_history': backtest_streamer.tick_history  # Return tick history for market return calculation
+            'portfolio': portfolio.to_compact() if fraction >= 1.0 else None,
+            'memo_counts': (memo_hits, memo_misses)
         }
 
     except Exception as e:
-        # Return error result
-        print(f"HERE {worker_id}: exception {e}")
-        import traceback
-        traceback.print_exc()
+        # The parent logs the returned error per individual; keep the traceback in the worker's log
+        logger.exception(f"Fitness worker pid {worker_id} failed to evaluate an individual on split {split_index}")
         return {
             'success': False,
             'error': str(e),
-            'individual': individual,
             'fitness_values': None
         }
 
 
+def evaluate_chunk_worker(args):
+    """
+    Evaluate a chunk of individuals on one split, or on its leading `fraction`
+    (one task per chunk keeps the objectives and task overhead per chunk instead
+    of per individual). Returns the per-individual results plus the worker's pid
+    and busy time.
+    """
+    payloads, split_index, objectives_data, use_indicator_memo, fraction = args
+    start = time.perf_counter()
+    results = [evaluate_individual_worker((payload, split_index, objectives_data, os.getpid(), use_indicator_memo,
+                                           fraction))
+               for payload in payloads]
+    return {'results': results, 'pid': os.getpid(), 'elapsed': time.perf_counter() - start}
+
+
+def backtest_individual_worker(args):
+    """
+    Worker function for evaluating an individual on a split outside the
+    training rotation (e.g. the test split): runs the backtest only and
+    returns the compact portfolio.
+    """
+    payload, split_index, use_indicator_memo = args
+    indicator_memo = get_indicator_memo() if use_indicator_memo else None
+    try:
+        individual = _worker_individual(payload)
+        backtest_streamer = get_worker_streamer(split_index)
+        backtest_streamer.replace_monitor_config(individual.monitor_configuration)
+        portfolio = backtest_streamer.run(fast=True, indicator_memo=indicator_memo)
+        return {'portfolio': portfolio.to_compact()}
+    except Exception as e:
+        return {'error': str(e)}
+
+
 @dataclass
 class MlfFitnessCalculator(FitnessCalculator):
     backtest_streamers: List[BacktestDataStreamer] = None
     display_results: bool = False
     max_workers: Optional[int] = None
     _executor: Optional[ProcessPoolExecutor] = None
-    force_sequential: bool = True
+    _shared_data: Optional[SharedBacktestData] = None
+    force_sequential: bool = False
     selected_streamer: Optional[BacktestDataStreamer] = None
     split = None
     repeat_split: int = 0
     split_repeat_count: int = 3
+    use_indicator_memo: bool = True
+    indicator_memo_megabytes: float = DEFAULT_MEMO_MEGABYTES  # per process: each worker keeps its own memo
+    # Splits that are only evaluated on request (e.g. the test split), shared with the workers too
+    evaluation_streamers: List[BacktestDataStreamer] = None
+    # Racing: leading fractions of the split evaluated before the full backtest (empty: no racing)
+    racing_stages: Tuple[float, ...] = ()
+    racing_confidence: float = 1.0  # width of the optimistic bound in population spreads
+    racing_dominance: float = 0.5  # fraction of the front that must dominate the bound to drop an individual
+    # Reuse fitness of configurations already evaluated on the split (floats rounded to fitness_cache_decimals)
+    use_fitness_cache: bool = True
+    fitness_cache_decimals: int = 6
 
     def __post_init__(self):
         # Set default number of workers to CPU count
@@ -86,6 +179,29 @@ class MlfFitnessCalculator(FitnessCalculator):
 
         self.logger.info(f"Initialized parallel fitness calculator with {self.max_workers} workers")
         self.logger.info(f"Got {len(self.backtest_streamers)} data split streamers")
+        if self.evaluation_streamers is None:
+            self.evaluation_streamers = []
+
+        # Indicator memo lookups (hits, misses): whole run and latest generation
+        self._memo_counts = [0, 0]
+        self._generation_memo_counts = [0, 0]
+        # Genome schema the pool workers were started with (tasks then only carry genomes)
+        self._pool_schema: Optional[GenomeSchema] = None
+        # Busy time per worker process: whole run and latest generation
+        self._worker_stats: Dict[int, Dict[str, float]] = {}
+        self._generation_timing: Dict[str, float] = {}
+        # Racing: front members' objective values per stage, by split index
+        self._racing_fronts: Dict[int, List[np.ndarray]] = {}
+        self._racing_counts = {'stage_backtests': 0, 'full_backtests': 0, 'dropped': 0}
+        self._generation_racing = dict(self._racing_counts)
+        # Fitness cache lookups (duplicates, evaluated): whole run and latest generation
+        self._fitness_cache = FitnessCache()
+        self._cache_counts = [0, 0]
+        self._generation_cache_counts = [0, 0]
+        self._cache_keys: Dict[int, Any] = {}
+        self._cached: Dict[int, FitnessCacheEntry] = {}
+        self._duplicates: Dict[int, int] = {}
+        self._failed: Set[int] = set()  # individuals whose evaluation raised this generation (never cached)
 
     def _select_random_streamer(self) -> BacktestDataStreamer:
         """Randomly select one of the available data streamers"""
@@ -95,6 +211,21 @@ class MlfFitnessCalculator(FitnessCalculator):
             self.repeat_split = 0
         return self.split
 
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """Split rotation state, so a resumed optimization picks the same splits"""
+        split_index = next((i for i, streamer in enumerate(self.backtest_streamers) if streamer is self.split), None)
+        return {'split_index': split_index, 'repeat_split': self.repeat_split,
+                'racing_fronts': {str(index): [stage.tolist() for stage in front]
+                                  for index, front in self._racing_fronts.items()}}
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]):
+        split_index = state.get('split_index')
+        self.split = self.backtest_streamers[split_index] if split_index is not None else None
+        self.repeat_split = state.get('repeat_split', 0)
+        self._racing_fronts = {int(index): [np.array(stage, dtype=np.float64).reshape(-1, len(self.objectives))
+                                            for stage in front]
+                               for index, front in state.get('racing_fronts', {}).items()}
+
 
 
     def add_objective(self, obj: ObjectiveFunctionBase, weight: float = 1.0):
@@ -112,21 +243,168 @@ class MlfFitnessCalculator(FitnessCalculator):
 
 
 
-    def _get_executor(self):
-        """Get or create the process pool executor"""
+    def _record_memo_counts(self, hits: int, misses: int):
+        for counts in (self._memo_counts, self._generation_memo_counts):
+            counts[0] += hits
+            counts[1] += misses
+
+
+
+    def get_indicator_memo_stats(self) -> Dict[str, Any]:
+        """Indicator memo hit rates for progress reporting"""
+        hits, misses = self._memo_counts
+        generation_hits, generation_misses = self._generation_memo_counts
+        return {
+            'enabled': self.use_indicator_memo,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate(hits, misses),
+            'generation_hits': generation_hits,
+            'generation_misses': generation_misses,
+            'generation_hit_rate': hit_rate(generation_hits, generation_misses)
+        }
+
+
+
+    def get_fitness_cache_stats(self) -> Dict[str, Any]:
+        """Share of individuals that duplicated an already evaluated configuration"""
+        duplicates, evaluated = self._cache_counts
+        generation_duplicates, generation_evaluated = self._generation_cache_counts
+        return {
+            'enabled': self.use_fitness_cache,
+            'entries': len(self._fitness_cache),
+            'duplicates': duplicates,
+            'evaluated': evaluated,
+            'duplicate_rate': hit_rate(duplicates, evaluated),
+            'generation_duplicates': generation_duplicates,
+            'generation_evaluated': generation_evaluated,
+            'generation_duplicate_rate': hit_rate(generation_duplicates, generation_evaluated)
+        }
+
+
+
+    def get_racing_stats(self) -> Dict[str, Any]:
+        """Racing backtest counts for the run and the latest generation"""
+        return {
+            'enabled': bool(self.racing_stages),
+            'stages': list(self.racing_stages),
+            **self._racing_counts,
+            'generation': dict(self._generation_racing)
+        }
+
+
+
+    def _get_executor(self, genome_schema: Optional[GenomeSchema] = None):
+        """
+        Get or create the process pool executor. The pool lives for the whole run:
+        every worker attaches all splits once and keeps its indicator memo.
+        """
         if self._executor is None:
-            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            # Export every split's candles once; workers attach to them in the initializer
+            self._shared_data = SharedBacktestData(self.backtest_streamers + self.evaluation_streamers)
+            self._pool_schema = genome_schema
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_fitness_worker,
+                                                 initargs=(self._shared_data.splits, genome_schema,
+                                                           self.indicator_memo_megabytes))
             self.logger.info(f"Created process pool with {self.max_workers} workers")
         return self._executor
 
 
 
+    @staticmethod
+    def _population_schema(population: List[MlfIndividual]) -> Optional[GenomeSchema]:
+        return next((schema for schema in (getattr(individual, 'schema', None) for individual in population)
+                     if schema is not None), None)
+
+
+
+    def _record_worker_time(self, pid: int, individuals: int, elapsed: float):
+        stats = self._worker_stats.setdefault(pid, {'chunks': 0, 'individuals': 0, 'busy_seconds': 0.0})
+        stats['chunks'] += 1
+        stats['individuals'] += individuals
+        stats['busy_seconds'] += elapsed
+
+
+
+    def get_worker_stats(self) -> Dict[str, Any]:
+        """Per-worker busy time for the run plus timing of the latest parallel generation"""
+        return {
+            'workers': {pid: dict(stats) for pid, stats in self._worker_stats.items()},
+            'generation': dict(self._generation_timing)
+        }
+
+
+
     def shutdown_executor(self):
         """Shutdown the executor when done with all generations"""
         if self._executor is not None:
             self._executor.shutdown(wait=True)
             self._executor = None
             self.logger.info("Process pool executor shutdown complete")
+        if self._shared_data is not None:
+            self._shared_data.close()
+            self._shared_data = None
+        self._pool_schema = None
+
+
+
+    def add_evaluation_streamer(self, streamer: BacktestDataStreamer) -> None:
+        """
+        Register a split for evaluate_portfolios(). Its candles are exported to
+        the workers with the training splits, so register it before the first
+        parallel generation (a running pool is restarted to pick it up).
+        """
+        if any(s is streamer for s in self.evaluation_streamers):
+            return
+        self.evaluation_streamers.append(streamer)
+        if self._executor is not None:
+            self.shutdown_executor()
+
+
+
+    def evaluate_portfolios(self, streamer: BacktestDataStreamer,
+                            individuals: List[MlfIndividual]) -> List[Optional[Portfolio]]:
+        """
+        Backtest individuals on a registered evaluation split through the same
+        worker pool (or sequential path) as training. Failed backtests give None.
+        """
+        if self.force_sequential:
+            return self._evaluate_portfolios_sequential(streamer, individuals)
+
+        try:
+            all_streamers = self.backtest_streamers + self.evaluation_streamers
+            split_index = next(i for i, s in enumerate(all_streamers) if s is streamer)
+            executor = self._get_executor(self._population_schema(individuals))
+            worker_args = [(_task_payload(individual, self._pool_schema), split_index, self.use_indicator_memo)
+                           for individual in individuals]
+            results = list(executor.map(backtest_individual_worker, worker_args))
+        except Exception as e:
+            self.logger.error(f"Parallel evaluation failed, falling back to sequential: {e}")
+            return self._evaluate_portfolios_sequential(streamer, individuals)
+
+        portfolios = []
+        for cnt, result in enumerate(results):
+            if 'error' in result:
+                self.logger.error(f"Error evaluating individual {cnt}: {result['error']}")
+                portfolios.append(None)
+            else:
+                portfolios.append(Portfolio.from_compact(result['portfolio']))
+        return portfolios
+
+
+
+    def _evaluate_portfolios_sequential(self, streamer: BacktestDataStreamer,
+                                        individuals: List[MlfIndividual]) -> List[Optional[Portfolio]]:
+        indicator_memo = get_indicator_memo(self.indicator_memo_megabytes) if self.use_indicator_memo else None
+        portfolios = []
+        for cnt, individual in enumerate(individuals):
+            try:
+                streamer.replace_monitor_config(individual.monitor_configuration)
+                portfolios.append(streamer.run(fast=True, indicator_memo=indicator_memo))
+            except Exception as e:
+                self.logger.error(f"Error evaluating individual {cnt}: {e}")
+                portfolios.append(None)
+        return portfolios
 
 
 
@@ -134,6 +412,7 @@ class MlfFitnessCalculator(FitnessCalculator):
         """
         Parallel evaluation of population fitness using ProcessPoolExecutor
         """
+        self._generation_memo_counts = [0, 0]
         if self.force_sequential:
             return self._calculate_fitness_sequential(iteration_key, population)
 
@@ -143,49 +422,38 @@ class MlfFitnessCalculator(FitnessCalculator):
             f"Evaluating population of {len(population)} individuals for iteration {iteration_key} using {self.max_workers} workers")
 
         try:
-            # Prepare data for workers (serialize once)
+            # Candle data reaches the workers through shared memory; tasks only name the split
             self.selected_streamer = self._select_random_streamer()
-            source_streamer_data = self.selected_streamer  # Pass selected streamer for copying
+            split_index = next(i for i, streamer in enumerate(self.backtest_streamers)
+                               if streamer is self.selected_streamer)
             self.logger.info(f"🔄 Using: {self.selected_streamer.ticker} {self.selected_streamer.start_date} to {self.selected_streamer.end_date}")
-            objectives_data = self.objectives
-            for obj in self.objectives:
-                obj.preprocess(source_streamer_data.tick_history)
-
-            # Create arguments for each worker
-            worker_args = [
-                (individual, source_streamer_data, objectives_data, i % self.max_workers)
-                for i, individual in enumerate(population)
-            ]
 
-            # Get executor and submit all jobs
-            executor = self._get_executor()
+            # Workers keep the splits and schema from startup; tasks carry chunks of genomes
+            self._get_executor(self._population_schema(population))
+            self._generation_timing = {'wall_seconds': 0.0, 'busy_seconds': 0.0, 'utilization': 0.0, 'chunks': 0}
+            pending = self._lookup_fitness_cache(population, split_index)
+            evaluated = self._race(population, split_index, self._stage_fitness_parallel, pending)
 
-            # Submit all jobs and collect results
-            self.logger.debug(f"Submitting {len(worker_args)} jobs to process pool")
-            print(f"DEBUG: About to call executor.map with {len(worker_args)} jobs")
-            print(f"DEBUG: Executor type: {type(executor)}")
-            print(f"DEBUG: Max workers: {self.max_workers}")
-
-            try:
-                future_results = list(executor.map(evaluate_individual_worker, worker_args))
-                print(f"DEBUG: executor.map completed successfully, got {len(future_results)} results")
-            except Exception as map_error:
-                print(f"DEBUG: executor.map failed with error: {map_error}")
-                raise map_error
+            for obj in self.objectives:
+                obj.preprocess(self.selected_streamer.tick_history)
+            future_results = self._evaluate_parallel([population[i] for i in evaluated], split_index, 1.0)
+            self.logger.info(f"Evaluated {len(population)} individuals in "
+                             f"{self._generation_timing['wall_seconds']:.2f}s "
+                             f"({self._generation_timing['utilization']:.0%} worker utilization)")
 
             # Process results
-            for cnt, result in enumerate(future_results):
+            for cnt, result in zip(evaluated, future_results):
+                self._record_memo_counts(*result.get('memo_counts', (0, 0)))
 
                 try:
                     if result['success']:
                         # Successful evaluation - Create full MlfIndividualStats from worker results
-                        # Portfolio and tick_history are both pickleable!
                         individual_stats = MlfIndividualStats.from_backtest(
                             index=cnt,
                             fitness_values=result['fitness_values'],
-                            individual=result['individual'],
-                            portfolio=result['portfolio'],
-                            tick_history=result['tick_history']
+                            individual=population[cnt],
+                            portfolio=Portfolio.from_compact(result['portfolio']),
+                            tick_history=self.selected_streamer.tick_history
                         )
 
                         # Progress logging
@@ -204,6 +472,9 @@ class MlfFitnessCalculator(FitnessCalculator):
 
                 except Exception as e:
                     self.logger.error(f"Error processing result for individual {cnt}: {e}")
+                    # Unsuccessful results without an error (no trades) are real results
+                    if result.get('success'):
+                        self._failed.add(cnt)
                     # Create penalty result
                     fitness_values = np.array([100.0] * len(self.objectives))
                     individual_stats = MlfIndividualStats(
@@ -218,11 +489,232 @@ class MlfFitnessCalculator(FitnessCalculator):
             self.logger.warning("Falling back to sequential processing")
             return self._calculate_fitness_sequential(iteration_key, population)
 
+        fitness_results = self._finish_generation(population, split_index, pending, evaluated, fitness_results)
         self.logger.info(f"Completed evaluation of {len(population)} individuals, got {len(fitness_results)} valid")
         return fitness_results
 
 
 
+    def _evaluate_parallel(self, individuals: List[MlfIndividual], split_index: int,
+                           fraction: float) -> List[Dict[str, Any]]:
+        """Evaluate individuals on a split (or its leading fraction) in chunks on the process pool"""
+        executor = self._get_executor(self._population_schema(individuals))
+        payloads = [_task_payload(individual, self._pool_schema) for individual in individuals]
+        chunksize = max(1, -(-len(payloads) // (self.max_workers * 4)))
+        chunks = [payloads[i:i + chunksize] for i in range(0, len(payloads), chunksize)]
+
+        self.logger.debug(f"Submitting {len(chunks)} chunks of up to {chunksize} individuals to the process pool")
+        start = time.perf_counter()
+        futures = [executor.submit(evaluate_chunk_worker, (chunk, split_index, self.objectives,
+                                                           self.use_indicator_memo, fraction))
+                   for chunk in chunks]
+        results = []
+        busy_seconds = 0.0
+        for chunk, future in zip(chunks, futures):
+            chunk_result = future.result()
+            self._record_worker_time(chunk_result['pid'], len(chunk), chunk_result['elapsed'])
+            busy_seconds += chunk_result['elapsed']
+            results.extend(chunk_result['results'])
+
+        # Generation timing adds up the racing stages and the full evaluation
+        timing = self._generation_timing
+        timing['wall_seconds'] = timing.get('wall_seconds', 0.0) + time.perf_counter() - start
+        timing['busy_seconds'] = timing.get('busy_seconds', 0.0) + busy_seconds
+        timing['chunks'] = timing.get('chunks', 0) + len(chunks)
+        wall_seconds = timing['wall_seconds']
+        timing['utilization'] = timing['busy_seconds'] / (wall_seconds * self.max_workers) if wall_seconds > 0 else 0.0
+        return results
+
+
+
+    def _stage_fitness_parallel(self, individuals: List[MlfIndividual], split_index: int,
+                                fraction: float) -> List[Optional[np.ndarray]]:
+        results = self._evaluate_parallel(individuals, split_index, fraction)
+        for result in results:
+            self._record_memo_counts(*result.get('memo_counts', (0, 0)))
+        # All-penalty values (no trades yet) are stage values too; failed backtests have none
+        return [result['fitness_values'] for result in results]
+
+
+
+    def _stage_fitness_sequential(self, individuals: List[MlfIndividual], split_index: int,
+                                  fraction: float) -> List[Optional[np.ndarray]]:
+        streamer = self.backtest_streamers[split_index].prefix_streamer(fraction)
+        indicator_memo = get_indicator_memo(self.indicator_memo_megabytes) if self.use_indicator_memo else None
+        stage_values = []
+        for individual in individuals:
+            try:
+                streamer.replace_monitor_config(individual.monitor_configuration)
+                portfolio = streamer.run(fast=True, indicator_memo=indicator_memo)
+                stage_values.append(evaluate_objectives(self.objectives, individual, portfolio, streamer))
+            except Exception as e:
+                self.logger.error(f"Error evaluating individual on racing stage {fraction}: {e}")
+                stage_values.append(None)
+        return stage_values
+
+
+
+    def _lookup_fitness_cache(self, population: List[MlfIndividual], split_index: int) -> List[int]:
+        """
+        Indices of the individuals that need a backtest on the split. The others
+        repeat a configuration evaluated in an earlier generation (self._cached) or
+        earlier in this population (self._duplicates: index of the first one).
+        """
+        self._cache_keys, self._cached, self._duplicates = {}, {}, {}
+        self._failed = set()
+        if not self.use_fitness_cache:
+            self._generation_cache_counts = [0, len(population)]
+            return list(range(len(population)))
+
+        pending: List[int] = []
+        first_index: Dict[Any, int] = {}
+        for index, individual in enumerate(population):
+            key = (split_index, configuration_key(individual, self.fitness_cache_decimals))
+            self._cache_keys[index] = key
+            entry = self._fitness_cache.get(key)
+            if entry is not None:
+                self._cached[index] = entry
+            elif key in first_index:
+                self._duplicates[index] = first_index[key]
+            else:
+                first_index[key] = index
+                pending.append(index)
+
+        self._generation_cache_counts = [len(population) - len(pending), len(pending)]
+        self._cache_counts[0] += self._generation_cache_counts[0]
+        self._cache_counts[1] += self._generation_cache_counts[1]
+        return pending
+
+
+
+    def _race(self, population: List[MlfIndividual], split_index: int, stage_fitness,
+              candidates: List[int]) -> List[int]:
+        """
+        Racing: evaluate the candidates on leading parts of the split (racing_stages)
+        and drop individuals that cannot reach the front; returns the indices of
+        the individuals that get the full backtest.
+
+        At each stage an individual's objective values are compared with the values
+        the front of the last generation on this split had on the same part. Its
+        optimistic bound (values minus racing_confidence population spreads, scaled
+        by sqrt((1 - f) / f) for the part of the split still unseen) is dropped once
+        it is dominated by racing_dominance of the front. The first generation on a
+        split runs the stages without dropping to record the front's stage values.
+        Nothing here draws random numbers, so a seeded run prunes the same way on
+        the sequential and parallel paths.
+        """
+        self._generation_racing = {'stage_backtests': 0, 'full_backtests': 0, 'dropped': 0}
+        self._stage_values: Dict[int, List[Optional[np.ndarray]]] = {}
+        survivors = list(candidates)
+        if not self.racing_stages:
+            return survivors
+
+        split = self.backtest_streamers[split_index]
+        front = self._racing_fronts.get(split_index)
+        if front is not None and len(front) != len(self.racing_stages):
+            front = None
+        for stage, fraction in enumerate(self.racing_stages):
+            for obj in self.objectives:
+                obj.preprocess(split.prefix_streamer(fraction).tick_history)
+            stage_values = stage_fitness([population[i] for i in survivors], split_index, fraction)
+            self._generation_racing['stage_backtests'] += len(survivors)
+            for index, values in zip(survivors, stage_values):
+                self._stage_values.setdefault(index, []).append(values)
+            if front is not None:
+                hopeless = self._hopeless(stage_values, front[stage], fraction)
+                survivors = [index for index, drop in zip(survivors, hopeless) if not drop]
+
+        for obj in self.objectives:
+            obj.preprocess(split.tick_history)
+        self._generation_racing['dropped'] = len(candidates) - len(survivors)
+        return survivors
+
+
+
+    def _hopeless(self, stage_values: List[Optional[np.ndarray]], front: np.ndarray, fraction: float) -> List[bool]:
+        """Individuals whose optimistic bound on this stage is dominated by racing_dominance of the front"""
+        hopeless = [False] * len(stage_values)
+        # Failed stage backtests (or no trades yet) are no evidence against an individual
+        rows = [i for i, values in enumerate(stage_values) if values is not None and not np.all(values == 100.0)]
+        if len(rows) < 2 or len(front) == 0:
+            return hopeless
+
+        values = np.array([stage_values[i] for i in rows], dtype=np.float64)
+        margin = self.racing_confidence * values.std(axis=0) * np.sqrt((1.0 - fraction) / fraction)
+        optimistic = (values - margin)[:, None, :]
+        dominates = np.all(front[None, :, :] <= optimistic, axis=2) & np.any(front[None, :, :] < optimistic, axis=2)
+        required = max(1.0, self.racing_dominance * len(front))
+        for row, count in zip(rows, dominates.sum(axis=1)):
+            hopeless[row] = bool(count >= required)
+        return hopeless
+
+
+
+    def _finish_generation(self, population: List[MlfIndividual], split_index: int, candidates: List[int],
+                           evaluated: List[int], fitness_results: List[IndividualStats]) -> List[IndividualStats]:
+        """
+        Complete the generation's results: penalty results for individuals dropped
+        by racing, cached results for repeated configurations (new results go into
+        the cache unless their evaluation failed), the split every result belongs to, then keep the racing front of
+        this split and count backtests.
+        """
+        counts = self._generation_racing
+        counts['full_backtests'] = len(evaluated)
+        for key in self._racing_counts:
+            self._racing_counts[key] += counts[key]
+
+        survivors = set(evaluated)
+        for index in candidates:
+            if index not in survivors:
+                fitness_results.append(MlfIndividualStats(index=index, fitness_values=np.full(len(self.objectives), 100.0),
+                                                          individual=population[index]))
+
+        if self.use_fitness_cache:
+            results_by_index = {stats.index: stats for stats in fitness_results}
+            for index in evaluated:
+                # A failed evaluation (penalty result) may succeed in a later generation
+                if index in results_by_index and index not in self._failed:
+                    self._fitness_cache.put(self._cache_keys[index], results_by_index[index],
+                                            self._stage_values.get(index, []))
+            for index, entry in self._cached.items():
+                fitness_results.append(reuse_stats(entry.stats, index, population[index]))
+                self._stage_values[index] = entry.stage_values
+            for index, first in self._duplicates.items():
+                if first in results_by_index:
+                    fitness_results.append(reuse_stats(results_by_index[first], index, population[index]))
+                    self._stage_values[index] = self._stage_values.get(first, [])
+            duplicates, evaluated_count = self._generation_cache_counts
+            self.logger.info(f"♻️ Fitness cache: {duplicates}/{duplicates + evaluated_count} duplicate configurations "
+                             f"({len(self._fitness_cache)} cached)")
+        fitness_results.sort(key=lambda stats: stats.index)
+        # Charts of a generation's individuals need the split they were evaluated on
+        data_split = self.backtest_streamers[split_index].data_split()
+        for stats in fitness_results:
+            stats.data_split = data_split
+
+        if not self.racing_stages:
+            return fitness_results
+
+        # Front of the fully evaluated individuals that have values on every stage
+        front_candidates = [stats for stats in fitness_results
+                      if not np.all(stats.fitness_values == 100.0)
+                      and len(self._stage_values.get(stats.index, [])) == len(self.racing_stages)
+                      and all(values is not None for values in self._stage_values[stats.index])]
+        if front_candidates:
+            fitness = np.array([stats.fitness_values for stats in front_candidates], dtype=np.float64)
+            dominated = np.any(np.all(fitness[None, :, :] <= fitness[:, None, :], axis=2)
+                               & np.any(fitness[None, :, :] < fitness[:, None, :], axis=2), axis=1)
+            front = [stats.index for stats, is_dominated in zip(front_candidates, dominated) if not is_dominated]
+            self._racing_fronts[split_index] = [
+                np.array([self._stage_values[index][stage] for index in front], dtype=np.float64)
+                for stage in range(len(self.racing_stages))]
+
+        self.logger.info(f"🏁 Racing: {counts['full_backtests']}/{len(population)} full backtests, "
+                         f"{counts['dropped']} dropped after {counts['stage_backtests']} stage backtests")
+        return fitness_results
+
+
+
     def _calculate_fitness_sequential(self, iteration_key: int, population: List[MlfIndividual]) -> List[MlfIndividualStats]:
         """
         Fallback sequential implementation (your original code)
@@ -231,11 +723,21 @@ class MlfFitnessCalculator(FitnessCalculator):
 
         self.logger.debug(f"Sequential calculation of {len(population)} individuals for iteration {iteration_key}")
         self.selected_streamer = self._select_random_streamer()
-
-        for cnt, individual in enumerate(population):
+        split_index = next(i for i, streamer in enumerate(self.backtest_streamers)
+                           if streamer is self.selected_streamer)
+        indicator_memo = get_indicator_memo(self.indicator_memo_megabytes) if self.use_indicator_memo else None
+        pending = self._lookup_fitness_cache(population, split_index)
+        evaluated = self._race(population, split_index, self._stage_fitness_sequential, pending)
+
+        for cnt in evaluated:
+            individual = population[cnt]
             try:
                 self.selected_streamer.replace_monitor_config(individual.monitor_configuration)
-                portfolio = self.selected_streamer.run()
+                memo_counts = indicator_memo.counts() if indicator_memo else (0, 0)
+                portfolio = self.selected_streamer.run(fast=True, indicator_memo=indicator_memo)
+                if indicator_memo:
+                    hits, misses = indicator_memo.counts()
+                    self._record_memo_counts(hits - memo_counts[0], misses - memo_counts[1])
 
                 # Progress logging
                 if self.display_results or cnt % 50 == 0:
@@ -254,11 +756,12 @@ class MlfFitnessCalculator(FitnessCalculator):
 
             except Exception as e:
                 self.logger.error(f"Error evaluating individual {cnt}: {e}")
+                self._failed.add(cnt)
                 fitness_values = np.array([99.0] * len(self.objectives))
                 individual_stats = IndividualStats(index=cnt, fitness_values=fitness_values, individual=individual)
                 fitness_results.append(individual_stats)
 
-        return fitness_results
+        return self._finish_generation(population, split_index, pending, evaluated, fitness_results)
 
 
 
@@ -271,10 +774,7 @@ class MlfFitnessCalculator(FitnessCalculator):
         in visualization routes.
         """
         try:
-            fitness_values = np.array([
-                objective.calculate_objective(individual, portfolio, bt)
-                for objective in self.objectives
-            ])
+            fitness_values = evaluate_objectives(self.objectives, individual, portfolio, bt)
 
             # if fitness_values[0] == 100.0:
             #     fitness_values = np.ones_like(fitness_values) * 100.0
@@ -290,6 +790,7 @@ class MlfFitnessCalculator(FitnessCalculator):
 
         except Exception as e:
             self.logger.error(f"Error calculating individual stats: {e}")
+            self._failed.add(index)
             fitness_values = np.array([100.0] * len(self.objectives))
             # Even for errors, use MlfIndividualStats for consistency
             return MlfIndividualStats(index=index, fitness_values=fitness_values, individual=individual)
@@ -0,0 +1,273 @@
+"""
+Flat genome representation for MlfIndividual.
+
+A GenomeSchema is built once per optimization from the template
+MonitorConfiguration. It lists every optimizable value (bar weights, trend
+weights, trend thresholds, enter/exit thresholds and ranged indicator
+parameters) with its range, type and config path, so an individual can be a
+single float64 vector. The MonitorConfiguration is only rebuilt from the vector
+when a backtest or export needs it.
+"""
+
+import copy
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from models.monitor_configuration import MonitorConfiguration
+
+# Gene kinds (first element of a gene path)
+BAR_WEIGHT = 'bar_weight'            # ('bar_weight', bar_name, indicator_name)
+TREND_WEIGHT = 'trend_weight'        # ('trend_weight', bar_name, trend_name)
+TREND_THRESHOLD = 'trend_threshold'  # ('trend_threshold', bar_name)
+ENTER_THRESHOLD = 'enter_threshold'  # ('enter_threshold', condition_index)
+EXIT_THRESHOLD = 'exit_threshold'    # ('exit_threshold', condition_index)
+PARAMETER = 'parameter'              # ('parameter', indicator_index, parameter_name)
+
+# Mutation step sizes
+BAR_WEIGHT_DELTA = 0.15
+ENTER_THRESHOLD_DELTA = 0.1
+PERCENT_CHANGE = 0.2  # fraction of the range for exit thresholds and indicator parameters
+
+
+@dataclass
+class GenomeSchema:
+    """
+    Maps genome vector indices to MonitorConfiguration paths.
+
+    Per-gene arrays (all of length `size`):
+        low/high: allowed range (mutations are clipped to it)
+        is_int: integer indicator parameters
+        evolves: mutated and crossed over (trend weights and trend thresholds
+                 are only randomized when an individual is created)
+        is_parameter: indicator parameters (used for individual equality)
+        mutation_delta: maximum mutation step
+    """
+    template: MonitorConfiguration
+    paths: List[Tuple] = field(default_factory=list)
+    low: np.ndarray = None
+    high: np.ndarray = None
+    is_int: np.ndarray = None
+    evolves: np.ndarray = None
+    is_parameter: np.ndarray = None
+    mutation_delta: np.ndarray = None
+    template_genome: np.ndarray = None
+    _template_hashes: Dict[int, str] = field(default_factory=dict, repr=False, compare=False)  # by decimals
+
+    @classmethod
+    def from_configuration(cls, monitor_config: MonitorConfiguration) -> "GenomeSchema":
+        """Collect the optimizable values of a monitor configuration"""
+        genes: List[Tuple[Tuple, float, float, bool, bool, float]] = []  # path, low, high, int, evolves, delta
+
+        for bar_name, bar_config in monitor_config.bars.items():
+            # Signal indicator weights
+            weight_ranges = bar_config.get('weight_ranges', {})
+            for indicator_name in bar_config.get('indicators', {}):
+                w_range = weight_ranges.get(indicator_name, {})
+                # Skip if marked as 'skip' (not being optimized) - keep existing weight value
+                if w_range.get('t') == 'skip':
+                    continue
+                if not w_range or not w_range.get('r'):
+                    raise ValueError(f"Invalid specification on bar indicator weight ranges for '{indicator_name}'")
+                low, high = w_range['r'][0], w_range['r'][1]
+                genes.append(((BAR_WEIGHT, bar_name, indicator_name), low, high, False, True, BAR_WEIGHT_DELTA))
+
+            # Trend indicator weights (only ranged ones are optimized)
+            trend_weight_ranges = bar_config.get('trend_weight_ranges', {})
+            for trend_name in bar_config.get('trend_indicators', {}):
+                tw_range = trend_weight_ranges.get(trend_name, {})
+                if tw_range.get('t') == 'skip' or not tw_range.get('r'):
+                    continue
+                low, high = tw_range['r'][0], tw_range['r'][1]
+                genes.append(((TREND_WEIGHT, bar_name, trend_name), low, high, False, False, 0.0))
+
+            # Trend threshold (gate threshold for this bar)
+            tt_range = bar_config.get('trend_threshold_range')
+            if tt_range:
+                genes.append(((TREND_THRESHOLD, bar_name), tt_range[0], tt_range[1], False, False, 0.0))
+
+        # Enter/exit thresholds (skip if threshold_range is None - checkbox unchecked)
+        for idx, condition in enumerate(monitor_config.enter_long):
+            t_range = condition.get('threshold_range')
+            if t_range:
+                genes.append(((ENTER_THRESHOLD, idx), t_range[0], t_range[1], False, True, ENTER_THRESHOLD_DELTA))
+        for idx, condition in enumerate(monitor_config.exit_long):
+            t_range = condition.get('threshold_range')
+            if t_range:
+                delta = PERCENT_CHANGE * (t_range[1] - t_range[0])
+                genes.append(((EXIT_THRESHOLD, idx), t_range[0], t_range[1], False, True, delta))
+
+        # Indicator parameters
+        for idx, indicator in enumerate(monitor_config.indicators):
+            for name, range_info in (indicator.ranges or {}).items():
+                if range_info.get('t') not in ('int', 'float'):
+                    continue
+                low, high = range_info['r'][0], range_info['r'][1]
+                is_int = range_info['t'] == 'int'
+                delta = PERCENT_CHANGE * (high - low)
+                if is_int:
+                    delta = max(1, int(delta))
+                genes.append(((PARAMETER, idx, name), low, high, is_int, True, delta))
+
+        schema = cls(template=copy.deepcopy(monitor_config))
+        schema.paths = [gene[0] for gene in genes]
+        schema.low = np.array([gene[1] for gene in genes], dtype=np.float64)
+        schema.high = np.array([gene[2] for gene in genes], dtype=np.float64)
+        schema.is_int = np.array([gene[3] for gene in genes], dtype=bool)
+        schema.evolves = np.array([gene[4] for gene in genes], dtype=bool)
+        schema.is_parameter = np.array([gene[0][0] == PARAMETER for gene in genes], dtype=bool)
+        schema.mutation_delta = np.array([gene[5] for gene in genes], dtype=np.float64)
+        schema.template_genome = schema.encode(schema.template)
+        return schema
+
+    @property
+    def size(self) -> int:
+        return len(self.paths)
+
+    def gene_names(self) -> List[str]:
+        """Readable label for each gene, e.g. 'parameter:macd1m.fast'"""
+        names = []
+        for path in self.paths:
+            if path[0] == PARAMETER:
+                names.append(f"{PARAMETER}:{self.template.indicators[path[1]].name}.{path[2]}")
+            else:
+                names.append(f"{path[0]}:" + ".".join(str(p) for p in path[1:]))
+        return names
+
+    def encode(self, monitor_config: MonitorConfiguration) -> np.ndarray:
+        """Genome vector of a configuration (missing values become NaN)"""
+        genome = np.empty(self.size, dtype=np.float64)
+        for i, path in enumerate(self.paths):
+            genome[i] = _read_value(monitor_config, path)
+        return genome
+
+    def decode(self, genome: np.ndarray) -> MonitorConfiguration:
+        """
+        Build the MonitorConfiguration of a genome. Values equal to the template
+        are left untouched, so the template's own types and formats survive;
+        changed scalar trend weights are written as {'weight': w, 'mode': 'soft'}.
+        Indicator parameters without a range are always the template's.
+        """
+        monitor_config = copy.deepcopy(self.template)
+        for i in np.flatnonzero((genome != self.template_genome) & ~np.isnan(genome)):
+            value = int(genome[i]) if self.is_int[i] else float(genome[i])
+            _write_value(monitor_config, self.paths[i], value)
+        return monitor_config
+
+    def configuration_hash(self, genome: np.ndarray, decimals: int = 6) -> str:
+        """
+        Hash of the configuration a genome decodes to, without decoding it: the
+        template's configuration_hash plus the genome rounded to `decimals` places.
+        """
+        template_hash = self._template_hashes.get(decimals)
+        if template_hash is None:
+            template_hash = self._template_hashes[decimals] = self.template.configuration_hash(decimals)
+        rounded = np.round(np.asarray(genome, dtype=np.float64), decimals) + 0.0
+        return hashlib.sha1(template_hash.encode() + rounded.tobytes()).hexdigest()
+
+    def random_genome(self) -> np.ndarray:
+        """Uniformly random genome (integer parameters inclusive of both ends, float parameters to 4 places)"""
+        genome = np.random.uniform(self.low, self.high)
+        parameter_floats = self.is_parameter & ~self.is_int
+        genome[parameter_floats] = np.round(genome[parameter_floats], 4)
+        if self.is_int.any():
+            low = self.low[self.is_int].astype(np.int64)
+            high = self.high[self.is_int].astype(np.int64)
+            genome[self.is_int] = np.random.randint(low, high + 1)
+        return genome
+
+    def mutate(self, genome: np.ndarray, mutate_probability: float) -> Tuple[np.ndarray, int]:
+        """
+        Mutate each evolving gene with the given probability (at least one gene
+        always mutates). Float genes move by up to +/- mutation_delta, integer
+        genes by a non-zero step of at most mutation_delta; results are clipped
+        to the gene range.
+
+        Returns:
+            (mutated copy of genome, number of mutated genes)
+        """
+        if not self.evolves.any():
+            return genome.copy(), 0
+
+        mask = np.zeros(self.size, dtype=bool)
+        while not mask.any():
+            mask = (np.random.random(self.size) < mutate_probability) & self.evolves
+
+        steps = np.random.uniform(-self.mutation_delta, self.mutation_delta)
+        int_mask = mask & self.is_int
+        if int_mask.any():
+            magnitude = np.random.randint(1, self.mutation_delta[int_mask].astype(np.int64) + 1)
+            sign = np.where(np.random.random(magnitude.size) < 0.5, -1, 1)
+            steps[int_mask] = sign * magnitude
+
+        mutated = genome.copy()
+        mutated[mask] = np.clip(genome[mask] + steps[mask], self.low[mask], self.high[mask])
+        return mutated, int(mask.sum())
+
+    def cross_over(self, mom: np.ndarray, dad: np.ndarray, chance: float) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Uniform crossover: swap each differing evolving gene with the given
+        chance (at least one swap when the parents differ at all).
+
+        Returns:
+            (first child, second child, number of swapped genes)
+        """
+        candidates = self.evolves & (mom != dad)
+        if not candidates.any():
+            return mom.copy(), dad.copy(), 0
+
+        mask = np.zeros(self.size, dtype=bool)
+        while not mask.any():
+            mask = (np.random.random(self.size) < chance) & candidates
+
+        child1 = np.where(mask, dad, mom)
+        child2 = np.where(mask, mom, dad)
+        return child1, child2, int(mask.sum())
+
+    def same_parameters(self, genome1: np.ndarray, genome2: np.ndarray) -> bool:
+        """Same indicator parameters (the MonitorConfiguration equality rule)"""
+        return bool(np.array_equal(genome1[self.is_parameter], genome2[self.is_parameter]))
+
+
+def _read_value(monitor_config: MonitorConfiguration, path: Tuple) -> float:
+    kind = path[0]
+    if kind == BAR_WEIGHT:
+        value = monitor_config.bars[path[1]]['indicators'].get(path[2])
+    elif kind == TREND_WEIGHT:
+        trend_config = monitor_config.bars[path[1]]['trend_indicators'].get(path[2])
+        value = trend_config.get('weight', 1.0) if isinstance(trend_config, dict) else trend_config
+    elif kind == TREND_THRESHOLD:
+        value = monitor_config.bars[path[1]].get('trend_threshold')
+    elif kind == ENTER_THRESHOLD:
+        value = monitor_config.enter_long[path[1]].get('threshold')
+    elif kind == EXIT_THRESHOLD:
+        value = monitor_config.exit_long[path[1]].get('threshold')
+    else:
+        value = (monitor_config.indicators[path[1]].parameters or {}).get(path[2])
+    return np.nan if value is None else float(value)
+
+
+def _write_value(monitor_config: MonitorConfiguration, path: Tuple, value: Any) -> None:
+    kind = path[0]
+    if kind == BAR_WEIGHT:
+        monitor_config.bars[path[1]]['indicators'][path[2]] = value
+    elif kind == TREND_WEIGHT:
+        trend_indicators = monitor_config.bars[path[1]]['trend_indicators']
+        if isinstance(trend_indicators[path[2]], dict):
+            trend_indicators[path[2]]['weight'] = value
+        else:
+            # Simple weight format - convert to dict format
+            trend_indicators[path[2]] = {'weight': value, 'mode': 'soft'}
+    elif kind == TREND_THRESHOLD:
+        monitor_config.bars[path[1]]['trend_threshold'] = value
+    elif kind == ENTER_THRESHOLD:
+        monitor_config.enter_long[path[1]]['threshold'] = value
+    elif kind == EXIT_THRESHOLD:
+        monitor_config.exit_long[path[1]]['threshold'] = value
+    else:
+        indicator = monitor_config.indicators[path[1]]
+        if indicator.parameters is None:
+            indicator.parameters = {}
+        indicator.parameters[path[2]] = value
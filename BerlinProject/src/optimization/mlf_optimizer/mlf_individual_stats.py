@@ -45,6 +45,9 @@ class MlfIndividualStats(IndividualStats):
     winning_trades_distribution: List[tuple] = field(default_factory=list)
     losing_trades_distribution: List[tuple] = field(default_factory=list)
 
+    # ===== Data Split (ticker/start_date/end_date the fitness was evaluated on) =====
+    data_split: Optional[Dict[str, str]] = None
+
     # ===== Raw Data References (optional, for advanced analysis) =====
     # Note: These should NOT be serialized/pickled for large-scale storage
     # MEMORY OPTIMIZATION: These are cleared after metric calculation to prevent memory bloat
@@ -3,10 +3,19 @@ MLF Objective Functions for Genetic Algorithm Optimization.
 
 Each objective function defines a fitness metric that the GA tries to optimize.
 Objectives can have configurable parameters exposed through get_parameter_specs().
+
+Objectives read their trade statistics from the portfolio's TradeLedger,
+which is built once per portfolio. evaluate_objectives() still calls the
+configured objectives one after another, but they share that ledger and
+read its totals instead of each walking the trade list.
 """
 
 from typing import List, Optional
 from dataclasses import dataclass
+
+import numpy as np
+
+from indicator_triggers.indicator_base import candle_column
 from optimization.genetic_optimizer.abstractions.objective_function_base import (
     ObjectiveFunctionBase,
     ObjectiveParameterSpec,
@@ -244,8 +253,9 @@ class MaximizeScaledNetPnL(ObjectiveFunctionBase):
     def preprocess(self, *args):
         """Calculate maximum expected return from price range."""
         tick_history: List[TickData] = args[0]
-        max_close = max(tick_history, key=lambda x: x.close).close
-        min_close = min(tick_history, key=lambda x: x.close).close
+        closes = candle_column(tick_history, "close")
+        max_close = float(np.max(closes))
+        min_close = float(np.min(closes))
         self.global_pct = abs((max_close - min_close) / min_close)
 
 
@@ -334,6 +344,18 @@ class MaximizeCashProfit(ObjectiveFunctionBase):
         return objective_value * self.weight
 
 
+def evaluate_objectives(objectives: List[ObjectiveFunctionBase], individual: MlfIndividual, portfolio: Portfolio,
+                        backtest_streamer=None) -> np.ndarray:
+    """
+    Fitness vector of an individual, one objective at a time. The portfolio's
+    trade ledger is built once up front and the objectives share it: each reads
+    its accumulators instead of walking the trades.
+    """
+    portfolio.trade_ledger()
+    return np.array([objective.calculate_objective(individual, portfolio, backtest_streamer)
+                     for objective in objectives])
+
+
 # Registry of all available objective functions
 OBJECTIVE_CLASSES = {
     'MaximizeProfit': MaximizeProfit,
@@ -3,6 +3,8 @@ from enum import Enum
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+import numpy as np
+
 
 class TradeReason(Enum):
     ENTER_LONG = "enter_long"
@@ -36,6 +38,65 @@ class Trade:
     reason: TradeReason
 
 
+_ENTRY_REASONS = frozenset(reason for reason in TradeReason if reason.is_entry())
+_EXIT_REASONS = frozenset(reason for reason in TradeReason if reason.is_exit())
+
+
+def _running_total(values: np.ndarray) -> float:
+    """Sum in trade order (np.sum adds pairwise, which can differ in the last bits)"""
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
+@dataclass
+class TradeLedger:
+    """
+    Closed trades of a portfolio as columns, one row per entry trade directly
+    followed by an exit trade in trade_history (the pairing the objective
+    functions use), plus running accumulators over the rows.
+    """
+    entry_index: np.ndarray  # positions in trade_history
+    exit_index: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    size: np.ndarray  # entry size
+    pnl_percent: np.ndarray  # (exit - entry) / entry * 100
+    pnl_cash: np.ndarray  # (exit - entry) * size
+    total_percent_profits: float = 0.0
+    total_percent_losses: float = 0.0  # positive
+    total_cash_profits: float = 0.0
+    total_cash_losses: float = 0.0  # positive
+    winning_trades_count: int = 0
+    losing_trades_count: int = 0
+
+    @classmethod
+    def from_trades(cls, trades: List[Trade]) -> 'TradeLedger':
+        """Build the ledger with one pass over the trades and array operations for the rest"""
+        columns = np.array([(trade.price, trade.size, trade.reason in _ENTRY_REASONS, trade.reason in _EXIT_REASONS)
+                            for trade in trades], dtype=np.float64).reshape(-1, 4)
+        prices, sizes = columns[:, 0], columns[:, 1]
+        is_entry, is_exit = columns[:, 2] > 0, columns[:, 3] > 0
+        # An entry followed by an exit; such pairs cannot overlap since no trade is both
+        entry_index = np.flatnonzero(is_entry[:-1] & is_exit[1:])
+        exit_index = entry_index + 1
+
+        entry_price, exit_price, size = prices[entry_index], prices[exit_index], sizes[entry_index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_percent = ((exit_price - entry_price) / entry_price) * 100.0
+        pnl_cash = (exit_price - entry_price) * size
+
+        return cls(entry_index=entry_index, exit_index=exit_index, entry_price=entry_price, exit_price=exit_price,
+                   size=size, pnl_percent=pnl_percent, pnl_cash=pnl_cash,
+                   total_percent_profits=_running_total(pnl_percent[pnl_percent > 0]),
+                   total_percent_losses=_running_total(-pnl_percent[pnl_percent < 0]),
+                   total_cash_profits=_running_total(pnl_cash[pnl_cash > 0]),
+                   total_cash_losses=_running_total(-pnl_cash[pnl_cash < 0]),
+                   winning_trades_count=int(np.count_nonzero(pnl_percent > 0)),
+                   losing_trades_count=int(np.count_nonzero(pnl_percent < 0)))
+
+    def __len__(self) -> int:
+        return len(self.entry_index)
+
+
 @dataclass
 class Portfolio:
     """
@@ -54,6 +115,10 @@ class Portfolio:
     # DEBUG: Add debug mode
     debug_mode: bool = False
 
+    # Ledger of trade_history, rebuilt when trades were added since
+    _ledger: Optional[TradeLedger] = field(default=None, init=False, repr=False, compare=False)
+    _ledger_trades: int = field(default=-1, init=False, repr=False, compare=False)
+
     def enable_debug_mode(self):
         """Enable debug logging"""
         self.debug_mode = True
@@ -119,6 +184,25 @@ class Portfolio:
         )
         self.trade_history.append(trade)
 
+    def to_compact(self) -> Dict[str, Any]:
+        """Plain-tuple form of the portfolio for cheap transfer between processes"""
+        return {
+            'position_size': self.position_size,
+            'trade_size': self.trade_size,
+            'total_realized_pnl_percent': self.total_realized_pnl_percent,
+            'trades': [(trade.time, trade.size, trade.price, trade.reason.value) for trade in self.trade_history]
+        }
+
+    @classmethod
+    def from_compact(cls, data: Dict[str, Any]) -> 'Portfolio':
+        """Rebuild a portfolio from to_compact() output"""
+        return cls(
+            position_size=data['position_size'],
+            trade_size=data['trade_size'],
+            trade_history=[Trade(time, size, price, TradeReason(reason)) for time, size, price, reason in data['trades']],
+            total_realized_pnl_percent=data['total_realized_pnl_percent']
+        )
+
     # THIS STUFF IS USED FOR UI
 
     def is_in_position(self) -> bool:
@@ -225,38 +309,20 @@ class Portfolio:
 
     # THIS IS USED FOR GA OPTIMIZER OBJECTIVE FUNCTIONS
 
+    def trade_ledger(self) -> TradeLedger:
+        """Columnar ledger of the closed trades (cached until more trades are recorded)"""
+        if self._ledger is None or self._ledger_trades != len(self.trade_history):
+            self._ledger = TradeLedger.from_trades(self.trade_history)
+            self._ledger_trades = len(self.trade_history)
+        return self._ledger
+
     def get_total_percent_profits(self) -> float:
         """
         Sum of all profitable trades as percentages - used in Maximize profit OF.
 
         FIXED: Return as percentage value (not decimal)
         """
-        total_profits = 0.0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-
-                # Calculate P&L percentage (as percentage, not decimal)
-                pnl_percent = ((exit_trade.price - entry_trade.price) / entry_trade.price) * 100.0
-
-                # Add to profits if positive
-                if pnl_percent > 0:
-                    total_profits += pnl_percent
-
-                if self.debug_mode:
-                    print(
-                        f"Profit Trade: Entry ${entry_trade.price:.2f} -> Exit ${exit_trade.price:.2f} = {pnl_percent:.2f}%")
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
+        total_profits = self.trade_ledger().total_percent_profits
         if self.debug_mode:
             print(f"Total Profits: {total_profits:.2f}%")
         return total_profits
@@ -267,32 +333,7 @@ class Portfolio:
 
         FIXED: Return as percentage value (not decimal)
         """
-        total_losses = 0.0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-
-                # Calculate P&L percentage (as percentage, not decimal)
-                pnl_percent = ((exit_trade.price - entry_trade.price) / entry_trade.price) * 100.0
-
-                # Add to losses if negative (convert to positive)
-                if pnl_percent < 0:
-                    total_losses += abs(pnl_percent)
-
-                if self.debug_mode:
-                    print(
-                        f"Loss Trade: Entry ${entry_trade.price:.2f} -> Exit ${exit_trade.price:.2f} = {pnl_percent:.2f}%")
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
+        total_losses = self.trade_ledger().total_percent_losses
         if self.debug_mode:
             print(f"Total Losses: {total_losses:.2f}%")
         return total_losses
@@ -301,57 +342,13 @@ class Portfolio:
         """
         Count of trades that lost money - used in minimize losing trades
         """
-        losing_count = 0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-
-                # Calculate P&L percentage
-                pnl_percent = ((exit_trade.price - entry_trade.price) / entry_trade.price) * 100.0
-
-                # Count if losing
-                if pnl_percent < 0:
-                    losing_count += 1
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
-        return losing_count
+        return self.trade_ledger().losing_trades_count
 
     def get_winning_trades_count(self) -> int:
         """
         Count of trades that made money - used in minimize losing trades
         """
-        winning_count = 0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-
-                # Calculate P&L percentage
-                pnl_percent = ((exit_trade.price - entry_trade.price) / entry_trade.price) * 100.0
-
-                # Count if winning
-                if pnl_percent > 0:
-                    winning_count += 1
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
-        return winning_count
+        return self.trade_ledger().winning_trades_count
 
     def get_total_cash_profits(self) -> float:
         """
@@ -360,28 +357,7 @@ class Portfolio:
         Calculates (exit_price - entry_price) * size for each profitable trade.
         Used for cash-based optimization objectives.
         """
-        total_profits = 0.0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-                # Calculate cash P&L
-                pnl_cash = (exit_trade.price - entry_trade.price) * entry_trade.size
-
-                # Add to profits if positive
-                if pnl_cash > 0:
-                    total_profits += pnl_cash
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
-        return total_profits
+        return self.trade_ledger().total_cash_profits
 
     def get_total_cash_losses(self) -> float:
         """
@@ -390,31 +366,11 @@ class Portfolio:
         Calculates abs((exit_price - entry_price) * size) for each losing trade.
         Used for cash-based optimization objectives.
         """
-        total_losses = 0.0
-
-        # Look for entry/exit pairs
-        i = 0
-        while i < len(self.trade_history) - 1:
-            entry_trade = self.trade_history[i]
-            exit_trade = self.trade_history[i + 1]
-
-            # Check if this is an entry followed by an exit
-            if entry_trade.reason.is_entry() and exit_trade.reason.is_exit():
-                # Calculate cash P&L
-                pnl_cash = (exit_trade.price - entry_trade.price) * entry_trade.size
-
-                # Add to losses if negative (convert to positive)
-                if pnl_cash < 0:
-                    total_losses += abs(pnl_cash)
-
-                i += 2  # Skip both trades
-            else:
-                i += 1
-
-        return total_losses
+        return self.trade_ledger().total_cash_losses
 
     def reset(self) -> None:
         """Reset portfolio to initial state"""
         self.position_size = 0.0
         self.trade_history.clear()
-        self.total_realized_pnl_percent = 0.0  # Reset realized P&L too
\ No newline at end of file
+        self.total_realized_pnl_percent = 0.0  # Reset realized P&L too
+        self._ledger = None
\ No newline at end of file
@@ -1,9 +1,11 @@
 # portfolios/trade_executor_unified.py
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, date
 from collections import defaultdict
 
+import numpy as np
+
 from models.monitor_configuration import MonitorConfiguration
 from models.tick_data import TickData
 from portfolios.portfolio_tool import Portfolio, TradeReason
@@ -730,6 +732,184 @@ class TradeExecutorUnified:
 
         return False
 
+    # ----- Array-driven fast path (backtests) -----
+
+    @staticmethod
+    def end_of_day_window_mask(trade_times: List[Optional[datetime]]) -> np.ndarray:
+        """
+        Boolean mask of ticks within one minute of market close, i.e. where
+        _check_end_of_day_exit would close an open position.
+        """
+        mask = np.zeros(len(trade_times), dtype=bool)
+        for i, trade_time in enumerate(trade_times):
+            if not trade_time:
+                continue
+            try:
+                time_diff = (get_market_close_today(trade_time) - trade_time.astimezone(ET)).total_seconds()
+                mask[i] = -60 <= time_diff <= 60
+            except Exception:
+                pass
+        return mask
+
+    def _conditions_triggered(self, conditions: List[Dict], bar_arrays: Dict[str, np.ndarray],
+                              length: int) -> np.ndarray:
+        """Mask of ticks where any condition's bar score reaches its threshold"""
+        triggered = np.zeros(length, dtype=bool)
+        for condition in conditions:
+            scores = bar_arrays.get(condition.get('name'))
+            if scores is None:
+                scores = np.zeros(length)
+            triggered |= scores >= condition.get('threshold', 0.5)
+        return triggered
+
+    def run_on_arrays(self, ticks, closes: np.ndarray,
+                      bar_score_history: Dict[str, List[float]],
+                      indicator_history: Dict[str, List[float]],
+                      end_of_day_mask: Optional[np.ndarray] = None) -> bool:
+        """
+        Run a whole backtest from precomputed arrays instead of calling make_decision per tick.
+
+        Entry and bear-exit candidates come from vectorized threshold tests on the bar
+        score arrays; stop loss, trailing stop, take profit and end-of-day levels are
+        evaluated as arrays over the ticks after each entry. The executor's own entry
+        and exit methods run only at the resulting trade ticks, so the portfolio and
+        trade_details_history match the tick-by-tick path.
+
+        Args:
+            ticks: Primary timeframe candles (indexable; only trade ticks are read)
+            closes: Close prices aligned with ticks
+            bar_score_history: bar_name -> score per tick
+            indicator_history: indicator_name -> value per tick (for trade details)
+            end_of_day_mask: Optional precomputed end_of_day_window_mask for ticks
+
+        Returns:
+            False if this executor state/configuration needs the tick-by-tick path
+            (nothing was executed), True otherwise
+        """
+        trailing_factor = 1.0 - self.trailing_stop_distance_pct
+        if self.portfolio.is_in_position() or self._trading_halted or \
+                (self.trailing_stop_loss and not trailing_factor > 0):
+            return False
+
+        length = len(ticks)
+        closes = np.asarray(closes, dtype=np.float64)[:length]
+        bar_arrays = {}
+        for bar_name, values in bar_score_history.items():
+            scores = np.zeros(length)
+            count = min(len(values), length)
+            scores[:count] = values[:count]
+            bar_arrays[bar_name] = scores
+
+        bull = self._conditions_triggered(getattr(self.monitor_config, 'enter_long', []), bar_arrays, length)
+        bear = self._conditions_triggered(getattr(self.monitor_config, 'exit_long', []), bar_arrays, length)
+        # Entries need a bull signal without a conflicting bear signal
+        entry_candidates = np.flatnonzero(bull & ~bear)
+        exit_signals = bear if not self.ignore_bear_signals else np.zeros(length, dtype=bool)
+        if self.exit_by_end_of_day:
+            if end_of_day_mask is None:
+                end_of_day_mask = self.end_of_day_window_mask([tick.timestamp for tick in ticks])
+            exit_signals = exit_signals | end_of_day_mask[:length]
+
+        def decision_context(index: int):
+            tick = ticks[index]
+            timestamp = int(tick.timestamp.timestamp() * 1000) if tick.timestamp else 0
+            indicators = {name: values[index] if index < len(values) else 0.0
+                          for name, values in indicator_history.items()}
+            bar_scores = defaultdict(float, {name: values[index] if index < len(values) else 0.0
+                                             for name, values in bar_score_history.items()})
+            return timestamp, tick.close, bar_scores, tick.timestamp, indicators
+
+        position = 0
+        while position < length:
+            # Trading halt (dollar target reached) blocks entries until the next session
+            while self._trading_halted and position < length:
+                self._check_halt_reset(ticks[position].timestamp)
+                if self._trading_halted:
+                    position += 1
+
+            candidate = np.searchsorted(entry_candidates, position)
+            if candidate >= len(entry_candidates):
+                break
+            entry_index = int(entry_candidates[candidate])
+
+            timestamp, price, bar_scores, trade_time, indicators = decision_context(entry_index)
+            if not self._check_entry_conditions(timestamp, price, bar_scores, trade_time, indicators) or \
+                    not self.portfolio.is_in_position():
+                position = entry_index + 1
+                continue
+
+            exit_index, highest, trailing_stop = self._find_exit_index(
+                closes, entry_index + 1, exit_signals, trailing_factor)
+            if self.trailing_stop_loss:
+                self.highest_price_since_entry = highest
+                self.trailing_stop_price = trailing_stop
+            if exit_index is None:
+                break
+
+            timestamp, price, bar_scores, trade_time, indicators = decision_context(exit_index)
+            if not self._check_exit_conditions(timestamp, price, bar_scores, trade_time, indicators):
+                raise RuntimeError(f"Fast path exit at tick {exit_index} was not confirmed by the executor")
+            position = exit_index + 1
+
+        return True
+
+    def _find_exit_index(self, closes: np.ndarray, start: int, exit_signals: np.ndarray,
+                         trailing_factor: float) -> Tuple[Optional[int], Optional[float], Optional[float]]:
+        """
+        Find the first tick at or after `start` where the open position exits.
+
+        Scans in growing chunks so that short trades only touch a few ticks.
+
+        Returns:
+            (exit index or None, highest price since entry, trailing stop) at that tick
+            (or at the last tick when the position stays open)
+        """
+        entry_price = self.portfolio.get_entry_price()
+        fixed_stop = self.stop_loss_price
+        take_profit = self.take_profit_price
+        # _update_trailing_stop only runs while highest_price_since_entry is truthy
+        trails = self.trailing_stop_loss and bool(self.highest_price_since_entry)
+        highest = self.highest_price_since_entry
+        trailing_stop = self.trailing_stop_price
+
+        length = len(closes)
+        chunk = 64
+        while start < length:
+            end = min(length, start + chunk)
+            prices = closes[start:end]
+
+            if trails:
+                # fmax skips NaN closes, as the tick loop does (NaN > highest is False)
+                running_high = np.fmax(np.fmax.accumulate(prices), highest)
+                # New highs move the stop up to price * (1 - distance), never down
+                stops = np.where(running_high > entry_price,
+                                 np.maximum(fixed_stop, running_high * trailing_factor), fixed_stop)
+                stops = np.maximum(stops, trailing_stop)
+            elif self.trailing_stop_loss:
+                running_high = None
+                stops = np.full(len(prices), trailing_stop if trailing_stop is not None else np.nan)
+            else:
+                running_high = None
+                stops = np.full(len(prices), fixed_stop if fixed_stop is not None else np.nan)
+
+            hits = (stops != 0) & (prices <= stops)
+            if take_profit:
+                hits |= prices >= take_profit
+            hits |= exit_signals[start:end]
+
+            offsets = np.flatnonzero(hits)
+            index = int(offsets[0]) if len(offsets) else len(prices) - 1
+            if running_high is not None:
+                highest = float(running_high[index])
+                trailing_stop = float(stops[index])
+            if len(offsets):
+                return start + index, highest, trailing_stop
+
+            start = end
+            chunk *= 4
+
+        return None, highest, trailing_stop
+
     def get_status(self) -> Dict:
         """Get current executor status for debugging"""
         return {
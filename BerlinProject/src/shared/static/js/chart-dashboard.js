@@ -111,6 +111,88 @@ class ChartDashboard {
         return this.data;
     }
 
+    /**
+     * Fetch only the points added since the last response (?since=cursor) and
+     * merge them into this.data. Falls back to a full load without a cursor.
+     * @param {string} cardId - The card ID
+     */
+    async loadUpdates(cardId) {
+        if (!this.data || this.data.cursor === undefined || this.data.cursor === null) {
+            return this.loadData(cardId);
+        }
+
+        const response = await fetch(
+            `${this.apiBaseUrl}/combinations/${cardId}/chart-data?since=${this.data.cursor}`);
+        if (!response.ok) {
+            throw new Error(`Failed to fetch chart data: ${response.statusText}`);
+        }
+
+        const delta = await response.json();
+        if (!delta.success) {
+            throw new Error(delta.error || 'Unknown error fetching chart data');
+        }
+
+        this.mergeDelta(delta);
+        return this.data;
+    }
+
+    /**
+     * Merge an incremental chart-data response into this.data.
+     * Points at or after the first new timestamp replace existing ones (the
+     * full response ends with the in-progress candle), and the delta's
+     * current_candles become the last point of each candle series.
+     * @param {Object} delta - Response of the ?since= endpoint
+     */
+    mergeDelta(delta) {
+        const appendPoints = (existing, points, timestampOf) => {
+            if (!points || points.length === 0) {
+                return existing || [];
+            }
+            const first = timestampOf(points[0]);
+            const kept = (existing || []).filter(point => timestampOf(point) < first);
+            return kept.concat(points);
+        };
+        const byArrayTs = point => point[0];
+        const byFieldTs = entry => entry.timestamp;
+
+        // The in-progress candle is each candle series' last point, replaced on every merge
+        const currentCandles = delta.current_candles || {};
+        const withCurrent = (rows, current) => {
+            if (!current) {
+                return rows;
+            }
+            return rows.filter(row => row[0] < current[0]).concat([current]);
+        };
+
+        this.data.candlestick_data = withCurrent(
+            appendPoints(this.data.candlestick_data, delta.candlestick_data, byArrayTs),
+            currentCandles[delta.primary_agg_key]);
+        ['per_aggregator_candles', 'indicator_history', 'raw_indicator_history', 'component_history'].forEach(key => {
+            this.data[key] = this.data[key] || {};
+            Object.entries(delta[key] || {}).forEach(([name, points]) => {
+                this.data[key][name] = appendPoints(this.data[key][name], points, byArrayTs);
+            });
+        });
+        Object.entries(currentCandles).forEach(([aggKey, current]) => {
+            this.data.per_aggregator_candles[aggKey] = withCurrent(
+                this.data.per_aggregator_candles[aggKey] || [], current);
+        });
+        this.data.bar_scores_formatted = appendPoints(
+            this.data.bar_scores_formatted, delta.bar_scores_formatted, byFieldTs);
+        ['trades', 'triggers', 'pnl_history'].forEach(key => {
+            this.data[key] = appendPoints(this.data[key], delta[key], byFieldTs);
+        });
+        this.data.pnl_data = this.data.pnl_history;
+
+        this.data.current_values = delta.current_values;
+        this.data.portfolio_metrics = delta.portfolio_metrics;
+        this.data.total_candles = this.data.candlestick_data.length;
+        this.data.total_trades = delta.total_trades;
+        if (delta.cursor !== null && delta.cursor !== undefined) {
+            this.data.cursor = delta.cursor;
+        }
+    }
+
     /**
      * Render all dashboard components
      */
@@ -446,7 +528,7 @@ class ChartDashboard {
             return;
         }
 
-        await this.loadData(this.cardId);
+        await this.loadUpdates(this.cardId);
         this.renderAll();
     }
 
@@ -12,9 +12,9 @@ import math
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
-import numpy as np
 
 from mlf_utils.log_manager import LogManager
+from mlf_utils import fast_json
 
 logger = LogManager().get_logger("ChartDataService")
 
@@ -234,8 +234,8 @@ class ChartDataService:
             Formatted trade details dict
         """
         # The trade_details_history from TradeExecutorUnified is already
-        # in the correct format, so we just return it with any needed sanitization
-        return ChartDataService.sanitize_data(trade_details_history)
+        # in the correct format (NaN and NumPy values are handled when the response is encoded)
+        return trade_details_history
 
     @staticmethod
     def build_indicator_chart_data(indicator_processor, monitor_config, all_candle_data: Dict[str, List]) -> Dict[str, Any]:
@@ -464,32 +464,16 @@ class ChartDataService:
     @staticmethod
     def sanitize_data(data: Any) -> Any:
         """
-        Recursively sanitize data for JSON serialization.
-        Handles NaN, Infinity, numpy types.
+        Sanitize data for JSON serialization.
+        Handles NaN, Infinity, numpy types (one encode/decode pass through fast_json).
 
         Args:
             data: Any data structure
 
         Returns:
-            Sanitized data safe for JSON serialization
+            Sanitized data safe for JSON serialization (dict keys become strings)
         """
-        if isinstance(data, dict):
-            return {k: ChartDataService.sanitize_data(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [ChartDataService.sanitize_data(item) for item in data]
-        elif isinstance(data, float):
-            if math.isnan(data) or math.isinf(data):
-                return None
-            return data
-        elif isinstance(data, np.floating):
-            if np.isnan(data) or np.isinf(data):
-                return None
-            return float(data)
-        elif isinstance(data, np.integer):
-            return int(data)
-        elif isinstance(data, np.ndarray):
-            return ChartDataService.sanitize_data(data.tolist())
-        return data
+        return fast_json.to_jsonable(data)
 
     @staticmethod
     def get_unified_chart_data(data_streamer, monitor_config, card_id: str, symbol: str,
@@ -509,7 +493,7 @@ class ChartDataService:
             test_name: Optional test/config name
 
         Returns:
-            Complete chart data dict ready for JSON response
+            Complete chart data dict; encode it with fast_json.dumps_bytes (values may be NaN or NumPy types)
         """
         from optimization.calculators.indicator_processor_historical_new import IndicatorProcessorHistoricalNew
 
@@ -682,13 +666,81 @@ class ChartDataService:
 
             # Stats
             'total_candles': len(candlestick_data),
-            'total_trades': len(trade_history)
-        }
+            'total_trades': len(trade_history),
 
-        # Sanitize for JSON
-        chart_data = ChartDataService.sanitize_data(chart_data)
+            # Poll with ?since=<cursor> for incremental updates
+            'cursor': ChartDataService.last_completed_timestamp(data_streamer.aggregators, primary_agg_key)
+        }
 
         logger.info(f"Chart data for {card_id}: {len(candlestick_data)} candles, "
                     f"{len(indicators_list)} indicators, {len(trade_history)} trades")
 
         return chart_data
+
+    @staticmethod
+    def last_completed_timestamp(aggregators: Dict[str, Any], agg_key: Optional[str]) -> Optional[int]:
+        """Timestamp (ms) of the last completed candle of an aggregator, if any"""
+        if agg_key is None or agg_key not in aggregators:
+            return None
+        timestamps = aggregators[agg_key].timestamps_ms()
+        return int(timestamps[-1]) if len(timestamps) else None
+
+    @staticmethod
+    def get_incremental_chart_data(data_streamer, monitor_config, card_id: str, symbol: str,
+                                   since: int) -> Dict[str, Any]:
+        """
+        Get chart data points newer than a client cursor for Card Details polling.
+
+        Series come from the card's ChartStore, which the DataStreamer appends candles
+        and their indicator points to as they complete (the first request seeds it with
+        one full calculation), and the response only carries the new points.
+
+        Args:
+            data_streamer: DataStreamer instance
+            monitor_config: MonitorConfiguration
+            card_id: Card identifier
+            symbol: Trading symbol
+            since: Cursor (timestamp in ms) returned by the previous response
+
+        Returns:
+            Chart data delta dict (encode with fast_json.dumps_bytes); pass its 'cursor' as the next `since`
+        """
+        chart_store = data_streamer.chart_store
+        chart_store.ensure_current(data_streamer.aggregators, monitor_config)
+        chart_data = chart_store.get_since(since)
+
+        # In-progress candle per aggregator so the client can redraw the forming bar
+        current_candles = {}
+        for agg_key, aggregator in data_streamer.aggregators.items():
+            current = aggregator.get_current_candle()
+            if current is not None:
+                current_candles[agg_key] = ChartDataService.format_candlestick_data([current])[0]
+
+        # Trades are few; P&L needs the whole list so filter after extraction
+        trade_executor = data_streamer.trade_executor
+        trade_details_history = getattr(trade_executor, 'trade_details_history', {})
+        trade_history, triggers, pnl_history = ChartDataService.extract_trade_history(
+            trade_executor.portfolio, trade_details_history
+        )
+
+        indicator_processor = data_streamer.indicator_processor
+        chart_data.update({
+            'success': True,
+            'incremental': True,
+            'ticker': symbol,
+            'card_id': card_id,
+            'current_candles': current_candles,
+            'trades': [trade for trade in trade_history if trade['timestamp'] > since],
+            'triggers': [trigger for trigger in triggers if trigger['timestamp'] > since],
+            'pnl_history': [point for point in pnl_history if point['timestamp'] > since],
+            'current_values': {
+                'indicators': getattr(indicator_processor, 'indicators', {}),
+                'raw_indicators': getattr(indicator_processor, 'raw_indicators', {}),
+                'bar_scores': getattr(data_streamer, 'bar_scores', {})
+            },
+            'portfolio_metrics': data_streamer.get_portfolio_metrics()
+            if hasattr(data_streamer, 'get_portfolio_metrics') else {},
+            'total_trades': len(trade_history)
+        })
+
+        return chart_data
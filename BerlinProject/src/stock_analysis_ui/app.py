@@ -14,12 +14,14 @@ from data_streamer.cs_replay_data_link import CSReplayDataLink
 
 # Configure logging
 from mlf_utils.log_manager import LogManager
+from mlf_utils import fast_json
 logger = LogManager("mlf.log").get_logger("app")
 
 # Flask app setup
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
-socketio = SocketIO(app, cors_allowed_origins="*")
+# fast_json encodes event payloads with NaN/Infinity and NumPy types handled natively
+socketio = SocketIO(app, cors_allowed_origins="*", json=fast_json)
 
 # CHANGED: Session-based app services instead of global
 session_app_services = {}  # session_id -> app_service
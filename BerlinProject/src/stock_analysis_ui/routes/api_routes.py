@@ -18,6 +18,7 @@ from stock_analysis_ui.services.schwab_auth import SchwabAuthManager
 from shared.utils.chart_data_service import ChartDataService
 from mlf_utils.log_manager import LogManager
 from mlf_utils.timezone_utils import now_utc, isoformat_et
+from mlf_utils import fast_json
 from stock_analysis_ui.services.ui_external_tool import sanitize_for_json
 
 logger = LogManager().get_logger("APIRoutes")
@@ -844,9 +845,13 @@ def get_chart_data(card_id: str):
     - Bar scores chart
     - Indicator analysis charts
     - Trade details modal
+
+    With ?since=<cursor> (a timestamp in ms from the previous response) only the
+    points added after the cursor are returned, from the card's chart store.
     """
     try:
         app_service = get_session_app_service()
+        since = request.args.get('since', type=int)
 
         # Check if card exists
         if card_id not in app_service.combinations:
@@ -858,6 +863,16 @@ def get_chart_data(card_id: str):
         data_streamer = combination['data_streamer']
         test_name = combination.get('test_name', monitor_config.name)
 
+        if since is not None:
+            chart_data = ChartDataService.get_incremental_chart_data(
+                data_streamer=data_streamer,
+                monitor_config=monitor_config,
+                card_id=card_id,
+                symbol=symbol,
+                since=since
+            )
+            return current_app.response_class(fast_json.dumps_bytes(chart_data), mimetype='application/json')
+
         # Use shared ChartDataService for unified data extraction
         chart_data = ChartDataService.get_unified_chart_data(
             data_streamer=data_streamer,
@@ -867,8 +882,8 @@ def get_chart_data(card_id: str):
             test_name=test_name
         )
 
-        # Sanitize NaN/Infinity values that break JSON serialization
-        return jsonify(sanitize_for_json(chart_data))
+        # One-pass encode; NaN/Infinity become null
+        return current_app.response_class(fast_json.dumps_bytes(chart_data), mimetype='application/json')
 
     except Exception as e:
         logger.error(f"Error getting chart data for {card_id}: {e}")
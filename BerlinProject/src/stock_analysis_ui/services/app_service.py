@@ -11,11 +11,13 @@ from socket import SocketIO
 from data_streamer.schwab_data_link import SchwabDataLink
 from data_streamer.cs_replay_data_link import CSReplayDataLink
 from data_streamer.data_streamer import DataStreamer
+from candle_aggregator.symbol_aggregator_hub import SymbolAggregatorHub
 from models.monitor_configuration import MonitorConfiguration, load_monitor_config
 from stock_analysis_ui.services.ui_external_tool import UIExternalTool
 from stock_analysis_ui.services.pip_saver import PipSaver
 from stock_analysis_ui.services.schwab_auth import SchwabAuthManager
 from mlf_utils.log_manager import LogManager
+from mlf_utils.env_vars import EnvVars
 from mlf_utils.timezone_utils import now_utc, isoformat_et
 
 
@@ -39,8 +41,11 @@ class AppService:
         self.session_id: str = session_id  # NEW: Track session ID
 
         self.data_link: Optional[Union[SchwabDataLink, CSReplayDataLink]] = None
+        # One set of candle aggregators per symbol, shared by all cards on that symbol
+        self.aggregator_hub: SymbolAggregatorHub = SymbolAggregatorHub()
         # MODIFIED: Pass self to UIExternalTool so it can access combination data
-        self.ui_tool: UIExternalTool = UIExternalTool(socketio, app_service=self)
+        self.ui_tool: UIExternalTool = UIExternalTool(socketio, app_service=self,
+                                                      frame_rate=EnvVars().ui_frame_rate)
 
         # Initialize pip saver and connect to ui_tool
         self.pip_saver: PipSaver = PipSaver(session_id=session_id)
@@ -170,7 +175,8 @@ class AppService:
             data_streamer: DataStreamer = DataStreamer(
                 card_id=card_id,
                 symbol=symbol,
-                monitor_config=monitor_config
+                monitor_config=monitor_config,
+                aggregator_hub=self.aggregator_hub
             )
 
             # Store test_name in the DataStreamer
@@ -288,6 +294,9 @@ class AppService:
                 if not self.data_link.data_streamers[symbol]:
                     del self.data_link.data_streamers[symbol]
 
+            # Release this card's references to the shared aggregators
+            data_streamer.release_aggregators()
+
             # Clear UI tool data for this card
             self.ui_tool.clear_meaningful_data(card_id)
 
@@ -333,8 +342,9 @@ class AppService:
                 elif hasattr(self.data_link, 'stop_streaming'):
                     self.data_link.stop_streaming()
 
-            # Clear all combinations
+            # Clear all combinations and the aggregators they shared
             self.combinations.clear()
+            self.aggregator_hub = SymbolAggregatorHub()
 
             self.logger.info("Streaming stopped")
             return True
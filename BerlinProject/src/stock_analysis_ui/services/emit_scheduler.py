@@ -0,0 +1,140 @@
+"""
+Coalescing emit scheduler for live card updates.
+
+DataStreamers hand every tick's card state to the scheduler; only the latest
+state per card is kept, and a background task flushes all changed cards of the
+session as one `card_updates` event per frame. Intermediate states between
+frames are replaced rather than dropped-after-the-fact, so the browser always
+gets the most recent values at a bounded event rate.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from mlf_utils.log_manager import LogManager
+
+logger = LogManager().get_logger("CardEmitScheduler")
+
+# emit(event_name, data) -> success
+EmitFunction = Callable[[str, Dict[str, Any]], bool]
+
+
+class CardEmitScheduler:
+    """
+    Keeps the latest update per card and emits them in batches at `frame_rate`
+    frames per second. Failed emits slow the frame rate down (up to one frame
+    per second) until an emit succeeds again.
+    """
+
+    MAX_FRAME_INTERVAL: float = 1.0
+
+    def __init__(self, socketio, emit: EmitFunction, frame_rate: float = 20.0,
+                 event_name: str = 'card_updates') -> None:
+        self.socketio = socketio
+        self._emit: EmitFunction = emit
+        self.event_name: str = event_name
+        self.base_interval: float = 1.0 / frame_rate
+        self.frame_interval: float = self.base_interval
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._running: bool = False
+        self._generation: int = 0  # lets a stopped loop exit even if restarted meanwhile
+
+        # Statistics
+        self.updates_submitted: int = 0
+        self.updates_coalesced: int = 0
+        self.frames_sent: int = 0
+        self.failed_frames: int = 0
+
+    @property
+    def frame_rate(self) -> float:
+        return 1.0 / self.base_interval
+
+    def set_frame_rate(self, frame_rate: float) -> None:
+        """Change the target frame rate (frames per second)"""
+        if frame_rate <= 0:
+            raise ValueError(f"Frame rate must be positive, got {frame_rate}")
+        self.base_interval = 1.0 / frame_rate
+        self.frame_interval = self.base_interval
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def submit(self, card_id: str, update: Dict[str, Any]) -> None:
+        """Queue the latest state of a card (replaces any update not yet flushed)"""
+        with self._lock:
+            if card_id in self._pending:
+                self.updates_coalesced += 1
+            self._pending[card_id] = update
+            self.updates_submitted += 1
+        self.start()
+
+    def discard(self, card_id: str) -> None:
+        """Drop a pending update (e.g. the card was removed)"""
+        with self._lock:
+            self._pending.pop(card_id, None)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Emit all pending updates as one event.
+
+        Returns:
+            Number of card updates emitted
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            updates: List[Dict[str, Any]] = list(self._pending.values())
+            self._pending = {}
+
+        success = self._emit(self.event_name, {'updates': updates})
+        if success:
+            self.frames_sent += 1
+            self.frame_interval = self.base_interval
+        else:
+            self.failed_frames += 1
+            self.frame_interval = min(self.frame_interval * 1.5, self.MAX_FRAME_INTERVAL)
+        return len(updates)
+
+    def start(self) -> None:
+        """Start the background flush task (no-op when already running)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._generation += 1
+            generation = self._generation
+        self.socketio.start_background_task(self._run, generation)
+
+    def stop(self) -> None:
+        """Stop the flush task after emitting whatever is still pending"""
+        self._running = False
+        self.flush()
+
+    def _run(self, generation: int) -> None:
+        logger.debug(f"Emit scheduler started at {self.frame_rate:.1f} frames/s")
+        while self._running and generation == self._generation:
+            started = time.monotonic()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing card updates: {e}")
+            self.socketio.sleep(max(0.0, self.frame_interval - (time.monotonic() - started)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'frame_rate': self.frame_rate,
+            'frame_interval': self.frame_interval,
+            'updates_submitted': self.updates_submitted,
+            'updates_coalesced': self.updates_coalesced,
+            'frames_sent': self.frames_sent,
+            'failed_frames': self.failed_frames,
+            'pending': self.pending_count(),
+        }
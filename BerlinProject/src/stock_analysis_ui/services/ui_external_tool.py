@@ -3,7 +3,6 @@ Enhanced UIExternalTool with candlestick chart support, minimal logging, and pip
 """
 
 import time
-import math
 from typing import Dict, Optional, Any, List, TYPE_CHECKING
 from datetime import datetime
 from collections import defaultdict
@@ -14,6 +13,8 @@ from flask_socketio import SocketIO
 from data_streamer import ExternalTool
 from models.tick_data import TickData
 from mlf_utils.log_manager import LogManager
+from mlf_utils import fast_json
+from stock_analysis_ui.services.emit_scheduler import CardEmitScheduler
 from mlf_utils.timezone_utils import now_utc, isoformat_et
 
 if TYPE_CHECKING:
@@ -25,25 +26,9 @@ logger = LogManager().get_logger("UIExternalTool")
 def sanitize_for_json(obj: Any) -> Any:
     """
     Recursively sanitize data for JSON serialization.
-    Converts NaN and Infinity to None (JSON null).
+    Converts NaN and Infinity to None (JSON null) and NumPy types to Python ones.
     """
-    if isinstance(obj, dict):
-        return {k: sanitize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [sanitize_for_json(item) for item in obj]
-    elif isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None  # JSON null
-        return obj
-    elif isinstance(obj, np.floating):
-        if np.isnan(obj) or np.isinf(obj):
-            return None
-        return float(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.ndarray):
-        return sanitize_for_json(obj.tolist())
-    return obj
+    return fast_json.to_jsonable(obj)
 
 
 class UIExternalTool(ExternalTool):
@@ -51,16 +36,21 @@ class UIExternalTool(ExternalTool):
     Enhanced UI External Tool - sends data to browser via WebSocket with candlestick support
     """
 
-    def __init__(self, socketio: SocketIO, app_service=None):
+    def __init__(self, socketio: SocketIO, app_service=None, frame_rate: float = 20.0):
         self.socketio: SocketIO = socketio
         self.app_service = app_service  # Store reference to app_service
         self.last_meaningful_data: Dict[str, Dict] = {}
 
-        # Rate limiting
+        # Card updates are coalesced per card and emitted as one 'card_updates' event per frame
+        self.emit_scheduler: CardEmitScheduler = CardEmitScheduler(
+            socketio, self._emit_card_updates, frame_rate=frame_rate)
         self.last_update_time: Dict[str, float] = defaultdict(float)
-        self.min_update_interval: float = 0.05  # 50ms minimum between updates
         self.update_counter: Dict[str, int] = defaultdict(int)
-        self.failed_emit_counter: Dict[str, int] = defaultdict(int)
+
+        # Whether a browser is in this session's room (re-checked at most every watcher_check_interval)
+        self.watcher_check_interval: float = 0.5
+        self._has_watchers: bool = True
+        self._watchers_checked_at: float = 0.0
 
         # WebSocket health monitoring
         self.last_successful_emit: float = time.time()
@@ -83,8 +73,9 @@ class UIExternalTool(ExternalTool):
     def emit_to_session(self, event_name, data, session_id=None):
         """Emit WebSocket event to specific session room or broadcast"""
         try:
-            # Sanitize data to handle NaN/Infinity values that break JSON serialization
-            sanitized_data = sanitize_for_json(data)
+            # The fast_json packet encoder handles NaN/Infinity and NumPy types itself;
+            # other encoders need a sanitized copy
+            sanitized_data = data if self.encodes_natively else sanitize_for_json(data)
 
             if session_id:
                 # Send to specific session room
@@ -102,6 +93,38 @@ class UIExternalTool(ExternalTool):
             logger.error(f"Failed to emit {event_name} to session {session_id}: {e}")
             return False
 
+    @property
+    def encodes_natively(self) -> bool:
+        """Whether the SocketIO server encodes packets with fast_json"""
+        return getattr(self.socketio, 'server_options', {}).get('json') is fast_json
+
+    def _emit_card_updates(self, event_name: str, data: Dict[str, Any]) -> bool:
+        """Emit callback of the scheduler (one batched event per frame)"""
+        return self.emit_to_session(event_name, data, self.get_session_id_from_app_service())
+
+    def has_watchers(self) -> bool:
+        """
+        Whether any client is connected to this session's room. Without a session
+        (replay mode broadcasts) or when the server cannot tell, assume yes.
+        """
+        session_id = self.get_session_id_from_app_service()
+        if not session_id:
+            return True
+
+        current_time = time.time()
+        if current_time - self._watchers_checked_at >= self.watcher_check_interval:
+            self._watchers_checked_at = current_time
+            try:
+                rooms = self.socketio.server.manager.rooms.get('/', {})
+                self._has_watchers = bool(rooms.get(f"session_{session_id}"))
+            except AttributeError:
+                self._has_watchers = True
+        return self._has_watchers
+
+    def wants_updates(self, card_id: str) -> bool:
+        """Live card data is needed while a browser watches the session or pips are being saved"""
+        return self.has_watchers() or bool(self.pip_saver and self.pip_saver.is_enabled)
+
     def get_session_id_from_app_service(self):
         """Get session ID from the app_service if it has one"""
         if hasattr(self.app_service, 'session_id'):
@@ -118,62 +141,44 @@ class UIExternalTool(ExternalTool):
         Process real-time tick data and send updates to browser (session-specific) - Enhanced for candlestick support
         """
         try:
-            current_time = time.time()
-
-            # Rate limiting check
-            if current_time - self.last_update_time[card_id] < self.min_update_interval:
-                return
-
-            self.last_update_time[card_id] = current_time
+            self.last_update_time[card_id] = time.time()
             self.update_counter[card_id] += 1
 
-            # Build update data - Enhanced with candlestick information and component data
-            update_data = {
-                'card_id': card_id,
-                'symbol': symbol,
-                'price': tick_data.close,
-                'timestamp': tick_data.timestamp.isoformat(),
-                'ohlc': [tick_data.open, tick_data.high, tick_data.low, tick_data.close],  # For candlestick chart
-                'volume': tick_data.volume,
-                'indicators': indicators,
-                'raw_indicators': raw_indicators,
-                'bar_scores': bar_scores,
-                'update_count': self.update_counter[card_id]
-            }
-
-            # Add component data if available (MACD components, SMA values, etc.)
-            if component_data:
-                update_data['components'] = component_data
-
-            # Add portfolio data if available
-            if portfolio_metrics:
-                update_data['portfolio'] = portfolio_metrics
-                update_data['portfolio_data'] = portfolio_metrics  # For backward compatibility
-
-            # Add data status for insufficient data warnings
-            if data_status:
-                update_data['data_status'] = data_status
-
-            # Add thresholds for sound notifications
-            if thresholds:
-                update_data['thresholds'] = thresholds
-
-            # Get session ID from app_service if available
-            session_id = self.get_session_id_from_app_service()
-
-            # Emit to specific session or broadcast
-            success = self.emit_to_session('card_update', update_data, session_id)
-
-            if not success:
-                self.failed_emit_counter[card_id] += 1
-                if self.failed_emit_counter[card_id] > self.max_failed_emits:
-                    logger.warning(f"Too many failed emits for card {card_id}, temporarily reducing updates")
-                    self.min_update_interval = min(self.min_update_interval * 1.5, 1.0)
-
-            # Reset failed counter on success
-            if success and self.failed_emit_counter[card_id] > 0:
-                self.failed_emit_counter[card_id] = 0
-                self.min_update_interval = 0.05  # Reset to normal rate
+            # Only the latest state per card is sent, so skip building it while nobody watches
+            if self.has_watchers():
+                # Build update data - Enhanced with candlestick information and component data
+                # (dicts are copied: the streamer keeps updating its own until the frame is flushed)
+                update_data = {
+                    'card_id': card_id,
+                    'symbol': symbol,
+                    'price': tick_data.close,
+                    'timestamp': tick_data.timestamp.isoformat(),
+                    'ohlc': [tick_data.open, tick_data.high, tick_data.low, tick_data.close],  # For candlestick chart
+                    'volume': tick_data.volume,
+                    'indicators': dict(indicators),
+                    'raw_indicators': dict(raw_indicators),
+                    'bar_scores': dict(bar_scores),
+                    'update_count': self.update_counter[card_id]
+                }
+
+                # Add component data if available (MACD components, SMA values, etc.)
+                if component_data:
+                    update_data['components'] = dict(component_data)
+
+                # Add portfolio data if available
+                if portfolio_metrics:
+                    update_data['portfolio'] = portfolio_metrics
+                    update_data['portfolio_data'] = portfolio_metrics  # For backward compatibility
+
+                # Add data status for insufficient data warnings
+                if data_status:
+                    update_data['data_status'] = data_status
+
+                # Add thresholds for sound notifications
+                if thresholds:
+                    update_data['thresholds'] = thresholds
+
+                self.emit_scheduler.submit(card_id, update_data)
 
             # Save pip to file if pip saver is enabled
             if self.pip_saver and self.pip_saver.is_enabled:
@@ -278,7 +283,9 @@ class UIExternalTool(ExternalTool):
             'success_rate': (self.total_emits - self.failed_emits) / max(self.total_emits, 1) * 100,
             'last_successful_emit': self.last_successful_emit,
             'seconds_since_last_emit': current_time - self.last_successful_emit,
-            'min_update_interval': self.min_update_interval,
+            'frame_rate': self.emit_scheduler.frame_rate,
+            'emit_scheduler': self.emit_scheduler.get_stats(),
+            'has_watchers': self.has_watchers(),
             'active_cards': len(self.last_update_time),
             'total_updates': sum(self.update_counter.values())
         }
@@ -352,8 +359,7 @@ class UIExternalTool(ExternalTool):
                 del self.last_update_time[card_id]
             if card_id in self.update_counter:
                 del self.update_counter[card_id]
-            if card_id in self.failed_emit_counter:
-                del self.failed_emit_counter[card_id]
+            self.emit_scheduler.discard(card_id)
                 
             logger.debug(f"Cleared meaningful data for card {card_id}")
             
@@ -365,10 +371,11 @@ class UIExternalTool(ExternalTool):
         try:
             logger.info("Cleaning up UIExternalTool...")
 
+            self.emit_scheduler.stop()
+
             # Clear tracking dictionaries
             self.last_update_time.clear()
             self.update_counter.clear()
-            self.failed_emit_counter.clear()
             self.last_meaningful_data.clear()
 
             logger.info("UIExternalTool cleanup completed")
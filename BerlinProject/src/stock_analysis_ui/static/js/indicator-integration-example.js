@@ -99,6 +99,11 @@ class StockAnalysisIndicatorManager {
         this.socket.on('card_update', (data) => {
             this.handleCardUpdate(data);
         });
+
+        // Coalesced updates (one event per frame with the latest state of each card)
+        this.socket.on('card_updates', (batch) => {
+            (batch.updates || []).forEach((data) => this.handleCardUpdate(data));
+        });
         
         // Listen for candle completed events
         this.socket.on('candle_completed', (data) => {
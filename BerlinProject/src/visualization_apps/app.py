@@ -93,14 +93,19 @@ def handle_start_optimization(data):
         'best_individuals_log': [],
         'elites': [],
         'test_evaluations': [],  # New: track test evaluations
+        'test_streamer': None,  # Test split is loaded once per optimization
+        'test_streamer_key': None,
         'ga_instance': None,  # Clear cached GA instance
         'io_instance': None   # Clear cached IO instance
     })
 
     # Start optimization thread with NEW indicator system
+    # 'resume' continues from the test's last checkpoint, 'resume_checkpoint_path' from a given file
     thread = threading.Thread(
         target=run_genetic_algorithm_threaded_with_new_indicators,
-        args=(ga_config_path, data_config_path, socketio, OptimizationState(), test_data_config_path)
+        args=(ga_config_path, data_config_path, socketio, OptimizationState(), test_data_config_path),
+        kwargs={'resume': bool(data.get('resume', False)),
+                'resume_checkpoint_path': data.get('resume_checkpoint_path')}
     )
     OptimizationState().set('thread', thread)
     thread.start()
@@ -221,6 +226,13 @@ def handle_state_recovery(data=None):
     logger.info(f"📤 Sending state recovery: {current_state}")
     emit('state_recovery', current_state)
 
+    # Candles and earlier objective points are not repeated by generation_complete deltas;
+    # resend them to the reconnected client
+    static_chart_data = state.get('static_chart_data') if state.is_running() else None
+    if static_chart_data:
+        emit('optimization_static_data', dict(static_chart_data,
+                                              best_individuals_log=list(state.get('best_individuals_log', []))))
+
 
 @app.errorhandler(404)
 def not_found(error):
@@ -33,7 +33,9 @@ class OptimizationState(metaclass=Singleton):
             'data_config_path_temp': None,
             'ga_config_path_temp': None,
             'timestamp': None,
-            'processed_indicators': []
+            'processed_indicators': [],
+            'test_streamer': None,  # test-split BacktestDataStreamer, built once per optimization
+            'test_streamer_key': None
         }
 
 
@@ -93,7 +95,9 @@ class OptimizationState(metaclass=Singleton):
                 'test_name': None,
                 'ga_config_path': None,
                 'timestamp': None,
-                'processed_indicators': []
+                'processed_indicators': [],
+                'test_streamer': None,
+                'test_streamer_key': None
             })
 
             if ga_config_path_temp:
@@ -8,6 +8,7 @@ splitting the original monolithic optimizer_routes.py into focused components:
 - constants.py: Shared constants and configuration
 - elite_selection.py: Pareto front balancing and elite selection
 - chart_generation.py: Chart data generation for visualization
+- generation_reporter.py: Background generation_complete reporting (deltas)
 - genetic_algorithm.py: Core GA execution with WebSocket updates
 - results_manager.py: Results saving and export functionality
 
@@ -24,6 +25,7 @@ from .chart_generation import (
     extract_trade_history_and_pnl_from_portfolio,
     generate_chart_data_for_individual_with_new_indicators
 )
+from .generation_reporter import GenerationReporter
 from .genetic_algorithm import (
     heartbeat_thread,
     run_genetic_algorithm_threaded_with_new_indicators
@@ -45,6 +47,7 @@ __all__ = [
     'generate_chart_data_for_individual_with_new_indicators',
 
     # Genetic algorithm
+    'GenerationReporter',
     'heartbeat_thread',
     'run_genetic_algorithm_threaded_with_new_indicators',
 
@@ -18,8 +18,16 @@ from mlf_utils.log_manager import LogManager
 logger = LogManager().get_logger("OptimizerVisualization")
 
 
-def generate_optimizer_chart_data(best_individual, elites, io, data_config_path, best_individuals_log, objectives):
-    """Generate chart data specifically for optimizer visualization"""
+def generate_optimizer_chart_data(best_individual, elites, backtest_streamer, data_config_path, best_individuals_log,
+                                  objectives, candlestick_data=None):
+    """
+    Generate chart data specifically for optimizer visualization
+
+    backtest_streamer is the split the elites were evaluated on (MlfOptimizerConfig.chart_streamer).
+    objective_evolution covers the generations in best_individuals_log, so passing only
+    the new log entries yields only the new points. Pass candlestick_data (from an
+    earlier call on the same split) to reuse the candles instead of rebuilding them.
+    """
     logger.info("🎯 Generating optimizer chart data...")
 
     try:
@@ -29,7 +37,8 @@ def generate_optimizer_chart_data(best_individual, elites, io, data_config_path,
         # Get basic chart data from individual (OPTIMIZED: uses cached data from best_individual_stats)
         logger.info(f"🎯 Generating chart data for best individual in generation...")
         chart_data = generate_chart_data_for_individual_with_new_indicators(
-            best_individual, io, data_config_path, best_individual_stats=best_individual_stats
+            best_individual, backtest_streamer, data_config_path, best_individual_stats=best_individual_stats,
+            candlestick_data=candlestick_data
         )
         logger.info(f"📊 Chart data generated: {list(chart_data.keys()) if chart_data else 'EMPTY'}")
 
@@ -328,7 +337,7 @@ def generate_optimizer_chart_data(best_individual, elites, io, data_config_path,
         return {}
 
 
-def load_raw_candle_data(data_config_path: str, io):
+def load_raw_candle_data(data_config_path: str, backtest_streamer):
     """Load raw candlestick data from MongoDB using the same data as trade execution"""
     logger.info("📊 Loading raw candle data for visualization")
 
@@ -346,8 +355,6 @@ def load_raw_candle_data(data_config_path: str, io):
         logger.info(f"   Data config path: {data_config_path}")
 
         # Use the SAME data source as trade execution to ensure consistency
-        backtest_streamer = io.fitness_calculator.selected_streamer
-
         # Debug: Check what ticker is actually loaded in the streamer
         actual_ticker = getattr(backtest_streamer, 'ticker', 'UNKNOWN')
         logger.info(f"🔍 Backtest streamer ticker: {actual_ticker}")
@@ -523,7 +530,8 @@ def extract_trade_history_and_pnl_from_portfolio(portfolio, backtest_streamer):
     return trade_history, triggers, pnl_history, bar_scores_history, trade_details
 
 
-def generate_chart_data_for_individual_with_new_indicators(best_individual, io, data_config_path, best_individual_stats=None):
+def generate_chart_data_for_individual_with_new_indicators(best_individual, backtest_streamer, data_config_path,
+                                                            best_individual_stats=None, candlestick_data=None):
     """
     Generate chart data for the given the best individual using NEW indicator system.
 
@@ -533,14 +541,18 @@ def generate_chart_data_for_individual_with_new_indicators(best_individual, io,
 
     Args:
         best_individual: The MlfIndividual to generate chart data for
-        io: OptimizationIO instance with fitness calculator
+        backtest_streamer: Streamer of the split the individual was evaluated on (not one the GA is using)
         data_config_path: Path to data configuration file
         best_individual_stats: Optional MlfIndividualStats with pre-calculated metrics
+        candlestick_data: Optional candles already loaded for this split
     """
-    # Load candle data
-    candlestick_data, data_config = load_raw_candle_data(data_config_path, io)
+    # Load candle data (the candles of the split the individual was evaluated on)
+    if candlestick_data is None:
+        candlestick_data, data_config = load_raw_candle_data(data_config_path, backtest_streamer)
+    else:
+        with open(data_config_path) as f:
+            data_config = json.load(f)
 
-    backtest_streamer = io.fitness_calculator.selected_streamer
     tick_history = backtest_streamer.tick_history
 
     # PERFORMANCE OPTIMIZATION: Use cached results from MlfIndividualStats if available
@@ -0,0 +1,173 @@
+"""
+Generation Reporter
+Builds optimizer chart payloads off the GA thread and emits them as deltas
+
+The GA thread only publishes a snapshot of each finished generation. A
+background thread turns the latest snapshot into a 'generation_complete'
+payload; if the GA finishes several generations while a payload is being
+built, the intermediate snapshots are skipped, but their log entries and test
+evaluations are still carried by the next payload.
+
+Payloads only carry what changed since the previous one:
+- best_individuals_log / objective_evolution: the new generations only
+- parameter_list: only when the parameter names change
+- test_evaluations: the evaluations since the last payload
+Static data (the candles of the training split the charted generation was
+evaluated on) is emitted as 'optimization_static_data' once per split: again
+whenever the charted split changes. The client merges both into its chart state.
+
+Charts are built on MlfOptimizerConfig.chart_streamer() of the snapshot's split,
+never on the streamer the GA is evaluating the next generation on.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from mlf_utils.log_manager import LogManager
+from .chart_generation import generate_optimizer_chart_data
+
+logger = LogManager().get_logger("OptimizerVisualization")
+
+
+class GenerationReporter:
+    """Emits generation_complete deltas for one optimization run"""
+
+    def __init__(self, socketio, io, data_config_path: str, objectives: List[str], total_generations: int,
+                 opt_state=None, background: bool = True):
+        self.socketio = socketio
+        self.io = io
+        self.data_config_path = data_config_path
+        self.objectives = objectives
+        self.total_generations = total_generations
+        self.opt_state = opt_state
+        self.background = background
+
+        self._condition = threading.Condition()
+        self._latest: Optional[Dict[str, Any]] = None
+        self._pending_test_evaluations: List[Dict] = []
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Reporting state (only touched by the reporting thread)
+        self._log_reported = 0
+        self._parameter_list: Optional[List] = None
+        self._candlestick_data = None
+        self._candles_data_key: Optional[str] = None  # split of _candlestick_data
+
+    def start(self) -> None:
+        if self.background:
+            self._thread = threading.Thread(target=self._run, name="generation-reporter", daemon=True)
+            self._thread.start()
+            logger.info("📡 Generation reporter thread started")
+
+    def publish(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Hand over a finished generation: generation, data_split (split the elites were
+        evaluated on), fitness_metrics, best_individual, elites, best_individuals_log,
+        parameter_list, indicator_memo, fitness_cache, test_evaluations.
+        """
+        with self._condition:
+            self._pending_test_evaluations.extend(snapshot.pop('test_evaluations', None) or [])
+            self._latest = snapshot
+            if self.background:
+                self._condition.notify()
+                return
+        # Sequential fitness shares the streamers with the GA thread: report inline
+        self._report_latest()
+
+    def stop(self, timeout: float = 60) -> None:
+        """Report the last published generation and stop the thread"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("📡 Generation reporter did not stop within timeout")
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._latest is None and not self._stopping:
+                    self._condition.wait()
+                if self._latest is None:
+                    break
+            self._report_latest()
+        logger.info("📡 Generation reporter thread stopped")
+
+    def _report_latest(self) -> None:
+        with self._condition:
+            snapshot, self._latest = self._latest, None
+            test_evaluations, self._pending_test_evaluations = self._pending_test_evaluations, []
+        if snapshot is None:
+            return
+        try:
+            payload = self.build_payload(snapshot, test_evaluations)
+            self.socketio.emit('generation_complete', payload)
+        except Exception as e:
+            logger.error(f"Error generating chart data: {e}")
+            self.socketio.emit('optimization_error', {'error': str(e)})
+
+    def build_payload(self, snapshot: Dict[str, Any], test_evaluations: List[Dict]) -> Dict[str, Any]:
+        """generation_complete payload with the changes since the previous payload"""
+        current_gen = snapshot['generation']
+        full_log = snapshot['best_individuals_log']
+        new_log = full_log[self._log_reported:]
+        self._log_reported = len(full_log)
+
+        # Candles are rebuilt (and sent again) when the generation was evaluated on another split
+        backtest_streamer = self.io.chart_streamer(snapshot.get('data_split')) if self.io is not None else None
+        data_key = getattr(backtest_streamer, 'data_key', None)
+        candlestick_data = self._candlestick_data if data_key == self._candles_data_key else None
+
+        # Objective evolution is built from the new log entries only
+        optimizer_charts = generate_optimizer_chart_data(
+            snapshot['best_individual'], snapshot['elites'], backtest_streamer, self.data_config_path,
+            new_log, self.objectives, candlestick_data=candlestick_data
+        )
+        best_strategy = optimizer_charts.get('best_strategy')
+        if best_strategy is not None:
+            candlestick_data = best_strategy.pop('candlestick_data', [])
+            if candlestick_data and (self._candlestick_data is None or data_key != self._candles_data_key):
+                self._candles_data_key = data_key
+                self._emit_static_data(candlestick_data)
+
+        parameter_list = snapshot.get('parameter_list') or []
+        if parameter_list == self._parameter_list:
+            parameter_list = []
+        else:
+            self._parameter_list = parameter_list
+
+        return {
+            'generation': current_gen,
+            'total_generations': self.total_generations,
+            'fitness_metrics': snapshot['fitness_metrics'],
+            'best_individuals_log': new_log,
+            'elite_objective_values': [e.fitness_values.tolist() for e in snapshot['elites']],
+            'objective_names': self.objectives,
+            'progress': {
+                'current_generation': current_gen,
+                'total_generations': self.total_generations,
+                'completed': False,
+                'indicator_memo': snapshot.get('indicator_memo'),
+                'fitness_cache': snapshot.get('fitness_cache')
+            },
+            'optimizer_charts': optimizer_charts,
+            'parameter_list': parameter_list,  # Empty when unchanged
+            'test_evaluations': test_evaluations,
+            'delta': True
+        }
+
+    def _emit_static_data(self, candlestick_data) -> None:
+        self._candlestick_data = candlestick_data
+        static_data = {
+            'candlestick_data': candlestick_data,
+            'objective_names': self.objectives,
+            'total_generations': self.total_generations
+        }
+        if self.opt_state is not None:
+            # Kept for clients that reconnect during the run
+            self.opt_state.set('static_chart_data', static_data)
+        self.socketio.emit('optimization_static_data', static_data)
+        logger.info(f"📡 Sent {len(candlestick_data)} candles of the charted split")
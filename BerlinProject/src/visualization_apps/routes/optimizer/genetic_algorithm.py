@@ -10,12 +10,12 @@ import os
 import json
 import time
 import threading
-import tempfile
 import gc
 from datetime import datetime
 from pathlib import Path
 
 from optimization.genetic_optimizer.apps.utils.mlf_optimizer_config import MlfOptimizerConfig
+from optimization.genetic_optimizer.genetic_algorithm.checkpoint import GACheckpoint
 from optimization.genetic_optimizer.support.parameter_collector import ParameterCollector
 from portfolios.portfolio_tool import TradeReason
 from candle_aggregator.csa_container import CSAContainer
@@ -24,7 +24,7 @@ from mlf_utils.log_manager import LogManager
 from mlf_utils.timezone_utils import now_et, isoformat_et, format_et
 
 from .elite_selection import select_winning_population
-from .chart_generation import generate_optimizer_chart_data
+from .generation_reporter import GenerationReporter
 
 logger = LogManager().get_logger("OptimizerVisualization")
 
@@ -59,8 +59,15 @@ def heartbeat_thread(socketio, opt_state):
     logger.info("💓 Heartbeat thread stopped")
 
 
+def checkpoint_path_for_test(test_name: str) -> Path:
+    """Checkpoint file of an optimization run (one per test name, overwritten as the run progresses)"""
+    safe_name = test_name.replace(' ', '-').replace('/', '-')
+    return Path('outputs') / 'checkpoints' / f"{safe_name}.npz"
+
+
 def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data_config_path: str,
-                                                       socketio, opt_state, test_data_config_path: str = None):
+                                                       socketio, opt_state, test_data_config_path: str = None,
+                                                       resume: bool = False, resume_checkpoint_path: str = None):
     """
     Run the genetic algorithm optimization with real-time WebSocket updates
 
@@ -77,8 +84,12 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
         socketio: Flask-SocketIO instance for real-time updates
         opt_state: OptimizationState singleton for thread-safe state management
         test_data_config_path: Optional path to test data configuration
+        resume: Continue from the checkpoint of this test (see checkpoint_path_for_test)
+        resume_checkpoint_path: Continue from this checkpoint file instead
     """
     heartbeat_worker = None
+    io = None
+    reporter = None
     try:
         logger.info("🚀 Starting threaded optimization with NEW indicator system")
 
@@ -113,7 +124,12 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
 
         # Create optimizer config with processed indicators
         io = MlfOptimizerConfig.from_json(config_data, data_config_path)
-        genetic_algorithm = io.create_project()
+        if io.hyper_parameters.islands > 1:
+            # Evolve the islands in their own processes; this process only evaluates elites on test data
+            genetic_algorithm = io.create_island_model()
+            logger.info(f"   Islands: {io.hyper_parameters.islands}")
+        else:
+            genetic_algorithm = io.create_project()
 
         # Initialize parameter collector for histogram tracking
         parameter_collector = ParameterCollector()
@@ -126,9 +142,46 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
             'current_generation': 0,
             'best_individuals_log': [],
             'processed_indicators': processed_indicators,
-            'parameter_collector': parameter_collector
+            'parameter_collector': parameter_collector,
+            'static_chart_data': None
         })
 
+        # Checkpoint the single-population GA so a stopped or crashed run can be resumed
+        checkpoint_path = checkpoint_path_for_test(test_name)
+        if io.hyper_parameters.islands == 1 and io.hyper_parameters.checkpoint_interval > 0:
+            genetic_algorithm.checkpoint_path = str(checkpoint_path)
+            genetic_algorithm.checkpoint_extras = lambda: {
+                'best_individuals_log': opt_state.get('best_individuals_log', []),
+                'test_evaluations': opt_state.get('test_evaluations', []),
+                'parameter_collector': parameter_collector.get_state()
+            }
+
+        resumed_generation = 0
+        if resume or resume_checkpoint_path:
+            if io.hyper_parameters.islands > 1:
+                raise ValueError("Resuming from a checkpoint is only supported for single-population runs")
+            checkpoint = GACheckpoint.load(resume_checkpoint_path or str(checkpoint_path))
+            genetic_algorithm.resume(checkpoint)
+            parameter_collector.load_state(checkpoint.extras.get('parameter_collector', {}))
+            resumed_generation = checkpoint.generation
+            opt_state.update({
+                'current_generation': resumed_generation,
+                'best_individuals_log': checkpoint.extras.get('best_individuals_log', []),
+                'test_evaluations': checkpoint.extras.get('test_evaluations', [])
+            })
+            logger.info(f"▶️ Resuming {test_name} after generation {resumed_generation}")
+
+        # Build the test-split streamer up front so the worker pool exports it with the training splits
+        if test_data_config:
+            try:
+                _get_test_streamer(test_data_config, io, opt_state)
+            except Exception as test_data_error:
+                logger.error(f"Error loading test data - elites will not be evaluated on test data: "
+                             f"{test_data_error}")
+                import traceback
+                traceback.print_exc()
+                test_data_config = None
+
         logger.info(f"   Test: {test_name}")
         logger.info(f"   Generations: {genetic_algorithm.number_of_generations}")
         logger.info(f"   Population Size: {genetic_algorithm.population_size}")
@@ -149,13 +202,23 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
         opt_state.set('heartbeat_thread', heartbeat_worker)
         logger.info("💓 Heartbeat thread started")
 
+        # Chart payloads are built off the GA thread (on streamers of their own), except when
+        # fitness runs sequentially in this process
+        reporter = GenerationReporter(
+            socketio, io, data_config_path, [o.name for o in io.fitness_calculator.objectives],
+            genetic_algorithm.number_of_generations, opt_state=opt_state,
+            background=io.hyper_parameters.islands > 1 or not io.fitness_calculator.force_sequential
+        )
+        reporter.start()
+
         # Emit initial status
         socketio.emit('optimization_started', {
             'test_name': test_name,
             'total_generations': genetic_algorithm.number_of_generations,
             'population_size': genetic_algorithm.population_size,
             'timestamp': optimization_timestamp,
-            'new_indicators_count': len(processed_indicators)
+            'new_indicators_count': len(processed_indicators),
+            'resumed_from_generation': resumed_generation
         })
 
         # Run optimization with generation-by-generation updates
@@ -170,6 +233,8 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
             # Check if stopped using thread-safe methods
             if not opt_state.is_running():
                 logger.info(f"🛑 Optimization stopped by user at generation {current_gen}")
+                if io.hyper_parameters.islands > 1:
+                    genetic_algorithm.stop()
                 socketio.emit('optimization_stopped', {
                     'generation': current_gen,
                     'total_generations': genetic_algorithm.number_of_generations
@@ -179,11 +244,19 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
             # Wait while paused using thread-safe methods - pause after finishing current generation
             if opt_state.is_paused() and opt_state.is_running():
                 logger.info(f"⏸️ Optimization paused after completing generation {current_gen}")
+                # Release the worker processes while paused; the pool restarts on the next generation
+                io.fitness_calculator.shutdown_executor()
+                if io.hyper_parameters.islands > 1:
+                    genetic_algorithm.pause()  # the islands hold after their current generation
                 while opt_state.is_paused() and opt_state.is_running():
                     time.sleep(0.1)
 
                 if opt_state.is_running():  # If still running after unpause
                     logger.info(f"▶️ Optimization resumed at generation {current_gen}")
+                    if io.hyper_parameters.islands > 1:
+                        genetic_algorithm.resume()
+                elif io.hyper_parameters.islands > 1:
+                    genetic_algorithm.stop()  # stopped while paused: the islands end instead of waiting
 
             metrics = statsobserver.best_metric_iteration
 
@@ -227,56 +300,33 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
             out_str = f"{test_name}, {current_gen}/{genetic_algorithm.number_of_generations}, {metric_out}"
             logger.info(out_str)
 
-            # Get chart data for optimizer visualization
-            try:
-                # Get objective names dynamically
-                objectives = [o.name for o in io.fitness_calculator.objectives]
-
-                # Generate optimizer-specific chart data
-                optimizer_charts = generate_optimizer_chart_data(
-                    best_individual, elites, io, data_config_path,
-                    opt_state.get('best_individuals_log', []), objectives
-                )
-
-                # Convert numpy arrays to regular Python lists for JSON serialization
-                elite_objectives = [e.fitness_values.tolist() for e in elites]
-
-                # Get parameter list for histogram dropdown
-                parameter_list = parameter_collector.get_parameter_list()
-
-                # Evaluate elites on test data if test config is provided
-                test_evaluations = _evaluate_elites_on_test_data(
-                    test_data_config, config_data, elites, io, current_gen, opt_state
-                ) if test_data_config else []
-
-                socketio.emit('generation_complete', {
-                    'generation': current_gen,
-                    'total_generations': genetic_algorithm.number_of_generations,
-                    'fitness_metrics': dict(zip(objectives, metrics)),
-                    'chart_data': optimizer_charts,
-                    'best_individuals_log': opt_state.get('best_individuals_log', []),
-                    'elite_objective_values': elite_objectives,
-                    'objective_names': objectives,
-                    'progress': {
-                        'current_generation': current_gen,
-                        'total_generations': genetic_algorithm.number_of_generations,
-                        'completed': False
-                    },
-                    'optimizer_charts': optimizer_charts,  # Specifically for optimizer frontend
-                    'parameter_list': parameter_list,  # For parameter histogram dropdown
-                    'test_evaluations': test_evaluations  # Test data evaluation results
-                })
+            # Evaluate elites on test data if test config is provided (uses the fitness worker pool)
+            test_evaluations = _evaluate_elites_on_test_data(
+                test_data_config, config_data, elites, io, current_gen, opt_state
+            ) if test_data_config else []
 
-            except Exception as e:
-                logger.error(f"Error generating chart data: {e}")
-                socketio.emit('optimization_error', {'error': str(e)})
-                break
+            # Charts and the generation_complete payload are built by the reporter thread
+            reporter.publish({
+                'generation': current_gen,
+                'data_split': getattr(elites[0], 'data_split', None),
+                'fitness_metrics': dict(zip(objectives, metrics)),
+                'best_individual': best_individual,
+                'elites': elites,
+                'best_individuals_log': list(current_log),
+                'parameter_list': parameter_collector.get_parameter_list(),
+                'indicator_memo': io.fitness_calculator.get_indicator_memo_stats(),
+                'fitness_cache': io.fitness_calculator.get_fitness_cache_stats(),
+                'test_evaluations': test_evaluations
+            })
 
             # MEMORY OPTIMIZATION: Periodic garbage collection every 5 generations
             # to prevent memory accumulation during long optimization runs
             if current_gen % 5 == 0:
                 gc.collect()
 
+        # Deliver the last generation before reporting completion
+        reporter.stop()
+
         # Optimization completed
         if opt_state.is_running():
             logger.info("⏱️  Optimization completed successfully with NEW indicator system")
@@ -296,6 +346,13 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
         socketio.emit('optimization_error', {'error': str(e)})
 
     finally:
+        if reporter is not None:
+            reporter.stop()
+
+        # Stop the fitness worker pool (also when the run was stopped or failed)
+        if io is not None:
+            io.fitness_calculator.shutdown_executor()
+
         # Stop the heartbeat thread first
         logger.info("🛑 Stopping heartbeat thread...")
         opt_state.update({
@@ -334,7 +391,9 @@ def run_genetic_algorithm_threaded_with_new_indicators(ga_config_path: str, data
             'thread': None,
             'heartbeat_thread': None,
             'ga_config_path_temp': None,
-            'data_config_path_temp': None
+            'data_config_path_temp': None,
+            'test_streamer': None,
+            'test_streamer_key': None
         })
 
 
@@ -435,6 +494,35 @@ def _save_elites_for_epoch(config_data, elites, test_name, optimization_timestam
         traceback.print_exc()
 
 
+def _get_test_streamer(test_data_config, io, opt_state):
+    """
+    Test-split streamer for this optimization, built once and kept in the
+    optimization state (the test data does not change during a run). It is
+    registered with the fitness calculator so elites are evaluated through the
+    same worker pool as the training splits.
+    """
+    aggregator_list = list(io.monitor_config.get_aggregator_configs().keys())
+    key = (test_data_config.get('ticker'), test_data_config.get('start_date'), test_data_config.get('end_date'),
+           test_data_config.get('include_extended_hours', True), tuple(aggregator_list), id(io))
+    if opt_state.get('test_streamer_key') == key:
+        return opt_state.get('test_streamer')
+
+    logger.info(f"🧪 Loading test data for {test_data_config.get('ticker')} "
+                f"{test_data_config.get('start_date')} to {test_data_config.get('end_date')}")
+    test_csa = CSAContainer(test_data_config, aggregator_list)
+    test_streamer = BacktestDataStreamer()
+    test_streamer.initialize(test_csa.get_aggregators(), test_data_config, io.monitor_config)
+
+    if not test_streamer.tick_history:
+        logger.error("Test data is empty - elites will not be evaluated on test data")
+        test_streamer = None
+    else:
+        io.fitness_calculator.add_evaluation_streamer(test_streamer)
+
+    opt_state.update({'test_streamer': test_streamer, 'test_streamer_key': key})
+    return test_streamer
+
+
 def _evaluate_elites_on_test_data(test_data_config, config_data, elites, io, current_gen, opt_state):
     """Helper function to evaluate elite individuals on test data"""
     test_evaluations = []
@@ -445,24 +533,12 @@ def _evaluate_elites_on_test_data(test_data_config, config_data, elites, io, cur
 
         logger.info(f"🧪 Evaluating top {num_elites_to_evaluate} elites (out of {len(elites)}) on test data for generation {current_gen}")
 
-        # Create a temporary test data config file for evaluation
-        with tempfile.NamedTemporaryFile(mode='w', suffix='_test_eval.json', delete=False) as test_file:
-            json.dump(test_data_config, test_file, indent=2)
-            temp_test_path = test_file.name
-
-        try:
-            # Get aggregator configurations from monitor config
-            aggregator_list = list(io.monitor_config.get_aggregator_configs().keys())
-
-            # Create CSA container for test data
-            test_csa = CSAContainer(test_data_config, aggregator_list)
-
-            # Create and initialize BacktestDataStreamer with test data
-            test_streamer = BacktestDataStreamer()
-            test_streamer.initialize(test_csa.get_aggregators(), test_data_config, io.monitor_config)
-
+        test_streamer = _get_test_streamer(test_data_config, io, opt_state)
+        if test_streamer is not None:
             # Only evaluate the top elites that will be saved
             elites_to_test = elites[:num_elites_to_evaluate]
+            test_portfolios = io.fitness_calculator.evaluate_portfolios(
+                test_streamer, [elite_stats.individual for elite_stats in elites_to_test])
 
             for elite_idx, elite_stats in enumerate(elites_to_test):
                 try:
@@ -472,9 +548,9 @@ def _evaluate_elites_on_test_data(test_data_config, config_data, elites, io, cur
                     train_winning = getattr(elite_stats, 'number_of_winning_trades', 0)
                     train_win_rate = (train_winning / train_trades * 100) if train_trades > 0 else 0
 
-                    # Evaluate elite on test data using the backtest streamer
-                    test_streamer.replace_monitor_config(elite_stats.individual.monitor_configuration)
-                    test_portfolio = test_streamer.run()
+                    test_portfolio = test_portfolios[elite_idx]
+                    if test_portfolio is None:
+                        continue
 
                     # Extract test metrics from portfolio trade history
                     # Calculate P&L from entry/exit pairs
@@ -541,11 +617,6 @@ def _evaluate_elites_on_test_data(test_data_config, config_data, elites, io, cur
 
             logger.info(f"✅ Evaluated {len(test_evaluations)} elites on test data")
 
-        finally:
-            # Clean up temporary test config file
-            if os.path.exists(temp_test_path):
-                os.unlink(temp_test_path)
-
     except Exception as test_eval_error:
         logger.error(f"Error during test data evaluation: {test_eval_error}")
         import traceback
@@ -10,6 +10,55 @@ class OptimizerUIIntegration {
         this.pollInterval = null;
         this.addedGenerations = new Set();
         this.connectionIndicator = null;
+        this.resetRunChartState();
+    }
+
+    /**
+     * Forget the chart data of the previous run
+     */
+    resetRunChartState() {
+        this.staticChartData = null;
+        this.objectiveEvolution = {};
+    }
+
+    /**
+     * generation_complete payloads only carry the new objective points and no
+     * candles: append the points to the run's history and restore the candles
+     * from the static data sent once per run
+     */
+    mergeGenerationDelta(chartData, isDelta) {
+        if (!isDelta) return chartData;
+
+        if (chartData.objective_evolution) {
+            Object.entries(chartData.objective_evolution).forEach(([objectiveName, points]) => {
+                const history = this.objectiveEvolution[objectiveName] || (this.objectiveEvolution[objectiveName] = []);
+                const lastGeneration = history.length > 0 ? history[history.length - 1][0] : -Infinity;
+                points.forEach(point => {
+                    if (point[0] > lastGeneration) history.push(point);
+                });
+            });
+            chartData.objective_evolution = Object.fromEntries(
+                Object.entries(this.objectiveEvolution).map(([objectiveName, history]) => [objectiveName, history.slice()])
+            );
+        }
+
+        if (chartData.best_strategy && !chartData.best_strategy.candlestick_data) {
+            chartData.best_strategy.candlestick_data = this.staticChartData ? this.staticChartData.candlestick_data : [];
+        }
+        return chartData;
+    }
+
+    /**
+     * Rebuild the objective history from the run's best_individuals_log (later
+     * deltas only append generations after the last one)
+     */
+    seedObjectiveEvolution(bestIndividualsLog, objectiveNames) {
+        this.objectiveEvolution = {};
+        objectiveNames.forEach(objectiveName => {
+            this.objectiveEvolution[objectiveName] = bestIndividualsLog
+                .filter(entry => entry.metrics && objectiveName in entry.metrics)
+                .map(entry => [entry.generation, entry.metrics[objectiveName]]);
+        });
     }
 
     /**
@@ -163,6 +212,7 @@ class OptimizerUIIntegration {
         // Optimization events
         ws.on('optimization_started', (data) => {
             console.log('🚀 Optimization started:', data);
+            this.resetRunChartState();
             if (typeof window.showAlert === 'function') {
                 window.showAlert('Optimization started successfully!', 'success');
             }
@@ -183,6 +233,17 @@ class OptimizerUIIntegration {
             }
         });
 
+        ws.on('optimization_static_data', (data) => {
+            this.staticChartData = data;
+            // Sent on state recovery: the objective history before this client connected
+            if (data.best_individuals_log) {
+                this.seedObjectiveEvolution(data.best_individuals_log, data.objective_names || []);
+                if (window.chartUpdateManager) {
+                    window.chartUpdateManager.scheduleUpdate('objective', this.mergeGenerationDelta({objective_evolution: {}}, true));
+                }
+            }
+        });
+
         ws.on('generation_complete', (data) => {
             console.log('📊 Generation complete:', data.generation);
 
@@ -194,7 +255,7 @@ class OptimizerUIIntegration {
                 }
 
                 // Schedule chart updates via optimized manager
-                const chartData = data.optimizer_charts || data.chart_data || {};
+                const chartData = this.mergeGenerationDelta(data.optimizer_charts || data.chart_data || {}, data.delta);
                 if (window.chartUpdateManager && Object.keys(chartData).length > 0) {
                     // Schedule debounced batch updates for each chart type
                     if (chartData.objective_evolution) {
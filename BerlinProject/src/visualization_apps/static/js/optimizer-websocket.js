@@ -142,6 +142,12 @@ class OptimizerWebSocket {
             this.emit('optimization_started', data);
         });
 
+        // Per-run chart data (candles), sent once per run and after state recovery
+        this.socket.on('optimization_static_data', (data) => {
+            console.log('📦 Static chart data received');
+            this.emit('optimization_static_data', data);
+        });
+
         this.socket.on('generation_complete', (data) => {
             console.log(`📊 Generation ${data.generation} complete`);
             this.lastHeartbeat = Date.now(); // Treat generation updates as heartbeat
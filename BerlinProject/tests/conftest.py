@@ -0,0 +1,8 @@
+"""
+Keeps the tests directory importable so test modules can share market_fixtures.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
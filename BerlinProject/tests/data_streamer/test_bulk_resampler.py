@@ -0,0 +1,84 @@
+"""
+Tests that the array-based candle builder matches tick-by-tick aggregation.
+"""
+
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from candle_aggregator.bulk_resampler import resample_aggregators, resample_ticks
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from candle_aggregator.candle_aggregator_normal import CANormal
+from mlf_utils.timezone_utils import ET
+from mongo_tools.tick_cache import TickArrays
+from market_fixtures import make_tick_arrays
+
+
+def make_aggregators(include_extended_hours: bool):
+    return {f"{timeframe}-{kind}": cls("TEST", timeframe, include_extended_hours)
+            for timeframe in ("1m", "5m", "15m", "30m", "1h")
+            for kind, cls in (("normal", CANormal), ("heiken", CAHeiken))}
+
+
+class TestBulkResampler(unittest.TestCase):
+
+    def assert_same_candles(self, ticks: TickArrays, include_extended_hours: bool, finalize: bool):
+        bulk = make_aggregators(include_extended_hours)
+        replay = make_aggregators(include_extended_hours)
+        for tick in ticks.to_ticks("TEST"):
+            for aggregator in replay.values():
+                aggregator.process_tick(tick)
+        if finalize:
+            for aggregator in replay.values():
+                aggregator.finalize()
+        resample_aggregators(bulk, ticks, finalize=finalize, max_workers=3)
+
+        for key, expected in replay.items():
+            with self.subTest(key=key, extended=include_extended_hours, finalize=finalize):
+                actual = bulk[key]
+                self.assertGreater(len(expected.get_candles()), 0)
+                np.testing.assert_array_equal(actual.ohlc_view(include_current=True),
+                                              expected.ohlc_view(include_current=True))
+                np.testing.assert_array_equal(actual.timestamps_ms(include_current=True),
+                                              expected.timestamps_ms(include_current=True))
+                self.assertEqual(actual.get_candles().timestamp_objects(),
+                                 expected.get_candles().timestamp_objects())
+                self.assertEqual(actual.current_candle is None, expected.current_candle is None)
+                self.assertEqual(actual.completed_candle is None, expected.completed_candle is None)
+
+    def test_matches_process_tick(self):
+        ticks = make_tick_arrays(20000, seed=1)
+        for include_extended_hours in (True, False):
+            for finalize in (True, False):
+                self.assert_same_candles(ticks, include_extended_hours, finalize)
+
+    def test_fractional_volume_sums_in_tick_order(self):
+        self.assert_same_candles(make_tick_arrays(5000, seed=2, fractional_volume=True), True, True)
+
+    def test_aggregator_keeps_working_after_resample(self):
+        ticks = make_tick_arrays(3000, seed=3)
+        head, tail = ticks.take(slice(0, 2000)), ticks.take(slice(2000, None))
+        bulk, replay = CAHeiken("TEST", "5m"), CAHeiken("TEST", "5m")
+        resample_ticks(bulk, head, finalize=False)
+        for tick in head.to_ticks("TEST"):
+            replay.process_tick(tick)
+        for tick in tail.to_ticks("TEST"):
+            bulk.process_tick(tick)
+            replay.process_tick(tick)
+        np.testing.assert_array_equal(bulk.ohlc_view(include_current=True), replay.ohlc_view(include_current=True))
+
+        with self.assertRaises(ValueError):
+            resample_ticks(bulk, head)
+
+    def test_no_ticks_in_regular_hours(self):
+        start = int(datetime(2024, 3, 6, 20, 0, tzinfo=ET).timestamp() * 1000)
+        night = TickArrays(start + np.arange(10) * 60_000, *(np.full(10, 100.0) for _ in range(5)))
+        aggregator = CANormal("TEST", "1m", include_extended_hours=False)
+        resample_ticks(aggregator, night)
+        self.assertEqual(len(aggregator.get_candles()), 0)
+        self.assertIsNone(aggregator.current_candle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Tests for the columnar candle store behind CandleAggregator.
+"""
+
+import pickle
+import unittest
+
+import numpy as np
+
+from models.tick_data import TickData
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from candle_aggregator.candle_store import CandleStore, CandleRow
+from market_fixtures import make_ticks
+
+
+class TestCandleStore(unittest.TestCase):
+
+    def test_append_and_live_row(self):
+        store = CandleStore(symbol="TEST", time_increment="1m", capacity=2)
+        for i in range(5):
+            store.append(TickData(open=i, high=i + 1, low=i - 1, close=i + 0.5, volume=10, timestamp=1000 + i))
+        live = store.set_live(TickData(open=9, high=9, low=9, close=9, volume=1, timestamp=2000))
+
+        self.assertEqual(len(store), 5)
+        self.assertGreaterEqual(store.capacity, 6)
+        np.testing.assert_array_equal(store.column("close"), [0.5, 1.5, 2.5, 3.5, 4.5])
+        np.testing.assert_array_equal(store.column("close", include_live=True), [0.5, 1.5, 2.5, 3.5, 4.5, 9])
+
+        # Mutating the live row writes straight into the columns
+        live.close = 11.0
+        live.volume += 5
+        self.assertEqual(store.column("close", include_live=True)[-1], 11.0)
+        self.assertEqual(store.ohlc_view(1, include_live=True)[4, 0], 6.0)
+
+        # Appending a completed candle keeps the live candle in the tail slot
+        store.append(TickData(open=5, high=6, low=4, close=5.5, volume=10, timestamp=1005))
+        self.assertEqual(len(store), 6)
+        self.assertEqual(live.close, 11.0)
+        self.assertEqual(store.timestamps(include_live=True).tolist()[-2:], [1005, 2000])
+
+        store.append(live)
+        self.assertEqual(len(store), 7)
+        self.assertIsNone(store.live)
+
+    def test_views_are_read_only(self):
+        store = CandleStore()
+        store.append(TickData(open=1, high=1, low=1, close=1, volume=1, timestamp=1))
+        with self.assertRaises(ValueError):
+            store.column("close")[0] = 2.0
+
+    def test_row_pickles_as_tick_data(self):
+        store = CandleStore(symbol="TEST")
+        store.append(TickData(open=1, high=2, low=0.5, close=1.5, volume=3, timestamp=7))
+        row = store.row(0)
+        self.assertIsInstance(row, CandleRow)
+        restored = pickle.loads(pickle.dumps(row))
+        self.assertIs(type(restored), TickData)
+        self.assertEqual((restored.close, restored.timestamp, restored.symbol), (1.5, 7, "TEST"))
+
+
+class TestAggregatorColumns(unittest.TestCase):
+
+    def _run(self, aggregator):
+        for tick in make_ticks(400, seed=5, volatility=0.1, spread=0.05, seconds=20):
+            aggregator.process_tick(tick)
+        return aggregator
+
+    def test_history_view_matches_rows(self):
+        for aggregator_class in (CANormal, CAHeiken):
+            with self.subTest(aggregator=aggregator_class.__name__):
+                aggregator = self._run(aggregator_class("TEST", "1m"))
+                history = aggregator.get_history()
+                candles = aggregator.get_candles()
+
+                self.assertEqual(len(candles), len(history) + 1)
+                self.assertIs(candles[-1], aggregator.get_current_candle())
+                np.testing.assert_array_equal(history.closes(), [c.close for c in history])
+                np.testing.assert_array_equal(candles.highs(), [c.high for c in candles])
+                self.assertEqual(history.timestamps().tolist(),
+                                 [int(c.timestamp.timestamp() * 1000) for c in history])
+                self.assertIsInstance(history.copy(), list)
+                self.assertEqual(aggregator.ohlc_view(3).shape, (5, 3))
+
+    def test_finalize_and_pickle(self):
+        aggregator = self._run(CANormal("TEST", "5m"))
+        current = aggregator.get_current_candle()
+        completed = aggregator.finalize()
+
+        self.assertIs(completed, current)
+        self.assertIsNone(aggregator.get_current_candle())
+        self.assertIs(aggregator.get_history()[-1].timestamp, completed.timestamp)
+
+        restored = pickle.loads(pickle.dumps(aggregator))
+        np.testing.assert_array_equal(restored.closes(), aggregator.closes())
+        self.assertEqual(restored.get_history()[-1].timestamp, completed.timestamp)
+
+    def test_history_assignment_keeps_current_candle(self):
+        aggregator = CANormal("TEST", "1m")
+        candles = make_ticks(5, seed=5, seconds=60)
+        aggregator.history = candles[:-1]
+        aggregator.current_candle = candles[-1]
+        aggregator.history = candles[:2]
+
+        self.assertEqual(len(aggregator.history), 2)
+        self.assertEqual(aggregator.get_current_candle().close, candles[-1].close)
+
+    def test_maximum_drawdown_matches_loop(self):
+        aggregator = self._run(CANormal("TEST", "1m"))
+        closes = [c.close for c in aggregator.get_history()]
+        running_max, expected = closes[0], 0.0
+        for price in closes[1:]:
+            running_max = max(running_max, price)
+            expected = min(expected, ((price - running_max) / running_max) * 100)
+
+        self.assertEqual(aggregator.calculate_maximum_drawdown(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the per-card chart store behind the incremental chart-data endpoint.
+"""
+
+import unittest
+
+import numpy as np
+
+from models.indicator_definition import IndicatorDefinition
+from data_streamer.data_streamer import DataStreamer
+from optimization.calculators.indicator_processor_historical_new import IndicatorProcessorHistoricalNew
+from shared.utils.chart_data_service import ChartDataService
+from mlf_utils import fast_json
+from market_fixtures import create_config, make_ticks
+
+
+class TestChartStore(unittest.TestCase):
+
+    def setUp(self):
+        self.config = create_config(name="Chart Store Test")
+        self.streamer = DataStreamer("card1", "TEST", self.config)
+        self.ticks = make_ticks(1200, seed=8)
+        for tick in self.ticks[:800]:
+            self.streamer.process_tick(tick)
+
+    def test_not_updated_until_seeded(self):
+        self.assertFalse(self.streamer.chart_store.seeded)
+        self.assertEqual(self.streamer.chart_store.candles, {})
+
+    def test_seed_matches_full_chart_data(self):
+        full = ChartDataService.get_unified_chart_data(self.streamer, self.config, "card1", "TEST")
+        store = self.streamer.chart_store
+        store.ensure_current(self.streamer.aggregators, self.config)
+
+        self.assertEqual(store.cursor, full['cursor'])
+        completed = [row for row in full['candlestick_data'] if row[0] <= full['cursor']]
+        self.assertEqual(store.candles["1m-normal"], completed)
+        for key in ('indicator_history', 'raw_indicator_history', 'component_history'):
+            for name, series in full[key].items():
+                self.assertEqual(getattr(store, key)[name], [p for p in series if p[0] <= full['cursor']])
+        self.assertEqual(store.bar_scores, [e for e in full['bar_scores_formatted'] if e['timestamp'] <= full['cursor']])
+
+    def test_chart_data_encodes_in_one_pass(self):
+        full = ChartDataService.get_unified_chart_data(self.streamer, self.config, "card1", "TEST")
+        decoded = fast_json.loads(fast_json.dumps_bytes(full))
+        self.assertEqual(decoded['cursor'], full['cursor'])
+        self.assertEqual(decoded['candlestick_data'], full['candlestick_data'])
+
+    def test_incremental_points_after_cursor(self):
+        first = ChartDataService.get_incremental_chart_data(self.streamer, self.config, "card1", "TEST", since=0)
+        cursor = first['cursor']
+        self.assertEqual(len(first['candlestick_data']), len(self.streamer.aggregators["1m-normal"].get_history()))
+
+        for tick in self.ticks[800:]:
+            self.streamer.process_tick(tick)
+        delta = ChartDataService.get_incremental_chart_data(self.streamer, self.config, "card1", "TEST",
+                                                            since=cursor)
+
+        self.assertTrue(delta['incremental'])
+        # 400 ticks at 15s = 100 new 1m candles
+        self.assertEqual(len(delta['candlestick_data']), 100)
+        self.assertTrue(all(row[0] > cursor for row in delta['candlestick_data']))
+        self.assertEqual(delta['cursor'], delta['candlestick_data'][-1][0])
+        self.assertEqual(len(delta['per_aggregator_candles']["5m-normal"]), 20)
+        self.assertEqual(len(delta['bar_scores_formatted']), 100)
+
+        # Appended candles are the aggregator's completed candles
+        expected = ChartDataService.format_candlestick_data(self.streamer.aggregators["1m-normal"].get_history())
+        self.assertEqual(first['candlestick_data'] + delta['candlestick_data'], expected)
+        for name, series in delta['indicator_history'].items():
+            self.assertTrue(all(point[0] > cursor for point in series))
+        self.assertIn(delta['primary_agg_key'], delta['current_candles'])
+
+        # Delta points are the points a full recalculation gives for the new candles
+        full = ChartDataService.get_unified_chart_data(self.streamer, self.config, "card1", "TEST")
+        self.assertEqual(full['cursor'], delta['cursor'])
+        for key in ('indicator_history', 'raw_indicator_history', 'component_history'):
+            self.assertEqual(set(delta[key]), set(full[key]))
+        # Primary-timeframe indicators do not depend on still-open coarse candles
+        self.assertEqual(delta['indicator_history']['sma_cross'],
+                         [p for p in full['indicator_history']['sma_cross'] if cursor < p[0] <= delta['cursor']])
+
+        # Nothing new since the latest cursor
+        empty = ChartDataService.get_incremental_chart_data(self.streamer, self.config, "card1", "TEST",
+                                                            since=delta['cursor'])
+        self.assertEqual(empty['candlestick_data'], [])
+        self.assertEqual(empty['bar_scores_formatted'], [])
+
+    def test_appended_points_match_recalculation_at_completion(self):
+        self.check_appended_points()
+
+    def test_indicators_without_streaming_support(self):
+        self.config.indicators.append(IndicatorDefinition(
+            name="patterns", type="Indicator", indicator_class="CDLPatternIndicator", agg_config="5m-normal",
+            parameters={"patterns": ["CDLDOJI", "CDLENGULFING"], "trend": "bullish", "lookback": 3}))
+        self.config.bars["bull"]["indicators"]["patterns"] = 1.0
+        self.streamer = DataStreamer("card1", "TEST", self.config)
+        for tick in self.ticks[:800]:
+            self.streamer.process_tick(tick)
+        self.check_appended_points()
+        self.assertIn("patterns", self.streamer.chart_store.raw_indicator_history)
+
+    def check_appended_points(self):
+        self.streamer.chart_store.ensure_current(self.streamer.aggregators, self.config)
+        store = self.streamer.chart_store
+        primary = self.streamer.aggregators["1m-normal"]
+        seeded_points = len(store.bar_scores)
+
+        # Reference: a full recalculation at the moment each primary candle completes
+        expected = {'indicator_history': {}, 'raw_indicator_history': {}, 'component_history': {}}
+        expected_bar_scores = []
+        completed = len(primary.get_history())
+        for tick in self.ticks[800:]:
+            self.streamer.process_tick(tick)
+            if len(primary.get_history()) == completed:
+                continue
+            completed = len(primary.get_history())
+            index = completed - 1
+            timestamp = int(primary.timestamps_ms()[index])
+            (indicator_history, raw_indicator_history, bar_score_history, component_history,
+             _) = IndicatorProcessorHistoricalNew(self.config).calculate_indicators(self.streamer.aggregators)
+            for key, history in (('indicator_history', indicator_history),
+                                 ('raw_indicator_history', raw_indicator_history),
+                                 ('component_history', component_history)):
+                for name, values in history.items():
+                    if np.isfinite(values[index]):
+                        expected[key].setdefault(name, []).append([timestamp, values[index]])
+            expected_bar_scores.append({'timestamp': timestamp,
+                                        'scores': {name: values[index] for name, values in bar_score_history.items()}})
+
+        self.assertEqual(len(store.bar_scores) - seeded_points, 100)
+        for key, series_by_name in expected.items():
+            for name, series in series_by_name.items():
+                appended = getattr(store, key)[name][-len(series):]
+                self.assertEqual([p[0] for p in appended], [p[0] for p in series], f"{key}[{name}]")
+                np.testing.assert_allclose([p[1] for p in appended], [p[1] for p in series],
+                                           rtol=1e-9, atol=1e-12, err_msg=f"{key}[{name}]")
+        for entry, expected_entry in zip(store.bar_scores[seeded_points:], expected_bar_scores):
+            self.assertEqual(entry['timestamp'], expected_entry['timestamp'])
+            for name, score in expected_entry['scores'].items():
+                self.assertAlmostEqual(entry['scores'][name], score, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
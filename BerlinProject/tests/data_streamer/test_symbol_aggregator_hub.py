@@ -0,0 +1,102 @@
+"""
+Tests for sharing live candle aggregators between DataStreamers.
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from models.tick_data import TickData
+from models.monitor_configuration import MonitorConfiguration
+from data_streamer.data_streamer import DataStreamer
+from candle_aggregator.symbol_aggregator_hub import SymbolAggregatorHub
+from market_fixtures import create_config, make_ticks, rsi_indicator, sma_cross_indicator
+
+
+class TestSymbolAggregatorHub(unittest.TestCase):
+
+    def _create_config(self) -> MonitorConfiguration:
+        return create_config(
+            name="Hub Test",
+            trade_executor={},
+            indicators=[sma_cross_indicator(calc_on_pip=True), rsi_indicator("5m-heiken", period=7, lookback=5)],
+            bars={"bull": {"type": "bull", "indicators": {"sma_cross": 1.0, "rsi": 1.0}}},
+            enter_long=[],
+        )
+
+    def test_streamers_share_aggregators(self):
+        hub = SymbolAggregatorHub()
+        config = self._create_config()
+        first = DataStreamer("card1", "TEST", config, aggregator_hub=hub)
+        second = DataStreamer("card2", "TEST", config, aggregator_hub=hub)
+        other = DataStreamer("card3", "OTHER", config, aggregator_hub=hub)
+
+        self.assertEqual(len(hub), 4)
+        for agg_key, aggregator in first.aggregators.items():
+            self.assertIs(second.aggregators[agg_key], aggregator)
+            self.assertIsNot(other.aggregators[agg_key], aggregator)
+            self.assertEqual(hub.subscriber_count(aggregator), 2)
+
+    def test_shared_results_match_private_aggregators(self):
+        hub = SymbolAggregatorHub()
+        config = self._create_config()
+        shared = [DataStreamer(f"card{i}", "TEST", config, aggregator_hub=hub) for i in range(3)]
+        private = DataStreamer("private", "TEST", config)
+
+        for tick in make_ticks(600, seed=2, spread=0.0):
+            # The data link forwards the same tick object to every streamer on the symbol
+            for streamer in shared + [private]:
+                streamer.process_tick(tick)
+
+            for streamer in shared:
+                self.assertEqual(streamer.bar_scores.keys(), private.bar_scores.keys())
+                for name, value in private.raw_indicators.items():
+                    shared_value = streamer.raw_indicators[name]
+                    self.assertTrue(shared_value == value or (math.isnan(value) and math.isnan(shared_value)))
+                self.assertEqual(streamer.indicators, private.indicators)
+
+        for agg_key, aggregator in private.aggregators.items():
+            shared_aggregator = shared[0].aggregators[agg_key]
+            self.assertEqual(len(shared_aggregator.get_history()), len(aggregator.get_history()))
+            np.testing.assert_array_equal(shared_aggregator.closes(True), aggregator.closes(True))
+
+    def test_release_drops_unused_aggregators(self):
+        hub = SymbolAggregatorHub()
+        config = self._create_config()
+        first = DataStreamer("card1", "TEST", config, aggregator_hub=hub)
+        second = DataStreamer("card2", "TEST", config, aggregator_hub=hub)
+        aggregator = first.aggregators["1m-normal"]
+
+        first.release_aggregators()
+        self.assertEqual(hub.subscriber_count(aggregator), 1)
+        self.assertEqual(len(hub), 2)
+
+        second.release_aggregators()
+        self.assertEqual(len(hub), 0)
+        self.assertIsNot(DataStreamer("card3", "TEST", config, aggregator_hub=hub).aggregators["1m-normal"],
+                         aggregator)
+
+    def test_prepopulates_once(self):
+        class HistoryLink:
+            calls = 0
+
+            def load_historical_data(self, symbol, timeframe="1m"):
+                HistoryLink.calls += 1
+                return [TickData(symbol=symbol, timestamp=tick.timestamp.replace(second=0), open=tick.open,
+                                 high=tick.high, low=tick.low, close=tick.close, volume=tick.volume)
+                        for tick in make_ticks(400, seed=2, spread=0.0)[::4]]
+
+        hub = SymbolAggregatorHub()
+        aggregator = hub.subscribe("TEST", "1m", "normal")
+        self.assertGreater(hub.prepopulate(aggregator, HistoryLink()), 0)
+        history_length = len(aggregator.get_history())
+
+        self.assertIs(hub.subscribe("TEST", "1m", "normal"), aggregator)
+        self.assertEqual(hub.prepopulate(aggregator, HistoryLink()), 0)
+        self.assertEqual(HistoryLink.calls, 1)
+        self.assertEqual(len(aggregator.get_history()), history_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
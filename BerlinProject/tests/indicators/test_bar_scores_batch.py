@@ -0,0 +1,131 @@
+"""
+Batch bar scoring in IndicatorProcessorHistoricalNew must match the per-index calculation exactly.
+"""
+
+import unittest
+from typing import Dict, List
+
+import numpy as np
+
+from models.monitor_configuration import MonitorConfiguration
+from optimization.calculators.indicator_processor_historical_new import IndicatorProcessorHistoricalNew
+
+
+def reference_trend_gate(history: Dict[str, List[float]], index: int, trend_config: Dict,
+                         bar_type: str, trend_logic: str, trend_threshold: float) -> float:
+    if not trend_config:
+        return 1.0
+    trend_values = []
+    for trend_name, config in trend_config.items():
+        if trend_name not in history:
+            continue
+        trend_value = history[trend_name][index]
+        if isinstance(config, dict):
+            weight = config.get('weight', 1.0)
+            mode = config.get('mode', 'soft')
+        else:
+            weight = float(config)
+            mode = 'soft'
+        if bar_type.lower() == 'bear':
+            trend_value = -trend_value
+        if mode == 'hard':
+            gated_value = 1.0 if trend_value > 0 else 0.0
+        else:
+            gated_value = max(0.0, min(1.0, trend_value))
+        trend_values.append((gated_value, weight))
+    if not trend_values:
+        return 1.0
+    if trend_logic.upper() == 'AND':
+        gate = min(v for v, w in trend_values)
+    elif trend_logic.upper() == 'OR':
+        gate = max(v for v, w in trend_values)
+    else:
+        total_weight = sum(w for v, w in trend_values)
+        gate = sum(v * w for v, w in trend_values) / total_weight if total_weight > 0 else 1.0
+    return gate if gate >= trend_threshold else 0.0
+
+
+def reference_bar_scores(bars: Dict, history: Dict[str, List[float]], length: int) -> Dict[str, List[float]]:
+    """The original per-index loop"""
+    scores = {}
+    for bar_name, bar_config in bars.items():
+        bar_type = bar_config.get('type', 'bull')
+        signal_weights = bar_config['indicators'] if 'indicators' in bar_config else bar_config
+        trend_config = bar_config.get('trend_indicators', {})
+        trend_logic = bar_config.get('trend_logic', 'AND')
+        trend_threshold = bar_config.get('trend_threshold', 0.0)
+        values = []
+        for i in range(length):
+            weighted_sum = 0.0
+            total_weight = 0.0
+            for name, weight in signal_weights.items():
+                if name in history:
+                    weighted_sum += history[name][i] * weight
+                    total_weight += weight
+            signal_score = weighted_sum / total_weight if total_weight > 0 else 0.0
+            gate = reference_trend_gate(history, i, trend_config, bar_type, trend_logic, trend_threshold)
+            values.append(signal_score * gate)
+        scores[bar_name] = values
+    return scores
+
+
+class TestBarScoresBatch(unittest.TestCase):
+
+    def _create_processor(self, bars: Dict) -> IndicatorProcessorHistoricalNew:
+        sma = {"indicator_class": "SMACrossoverIndicator", "type": "Indicator", "agg_config": "1m-normal",
+               "parameters": {"period": 10, "crossover_value": 0.001, "trend": "bullish", "lookback": 5}}
+        adx = {"indicator_class": "ADXTrendIndicator", "type": "Indicator", "agg_config": "1m-normal",
+               "parameters": {"period": 14, "trend_threshold": 20.0, "strong_trend_threshold": 40.0,
+                              "direction_filter": "Both"}}
+        indicators = [dict(sma, name="sig1"), dict(sma, name="sig2"), dict(sma, name="sig3"),
+                      dict(adx, name="trend1"), dict(adx, name="trend2")]
+        config = MonitorConfiguration(name="Bar Score Test", trade_executor={}, indicators=indicators, bars=bars)
+        return IndicatorProcessorHistoricalNew(config)
+
+    def _history(self, length: int) -> Dict[str, List[float]]:
+        rng = np.random.default_rng(4)
+        history = {
+            "sig1": rng.choice([0.0, 0.2, 0.6, 1.0, -0.4], length),
+            "sig2": rng.random(length),
+            "sig3": rng.choice([0.0, 1.0], length),
+            "trend1": rng.uniform(-1.5, 1.5, length),
+            "trend2": rng.uniform(-1.0, 1.2, length),
+        }
+        history["trend1"][[3, 40]] = np.nan
+        history["sig2"][7] = np.nan
+        history["trend2"][[10, 11]] = [0.0, -0.0]
+        return {name: values.tolist() for name, values in history.items()}
+
+    def test_matches_per_index_loop(self):
+        bars = {
+            "plain": {"type": "bull", "indicators": {"sig1": 1.0, "sig2": 2, "missing": 5.0}},
+            "and_soft": {"type": "bull", "indicators": {"sig1": 0.7, "sig3": 0.3},
+                         "trend_indicators": {"trend1": {"weight": 1.0, "mode": "soft"}, "trend2": 2.0}},
+            "or_hard_bear": {"type": "bear", "indicators": {"sig2": 1.0},
+                             "trend_indicators": {"trend1": {"mode": "hard"}, "trend2": {"mode": "soft"}},
+                             "trend_logic": "or", "trend_threshold": 0.3},
+            "avg": {"type": "bull", "indicators": {"sig1": 1.0, "sig2": 1.0, "sig3": 1.0},
+                    "trend_indicators": {"trend1": {"weight": 3}, "trend2": {"weight": 1, "mode": "hard"}},
+                    "trend_logic": "AVG", "trend_threshold": 0.25},
+            "avg_zero_weight": {"type": "bear", "indicators": {"sig3": 1.0},
+                                "trend_indicators": {"trend1": {"weight": 0.0}}, "trend_logic": "AVG"},
+            "missing_trend": {"type": "bull", "indicators": {"sig1": 1.0},
+                              "trend_indicators": {"nope": {"weight": 1.0}}},
+            "no_signals": {"type": "bull", "indicators": {}},
+        }
+        processor = self._create_processor(bars)
+        history = self._history(500)
+
+        actual = processor._calculate_bar_scores_batch(history, 500)
+        expected = reference_bar_scores(bars, history, 500)
+
+        self.assertEqual(set(actual), set(expected))
+        for bar_name in bars:
+            with self.subTest(bar=bar_name):
+                self.assertIsInstance(actual[bar_name], list)
+                np.testing.assert_array_equal(np.array(actual[bar_name]), np.array(expected[bar_name]))
+                self.assertEqual(np.array(actual[bar_name]).tobytes(), np.array(expected[bar_name]).tobytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
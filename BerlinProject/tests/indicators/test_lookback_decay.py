@@ -0,0 +1,72 @@
+"""
+Tests for the vectorized lookback-decay kernel used by IndicatorProcessorHistoricalNew.
+
+The reference below is the original per-index loop; the kernel must match it bit for bit.
+"""
+
+import unittest
+
+import numpy as np
+
+from optimization.calculators.indicator_processor_historical_new import IndicatorCalculator, lookback_decay
+
+
+def reference_lookback(raw_values, lookback: int) -> np.ndarray:
+    raw_array = np.array(raw_values)
+    result = np.zeros(len(raw_array))
+    for i in range(len(raw_array)):
+        start_idx = max(0, i + 1 - lookback)
+        window = raw_array[start_idx:i + 1]
+        non_zero_mask = window != 0
+        if not np.any(non_zero_mask):
+            continue
+        last_trigger_idx = np.where(non_zero_mask)[0][-1]
+        lookback_ratio = (len(window) - last_trigger_idx - 1) / float(lookback)
+        lookback_ratio = min(1.0, max(0.0, lookback_ratio))
+        result[i] = (1.0 - lookback_ratio) * np.sign(window[last_trigger_idx])
+    return result
+
+
+def make_triggers(n: int, density: float = 0.02, seed: int = 9) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    values = np.zeros(n)
+    fired = rng.random(n) < density
+    values[fired] = rng.choice([-1.0, 1.0, 0.5, -2.0], fired.sum())
+    return values
+
+
+class TestLookbackDecay(unittest.TestCase):
+
+    def test_matches_reference_loop(self):
+        cases = [make_triggers(2000), make_triggers(500, density=0.3), np.zeros(50), np.ones(30), np.array([])]
+        with_nan = make_triggers(300, density=0.1)
+        with_nan[[5, 120]] = np.nan
+        cases.append(with_nan)
+
+        for values in cases:
+            for lookback in (1, 2, 7, 10, 50, 1000):
+                with self.subTest(n=len(values), lookback=lookback):
+                    expected = reference_lookback(values, lookback)
+                    actual = lookback_decay(values, lookback)
+                    np.testing.assert_array_equal(actual, expected)
+                    self.assertEqual(actual.tobytes(), expected.tobytes())
+
+    def test_calculator_wrapper_returns_list(self):
+        values = make_triggers(200, density=0.1).tolist()
+        result = IndicatorCalculator._apply_lookback_vectorized(values, 10)
+        self.assertIsInstance(result, list)
+        self.assertEqual(result, reference_lookback(values, 10).tolist())
+
+    def test_non_positive_lookback_gives_zeros(self):
+        values = make_triggers(100, density=0.2)
+        for lookback in (0, -3):
+            np.testing.assert_array_equal(lookback_decay(values, lookback), reference_lookback(values, lookback))
+
+    def test_month_of_minutes(self):
+        # ~21 trading days of 1m candles including extended hours, 50-period primary lookback
+        # (scripts/benchmark_lookback_decay.py times this case)
+        values = make_triggers(21 * 960)
+        np.testing.assert_array_equal(lookback_decay(values, 50), reference_lookback(values, 50))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+Parity tests for the incremental (streaming) indicator path.
+
+Each streaming indicator must produce, candle by candle, the same value and
+components as the last element of calculate() over the full history.
+"""
+
+import math
+import unittest
+from datetime import timedelta
+from typing import Dict, List
+
+import numpy as np
+
+from models.tick_data import TickData
+from models.monitor_configuration import MonitorConfiguration
+from candle_aggregator.candle_aggregator_normal import CANormal
+from data_streamer.indicator_processor import IndicatorProcessor
+from indicator_triggers.indicator_base import IndicatorConfiguration
+from indicator_triggers.sma_indicator import SMAIndicator
+from indicator_triggers.sma_crossover_indicator import SMACrossoverIndicator
+from indicator_triggers.macd_histogram_crossover_indicator import MACDHistogramCrossoverIndicator
+from indicator_triggers.rsi_indicator import RSIIndicator
+from indicator_triggers.bollinger_bands_indicator import BollingerBandsLowerBandBounceIndicator
+from indicator_triggers.trend_indicators import (
+    ADXTrendIndicator, EMASlopeTrendIndicator, SuperTrendIndicator, AROONTrendIndicator
+)
+from market_fixtures import (
+    SESSION_START, create_config, macd_indicator, make_ticks, make_trend_ticks, sma_cross_indicator
+)
+
+
+STREAMING_CASES = [
+    (SMAIndicator, {"period": 5}),
+    (SMACrossoverIndicator, {"period": 10, "crossover_value": 0.001, "trend": "bullish"}),
+    (SMACrossoverIndicator, {"period": 10, "crossover_value": 0.001, "trend": "bearish"}),
+    (MACDHistogramCrossoverIndicator, {"fast": 12, "slow": 26, "signal": 9, "histogram_threshold": 0.01}),
+    (MACDHistogramCrossoverIndicator, {"fast": 15, "slow": 12, "signal": 4, "histogram_threshold": 0.0,
+                                       "trend": "bearish"}),
+    (RSIIndicator, {"period": 14, "oversold_threshold": 40.0, "trend": "bullish"}),
+    (RSIIndicator, {"period": 7, "overbought_threshold": 60.0, "trend": "bearish"}),
+    (BollingerBandsLowerBandBounceIndicator, {"period": 10, "sd": 1.5, "candle_bounce_number": 3}),
+    (BollingerBandsLowerBandBounceIndicator, {"period": 10, "sd": 1.5, "candle_bounce_number": 2,
+                                              "trend": "bearish"}),
+    (ADXTrendIndicator, {"period": 7}),
+    (ADXTrendIndicator, {"period": 14, "direction_filter": "Bear"}),
+    (EMASlopeTrendIndicator, {"period": 10, "smoothing": 3}),
+    (EMASlopeTrendIndicator, {"period": 10, "smoothing": 1, "direction_filter": "Bull"}),
+    (SuperTrendIndicator, {"atr_period": 7, "multiplier": 2.0}),
+    (AROONTrendIndicator, {"period": 10, "threshold": 30.0}),
+]
+
+
+def generate_random_walk(n: int, seed: int = 3) -> List[TickData]:
+    """Generate a random-walk OHLC series with integer timestamps."""
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    highs = closes + rng.uniform(0, 1, n)
+    lows = closes - rng.uniform(0, 1, n)
+    return [
+        TickData(symbol="TEST", timestamp=1000 + i * 60000, open=closes[i], high=highs[i],
+                 low=lows[i], close=closes[i], volume=100)
+        for i in range(n)
+    ]
+
+
+def create_indicator(indicator_class, parameters: Dict):
+    defaults = indicator_class().config.parameters
+    config = IndicatorConfiguration(
+        indicator_name=indicator_class.name(),
+        display_name="streaming_test",
+        parameters={**defaults, **parameters}
+    )
+    return indicator_class(config)
+
+
+class TestStreamingIndicators(unittest.TestCase):
+
+    def setUp(self):
+        self.candles = generate_random_walk(250)
+
+    def assertValueEqual(self, streamed: float, expected: float, msg: str):
+        streamed, expected = float(streamed), float(expected)
+        if math.isnan(expected):
+            self.assertTrue(math.isnan(streamed), msg)
+        else:
+            self.assertAlmostEqual(streamed, expected, delta=1e-9 * max(1.0, abs(expected)), msg=msg)
+
+    def test_streaming_matches_batch(self):
+        for indicator_class, parameters in STREAMING_CASES:
+            with self.subTest(indicator=indicator_class.__name__, parameters=parameters):
+                batch = create_indicator(indicator_class, parameters)
+                streaming = create_indicator(indicator_class, parameters)
+                self.assertTrue(streaming.supports_streaming())
+
+                signals = 0
+                for i, candle in enumerate(self.candles):
+                    values, components = batch.calculate(self.candles[:i + 1])
+                    # Peek first (in-progress candle), then commit it
+                    for value, streamed_components in (streaming.update_current(candle), streaming.update(candle)):
+                        msg = f"{indicator_class.__name__} at candle {i}"
+                        self.assertValueEqual(value, values[-1], msg)
+                        self.assertEqual(set(streamed_components), set(components), msg)
+                        for name, series in components.items():
+                            self.assertValueEqual(streamed_components[name], series[-1], f"{msg} [{name}]")
+                    signals += values[-1] != 0 and not math.isnan(values[-1])
+
+                self.assertGreater(signals, 0, f"{indicator_class.__name__} never fired; test data too flat")
+
+    def test_reset_stream_restarts_series(self):
+        indicator = create_indicator(RSIIndicator, {"period": 7})
+        for candle in self.candles[:50]:
+            indicator.update(candle)
+
+        indicator.reset_stream()
+        for candle in self.candles[:30]:
+            value, components = indicator.update(candle)
+
+        values, expected = indicator.calculate(self.candles[:30])
+        self.assertValueEqual(components["RSI_rsi"], expected["RSI_rsi"][-1], "RSI after reset")
+
+    def test_non_streaming_indicator_raises(self):
+        from indicator_triggers.cdl_pattern_indicator import CDLPatternIndicator
+        indicator = CDLPatternIndicator()
+        self.assertFalse(indicator.supports_streaming())
+        with self.assertRaises(NotImplementedError):
+            indicator.update(self.candles[0])
+
+
+class TestIndicatorProcessorStreaming(unittest.TestCase):
+    """The processor's streaming path must match full recalculation tick by tick."""
+
+    def assertMatches(self, actual: Dict[str, float], expected: Dict[str, float], label: str):
+        self.assertEqual(set(actual), set(expected), label)
+        for name, value in expected.items():
+            if math.isnan(value):
+                self.assertTrue(math.isnan(actual[name]), f"{label} {name}")
+            else:
+                self.assertAlmostEqual(actual[name], value, places=9, msg=f"{label} {name}")
+
+    def _create_config(self) -> MonitorConfiguration:
+        return create_config(
+            name="Streaming Test",
+            trade_executor={},
+            indicators=[
+                sma_cross_indicator(calc_on_pip=True),
+                macd_indicator("1m-normal", fast=5, signal=4, lookback=3),
+                {"name": "adx", "type": "Indicator", "indicator_class": "ADXTrendIndicator",
+                 "agg_config": "1m-normal", "calc_on_pip": True,
+                 "parameters": {"period": 7, "trend_threshold": 20.0, "strong_trend_threshold": 40.0,
+                                "direction_filter": "Both"}},
+            ],
+            enter_long=[],
+        )
+
+    def test_processor_streaming_matches_batch(self):
+        config = self._create_config()
+        streaming = IndicatorProcessor(config)
+        batch = IndicatorProcessor(config)
+        self.assertEqual(len(streaming.indicator_objects), len(config.indicators))
+        for indicator in batch.indicator_objects.values():
+            indicator.supports_streaming = lambda: False
+
+        aggregator = CANormal("TEST", "1m")
+        for i, tick in enumerate(make_ticks(600, seed=11, spread=0.0, seconds=20)):
+            aggregator.process_tick(tick)
+
+            indicators, raw, bar_scores = streaming.calculate_indicators_new({"1m-normal": aggregator})
+            # Both processors read the same aggregator; keep the batch one off the shared cache
+            IndicatorProcessor._result_cache.clear()
+            expected_indicators, expected_raw, expected_bars = batch.calculate_indicators_new(
+                {"1m-normal": aggregator})
+
+            self.assertMatches(raw, expected_raw, f"raw at tick {i}")
+            self.assertMatches(indicators, expected_indicators, f"indicators at tick {i}")
+            self.assertMatches(bar_scores, expected_bars, f"bar scores at tick {i}")
+            self.assertMatches(streaming.component_data, batch.component_data, f"components at tick {i}")
+
+        self.assertTrue(any(value != 0 for value in streaming.indicator_history["sma_cross"]))
+
+    def test_identical_definitions_share_results(self):
+        config = self._create_config()
+        first = IndicatorProcessor(config)
+        second = IndicatorProcessor(config)
+        calls = []
+        for processor in (first, second):
+            for indicator in processor.indicator_objects.values():
+                original = indicator.calculate
+                indicator.supports_streaming = lambda: False
+                indicator.calculate = lambda candles, original=original: calls.append(1) or original(candles)
+
+        aggregator = CANormal("TEST", "1m")
+        for i, tick in enumerate(make_trend_ticks(60, seconds=20)):
+            aggregator.process_tick(tick)
+            version = aggregator.version
+            calls.clear()
+            first_raw = dict(first.calculate_indicators_new({"1m-normal": aggregator})[1])
+            computed = len(calls)
+            second_raw = dict(second.calculate_indicators_new({"1m-normal": aggregator})[1])
+
+            self.assertEqual(len(calls), computed, f"second processor recalculated at tick {i}")
+            self.assertMatches(second_raw, first_raw, f"raw at tick {i}")
+            self.assertEqual(aggregator.version, version)
+
+        self.assertGreater(second.cache_hits, 0)
+        self.assertEqual(second.cache_misses, 0)
+
+        # Any tick changes the version and invalidates the cached results
+        version = aggregator.version
+        aggregator.process_tick(TickData(symbol="TEST", timestamp=SESSION_START + timedelta(minutes=20),
+                                         open=99.0, high=99.0, low=99.0, close=99.0, volume=10))
+        self.assertGreater(aggregator.version, version)
+
+if __name__ == '__main__':
+    unittest.main()
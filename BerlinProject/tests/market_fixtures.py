@@ -0,0 +1,156 @@
+"""
+Market data and monitor configuration factories shared by the tests.
+
+Test modules import them directly, e.g. ``from market_fixtures import make_ticks``
+(conftest.py keeps this directory on sys.path).
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.tick_data import TickData
+from mlf_utils.timezone_utils import ET
+from models.monitor_configuration import MonitorConfiguration
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+from mongo_tools.tick_cache import TickArrays
+# The MLF optimizer modules go first: importing genetic_algorithm on its own runs into a circular import
+from optimization.mlf_optimizer import MlfProblem
+from optimization.mlf_optimizer.mlf_fitness_calculator import MlfFitnessCalculator
+from optimization.mlf_optimizer.mlf_objectives import MaximizeNetPnL, MinimizeLosingTrades
+from optimization.genetic_optimizer.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+
+SESSION_START = datetime(2024, 3, 4, 9, 30, tzinfo=ET)
+
+
+def make_ticks(n: int, seed: int = 0, volatility: float = 0.05, spread: float = 0.01, seconds: int = 15,
+               start: datetime = SESSION_START, price: float = 100.0, symbol: str = "TEST") -> List[TickData]:
+    """Random walk of n ticks spaced seconds apart, with high/low spread around the price"""
+    rng = np.random.default_rng(seed)
+    ticks = []
+    for i in range(n):
+        price += rng.normal(0, volatility)
+        ticks.append(TickData(symbol=symbol, timestamp=start + timedelta(seconds=seconds * i), open=price,
+                              high=price + spread, low=price - spread, close=price, volume=10))
+    return ticks
+
+
+def make_trend_ticks(n: int, step: float = 0.01, seconds: int = 15,
+                     start: datetime = SESSION_START) -> List[TickData]:
+    """n ticks rising from 100.0 by step per tick"""
+    return [TickData(symbol="TEST", timestamp=start + timedelta(seconds=seconds * i),
+                     open=100.0 + i * step, high=100.0 + i * step, low=100.0 + i * step,
+                     close=100.0 + i * step, volume=10) for i in range(n)]
+
+
+def make_tick_arrays(n: int, seed: int, fractional_volume: bool = False) -> TickArrays:
+    """Random ticks over 2024-03-06 .. 2024-03-14 (weekend, DST start and extended hours included)"""
+    rng = np.random.default_rng(seed)
+    start = int(datetime(2024, 3, 6, tzinfo=ET).timestamp() * 1000)
+    timestamp = np.sort(start + rng.integers(0, 8 * 86_400_000, n))
+    price = 100 + np.cumsum(rng.normal(0, 0.05, n))
+    volume = rng.random(n) * 10 if fractional_volume else rng.integers(1, 100, n).astype(np.float64)
+    return TickArrays(timestamp, price, price + rng.random(n) * 0.1, price - rng.random(n) * 0.1,
+                      price + rng.normal(0, 0.02, n), volume)
+
+
+def make_streamer(seed: int) -> BacktestDataStreamer:
+    """Backtest split of two sessions on 1m-normal and 5m-heiken, the last 5m candle left in progress"""
+    aggregators = {"1m-normal": CANormal("TEST", "1m", True), "5m-heiken": CAHeiken("TEST", "5m", True)}
+    for tick in make_ticks(2 * 390 * 4, seed=seed, volatility=0.04):
+        for aggregator in aggregators.values():
+            aggregator.process_tick(tick)
+    aggregators["1m-normal"].finalize()
+
+    streamer = BacktestDataStreamer()
+    streamer.initialize(aggregators, {"ticker": "TEST", "start_date": f"split{seed}", "end_date": "b"})
+    return streamer
+
+
+def sma_cross_indicator(period: int = 10, agg_config: str = "1m-normal", **fields) -> Dict:
+    return {"name": "sma_cross", "type": "Indicator", "indicator_class": "SMACrossoverIndicator",
+            "agg_config": agg_config,
+            "parameters": {"period": period, "crossover_value": 0.0005, "trend": "bullish", "lookback": 5},
+            **fields}
+
+
+def macd_indicator(agg_config: str = "5m-normal", name: str = "macd", **parameters) -> Dict:
+    return {"name": name, "type": "Indicator", "indicator_class": "MACDHistogramCrossoverIndicator",
+            "agg_config": agg_config,
+            "parameters": {"fast": 6, "slow": 13, "signal": 5, "histogram_threshold": 0.0,
+                           "trend": "bullish", "lookback": 4, **parameters}}
+
+
+def rsi_indicator(agg_config: str, period: int = 10, lookback: int = 4, **parameters) -> Dict:
+    return {"name": "rsi", "type": "Indicator", "indicator_class": "RSIIndicator",
+            "agg_config": agg_config,
+            "parameters": {"period": period, "oversold_threshold": 45.0, "trend": "bullish", "lookback": lookback,
+                           **parameters}}
+
+
+def create_config(name: str = "Test", period: int = 10, threshold: float = 0.5, sma_weight: float = 1.0,
+                  macd_agg_config: str = "5m-normal", **fields) -> MonitorConfiguration:
+    """
+    Long entries on a bull bar of an SMA crossover on 1m-normal and a MACD
+    histogram crossover on macd_agg_config. Keyword fields replace any field
+    of the configuration.
+    """
+    return MonitorConfiguration(**{
+        "name": name,
+        "trade_executor": {"default_position_size": 100, "stop_loss_pct": 0.01, "take_profit_pct": 0.02},
+        "indicators": [sma_cross_indicator(period), macd_indicator(macd_agg_config)],
+        "bars": {"bull": {"type": "bull", "indicators": {"sma_cross": sma_weight, "macd": 1.0}}},
+        "enter_long": [{"name": "bull", "threshold": threshold}],
+        "exit_long": [],
+        **fields
+    })
+
+
+def create_ranged_config(macd_agg_config: str = "5m-normal") -> MonitorConfiguration:
+    """create_config with genome ranges on parameters, bar and trend weights and thresholds"""
+    return create_config(
+        name="Genome Test",
+        indicators=[
+            {**sma_cross_indicator(),
+             "ranges": {"period": {"t": "int", "r": [5, 30]}, "crossover_value": {"t": "float", "r": [0.0001, 0.002]},
+                        "trend": {"t": "skip"}}},
+            {**macd_indicator(macd_agg_config), "ranges": {"fast": {"t": "int", "r": [4, 12]}, "slow": {"t": "int", "r": [13, 30]}}},
+        ],
+        bars={"bull": {"type": "bull",
+                       "indicators": {"sma_cross": 1.0, "macd": 1.0},
+                       "weight_ranges": {"sma_cross": {"r": [0.0, 2.0]}, "macd": {"t": "skip"}},
+                       "trend_indicators": {"macd": 1.0},
+                       "trend_weight_ranges": {"macd": {"r": [0.5, 1.5]}},
+                       "trend_threshold": 0.3,
+                       "trend_threshold_range": [0.1, 0.6]}},
+        enter_long=[{"name": "bull", "threshold": 0.5, "threshold_range": [0.2, 0.9]}],
+        exit_long=[{"name": "bull", "threshold": 0.4, "threshold_range": None}],
+    )
+
+
+def make_fitness_calculator(streamer: BacktestDataStreamer, force_sequential: bool = True,
+                            **calculator_kwargs) -> MlfFitnessCalculator:
+    """Fitness calculator on one split with the net P&L and losing trades objectives"""
+    calculator = MlfFitnessCalculator(backtest_streamers=[streamer], force_sequential=force_sequential,
+                                      **calculator_kwargs)
+    calculator.add_objective(MaximizeNetPnL())
+    calculator.add_objective(MinimizeLosingTrades())
+    return calculator
+
+
+def make_small_ga(streamer: BacktestDataStreamer, generations: int = 4, population_size: int = 12,
+                  random_seed: int = 7, calculator: Optional[MlfFitnessCalculator] = None,
+                  **ga_kwargs) -> GeneticAlgorithm:
+    """
+    Small seeded GA over create_ranged_config on a make_streamer split. Without a
+    calculator it evaluates sequentially with make_fitness_calculator; ga_kwargs
+    go to GeneticAlgorithm.
+    """
+    problem = MlfProblem(monitor_configuration=create_ranged_config("5m-heiken"),
+                         fitness_calculator=calculator or make_fitness_calculator(streamer))
+    return GeneticAlgorithm(number_of_generations=generations, problem_domain=problem,
+                            population_size=population_size, propagation_fraction=0.4, elitist_size=2,
+                            chance_of_mutation=0.3, chance_of_crossover=0.3, random_seed=random_seed, **ga_kwargs)
@@ -0,0 +1,65 @@
+"""
+Tests for the fast JSON encoder used for UI payloads.
+"""
+
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from mlf_utils import fast_json
+from stock_analysis_ui.services.ui_external_tool import sanitize_for_json
+
+
+def make_payload():
+    return {
+        'card_id': 'card1',
+        'price': np.float64(101.25),
+        'volume': np.int64(300),
+        'indicators': {'macd': float('nan'), 'sma': np.float32(0.5), 'rsi': float('inf')},
+        'history': np.array([1.0, np.nan, 3.0]),
+        'strided': np.arange(6.0)[::2],
+        'ohlc': (1.0, 2.0, 0.5, 1.5),
+        'trade_details': {1709562600000: {'pnl_pct': -np.inf}},
+        'flags': [True, None, 'x'],
+    }
+
+
+EXPECTED = {
+    'card_id': 'card1',
+    'price': 101.25,
+    'volume': 300,
+    'indicators': {'macd': None, 'sma': 0.5, 'rsi': None},
+    'history': [1.0, None, 3.0],
+    'strided': [0.0, 2.0, 4.0],
+    'ohlc': [1.0, 2.0, 0.5, 1.5],
+    'trade_details': {'1709562600000': {'pnl_pct': None}},
+    'flags': [True, None, 'x'],
+}
+
+
+class TestFastJson(unittest.TestCase):
+
+    def test_encodes_nan_and_numpy(self):
+        encoded = fast_json.dumps(make_payload())
+        self.assertEqual(json.loads(encoded), EXPECTED)
+        self.assertNotIn('NaN', encoded)
+        self.assertEqual(fast_json.loads(fast_json.dumps_bytes(make_payload())), EXPECTED)
+
+    def test_to_jsonable_matches_recursive_sanitize(self):
+        self.assertEqual(fast_json.to_jsonable(make_payload()), EXPECTED)
+        self.assertEqual(sanitize_for_json(make_payload()), EXPECTED)
+
+    def test_fallback_without_orjson(self):
+        with mock.patch.object(fast_json, 'HAS_ORJSON', False):
+            self.assertEqual(json.loads(fast_json.dumps(make_payload())), EXPECTED)
+            self.assertEqual(fast_json.to_jsonable(make_payload()), EXPECTED)
+
+    def test_unsupported_type_raises(self):
+        with self.assertRaises(TypeError):
+            fast_json.dumps({'value': object()})
+
+
+if __name__ == '__main__':
+    unittest.main()
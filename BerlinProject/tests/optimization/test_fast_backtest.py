@@ -0,0 +1,117 @@
+"""
+The array-driven backtest path (BacktestDataStreamer.run(fast=True)) must produce
+exactly the trades of the tick-by-tick TradeExecutorUnified loop.
+"""
+
+import unittest
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+
+from mlf_utils.timezone_utils import ET
+from models.monitor_configuration import MonitorConfiguration
+from portfolios.portfolio_tool import TradeReason
+from portfolios.trade_executor_unified import TradeExecutorUnified
+from candle_aggregator.candle_aggregator_normal import CANormal
+from candle_aggregator.candle_aggregator_heiken import CAHeiken
+from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+from market_fixtures import create_config, macd_indicator, make_ticks, rsi_indicator, sma_cross_indicator
+
+
+def create_trade_config(trade_executor: Dict) -> MonitorConfiguration:
+    return create_config(
+        name="Fast Backtest Test",
+        trade_executor=trade_executor,
+        indicators=[
+            sma_cross_indicator(),
+            rsi_indicator("1m-heiken", overbought_threshold=55.0),
+            macd_indicator("5m-normal", name="macd_bear", trend="bearish"),
+        ],
+        bars={
+            "bull": {"type": "bull", "indicators": {"sma_cross": 1.0, "rsi": 1.0}},
+            "bear": {"type": "bear", "indicators": {"macd_bear": 1.0}},
+        },
+        enter_long=[{"name": "bull", "threshold": 0.4}],
+        exit_long=[{"name": "bear", "threshold": 0.6}],
+    )
+
+
+class TestFastBacktest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # 15 second ticks from 8:00 to 18:00 ET so sessions include the close
+        ticks = []
+        for day in range(3):
+            ticks += make_ticks(10 * 240, seed=7 + day, volatility=0.04, spread=0.02,
+                                start=datetime(2024, 3, 4 + day, 8, 0, tzinfo=ET),
+                                price=ticks[-1].close if ticks else 100.0)
+        cls.aggregators = {}
+        for agg_key in ("1m-normal", "1m-heiken", "5m-normal"):
+            timeframe, agg_type = agg_key.split("-")
+            aggregator = (CAHeiken if agg_type == "heiken" else CANormal)("TEST", timeframe, True)
+            for tick in ticks:
+                aggregator.process_tick(tick)
+            aggregator.finalize()
+            cls.aggregators[agg_key] = aggregator
+
+    def _run(self, trade_executor: Dict, fast: bool) -> BacktestDataStreamer:
+        streamer = BacktestDataStreamer()
+        streamer.initialize(self.aggregators, {"ticker": "TEST", "start_date": "a", "end_date": "b"},
+                            create_trade_config(trade_executor))
+        streamer.run(fast=fast)
+        return streamer
+
+    def _assert_same_trades(self, trade_executor: Dict) -> int:
+        expected = self._run(trade_executor, fast=False).trade_executor
+        actual = self._run(trade_executor, fast=True).trade_executor
+
+        expected_trades = [(t.time, t.size, t.price, t.reason) for t in expected.portfolio.trade_history]
+        actual_trades = [(t.time, t.size, t.price, t.reason) for t in actual.portfolio.trade_history]
+        self.assertEqual(actual_trades, expected_trades)
+        self.assertEqual(actual.trade_details_history, expected.trade_details_history)
+        self.assertEqual(actual.trade_count, expected.trade_count)
+        self.assertEqual(actual.portfolio.is_in_position(), expected.portfolio.is_in_position())
+        return len(expected_trades)
+
+    def test_executor_configurations(self):
+        base = {"default_position_size": 100, "stop_loss_pct": 0.005, "take_profit_pct": 0.01}
+        configs = {
+            "fixed_stop": base,
+            "trailing_stop": dict(base, trailing_stop_loss=True, trailing_stop_distance_pct=0.003,
+                                  trailing_stop_activation_pct=0.002),
+            "wide_trailing_stop": dict(base, stop_loss_pct=0.03, take_profit_pct=0.05, trailing_stop_loss=True,
+                                       trailing_stop_distance_pct=0.02),
+            "ignore_bear": dict(base, ignore_bear_signals=True),
+            "end_of_day": dict(base, stop_loss_pct=0.05, take_profit_pct=0.2, ignore_bear_signals=True,
+                               exit_by_end_of_day=True),
+            "dollar_target_halt": dict(base, take_profit_type="dollars", take_profit_dollars=40.0,
+                                       halt_after_target=True),
+            "no_exits": dict(base, stop_loss_pct=0.9, take_profit_pct=5.0, ignore_bear_signals=True),
+        }
+        for name, trade_executor in configs.items():
+            with self.subTest(config=name):
+                self.assertGreater(self._assert_same_trades(trade_executor), 0)
+
+    def test_end_of_day_exits_are_taken(self):
+        config = {"default_position_size": 100, "stop_loss_pct": 0.05, "take_profit_pct": 0.2,
+                  "ignore_bear_signals": True, "exit_by_end_of_day": True}
+        portfolio = self._run(config, fast=True).trade_executor.portfolio
+        self.assertIn(TradeReason.END_OF_DAY, [trade.reason for trade in portfolio.trade_history])
+
+
+    def test_nan_close_does_not_reset_trailing_high(self):
+        config = create_trade_config({"default_position_size": 100, "stop_loss_pct": 0.005, "take_profit_pct": 0.05,
+                                      "trailing_stop_loss": True, "trailing_stop_distance_pct": 0.003})
+        executor = TradeExecutorUnified(config)
+        executor._execute_buy(0, 100.0)
+        closes = np.array([100.0, 101.0, np.nan, 102.0, 101.5, 99.0])
+
+        exit_index, highest, trailing_stop = executor._find_exit_index(closes, 1, np.zeros(len(closes), bool), 0.997)
+        self.assertEqual((exit_index, highest), (4, 102.0))
+        self.assertAlmostEqual(trailing_stop, 102.0 * 0.997)
+
+
+if __name__ == '__main__':
+    unittest.main()
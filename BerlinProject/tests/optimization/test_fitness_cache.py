@@ -0,0 +1,135 @@
+"""
+Tests for the configuration hash and the fitness cache of MlfFitnessCalculator.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from market_fixtures import create_ranged_config, make_fitness_calculator, make_small_ga, make_streamer
+from optimization.genetic_optimizer.apps.utils.mlf_optimizer_config import MlfOptimizerConfig
+from optimization.genetic_optimizer.apps.utils.optimizer_config import GAHyperparameters
+from optimization.mlf_optimizer import MlfIndividual
+from optimization.mlf_optimizer.fitness_cache import configuration_key
+from optimization.mlf_optimizer.mlf_genome import GenomeSchema
+
+
+class TestConfigurationHash(unittest.TestCase):
+
+    def test_hash_ignores_names_and_rounding_noise(self):
+        config = create_ranged_config()
+        other = create_ranged_config()
+        other.name = "Renamed"
+        other.bars['bull']['indicators']['sma_cross'] = 1.0 + 1e-9
+        other.indicators[0].parameters['period'] = 10.0
+        self.assertEqual(config.configuration_hash(), other.configuration_hash())
+
+        other.enter_long[0]['threshold'] = 0.55
+        self.assertNotEqual(config.configuration_hash(), other.configuration_hash())
+
+    def test_genome_hash(self):
+        schema = GenomeSchema.from_configuration(create_ranged_config())
+        genome = schema.template_genome.copy()
+        self.assertEqual(schema.configuration_hash(genome), schema.configuration_hash(genome + 1e-9))
+        genome[4] += 1
+        self.assertNotEqual(schema.configuration_hash(genome), schema.configuration_hash(schema.template_genome))
+
+        # The template part of the hash follows `decimals` too
+        fresh = GenomeSchema.from_configuration(create_ranged_config())
+        self.assertEqual(schema.configuration_hash(genome, 2), fresh.configuration_hash(genome, 2))
+
+        individual = MlfIndividual(genome=genome, schema=schema)
+        self.assertEqual(configuration_key(individual), configuration_key(individual.copy_individual()))
+        # Configuration-only individuals hash their configuration
+        self.assertEqual(configuration_key(MlfIndividual(monitor_configuration=create_ranged_config())),
+                         create_ranged_config().configuration_hash())
+
+
+class TestFitnessCache(unittest.TestCase):
+
+    def setUp(self):
+        self.streamer = make_streamer(3)
+
+    def test_duplicates_in_a_generation_are_evaluated_once(self):
+        schema = GenomeSchema.from_configuration(create_ranged_config("5m-heiken"))
+        np.random.seed(5)
+        first = MlfIndividual(genome=schema.random_genome(), schema=schema)
+        second = MlfIndividual(genome=schema.random_genome(), schema=schema)
+        population = [first, first.copy_individual(), second]
+
+        calculator = make_fitness_calculator(self.streamer)
+        results = calculator.calculate_fitness_functions(0, population)
+        self.assertEqual([stats.index for stats in results], [0, 1, 2])
+        self.assertIs(results[1].individual, population[1])
+        np.testing.assert_array_equal(results[0].fitness_values, results[1].fitness_values)
+        self.assertEqual(results[0].trade_history, results[1].trade_history)
+
+        stats = calculator.get_fitness_cache_stats()
+        self.assertEqual((stats['generation_duplicates'], stats['generation_evaluated']), (1, 2))
+        # Evaluated and reused results know their split
+        self.assertEqual([stats.data_split for stats in results], [self.streamer.data_split()] * 3)
+
+        # The next generation on the split reuses both results
+        calculator.calculate_fitness_functions(1, [second.copy_individual(), first.copy_individual()])
+        stats = calculator.get_fitness_cache_stats()
+        self.assertEqual((stats['generation_duplicates'], stats['generation_evaluated']), (2, 0))
+        self.assertEqual(stats['duplicate_rate'], 0.6)
+
+    def test_failed_evaluations_are_not_cached(self):
+        schema = GenomeSchema.from_configuration(create_ranged_config("5m-heiken"))
+        np.random.seed(5)
+        individual = MlfIndividual(genome=schema.random_genome(), schema=schema)
+
+        calculator = make_fitness_calculator(self.streamer)
+        with mock.patch.object(self.streamer, 'run', side_effect=RuntimeError("transient")):
+            results = calculator.calculate_fitness_functions(0, [individual])
+        np.testing.assert_array_equal(results[0].fitness_values, [99.0, 99.0])
+
+        # The next generation evaluates the configuration again
+        results = calculator.calculate_fitness_functions(1, [individual.copy_individual()])
+        stats = calculator.get_fitness_cache_stats()
+        self.assertEqual((stats['generation_duplicates'], stats['generation_evaluated']), (0, 1))
+        self.assertFalse(np.all(results[0].fitness_values == 99.0))
+
+    def test_cached_run_matches_uncached_run(self):
+        runs = []
+        for use_fitness_cache in (True, False):
+            calculator = make_fitness_calculator(self.streamer, use_fitness_cache=use_fitness_cache)
+            genetic_algorithm = make_small_ga(self.streamer, calculator=calculator)
+            runs.append([np.array([stats.fitness_values for stats in observer.individual_stats])
+                         for observer, _ in genetic_algorithm.run_ga_iterations(1)])
+            if use_fitness_cache:
+                self.assertGreater(calculator.get_fitness_cache_stats()['duplicates'], 0)
+
+        for cached, uncached in zip(*runs):
+            np.testing.assert_array_equal(cached, uncached)
+
+
+class TestChartStreamer(unittest.TestCase):
+
+    def test_chart_streamer_is_a_private_copy_of_the_split(self):
+        streamers = [make_streamer(3), make_streamer(4)]
+        hyper_parameters = GAHyperparameters(number_of_iterations=1, population_size=2, propagation_fraction=0.5,
+                                             elite_size=1, chance_of_mutation=0.1, chance_of_crossover=0.1,
+                                             num_splits=2)
+        io = MlfOptimizerConfig(objectives={}, hyper_parameters=hyper_parameters, data_config_file='data.json',
+                                monitor_config=create_ranged_config("5m-heiken"),
+                                fitness_calculator=make_fitness_calculator(streamers[0]))
+        io.fitness_calculator.backtest_streamers = streamers
+
+        chart_streamer = io.chart_streamer(streamers[1].data_split())
+        self.assertNotIn(chart_streamer, streamers)
+        self.assertIs(chart_streamer.tick_history, streamers[1].tick_history)
+        self.assertEqual(chart_streamer.data_key, streamers[1].data_key)
+        self.assertIs(io.chart_streamer(streamers[1].data_split()), chart_streamer)
+        self.assertEqual(io.chart_streamer(None).data_key, streamers[0].data_key)
+
+        # A backtest on the chart streamer leaves the split's trade executor alone
+        executor = streamers[1].trade_executor
+        chart_streamer.run()
+        self.assertIs(streamers[1].trade_executor, executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
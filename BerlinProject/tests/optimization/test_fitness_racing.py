@@ -0,0 +1,88 @@
+"""
+Tests for fitness racing in MlfFitnessCalculator: individuals are screened on
+leading parts of the split and only the survivors get a full backtest.
+"""
+
+import unittest
+
+import numpy as np
+
+from market_fixtures import make_fitness_calculator, make_small_ga, make_streamer
+
+
+def run_racing_ga(streamer, force_sequential=True, racing_stages=(0.25, 0.5)):
+    """Fitness values and racing counts of every generation of a small seeded run"""
+    calculator = make_fitness_calculator(streamer, force_sequential=force_sequential, max_workers=2,
+                                         racing_stages=racing_stages)
+    genetic_algorithm = make_small_ga(streamer, generations=5, population_size=20, calculator=calculator)
+    generations = []
+    try:
+        for observer, _ in genetic_algorithm.run_ga_iterations(1):
+            fitness = np.array([stats.fitness_values for stats in observer.individual_stats])
+            counts = dict(calculator.get_racing_stats()['generation'],
+                          duplicates=calculator.get_fitness_cache_stats()['generation_duplicates'])
+            generations.append((fitness, counts))
+    finally:
+        calculator.shutdown_executor()
+    return generations, calculator
+
+
+class TestPrefixStreamer(unittest.TestCase):
+
+    def test_prefix_cuts_every_aggregator_at_the_same_time(self):
+        streamer = make_streamer(3)
+        prefix = streamer.prefix_streamer(0.5)
+
+        self.assertEqual(len(prefix.tick_history), round(len(streamer.tick_history) * 0.5))
+        cutoff = prefix.tick_history.timestamps()[-1]
+        for agg_key, aggregator in prefix.aggregators.items():
+            timestamps = aggregator.timestamps_ms(include_current=True)
+            self.assertLessEqual(timestamps[-1], cutoff)
+            self.assertTrue(np.shares_memory(timestamps, streamer.aggregators[agg_key].timestamps_ms()))
+        self.assertNotEqual(prefix.data_key, streamer.data_key)
+        self.assertIs(streamer.prefix_streamer(0.5), prefix)
+
+
+class TestFitnessRacing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.streamer = make_streamer(3)
+        cls.generations, cls.calculator = run_racing_ga(cls.streamer)
+
+    def test_hopeless_individuals_skip_the_full_backtest(self):
+        first_fitness, first_counts = self.generations[0]
+        # No front on the split yet: everyone runs the stages and the full backtest
+        self.assertEqual(first_counts, {'stage_backtests': 40, 'full_backtests': 20, 'dropped': 0, 'duplicates': 0})
+
+        dropped = sum(counts['dropped'] for _, counts in self.generations[1:])
+        self.assertGreater(dropped, 0)
+        for fitness, counts in self.generations:
+            # Repeated configurations reuse their cached result and are not raced again
+            self.assertEqual(counts['full_backtests'] + counts['dropped'] + counts['duplicates'], 20)
+            self.assertEqual(len(fitness), 20)
+            # Dropped individuals carry the penalty, so they never reach the front
+            self.assertGreaterEqual(int(np.all(fitness == 100.0, axis=1).sum()), counts['dropped'])
+
+        stats = self.calculator.get_racing_stats()
+        self.assertTrue(stats['enabled'])
+        duplicates = self.calculator.get_fitness_cache_stats()['duplicates']
+        self.assertEqual(stats['full_backtests'], 100 - stats['dropped'] - duplicates)
+
+    def test_pruning_is_repeatable_and_matches_parallel(self):
+        for force_sequential in (True, False):
+            generations, _ = run_racing_ga(self.streamer, force_sequential=force_sequential)
+            for (fitness, counts), (expected_fitness, expected_counts) in zip(generations, self.generations):
+                self.assertEqual(counts, expected_counts)
+                np.testing.assert_array_equal(fitness, expected_fitness)
+
+    def test_racing_fronts_are_checkpointed(self):
+        state = self.calculator.checkpoint_state()
+        restored = make_fitness_calculator(self.streamer, racing_stages=(0.25, 0.5))
+        restored.restore_checkpoint_state(state)
+        for stage, expected in zip(restored._racing_fronts[0], self.calculator._racing_fronts[0]):
+            np.testing.assert_array_equal(stage, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for GeneticAlgorithm checkpoints: a resumed run continues exactly like
+an uninterrupted one.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from market_fixtures import make_small_ga, make_streamer
+from optimization.genetic_optimizer.genetic_algorithm.checkpoint import GACheckpoint
+from optimization.genetic_optimizer.support.parameter_collector import ParameterCollector
+
+
+def all_fitness(observer) -> np.ndarray:
+    return np.array(sorted(stats.fitness_values.tolist() for stats in observer.individual_stats))
+
+
+class TestGACheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.streamer = make_streamer(3)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / 'run.npz')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        uninterrupted = [all_fitness(observer) for observer, _ in
+                         make_small_ga(self.streamer).run_ga_iterations(1)]
+
+        # Stop after generation 1: the last checkpoint holds the bred population of generation 1
+        interrupted = make_small_ga(self.streamer, checkpoint_path=self.path,
+                                    checkpoint_extras=lambda: {'best_individuals_log': [{'generation': 1}]})
+        for observer, _ in interrupted.run_ga_iterations(1):
+            if observer.iteration == 1:
+                break
+
+        checkpoint = GACheckpoint.load(self.path)
+        self.assertEqual(checkpoint.generation, 1)
+        self.assertEqual(checkpoint.genomes.shape[0], 12)
+        self.assertEqual(checkpoint.fitness_values.shape, (12, 2))
+        self.assertEqual(checkpoint.extras, {'best_individuals_log': [{'generation': 1}]})
+
+        resumed = make_small_ga(self.streamer)
+        resumed.random_seed = 0
+        resumed.resume(checkpoint)
+        results = list(resumed.run_ga_iterations(1))
+        self.assertEqual([observer.iteration for observer, _ in results], [1, 2, 3])
+        for (observer, _), expected in zip(results, uninterrupted[1:]):
+            np.testing.assert_array_equal(all_fitness(observer), expected)
+        # Metric history continues from the checkpoint
+        self.assertEqual(len(results[-1][1].best_metrics), 4)
+
+    def test_checkpoint_interval(self):
+        genetic_algorithm = make_small_ga(self.streamer, checkpoint_path=self.path, checkpoint_interval=2)
+        generations = []
+        for observer, _ in genetic_algorithm.run_ga_iterations(1):
+            if Path(self.path).exists():
+                generations.append((observer.iteration, GACheckpoint.load(self.path).generation))
+        self.assertEqual(generations, [(2, 2), (3, 2)])
+
+    def test_mismatched_genomes_are_rejected(self):
+        genetic_algorithm = make_small_ga(self.streamer)
+        with self.assertRaises(ValueError):
+            genetic_algorithm.problem_domain.decode_population(np.zeros((2, 3)), ['a', 'b'])
+
+
+class TestParameterCollectorState(unittest.TestCase):
+
+    def test_state_round_trip(self):
+        collector = ParameterCollector()
+        collector.parameter_metadata['macd: fast'] = {'type': 'int', 'source': 'indicator', 'range': [2, 20]}
+        collector.parameter_history['macd: fast'] = [5, 6]
+        collector.parameter_evolution_history['macd: fast']['generations'].append(1)
+        collector.parameter_evolution_history['macd: fast']['mean'].append(5.5)
+
+        restored = ParameterCollector()
+        restored.load_state(collector.get_state())
+        self.assertEqual(restored.get_parameter_list(), collector.get_parameter_list())
+        self.assertEqual(restored.parameter_evolution_history['macd: fast']['mean'], [5.5])
+        self.assertEqual(restored.parameter_evolution_history['macd: fast']['std'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests for the indicator memo shared between GA individuals.
+"""
+
+import pickle
+import unittest
+from typing import Dict
+
+import numpy as np
+
+from models.monitor_configuration import MonitorConfiguration
+from candle_aggregator.candle_aggregator_normal import CANormal
+from optimization.calculators.bt_data_streamer import BacktestDataStreamer
+from optimization.calculators.indicator_memo import IndicatorMemo, IndicatorMemoEntry
+from market_fixtures import create_config, make_ticks
+
+
+def make_aggregators() -> Dict[str, CANormal]:
+    aggregators = {"1m-normal": CANormal("TEST", "1m", True), "5m-normal": CANormal("TEST", "5m", True)}
+    for tick in make_ticks(2 * 390 * 4, seed=11, volatility=0.04):
+        for aggregator in aggregators.values():
+            aggregator.process_tick(tick)
+    for aggregator in aggregators.values():
+        aggregator.finalize()
+    return aggregators
+
+
+class TestIndicatorMemo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.aggregators = make_aggregators()
+
+    def _streamer(self) -> BacktestDataStreamer:
+        streamer = BacktestDataStreamer()
+        streamer.initialize(self.aggregators, {"ticker": "TEST", "start_date": "a", "end_date": "b"},
+                            create_config())
+        return streamer
+
+    def _run(self, streamer: BacktestDataStreamer, config: MonitorConfiguration, memo=None):
+        streamer.replace_monitor_config(config)
+        histories = streamer.run_backtest(fast=True, indicator_memo=memo)
+        trades = [(t.time, t.size, t.price, t.reason) for t in streamer.trade_executor.portfolio.trade_history]
+        return histories, trades
+
+    def test_lru_eviction(self):
+        memo = IndicatorMemo(max_entries=2)
+        entry = IndicatorMemoEntry(np.zeros(3), np.zeros(3), {})
+        keys = [memo.make_key("split", "1m-normal", "SMACrossoverIndicator", {"period": p}) for p in (1, 2, 3)]
+        memo.put(keys[0], entry)
+        memo.put(keys[1], entry)
+        self.assertIs(memo.get(keys[0]), entry)
+        memo.put(keys[2], entry)
+
+        self.assertIsNone(memo.get(keys[1]))
+        self.assertIs(memo.get(keys[0]), entry)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.counts(), (2, 1))
+
+    def test_memory_budget_eviction(self):
+        # Each entry holds 3 * 16384 float64 values = 384 KiB, so a 1 MB budget keeps two
+        memo = IndicatorMemo(max_entries=512, max_megabytes=1.0)
+        keys = [memo.make_key("split", "1m-normal", "SMACrossoverIndicator", {"period": p}) for p in range(4)]
+        for key in keys:
+            memo.put(key, IndicatorMemoEntry(np.zeros(16384), np.zeros(16384), {"fast": np.zeros(16384)}))
+
+        self.assertEqual(len(memo), 2)
+        self.assertIsNone(memo.get(keys[1]))
+        self.assertIsNotNone(memo.get(keys[3]))
+        self.assertEqual(memo.nbytes, 2 * 3 * 16384 * 8)
+
+        memo.put(keys[3], IndicatorMemoEntry(np.zeros(10), np.zeros(10), {}))
+        self.assertEqual(memo.nbytes, 3 * 16384 * 8 + 2 * 10 * 8)
+        memo.clear()
+        self.assertEqual(memo.nbytes, 0)
+
+    def test_key_canonicalizes_parameters(self):
+        first = IndicatorMemo.make_key("split", "5m-heiken", "CDLPatternIndicator",
+                                       {"patterns": ["CDL3INSIDE"], "trend": "bearish", "lookback": 3})
+        second = IndicatorMemo.make_key("split", "5m-heiken", "CDLPatternIndicator",
+                                        {"lookback": 3, "trend": "bearish", "patterns": ["CDL3INSIDE"]})
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, IndicatorMemo.make_key("other", "5m-heiken", "CDLPatternIndicator",
+                                                          {"lookback": 3, "trend": "bearish",
+                                                           "patterns": ["CDL3INSIDE"]}))
+
+    def test_memoized_results_match(self):
+        streamer = self._streamer()
+        memo = IndicatorMemo()
+        configs = [create_config(), create_config(sma_weight=0.4, threshold=0.3), create_config(period=12)]
+
+        for config in configs:
+            expected_histories, expected_trades = self._run(streamer, config)
+            actual_histories, actual_trades = self._run(streamer, config, memo)
+            self.assertEqual(actual_trades, expected_trades)
+            for expected, actual in zip(expected_histories, actual_histories):
+                self.assertEqual(actual.keys(), expected.keys())
+                for name in expected:
+                    np.testing.assert_array_equal(np.array(actual[name]), np.array(expected[name]))
+
+        # Second config reuses both indicators of the first; the third only the MACD
+        self.assertEqual(memo.counts(), (0 + 2 + 1, 2 + 0 + 1))
+
+    def test_data_key_follows_copies(self):
+        streamer = self._streamer()
+        copy = BacktestDataStreamer()
+        copy.copy_data_from(pickle.loads(pickle.dumps(streamer)))
+        self.assertEqual(copy.data_key, streamer.data_key)
+        self.assertNotEqual(self._streamer().data_key, streamer.data_key)
+
+        memo = IndicatorMemo()
+        self._run(streamer, create_config(), memo)
+        self._run(copy, create_config(), memo)
+        self.assertEqual(memo.counts(), (2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
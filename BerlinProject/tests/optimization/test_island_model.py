@@ -0,0 +1,148 @@
+"""
+Tests for the island-model GA runner and immigrant placement in GeneticAlgorithm.
+"""
+
+import multiprocessing as mp
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from market_fixtures import create_ranged_config, make_small_ga, make_streamer
+from optimization.genetic_optimizer.apps.utils.mlf_optimizer_config import MlfOptimizerConfig
+from optimization.genetic_optimizer.apps.utils.optimizer_config import GAHyperparameters
+from optimization.genetic_optimizer.genetic_algorithm.genetic_algorithm import GeneticAlgorithm
+from optimization.genetic_optimizer.genetic_algorithm.island_model import IslandModel, _seed_unseeded_island
+
+
+class IslandFactory:
+    """Small MLF project per island (picklable for the island processes)"""
+
+    def __call__(self, island: int, seed: int) -> GeneticAlgorithm:
+        return make_small_ga(make_streamer(3), random_seed=seed)
+
+
+class TestIslandModel(unittest.TestCase):
+
+    def run_islands(self, seeds):
+        model = IslandModel(factory=IslandFactory(), number_of_islands=2, number_of_generations=4,
+                            population_size=12, elitist_size=2, migration_interval=2, migration_size=2,
+                            seeds=seeds, mp_context=mp.get_context('fork'))
+        results = list(model.run_ga_iterations(1))
+        self.assertEqual(model._processes, [])
+        return results
+
+    def test_merged_fronts_and_repeatable_seeds(self):
+        results = self.run_islands([11, 12])
+        self.assertEqual([observer.iteration for observer, _ in results], [0, 1, 2, 3])
+        for observer, statistics in results:
+            self.assertTrue(observer.success)
+            front = observer.fronts[0]
+            self.assertTrue(all(stats.dominated_by_count == 0 for stats in front))
+            self.assertEqual(len(statistics.best_metrics), 4)  # one entry per merged generation
+            # Merged individuals still decode to configurations in the parent
+            self.assertIsNotNone(front[0].individual.monitor_configuration)
+
+        again = self.run_islands([11, 12])
+        for (first, _), (second, _) in zip(results, again):
+            np.testing.assert_array_equal(first.fitness_values, second.fitness_values)
+
+    def test_paused_run_matches_uninterrupted_run(self):
+        expected = self.run_islands([11, 12])
+        model = IslandModel(factory=IslandFactory(), number_of_islands=2, number_of_generations=4,
+                            population_size=12, elitist_size=2, migration_interval=2, migration_size=2,
+                            seeds=[11, 12], mp_context=mp.get_context('fork'))
+        generations = model.run_ga_iterations(1)
+        results = [next(generations)]
+        model.pause()
+        resume = threading.Timer(1.5, model.resume)
+        resume.start()
+        started = time.monotonic()
+        results.extend(generations)
+        resume.join()
+        # The islands waited for the resume before finishing their last generations
+        self.assertGreaterEqual(time.monotonic() - started, 1.0)
+
+        for (first, _), (second, _) in zip(results, expected):
+            np.testing.assert_array_equal(first.fitness_values, second.fitness_values)
+        self.assertEqual(len(results), 4)
+
+    def test_stop_ends_the_islands(self):
+        model = IslandModel(factory=IslandFactory(), number_of_islands=2, number_of_generations=4,
+                            population_size=12, elitist_size=2, migration_interval=2, migration_size=2,
+                            seeds=[11, 12], mp_context=mp.get_context('fork'))
+        generations = model.run_ga_iterations(1)
+        next(generations)
+        processes = list(model._processes)
+        model.stop()
+        # Islands finish the generation they are on, then exit on their own
+        self.assertLessEqual(len(list(generations)), 1)
+        self.assertEqual([process.exitcode for process in processes], [0, 0])
+
+    def test_seeds_per_island(self):
+        model = IslandModel(factory=IslandFactory(), number_of_islands=3, number_of_generations=1,
+                            population_size=4, elitist_size=1, random_seed=40)
+        self.assertEqual(model.seeds, [40, 41, 42])
+        with self.assertRaises(ValueError):
+            IslandModel(factory=IslandFactory(), number_of_islands=2, number_of_generations=1,
+                        population_size=4, elitist_size=1, seeds=[1])
+
+    def test_unseeded_islands_draw_independently(self):
+        def draw(seed, results):
+            _seed_unseeded_island(seed)
+            results.put(tuple(np.random.random(4)))
+
+        context = mp.get_context('fork')
+        for seed, expect_equal in ((0, False), (7, True)):
+            results = context.Queue()
+            processes = [context.Process(target=draw, args=(seed, results)) for _ in range(2)]
+            for process in processes:
+                process.start()
+            draws = [results.get(timeout=10) for _ in processes]
+            for process in processes:
+                process.join()
+            self.assertEqual(draws[0] == draws[1], expect_equal)
+
+    def test_parent_calculator_only_evaluates_test_data(self):
+        def island_model_config(num_workers):
+            hyper_parameters = GAHyperparameters(number_of_iterations=2, population_size=4, propagation_fraction=0.5,
+                                                 elite_size=1, chance_of_mutation=0.1, chance_of_crossover=0.1,
+                                                 num_splits=1, num_workers=num_workers, islands=2)
+            return MlfOptimizerConfig(objectives={}, hyper_parameters=hyper_parameters, data_config_file='data.json',
+                                      monitor_config=create_ranged_config("5m-heiken"),
+                                      configuration={'ga_hyperparameters': {'elites_to_save': 3}})
+
+        io = island_model_config(8)
+        io.create_island_model()
+        self.assertEqual(io.fitness_calculator.backtest_streamers, [])
+        self.assertEqual(io.fitness_calculator.max_workers, 3)
+
+        io = island_model_config(0)
+        io.create_island_model()
+        self.assertTrue(io.fitness_calculator.force_sequential)
+        test_streamer = make_streamer(5)
+        io.fitness_calculator.add_evaluation_streamer(test_streamer)
+        individual = IslandFactory()(0, 1).problem_domain.create_initial_population(1)[0]
+        self.assertEqual(len(io.fitness_calculator.evaluate_portfolios(test_streamer, [individual])), 1)
+
+
+class TestImmigrants(unittest.TestCase):
+
+    def test_immigrants_replace_tail_but_not_elites(self):
+        genetic_algorithm = GeneticAlgorithm(number_of_generations=2, problem_domain=SimpleNamespace(
+            fitness_calculator=None), population_size=5, propagation_fraction=0.4, elitist_size=2)
+        genetic_algorithm.iteration_index = 0
+        population = ['e1', 'e2', 'a', 'b', 'c']
+
+        genetic_algorithm.receive_immigrants(['m1', 'm2'])
+        self.assertEqual(genetic_algorithm._place_immigrants(population), ['e1', 'e2', 'a', 'm1', 'm2'])
+        self.assertEqual(genetic_algorithm.pending_immigrants, [])
+
+        genetic_algorithm.receive_immigrants(['m1', 'm2', 'm3', 'm4'])
+        self.assertEqual(genetic_algorithm._place_immigrants(population), ['e1', 'e2', 'm1', 'm2', 'm3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
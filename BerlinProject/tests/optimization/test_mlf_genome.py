@@ -0,0 +1,166 @@
+"""
+Tests for the genome vector representation of MlfIndividual.
+"""
+
+import pickle
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from optimization.mlf_optimizer import MlfIndividual, MlfProblem
+from optimization.mlf_optimizer.mlf_genome import GenomeSchema, PARAMETER, TREND_WEIGHT
+from market_fixtures import create_ranged_config
+
+
+class TestGenomeSchema(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(3)
+        self.config = create_ranged_config()
+        self.schema = GenomeSchema.from_configuration(self.config)
+
+    def test_layout(self):
+        self.assertEqual(self.schema.gene_names(), [
+            'bar_weight:bull.sma_cross', 'trend_weight:bull.macd', 'trend_threshold:bull',
+            'enter_threshold:0', 'parameter:sma_cross.period', 'parameter:sma_cross.crossover_value',
+            'parameter:macd.fast', 'parameter:macd.slow'])
+        np.testing.assert_array_equal(self.schema.template_genome, [1.0, 1.0, 0.3, 0.5, 10, 0.0005, 6, 13])
+        # Trend values are only randomized at creation
+        self.assertEqual([p[0] for p, e in zip(self.schema.paths, self.schema.evolves) if not e],
+                         [TREND_WEIGHT, 'trend_threshold'])
+
+    def test_decode_template_is_unchanged(self):
+        decoded = self.schema.decode(self.schema.template_genome)
+        self.assertEqual(decoded.model_dump(), self.config.model_dump())
+        self.assertIsInstance(decoded.indicators[0].parameters['period'], int)
+
+    def test_decode_writes_changed_values(self):
+        genome = self.schema.template_genome.copy()
+        genome[[0, 1, 4, 5]] = [1.7, 0.8, 21, 0.0012]
+        decoded = self.schema.decode(genome)
+        self.assertEqual(decoded.bars['bull']['indicators'], {"sma_cross": 1.7, "macd": 1.0})
+        # Scalar trend weights are written in dict format (the format choose_weights used)
+        self.assertEqual(decoded.bars['bull']['trend_indicators']['macd'], {'weight': 0.8, 'mode': 'soft'})
+        self.assertEqual(decoded.indicators[0].parameters['period'], 21)
+        self.assertIsInstance(decoded.indicators[0].parameters['period'], int)
+        self.assertEqual(decoded.indicators[0].parameters['crossover_value'], 0.0012)
+        self.assertEqual(self.schema.encode(decoded).tolist(), genome.tolist())
+        # The template itself is not modified
+        self.assertEqual(self.schema.template.indicators[0].parameters['period'], 10)
+
+    def test_random_genome_within_ranges(self):
+        for _ in range(50):
+            genome = self.schema.random_genome()
+            self.assertTrue(np.all(genome >= self.schema.low) and np.all(genome <= self.schema.high))
+            np.testing.assert_array_equal(genome[self.schema.is_int], np.round(genome[self.schema.is_int]))
+
+    def test_mutate(self):
+        genome = self.schema.template_genome
+        for _ in range(50):
+            mutated, count = self.schema.mutate(genome, 0.3)
+            changed = mutated != genome
+            self.assertGreaterEqual(count, 1)
+            self.assertFalse(np.any(changed & ~self.schema.evolves))
+            self.assertTrue(np.all(mutated >= self.schema.low) and np.all(mutated <= self.schema.high))
+            np.testing.assert_array_equal(mutated[self.schema.is_int], np.round(mutated[self.schema.is_int]))
+        np.testing.assert_array_equal(genome, [1.0, 1.0, 0.3, 0.5, 10, 0.0005, 6, 13])
+
+    def test_cross_over(self):
+        mom = self.schema.random_genome()
+        dad = self.schema.random_genome()
+        for _ in range(20):
+            child1, child2, count = self.schema.cross_over(mom, dad, 0.5)
+            swapped = child1 != mom
+            self.assertEqual(count, int(swapped.sum()))
+            self.assertGreaterEqual(count, 1)
+            np.testing.assert_array_equal(child1[swapped], dad[swapped])
+            np.testing.assert_array_equal(child2[swapped], mom[swapped])
+            np.testing.assert_array_equal(child2[~swapped], dad[~swapped])
+            self.assertFalse(np.any(swapped & ~self.schema.evolves))
+
+        _, _, count = self.schema.cross_over(mom, mom.copy(), 0.5)
+        self.assertEqual(count, 0)
+
+    def test_missing_weight_range_raises(self):
+        config = create_ranged_config()
+        del config.bars['bull']['weight_ranges']['sma_cross']
+        with self.assertRaises(ValueError):
+            GenomeSchema.from_configuration(config)
+
+
+class TestMlfIndividualGenome(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(5)
+        self.config = create_ranged_config()
+        self.problem = MlfProblem(fitness_calculator=None, monitor_configuration=self.config)
+
+    def test_initial_population(self):
+        population = self.problem.create_initial_population(10)
+        self.assertEqual(len(population), 10)
+        self.assertEqual(population[0].monitor_configuration.model_dump(), self.config.model_dump())
+        self.assertTrue(all(ind.schema is self.problem.genome_schema for ind in population))
+
+    def test_configuration_is_lazy_and_follows_genome(self):
+        individual = self.problem.create_initial_population(2)[1]
+        self.assertIsNone(individual._monitor_configuration)
+        config = individual.monitor_configuration
+        self.assertIs(individual.monitor_configuration, config)
+
+        copy = individual.copy_individual("copy")
+        self.assertIsNone(copy._monitor_configuration)
+        self.assertIsNot(copy.genome, individual.genome)
+        self.assertEqual(copy, individual)
+
+        self.problem.mutation_function(copy, 1.0, 3)
+        self.assertIn("idx: 3", copy.source)
+        period_index = self.problem.genome_schema.paths.index((PARAMETER, 0, 'period'))
+        self.assertEqual(copy.monitor_configuration.indicators[0].parameters['period'], copy.genome[period_index])
+        self.assertEqual(individual.monitor_configuration.indicators[0].parameters['period'],
+                         individual.genome[period_index])
+
+    def test_cross_over_function(self):
+        mom, dad = self.problem.create_initial_population(3)[1:]
+        genomes = mom.genome.copy(), dad.genome.copy()
+        mom.monitor_configuration  # cached configuration must be rebuilt after crossover
+        children = self.problem.cross_over_function(mom, dad, 0.5)
+        self.assertEqual(children, [mom, dad])
+        np.testing.assert_array_equal(mom.genome + dad.genome, genomes[0] + genomes[1])
+        self.assertEqual(self.problem.genome_schema.encode(mom.monitor_configuration).tolist(), mom.genome.tolist())
+
+    def test_configuration_only_individual(self):
+        individual = MlfIndividual(monitor_configuration=create_ranged_config(), source="legacy")
+        self.assertIsNone(individual.genome)
+        self.problem.mutation_function(individual, 1.0, 0)
+        self.assertIsNotNone(individual.genome)
+        self.assertNotEqual(individual.monitor_configuration.model_dump(), self.config.model_dump())
+
+    def test_pickle_sends_genome_only(self):
+        individual = self.problem.create_initial_population(2)[1]
+        expected = individual.monitor_configuration.model_dump()
+        restored = pickle.loads(pickle.dumps(individual))
+        self.assertIsNone(restored._monitor_configuration)
+        self.assertEqual(restored.monitor_configuration.model_dump(), expected)
+
+    def test_cross_over_keeps_parameters_without_range(self):
+        # Every individual decodes from the template, so parameters without a range
+        # (here sma_cross.lookback and macd.signal) are equal in both parents and children
+        mom, dad = self.problem.create_initial_population(3)[1:]
+        for child in self.problem.cross_over_function(mom, dad, 1.0):
+            for indicator, template in zip(child.monitor_configuration.indicators, self.config.indicators):
+                for name in ('trend', 'lookback', 'signal', 'histogram_threshold'):
+                    self.assertEqual(indicator.parameters.get(name), template.parameters.get(name))
+            self.assertEqual(child.monitor_configuration.bars['bull']['trend_indicators']['macd']['mode'], 'soft')
+
+    def test_diversity_parameters_mix_genome_and_configuration_individuals(self):
+        from optimization.genetic_optimizer.genetic_algorithm.pareto_front import extract_all_parameters
+        individual = self.problem.create_initial_population(2)[1]
+        legacy = MlfIndividual(monitor_configuration=individual.monitor_configuration.model_copy(deep=True))
+        self.assertIsNone(legacy.genome)
+        self.assertEqual(extract_all_parameters(individual), extract_all_parameters(legacy))
+        self.assertEqual(extract_all_parameters(SimpleNamespace(monitor_configuration=self.config))[:1], [1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for the vectorized non-dominated sorting and crowding distance in pareto_front.
+"""
+
+import unittest
+from typing import List
+
+import numpy as np
+
+from optimization.genetic_optimizer.abstractions.individual_stats import IndividualStats
+from optimization.genetic_optimizer.genetic_algorithm.pareto_front import (
+    is_dominating, collect_domination_statistics, collect_fronts, crowd_sort, balance_fronts
+)
+
+
+# Reference (pairwise loop) implementations the vectorized versions must reproduce
+
+def reference_domination_statistics(individuals: List[IndividualStats]):
+    for i, solution_a in enumerate(individuals):
+        for j, solution_b in enumerate(individuals):
+            if i != j and is_dominating(solution_a.fitness_values, solution_b.fitness_values):
+                solution_a.dominates(solution_b)
+                solution_b.dominated_by_solution()
+
+
+def reference_fronts(individuals: List[IndividualStats]):
+    fronts = {}
+    for count in sorted({ind.dominated_by_count for ind in individuals if ind.dominated_by_count >= 0}):
+        fronts[len(fronts)] = balance_fronts([ind for ind in individuals if ind.dominated_by_count == count])
+    return fronts
+
+
+def reference_crowd_sort(front: List[IndividualStats]) -> List[IndividualStats]:
+    eps = np.finfo(float).eps
+    for ind in front:
+        ind.crowding_distance = 0.0
+    for oc in range(len(front[0].fitness_values)):
+        sorted_front = sorted(front, key=lambda x: x.fitness_values[oc])
+        denom = sorted_front[-1].fitness_values[oc] - sorted_front[0].fitness_values[oc] + eps
+        sorted_front[0].crowding_distance = np.inf
+        sorted_front[-1].crowding_distance = np.inf
+        for i in range(1, len(sorted_front) - 1):
+            gap = sorted_front[i + 1].fitness_values[oc] - sorted_front[i - 1].fitness_values[oc]
+            sorted_front[i].crowding_distance += gap / denom
+    return sorted(front, key=lambda x: x.crowding_distance, reverse=True)
+
+
+def make_population(fitness: np.ndarray) -> List[IndividualStats]:
+    return [IndividualStats(index=i, fitness_values=row.copy(), individual=None) for i, row in enumerate(fitness)]
+
+
+class TestParetoFront(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        # Rounded values so the population has duplicate points and tied objectives
+        self.fitness_sets = [np.round(rng.normal(size=(n, m)), 1) for n, m in ((40, 2), (150, 3), (300, 4))]
+        self.fitness_sets.append(rng.integers(0, 4, size=(60, 2)).astype(float))
+
+    def test_domination_statistics_match_reference(self):
+        for fitness in self.fitness_sets:
+            expected = make_population(fitness)
+            actual = make_population(fitness)
+            reference_domination_statistics(expected)
+            collect_domination_statistics(actual)
+
+            for exp, act in zip(expected, actual):
+                self.assertEqual(act.dominated_by_count, exp.dominated_by_count)
+                self.assertEqual([d.index for d in act.dominates_over], [d.index for d in exp.dominates_over])
+
+    def test_fronts_match_reference(self):
+        for fitness in self.fitness_sets:
+            population = make_population(fitness)
+            collect_domination_statistics(population)
+            expected = reference_fronts(population)
+            actual = collect_fronts(population)
+
+            self.assertEqual(list(actual.keys()), list(expected.keys()))
+            for key in expected:
+                self.assertEqual([ind.index for ind in actual[key]], [ind.index for ind in expected[key]])
+            # First front is the non-dominated set
+            self.assertTrue(all(ind.dominated_by_count == 0 for ind in actual[0]))
+
+    def test_negative_counts_are_not_a_front(self):
+        population = make_population(np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [0.5, 4.0]]))
+        collect_domination_statistics(population)
+        population[3].dominated_by_count = -1
+
+        fronts = collect_fronts(population)
+        self.assertEqual([[ind.index for ind in front] for front in fronts.values()], [[0], [1], [2]])
+
+    def test_crowd_sort_matches_reference(self):
+        for fitness in self.fitness_sets:
+            expected = reference_crowd_sort(make_population(fitness))
+            actual = crowd_sort(make_population(fitness))
+
+            self.assertEqual([ind.index for ind in actual], [ind.index for ind in expected])
+            self.assertEqual([ind.crowding_distance for ind in actual],
+                             [ind.crowding_distance for ind in expected])
+
+    def test_crowd_sort_small_front(self):
+        front = make_population(np.array([[1.0, 2.0], [2.0, 1.0]]))
+        self.assertEqual(crowd_sort(front), front)
+        self.assertTrue(all(ind.crowding_distance == np.inf for ind in front))
+
+
+if __name__ == '__main__':
+    unittest.main()
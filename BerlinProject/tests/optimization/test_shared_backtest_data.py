@@ -0,0 +1,150 @@
+"""
+Tests for exporting backtest candle data to shared memory for fitness workers.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+
+import numpy as np
+
+from models.monitor_configuration import MonitorConfiguration
+from optimization.calculators.shared_backtest_data import SharedBacktestData, attach_split
+from optimization.mlf_optimizer.mlf_fitness_calculator import MlfFitnessCalculator, evaluate_individual_worker
+from optimization.mlf_optimizer.mlf_genome import GenomeSchema
+from optimization.mlf_optimizer.mlf_individual import MlfIndividual
+from optimization.mlf_optimizer.mlf_objectives import MaximizeNetPnL, MinimizeLosingTrades
+from market_fixtures import create_config, make_streamer
+
+
+def create_split_config(period: int, threshold: float) -> MonitorConfiguration:
+    return create_config(name="Shared Data Test", period=period, threshold=threshold, macd_agg_config="5m-heiken",
+                         trade_executor={"default_position_size": 100, "stop_loss_pct": 0.005,
+                                         "take_profit_pct": 0.01})
+
+
+class TestSharedBacktestData(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.streamers = [make_streamer(3), make_streamer(4)]
+
+    def test_attached_split_matches_source(self):
+        shared = SharedBacktestData(self.streamers)
+        blocks = {}
+        try:
+            attached = attach_split(shared.splits[1], blocks)
+            source = self.streamers[1]
+            self.assertEqual(attached.data_key, source.data_key)
+            self.assertEqual(len(attached.tick_history), len(source.tick_history))
+
+            for agg_key, aggregator in source.aggregators.items():
+                copy = attached.aggregators[agg_key]
+                self.assertIs(type(copy), type(aggregator))
+                self.assertEqual(len(copy.get_candles()), len(aggregator.get_candles()))
+                self.assertEqual(copy.get_current_candle() is None, aggregator.get_current_candle() is None)
+                np.testing.assert_array_equal(copy.ohlc_view(include_current=True),
+                                              aggregator.ohlc_view(include_current=True))
+                self.assertEqual(copy.get_candles().timestamp_objects(), aggregator.get_candles().timestamp_objects())
+
+            config = create_split_config(10, 0.4)
+            for streamer in (source, attached):
+                streamer.replace_monitor_config(config)
+            expected = source.run(fast=True)
+            actual = attached.run(fast=True)
+            self.assertGreater(len(expected.trade_history), 0)
+            self.assertEqual(actual.trade_history, expected.trade_history)
+        finally:
+            for block in blocks.values():
+                block.close()
+            shared.close()
+
+    def test_parallel_matches_sequential(self):
+        population = [SimpleNamespace(monitor_configuration=create_split_config(period, threshold))
+                      for period in (8, 10, 14) for threshold in (0.3, 0.5)]
+
+        def evaluate(force_sequential: bool):
+            calculator = MlfFitnessCalculator(backtest_streamers=self.streamers, max_workers=2,
+                                              force_sequential=force_sequential)
+            calculator.objectives = [MaximizeNetPnL(), MinimizeLosingTrades()]
+            calculator.split = self.streamers[1]
+            try:
+                return calculator.calculate_fitness_functions(0, population)
+            finally:
+                calculator.shutdown_executor()
+
+        sequential = evaluate(True)
+        parallel = evaluate(False)
+        self.assertEqual(len(parallel), len(population))
+        self.assertTrue(any(stats.trade_history for stats in sequential))
+        for expected, actual in zip(sequential, parallel):
+            np.testing.assert_array_equal(actual.fitness_values, expected.fitness_values)
+            self.assertIs(actual.individual, expected.individual)
+            self.assertEqual(actual.trade_history, expected.trade_history)
+            self.assertEqual(actual.market_return, expected.market_return)
+
+    def test_evaluation_streamer_through_worker_pool(self):
+        test_streamer = make_streamer(5)
+        individuals = [SimpleNamespace(monitor_configuration=create_split_config(period, 0.4)) for period in (8, 12)]
+        expected = []
+        for individual in individuals:
+            test_streamer.replace_monitor_config(individual.monitor_configuration)
+            expected.append(test_streamer.run().trade_history)
+
+        for force_sequential in (True, False):
+            calculator = MlfFitnessCalculator(backtest_streamers=self.streamers[:1], max_workers=2,
+                                              force_sequential=force_sequential)
+            calculator.add_evaluation_streamer(test_streamer)
+            calculator.add_evaluation_streamer(test_streamer)
+            try:
+                portfolios = calculator.evaluate_portfolios(test_streamer, individuals)
+            finally:
+                calculator.shutdown_executor()
+            self.assertEqual(len(calculator.evaluation_streamers), 1)
+            self.assertEqual([p.trade_history for p in portfolios], expected)
+        self.assertTrue(any(expected))
+
+    def test_genome_tasks_and_worker_stats(self):
+        config = create_split_config(10, 0.4)
+        config.indicators[0].ranges = {"period": {"t": "int", "r": [6, 20]}}
+        config.bars["bull"]["weight_ranges"] = {"sma_cross": {"r": [0.5, 1.5]}, "macd": {"r": [0.5, 1.5]}}
+        config.enter_long[0]["threshold_range"] = [0.2, 0.7]
+        schema = GenomeSchema.from_configuration(config)
+        np.random.seed(7)
+        population = [MlfIndividual(source="test", genome=schema.random_genome(), schema=schema) for _ in range(9)]
+
+        results = {}
+        for force_sequential in (True, False):
+            calculator = MlfFitnessCalculator(backtest_streamers=self.streamers, max_workers=2,
+                                              force_sequential=force_sequential)
+            calculator.objectives = [MaximizeNetPnL(), MinimizeLosingTrades()]
+            calculator.split = self.streamers[0]
+            try:
+                results[force_sequential] = calculator.calculate_fitness_functions(0, population)
+                stats = calculator.get_worker_stats()
+            finally:
+                calculator.shutdown_executor()
+
+        for expected, actual in zip(results[True], results[False]):
+            np.testing.assert_array_equal(actual.fitness_values, expected.fitness_values)
+            self.assertIs(actual.individual, expected.individual)
+        self.assertEqual(sum(worker['individuals'] for worker in stats['workers'].values()), len(population))
+        self.assertGreater(stats['generation']['busy_seconds'], 0)
+        self.assertEqual(stats['generation']['chunks'], 5)  # chunks of 2 for 2 workers x 4
+
+    def test_worker_logs_failures(self):
+        stdout = io.StringIO()
+        with self.assertLogs("MlfFitnessCalculator", "ERROR") as logs, redirect_stdout(stdout):
+            # No split 99 is attached in this process
+            result = evaluate_individual_worker((SimpleNamespace(), 99, [], 1234, False, 1.0))
+
+        self.assertFalse(result['success'])
+        self.assertTrue(result['error'])
+        self.assertIn("pid 1234", logs.output[0])
+        self.assertIn("split 99", logs.output[0])
+        self.assertEqual(stdout.getvalue(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the columnar trade ledger of Portfolio and objective evaluation over a shared ledger.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from models.tick_data import TickData
+from optimization.mlf_optimizer.mlf_objectives import (MaximizeNetPnL, MaximizeProfit, MaximizeScaledNetPnL,
+                                                       MaximizeCashProfit, MinimizeLoss, MinimizeLosingTrades,
+                                                       MinimizeTrades, evaluate_objectives)
+from portfolios.portfolio_tool import Portfolio, TradeReason
+
+
+def create_portfolio() -> Portfolio:
+    portfolio = Portfolio()
+    portfolio.buy(1, 100.0, TradeReason.ENTER_LONG, 2.0)
+    portfolio.sell(2, 110.0, TradeReason.TAKE_PROFIT, 2.0)       # +10%
+    portfolio.buy(3, 100.0, TradeReason.ENTER_LONG, 1.0)
+    portfolio.buy(4, 90.0, TradeReason.ENTER_LONG, 1.0)
+    portfolio.sell(5, 81.0, TradeReason.STOP_LOSS, 2.0)          # -10% on the second entry only
+    portfolio.sell(6, 80.0, TradeReason.EXIT_LONG, 1.0)          # exit without entry: not a trade
+    portfolio.buy(7, 50.0, TradeReason.ENTER_LONG, 4.0)
+    portfolio.sell(8, 55.0, TradeReason.END_OF_DAY, 4.0)         # +10%
+    portfolio.buy(9, 60.0, TradeReason.ENTER_LONG, 1.0)          # still open
+    return portfolio
+
+
+class TestTradeLedger(unittest.TestCase):
+
+    def test_columns_and_accumulators(self):
+        portfolio = create_portfolio()
+        ledger = portfolio.trade_ledger()
+
+        np.testing.assert_array_equal(ledger.entry_index, [0, 3, 6])
+        np.testing.assert_array_equal(ledger.exit_index, [1, 4, 7])
+        np.testing.assert_array_equal(ledger.size, [2.0, 1.0, 4.0])
+        np.testing.assert_allclose(ledger.pnl_percent, [10.0, -10.0, 10.0])
+        np.testing.assert_allclose(ledger.pnl_cash, [20.0, -9.0, 20.0])
+
+        self.assertAlmostEqual(portfolio.get_total_percent_profits(), 20.0)
+        self.assertAlmostEqual(portfolio.get_total_percent_losses(), 10.0)
+        self.assertAlmostEqual(portfolio.get_total_cash_profits(), 40.0)
+        self.assertAlmostEqual(portfolio.get_total_cash_losses(), 9.0)
+        self.assertEqual((portfolio.get_winning_trades_count(), portfolio.get_losing_trades_count()), (2, 1))
+
+    def test_ledger_follows_new_trades(self):
+        portfolio = create_portfolio()
+        ledger = portfolio.trade_ledger()
+        self.assertIs(portfolio.trade_ledger(), ledger)
+
+        portfolio.sell(10, 54.0, TradeReason.EXIT_LONG, 1.0)
+        self.assertEqual(portfolio.get_losing_trades_count(), 2)
+        self.assertEqual(len(portfolio.trade_ledger()), 4)
+
+        portfolio.reset()
+        self.assertEqual(len(portfolio.trade_ledger()), 0)
+        self.assertEqual(portfolio.get_total_percent_profits(), 0.0)
+
+    def test_compact_round_trip(self):
+        portfolio = create_portfolio()
+        restored = Portfolio.from_compact(portfolio.to_compact())
+        np.testing.assert_array_equal(restored.trade_ledger().pnl_cash, portfolio.trade_ledger().pnl_cash)
+        # The cached ledger does not take part in comparisons
+        self.assertEqual(restored, portfolio)
+
+
+class TestEvaluateObjectives(unittest.TestCase):
+
+    def test_matches_objectives_one_by_one(self):
+        start = datetime(2024, 3, 4, 9, 30)
+        ticks = [TickData(symbol="TEST", timestamp=start + timedelta(minutes=i), open=price, high=price,
+                          low=price, close=price, volume=1) for i, price in enumerate([50.0, 80.0, 110.0, 60.0])]
+        scaled = MaximizeScaledNetPnL()
+        scaled.preprocess(ticks)
+        self.assertAlmostEqual(scaled.global_pct, 1.2)
+
+        objectives = [MaximizeProfit(), MinimizeLoss(), MinimizeLosingTrades(), MinimizeTrades(), MaximizeNetPnL(),
+                      scaled, MaximizeCashProfit()]
+        portfolio = create_portfolio()
+        expected = [objective.calculate_objective(None, create_portfolio(), None) for objective in objectives]
+        np.testing.assert_array_equal(evaluate_objectives(objectives, None, portfolio), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for the coalescing card update scheduler of the live dashboard.
+"""
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from data_streamer.data_streamer import DataStreamer
+from stock_analysis_ui.services.emit_scheduler import CardEmitScheduler
+from stock_analysis_ui.services.ui_external_tool import UIExternalTool
+from market_fixtures import create_config, make_trend_ticks, sma_cross_indicator
+
+
+class StubSocketIO:
+    """Records emits; background tasks run on threads like Flask-SocketIO's threading mode"""
+
+    def __init__(self, rooms=None):
+        self.emitted = []
+        self.server = SimpleNamespace(manager=SimpleNamespace(rooms={'/': rooms or {}}))
+
+    def emit(self, event, data, room=None):
+        self.emitted.append((event, data, room))
+
+    def start_background_task(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        return thread
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class ManualSocketIO(StubSocketIO):
+    """No background task: the test flushes by hand"""
+
+    def start_background_task(self, target, *args):
+        return None
+
+
+class TestCardEmitScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.emitted = []
+        self.success = True
+
+        def emit(event, data):
+            self.emitted.append((event, data))
+            return self.success
+
+        self.scheduler = CardEmitScheduler(ManualSocketIO(), emit)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_latest_update_per_card_in_one_event(self):
+        for i in range(3):
+            self.scheduler.submit("card1", {'card_id': "card1", 'price': i})
+        self.scheduler.submit("card2", {'card_id': "card2", 'price': 10})
+
+        self.assertEqual(self.scheduler.flush(), 2)
+        self.assertEqual(self.emitted, [('card_updates', {'updates': [{'card_id': "card1", 'price': 2},
+                                                                      {'card_id': "card2", 'price': 10}]})])
+        self.assertEqual(self.scheduler.updates_coalesced, 2)
+        self.assertEqual(self.scheduler.flush(), 0)
+        self.assertEqual(len(self.emitted), 1)
+
+    def test_failed_frames_back_off(self):
+        self.scheduler.set_frame_rate(20.0)
+        self.success = False
+        for _ in range(3):
+            self.scheduler.submit("card1", {'price': 1})
+            self.scheduler.flush()
+        self.assertAlmostEqual(self.scheduler.frame_interval, 0.05 * 1.5 ** 3)
+
+        self.success = True
+        self.scheduler.submit("card1", {'price': 1})
+        self.scheduler.flush()
+        self.assertEqual(self.scheduler.frame_interval, 0.05)
+        self.assertEqual(self.scheduler.failed_frames, 3)
+
+    def test_background_flush(self):
+        self.scheduler = CardEmitScheduler(StubSocketIO(), lambda event, data: self.emitted.append((event, data)) or True,
+                                           frame_rate=100.0)
+        self.scheduler.submit("card1", {'price': 1})
+        deadline = time.time() + 2.0
+        while not self.emitted and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.emitted, [('card_updates', {'updates': [{'price': 1}]})])
+        self.assertTrue(self.scheduler.is_running)
+
+
+class TestUIExternalToolWatchers(unittest.TestCase):
+
+    def _streamer(self, rooms):
+        socketio = StubSocketIO(rooms)
+        tool = UIExternalTool(socketio, app_service=SimpleNamespace(session_id="s1"))
+        streamer = DataStreamer("card1", "TEST", create_config(
+            name="Emit Test", trade_executor={}, indicators=[sma_cross_indicator()],
+            bars={"bull": {"type": "bull", "indicators": {"sma_cross": 1.0}}}, enter_long=[]))
+        streamer.connect_tool(tool)
+        return streamer, tool
+
+    def test_unwatched_session_skips_ui_work(self):
+        streamer, tool = self._streamer(rooms={})
+        calls = []
+        original = streamer.trade_executor.portfolio.get_performance_metrics
+        streamer.trade_executor.portfolio.get_performance_metrics = lambda price: calls.append(price) or original(price)
+
+        for tick in make_trend_ticks(50):
+            streamer.process_tick(tick)
+
+        self.assertFalse(tool.wants_updates("card1"))
+        self.assertEqual(calls, [])
+        self.assertEqual(tool.emit_scheduler.updates_submitted, 0)
+        # Indicators keep running for trading decisions
+        self.assertIn("bull", streamer.bar_scores)
+
+    def test_watched_session_batches_updates(self):
+        streamer, tool = self._streamer(rooms={"session_s1": {"sid": "eio"}})
+        try:
+            for tick in make_trend_ticks(50):
+                streamer.process_tick(tick)
+            self.assertEqual(tool.emit_scheduler.updates_submitted, 50)
+            tool.emit_scheduler.flush()
+
+            events = [(event, room) for event, _, room in tool.socketio.emitted]
+            self.assertEqual(set(events), {('card_updates', 'session_s1')})
+            last = tool.socketio.emitted[-1][1]['updates'][-1]
+            self.assertEqual(last['card_id'], "card1")
+            self.assertEqual(last['update_count'], 50)
+            self.assertEqual(last['price'], make_trend_ticks(50)[-1].close)
+        finally:
+            tool.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Tests for the columnar tick cache in front of MongoDBConnect._load_raw_ticks.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime
+
+import bson
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+
+from mlf_utils.timezone_utils import ET
+from mongo_tools.mongo_db_connect import MongoDBConnect
+from mongo_tools.tick_cache import TickCache, TickList, decode_month_documents
+
+
+def month_document(ticker, year, month, days, doc_id):
+    data = {}
+    for day in days:
+        data[str(day)] = {
+            str(seconds): {'open': f"float: {100 + day + seconds / 1e5}", 'high': 101.0 + day,
+                           'low': 99.0 + day, 'close': 100.5 + day, 'volume': 10 + seconds % 7}
+            # 09:30:00 .. 09:34:00 with one 16:00 entry, deliberately unsorted
+            for seconds in (57600, 34200, 34260, 34320, 34380, 34440)
+        }
+    return {'_id': doc_id, 'ticker': ticker, 'year': year, 'month': month, 'data': data}
+
+
+class FakeCursor(list):
+    def sort(self, keys):
+        return FakeCursor(sorted(self, key=lambda doc: tuple(doc[k] for k, _ in keys)))
+
+
+class FakeCollection:
+    """The find/aggregate subset MongoDBConnect uses"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.find_calls = 0
+        self.offline = False
+        self.bson_size_supported = True
+
+    def _matching(self, query):
+        months = {(c['year'], c['month']) for c in query['$or']}
+        return [d for d in self.documents if d['ticker'] == query['ticker'] and (d['year'], d['month']) in months]
+
+    def find(self, query, projection=None):
+        self.find_calls += 1
+        return FakeCursor(self._matching(query))
+
+    def aggregate(self, pipeline):
+        if self.offline:
+            raise ServerSelectionTimeoutError("offline")
+        if not self.bson_size_supported:
+            raise OperationFailure("Unrecognized expression '$bsonSize'")
+        return [{'_id': d['_id'], 'year': d['year'], 'month': d['month'], 'version': d.get('version', 0),
+                 'size': len(bson.encode(d))} for d in sorted(self._matching(pipeline[0]['$match']),
+                                                              key=lambda d: d['_id'])]
+
+
+def reference_ticks(documents, start_date, end_date):
+    """What _load_raw_ticks returned before the cache: (timestamp, o, h, l, c, v) sorted by time"""
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    rows = []
+    for doc in sorted(documents, key=lambda d: (d['year'], d['month'])):
+        for day, day_data in doc['data'].items():
+            for seconds, ohlc in day_data.items():
+                s = int(seconds)
+                dt = datetime(doc['year'], doc['month'], int(day), s // 3600, (s % 3600) // 60, s % 60, tzinfo=ET)
+                if start <= dt.date() <= end:
+                    rows.append((dt, float(ohlc['open'][7:]), ohlc['high'], ohlc['low'], ohlc['close'], ohlc['volume']))
+    return sorted(rows, key=lambda r: r[0])
+
+
+def as_rows(ticks):
+    return [(t.timestamp, t.open, t.high, t.low, t.close, t.volume) for t in ticks]
+
+
+class TestTickCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.documents = [
+            month_document('NVDA', 2024, 2, [27, 28, 29], 1),
+            month_document('NVDA', 2024, 3, [1, 8, 11, 29], 2),  # DST starts March 10
+            month_document('NVDA', 2024, 4, [1, 2], 3),
+            month_document('AAPL', 2024, 3, [1], 4),
+        ]
+        self.collection = FakeCollection(self.documents)
+        self.connect = MongoDBConnect()
+        self.connect.collection = self.collection
+        self.connect.tick_cache = TickCache(self.tmp.name)
+
+    def tearDown(self):
+        self.connect.close()
+        self.tmp.cleanup()
+
+    def test_matches_direct_decode(self):
+        ticks = self.connect._load_raw_ticks('NVDA', '2024-02-28', '2024-04-01')
+        expected = reference_ticks(self.documents[:3], '2024-02-28', '2024-04-01')
+        self.assertEqual(len(ticks), 7 * 6)
+        self.assertEqual(as_rows(ticks), expected)
+        self.assertEqual(ticks[0].symbol, 'NVDA')
+        self.assertEqual(ticks[0].time_increment, 'RAW')
+        self.assertEqual(ticks[0].timestamp.tzinfo, ET)
+
+        self.connect.tick_cache = None
+        self.assertEqual(as_rows(self.connect._load_raw_ticks('NVDA', '2024-02-28', '2024-04-01')), expected)
+
+    def test_repeat_load_served_from_cache(self):
+        first = self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-03-31')
+        self.assertEqual(self.collection.find_calls, 1)
+        self.assertTrue(self.connect.tick_cache.path('NVDA', 2024, 3).exists())
+
+        # Narrower range inside the cached month: sliced from the cache
+        second = self.connect.load_tick_arrays('NVDA', '2024-03-08', '2024-03-11')
+        self.assertEqual(self.collection.find_calls, 1)
+        self.assertEqual(len(first), 4 * 6)
+        self.assertEqual(len(second), 2 * 6)
+        self.assertEqual(as_rows(second.to_ticks('NVDA')), reference_ticks(self.documents[1:2], '2024-03-08', '2024-03-11'))
+
+    def test_changed_document_invalidates_month(self):
+        self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')
+        self.documents[1]['data']['12'] = {'34200': {'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1}}
+        self.documents[1]['version'] = 1
+
+        arrays = self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')
+        self.assertEqual(self.collection.find_calls, 2)
+        self.assertEqual(len(arrays), 6 * 6 + 1)
+
+        # Only the changed month was fetched again
+        self.connect.tick_cache = TickCache(self.tmp.name)
+        self.collection.find = lambda query, projection=None: self.fail(f"unexpected Mongo read {query}")
+        self.assertEqual(len(self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')), 6 * 6 + 1)
+
+    def test_offline_uses_cached_months(self):
+        expected = as_rows(self.connect._load_raw_ticks('NVDA', '2024-02-01', '2024-03-31'))
+        self.collection.offline = True
+        self.collection.find = lambda query, projection=None: self.fail("MongoDB is offline")
+        self.assertEqual(as_rows(self.connect._load_raw_ticks('NVDA', '2024-02-01', '2024-03-31')), expected)
+        # Months that were never cached are simply missing
+        self.assertEqual(len(self.connect.load_tick_arrays('NVDA', '2024-04-01', '2024-04-30')), 0)
+
+    def test_offline_is_probed_again(self):
+        self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-03-31')
+        self.collection.offline = True
+        self.assertEqual(len(self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')), 4 * 6)
+
+        # Back online after the retry interval: the uncached month is loaded
+        self.collection.offline = False
+        self.connect._offline_until = 0.0
+        self.assertEqual(len(self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')), 6 * 6)
+
+    def test_fingerprints_unsupported_loads_from_mongo(self):
+        self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-03-31')
+        self.documents[1]['data']['12'] = {'34200': {'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1}}
+        self.collection.bson_size_supported = False
+
+        # The cached month cannot be validated, so the current documents are read
+        arrays = self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')
+        self.assertEqual(len(arrays), 6 * 6 + 1)
+        self.assertEqual(self.collection.find_calls, 2)
+
+        # Unreachable as well: the cached months are served
+        def unreachable(query, projection=None):
+            raise ServerSelectionTimeoutError("offline")
+        self.collection.find = unreachable
+        self.assertEqual(len(self.connect.load_tick_arrays('NVDA', '2024-03-01', '2024-04-30')), 4 * 6)
+
+    def test_fingerprint_mismatch_and_unknown_ticker(self):
+        arrays = decode_month_documents([self.documents[3]])
+        cache = TickCache(self.tmp.name)
+        cache.put('AAPL', 2024, 3, arrays, 'a')
+        self.assertEqual(len(cache.get('AAPL', 2024, 3, 'a')), 6)
+        self.assertIsNone(cache.get('AAPL', 2024, 3, 'b'))
+        self.assertEqual(len(cache.get('AAPL', 2024, 3)), 6)
+        self.assertEqual(len(self.connect._load_raw_ticks('MSFT', '2024-03-01', '2024-03-31')), 0)
+
+
+    def test_decoder_across_dst_transitions(self):
+        documents = [month_document('SPY', 2024, 3, [9, 10, 11], 5), month_document('SPY', 2024, 11, [2, 3, 4], 6)]
+        # Early-morning ticks on the transition days (01:30 and 03:30 local)
+        for doc in documents:
+            for day_data in doc['data'].values():
+                day_data['5400'] = {'open': "float: 1.5", 'high': "2", 'low': 1, 'close': 1.25, 'volume': "7"}
+                day_data['12600'] = {'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.0, 'volume': 3}
+        arrays = decode_month_documents(documents)
+        ticks = arrays.to_ticks('SPY')
+        self.assertIsInstance(ticks, TickList)
+        self.assertEqual(len(ticks), 6 * 8)
+
+        expected = []
+        for doc in documents:
+            for day, day_data in doc['data'].items():
+                for seconds, ohlc in day_data.items():
+                    s = int(seconds)
+                    dt = datetime(doc['year'], doc['month'], int(day), s // 3600, (s % 3600) // 60, s % 60, tzinfo=ET)
+                    expected.append((int(dt.timestamp() * 1000), *(float(str(ohlc[k]).replace('float: ', ''))
+                                                                    for k in ('open', 'high', 'low', 'close', 'volume'))))
+        expected.sort(key=lambda row: row[0])
+        actual = list(zip(arrays.timestamp.tolist(), arrays.open.tolist(), arrays.high.tolist(),
+                          arrays.low.tolist(), arrays.close.tolist(), arrays.volume.tolist()))
+        self.assertEqual(actual, expected)
+
+        # Lazy TickData view: indexing, slicing and iteration agree
+        self.assertEqual(ticks[-1].timestamp, datetime.fromtimestamp(expected[-1][0] / 1000, tz=ET))
+        self.assertEqual(as_rows(ticks[2:5]), as_rows(list(ticks)[2:5]))
+        with self.assertRaises(IndexError):
+            ticks[len(ticks)]
+
+
+if __name__ == '__main__':
+    unittest.main()
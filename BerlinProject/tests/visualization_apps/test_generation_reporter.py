@@ -0,0 +1,162 @@
+"""
+Tests for the background generation_complete reporter of the optimizer.
+
+Tests verify that payloads only carry the changes since the previous payload,
+that candles are sent once per run and that skipped snapshots lose no log
+entries or test evaluations.
+
+Run with: python tests/visualization_apps/test_generation_reporter.py
+"""
+import sys
+import os
+import threading
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+
+from visualization_apps.routes.optimizer.generation_reporter import GenerationReporter
+
+CANDLES = [[1000, 1.0, 2.0, 0.5, 1.5], [2000, 1.5, 2.5, 1.0, 2.0]]
+
+
+def fake_chart_data(best_individual, elites, backtest_streamer, data_config_path, best_individuals_log, objectives,
+                    candlestick_data=None):
+    """Chart data shaped like generate_optimizer_chart_data (objective points from the given log)"""
+    return {
+        'objective_evolution': {name: [[entry['generation'], entry['metrics'][name]] for entry in best_individuals_log]
+                                for name in objectives},
+        'best_strategy': {'candlestick_data': candlestick_data if candlestick_data is not None else CANDLES,
+                          'triggers': []}
+    }
+
+
+def snapshot(generation, log, parameter_list=('a', 'b'), test_evaluations=None, data_split=None):
+    log.append({'generation': generation, 'metrics': {'pnl': float(generation)}})
+    return {
+        'generation': generation,
+        'data_split': data_split,
+        'fitness_metrics': {'pnl': float(generation)},
+        'best_individual': None,
+        'elites': [SimpleNamespace(fitness_values=np.array([float(generation)]))],
+        'best_individuals_log': list(log),
+        'parameter_list': list(parameter_list),
+        'indicator_memo': {},
+        'test_evaluations': test_evaluations or []
+    }
+
+
+def emitted(socketio, event):
+    return [call.args[1] for call in socketio.emit.call_args_list if call.args[0] == event]
+
+
+class TestGenerationReporter:
+    """Test the delta payloads of GenerationReporter."""
+
+    @patch('visualization_apps.routes.optimizer.generation_reporter.generate_optimizer_chart_data',
+           side_effect=fake_chart_data)
+    def test_inline_payloads_are_deltas(self, chart_mock):
+        socketio, opt_state = MagicMock(), MagicMock()
+        reporter = GenerationReporter(socketio, io=None, data_config_path='data.json', objectives=['pnl'],
+                                      total_generations=3, opt_state=opt_state, background=False)
+        reporter.start()
+        log = []
+        reporter.publish(snapshot(1, log, test_evaluations=[{'generation': 1}]))
+        reporter.publish(snapshot(2, log))
+        reporter.stop()
+
+        static = emitted(socketio, 'optimization_static_data')
+        assert len(static) == 1
+        assert static[0]['candlestick_data'] == CANDLES
+        opt_state.set.assert_called_once_with('static_chart_data', static[0])
+
+        first, second = emitted(socketio, 'generation_complete')
+        assert first['delta'] and second['delta']
+        assert first['best_individuals_log'] == [{'generation': 1, 'metrics': {'pnl': 1.0}}]
+        assert second['best_individuals_log'] == [{'generation': 2, 'metrics': {'pnl': 2.0}}]
+        assert second['optimizer_charts']['objective_evolution'] == {'pnl': [[2, 2.0]]}
+        assert 'candlestick_data' not in second['optimizer_charts']['best_strategy']
+        assert first['parameter_list'] == ['a', 'b'] and second['parameter_list'] == []
+        assert first['test_evaluations'] == [{'generation': 1}] and second['test_evaluations'] == []
+        assert second['elite_objective_values'] == [[2.0]]
+
+        # The candles of the first payload are reused for the later ones
+        assert chart_mock.call_args_list[1].kwargs['candlestick_data'] == CANDLES
+
+    def test_background_reports_latest_and_keeps_skipped_entries(self):
+        socketio = MagicMock()
+        first_build_started, release_first_build = threading.Event(), threading.Event()
+
+        def slow_chart_data(*args, **kwargs):
+            if not first_build_started.is_set():
+                first_build_started.set()
+                release_first_build.wait(timeout=10)
+            return fake_chart_data(*args, **kwargs)
+
+        with patch('visualization_apps.routes.optimizer.generation_reporter.generate_optimizer_chart_data',
+                   side_effect=slow_chart_data):
+            reporter = GenerationReporter(socketio, io=None, data_config_path='data.json', objectives=['pnl'],
+                                          total_generations=4)
+            reporter.start()
+            log = []
+            reporter.publish(snapshot(1, log))
+            assert first_build_started.wait(timeout=10)
+            # Generations 2-4 finish while generation 1 is still being reported
+            for generation in (2, 3, 4):
+                reporter.publish(snapshot(generation, log, test_evaluations=[{'generation': generation}]))
+            release_first_build.set()
+            reporter.stop()
+
+        payloads = emitted(socketio, 'generation_complete')
+        assert [payload['generation'] for payload in payloads] == [1, 4]
+        assert [entry['generation'] for entry in payloads[1]['best_individuals_log']] == [2, 3, 4]
+        assert payloads[1]['optimizer_charts']['objective_evolution'] == {'pnl': [[2, 2.0], [3, 3.0], [4, 4.0]]}
+        assert payloads[1]['test_evaluations'] == [{'generation': 2}, {'generation': 3}, {'generation': 4}]
+        assert len(emitted(socketio, 'optimization_static_data')) == 1
+
+    def test_candles_follow_the_split(self):
+        socketio = MagicMock()
+        streamers = {split: SimpleNamespace(data_key=split, candles=[[1000 * index, 1.0, 1.0, 1.0, 1.0]])
+                     for index, split in enumerate(('a', 'b'), start=1)}
+        io = SimpleNamespace(chart_streamer=lambda data_split: streamers[data_split['ticker']])
+
+        def split_chart_data(best_individual, elites, backtest_streamer, *args, candlestick_data=None):
+            chart_data = fake_chart_data(best_individual, elites, backtest_streamer, *args,
+                                         candlestick_data=candlestick_data)
+            if candlestick_data is None:
+                chart_data['best_strategy']['candlestick_data'] = backtest_streamer.candles
+            return chart_data
+
+        with patch('visualization_apps.routes.optimizer.generation_reporter.generate_optimizer_chart_data',
+                   side_effect=split_chart_data) as chart_mock:
+            reporter = GenerationReporter(socketio, io=io, data_config_path='data.json', objectives=['pnl'],
+                                          total_generations=3, background=False)
+            log = []
+            for generation, split in enumerate(('a', 'a', 'b'), start=1):
+                reporter.publish(snapshot(generation, log, data_split={'ticker': split}))
+
+        # Each generation is charted on its own split; candles are sent again when the split changes
+        assert [call.args[2] for call in chart_mock.call_args_list] == [streamers['a'], streamers['a'], streamers['b']]
+        assert [call.kwargs['candlestick_data'] for call in chart_mock.call_args_list] == [
+            None, streamers['a'].candles, None]
+        assert [data['candlestick_data'] for data in emitted(socketio, 'optimization_static_data')] == [
+            streamers['a'].candles, streamers['b'].candles]
+
+    @patch('visualization_apps.routes.optimizer.generation_reporter.generate_optimizer_chart_data',
+           side_effect=RuntimeError("no chart"))
+    def test_chart_errors_are_reported(self, chart_mock):
+        socketio = MagicMock()
+        reporter = GenerationReporter(socketio, io=None, data_config_path='data.json', objectives=['pnl'],
+                                      total_generations=1, background=False)
+        reporter.publish(snapshot(1, []))
+        assert emitted(socketio, 'optimization_error') == [{'error': 'no chart'}]
+        assert emitted(socketio, 'generation_complete') == []
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])